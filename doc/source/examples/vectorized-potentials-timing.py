@@ -0,0 +1,60 @@
+# Time the evaluation of FerrersPotential, AnyAxisymmetricRazorThinDiskPotential,
+# and RotateAndTiltWrapperPotential for an array of points, compared to
+# evaluating them point by point
+#
+# Run as: python vectorized-potentials-timing.py [npoints]
+import sys
+import time
+
+import numpy
+
+from galpy import potential
+
+
+def time_evaluation(func, pot, R, z, phi):
+    # Warm up, such that one-time setup (e.g., importing the modules used to
+    # evaluate forces in C) is not included in the timings
+    func(pot, R, z, phi=phi)
+    # Per-point evaluation (the per-point loop in between the two array
+    # evaluations also resets any cached forces)
+    start = time.perf_counter()
+    loop = numpy.array([func(pot, tR, tz, phi=tphi) for tR, tz, tphi in zip(R, z, phi)])
+    tloop = time.perf_counter() - start
+    # Array evaluation
+    start = time.perf_counter()
+    arr = func(pot, R, z, phi=phi)
+    tarr = time.perf_counter() - start
+    return tloop, tarr, numpy.amax(numpy.fabs(arr - loop) / numpy.fabs(loop))
+
+
+if __name__ == "__main__":
+    npoints = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    numpy.random.seed(1)
+    R = numpy.random.uniform(0.1, 3.0, npoints)
+    z = numpy.random.uniform(0.05, 1.0, npoints) * numpy.random.choice([-1, 1], npoints)
+    phi = numpy.random.uniform(0.0, 2.0 * numpy.pi, npoints)
+    pots = [
+        ("Ferrers", potential.FerrersPotential(normalize=1.0)),
+        ("Razor-thin disk", potential.AnyAxisymmetricRazorThinDiskPotential()),
+        (
+            "RotateAndTilt",
+            potential.RotateAndTiltWrapperPotential(
+                pot=potential.TriaxialNFWPotential(b=0.8, c=0.6),
+                zvec=[0.2, 0.3, 1.0],
+                galaxy_pa=0.4,
+            ),
+        ),
+    ]
+    funcs = [
+        ("potential", potential.evaluatePotentials),
+        ("Rforce", potential.evaluateRforces),
+        ("R2deriv", potential.evaluateR2derivs),
+    ]
+    print(f"Timings for {npoints} points, per point vs array:")
+    for name, pot in pots:
+        for funcname, func in funcs:
+            tloop, tarr, relerr = time_evaluation(func, pot, R, z, phi)
+            print(
+                f"{name:>16} {funcname:>10}: {tloop:8.3f}s -> {tarr:7.3f}s "
+                f"({tloop / tarr:6.0f}x; max. relative difference {relerr:.1e})"
+            )
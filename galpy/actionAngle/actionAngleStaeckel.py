@@ -11,11 +11,14 @@
 #
 ###############################################################################
 import copy
+import os
 import warnings
 
 import numpy
 from scipy import integrate, optimize
+from scipy.interpolate import RegularGridInterpolator
 
+from .. import __version__
 from ..potential import (
     DiskSCFPotential,
     MWPotential,
@@ -28,7 +31,9 @@ from ..potential import (
     verticalfreq,
 )
 from ..potential.Potential import (
+    PotentialError,
     _check_c,
+    _evaluate_broadcast,
     _evaluatePotentials,
     _evaluateRforces,
     _evaluatezforces,
@@ -36,6 +41,7 @@ from ..potential.Potential import (
 from ..potential.Potential import flatten as flatten_potential
 from ..util import coords  # for prolate confocal transforms
 from ..util import conversion, galpyWarning
+from ..util._table_cache import cache_table, content_hash, load_table
 from ..util.conversion import physical_conversion, potential_physical_input
 from . import actionAngleStaeckel_c
 from .actionAngle import UnboundError, actionAngle
@@ -54,7 +60,9 @@ class actionAngleStaeckel(actionAngle):
         INPUT:
            pot= potential or list of potentials (3D)
 
-           delta= focus (can be Quantity)
+           delta= focus (can be Quantity); or 'interp' to estimate delta for each phase-space point using estimateDeltaStaeckel with interp=True
+
+           cache= (None) directory in which to store the delta(R,z) table when delta='interp' (see estimateDeltaStaeckel)
 
            useu0 - use u0 to calculate dV (NOT recommended)
 
@@ -74,6 +82,8 @@ class actionAngleStaeckel(actionAngle):
 
            2012-11-27 - Written - Bovy (IAS)
 
+           2026-10-19 - Added delta='interp' and cache=
+
         """
         actionAngle.__init__(self, ro=kwargs.get("ro", None), vo=kwargs.get("vo", None))
         if not "pot" in kwargs:  # pragma: no cover
@@ -98,11 +108,29 @@ class actionAngleStaeckel(actionAngle):
         self._useu0 = kwargs.get("useu0", False)
         self._delta = kwargs["delta"]
         self._order = kwargs.get("order", 10)
-        self._delta = conversion.parse_length(self._delta, ro=self._ro)
+        if isinstance(self._delta, str) and self._delta.lower() != "interp":
+            raise ValueError("delta= must be a number, an array, or 'interp'")
+        elif not isinstance(self._delta, str):
+            self._delta = conversion.parse_length(self._delta, ro=self._ro)
+        self._delta_cache = kwargs.get("cache", None)
         # Check the units
         self._check_consistent_units()
         return None
 
+    def _parse_delta(self, delta, R, z):
+        """Estimate delta for each phase-space point from the potential's delta(R,z) table when delta='interp'"""
+        if not isinstance(delta, str):
+            return delta
+        return estimateDeltaStaeckel(
+            self._pot,
+            numpy.atleast_1d(numpy.array(R, dtype="float")),
+            numpy.atleast_1d(numpy.array(z, dtype="float")),
+            no_median=True,
+            interp=True,
+            cache=self._delta_cache,
+            use_physical=False,
+        )
+
     def _evaluate(self, *args, **kwargs):
         """
         NAME:
@@ -147,6 +175,7 @@ class actionAngleStaeckel(actionAngle):
             vT = numpy.array([vT])
             z = numpy.array([z])
             vz = numpy.array([vz])
+        delta = self._parse_delta(delta, R, z)
         if (
             (self._c and not ("c" in kwargs and not kwargs["c"]))
             or (ext_loaded and ("c" in kwargs and kwargs["c"]))
@@ -262,6 +291,7 @@ class actionAngleStaeckel(actionAngle):
                 vT = numpy.array([vT])
                 z = numpy.array([z])
                 vz = numpy.array([vz])
+            delta = self._parse_delta(delta, R, z)
             Lz = R * vT
             if self._useu0:
                 # First calculate u0
@@ -372,6 +402,7 @@ class actionAngleStaeckel(actionAngle):
                 z = numpy.array([z])
                 vz = numpy.array([vz])
                 phi = numpy.array([phi])
+            delta = self._parse_delta(delta, R, z)
             Lz = R * vT
             if self._useu0:
                 # First calculate u0
@@ -456,8 +487,15 @@ class actionAngleStaeckel(actionAngle):
         HISTORY:
            2017-12-12 - Written - Bovy (UofT)
         """
-        delta = kwargs.get("delta", self._delta)
-        umin, umax, vmin = self._uminumaxvmin(*args, **kwargs)
+        delta = kwargs.pop("delta", self._delta)
+        if isinstance(delta, str):
+            if len(args) >= 5:
+                R, z = args[0], args[3]
+            else:
+                self._parse_eval_args(*args)
+                R, z = self._eval_R, self._eval_z
+            delta = self._parse_delta(delta, R, z)
+        umin, umax, vmin = self._uminumaxvmin(*args, delta=delta, **kwargs)
         rperi = coords.uv_to_Rz(umin, numpy.pi / 2.0, delta=delta)[0]
         rap_tmp, zmax = coords.uv_to_Rz(umax, vmin, delta=delta)
         rap = numpy.sqrt(rap_tmp**2.0 + zmax**2.0)
@@ -499,6 +537,7 @@ class actionAngleStaeckel(actionAngle):
             vT = numpy.array([vT])
             z = numpy.array([z])
             vz = numpy.array([vz])
+        delta = self._parse_delta(delta, R, z)
         if (
             (self._c and not ("c" in kwargs and not kwargs["c"]))
             or (ext_loaded and ("c" in kwargs and kwargs["c"]))
@@ -775,7 +814,7 @@ class actionAngleStaeckelSingle(actionAngle):
                         self._pot,
                     ),
                     n=order,
-                    **kwargs
+                    **kwargs,
                 )[0]
             )
         else:
@@ -800,7 +839,7 @@ class actionAngleStaeckelSingle(actionAngle):
                         self._potu0v0,
                         self._pot,
                     ),
-                    **kwargs
+                    **kwargs,
                 )[0]
             )
         return self._JR
@@ -848,7 +887,7 @@ class actionAngleStaeckelSingle(actionAngle):
                         self._pot,
                     ),
                     n=order,
-                    **kwargs
+                    **kwargs,
                 )[0]
             )
         else:
@@ -873,7 +912,7 @@ class actionAngleStaeckelSingle(actionAngle):
                         self._potupi2,
                         self._pot,
                     ),
-                    **kwargs
+                    **kwargs,
                 )[0]
             )
         return self._JZ
@@ -1389,7 +1428,9 @@ def _vminFindStart(v, E, Lz, I3V, delta, u0, cosh2u0, sinh2u0, potu0pi2, pot):
 
 @potential_physical_input
 @physical_conversion("position", pop=True)
-def estimateDeltaStaeckel(pot, R, z, no_median=False, delta0=1e-6):
+def estimateDeltaStaeckel(
+    pot, R, z, no_median=False, delta0=1e-6, interp=False, cache=None
+):
     """
     NAME:
        estimateDeltaStaeckel
@@ -1401,6 +1442,8 @@ def estimateDeltaStaeckel(pot, R, z, no_median=False, delta0=1e-6):
        no_median - (False) if True, and input is array, return all calculated values of delta (useful for quickly
        estimating delta for many phase space points)
        delta0= (1e-6) value to return when delta<delta0 (because actionAngleStaeckel does not work with delta=0 exactly)
+       interp= (False) if True, interpolate delta in a delta(R,z) table that is computed once for each potential and kept in memory (second derivatives of the potential are computed numerically from the forces when they are not implemented)
+       cache= (None) if set to a directory and interp=True, store the delta(R,z) table in a file in this directory whose name contains a hash of the potential, such that it can be re-used across sessions
     OUTPUT:
        delta
     HISTORY:
@@ -1408,6 +1451,7 @@ def estimateDeltaStaeckel(pot, R, z, no_median=False, delta0=1e-6):
        2016-02-20 - Changed input order to allow physical conversions - Bovy (UofT)
        2022-09-14 - Deal with numerical issues with SCF/DiskSCFPotentials - Bovy (UofT)
        2022-09-15 - Add delta0 - Bovy (UofT)
+       2026-10-19 - Vectorized and added interp= and cache=
     """
     pot = flatten_potential(pot)
     # We'll special-case delta<0 when the potential includes SCF/DiskSCF components
@@ -1426,27 +1470,12 @@ def estimateDeltaStaeckel(pot, R, z, no_median=False, delta0=1e-6):
             z[z == 0.0] = 1e-4
         else:
             z = 1e-4
+    if interp:
+        delta2 = _interp_delta2(pot, R, z, cache=cache)
+    else:
+        delta2 = _estimate_delta2(pot, R, z)
     if isinstance(R, numpy.ndarray):
-        delta2 = numpy.array(
-            [
-                (
-                    z[ii] ** 2.0
-                    - R[ii] ** 2.0  # eqn. (9) has a sign error
-                    + (
-                        3.0 * R[ii] * _evaluatezforces(pot, R[ii], z[ii])
-                        - 3.0 * z[ii] * _evaluateRforces(pot, R[ii], z[ii])
-                        + R[ii]
-                        * z[ii]
-                        * (
-                            evaluateR2derivs(pot, R[ii], z[ii], use_physical=False)
-                            - evaluatez2derivs(pot, R[ii], z[ii], use_physical=False)
-                        )
-                    )
-                    / evaluateRzderivs(pot, R[ii], z[ii], use_physical=False)
-                )
-                for ii in range(len(R))
-            ]
-        )
+        delta2 = delta2 * numpy.ones(len(R))
         indx = (delta2 < delta0**2.0) * (
             (delta2 > -(10.0**-10.0)) + pot_includes_scf
         )
@@ -1454,21 +1483,95 @@ def estimateDeltaStaeckel(pot, R, z, no_median=False, delta0=1e-6):
         if not no_median:
             delta2 = numpy.median(delta2[True ^ numpy.isnan(delta2)])
     else:
-        delta2 = (
-            z**2.0
-            - R**2.0  # eqn. (9) has a sign error
-            + (
-                3.0 * R * _evaluatezforces(pot, R, z)
-                - 3.0 * z * _evaluateRforces(pot, R, z)
-                + R
-                * z
-                * (
-                    evaluateR2derivs(pot, R, z, use_physical=False)
-                    - evaluatez2derivs(pot, R, z, use_physical=False)
-                )
-            )
-            / evaluateRzderivs(pot, R, z, use_physical=False)
-        )
         if delta2 < delta0**2.0 and (delta2 > -(10.0**-10.0) or pot_includes_scf):
             delta2 = delta0**2.0
     return numpy.sqrt(delta2)
+
+
+def _estimate_delta2(pot, R, z, numerical=False):
+    """delta^2 from eqn. (9) in Sanders (2012) for all points at once; if numerical, compute the second derivatives of the potential numerically from the forces when they are not implemented"""
+    Rforce = _evaluate_broadcast(_evaluateRforces, pot, R, z, phi=None)
+    zforce = _evaluate_broadcast(_evaluatezforces, pot, R, z, phi=None)
+    try:
+        R2deriv, z2deriv, Rzderiv = (
+            _evaluate_broadcast(func, pot, R, z, phi=None, use_physical=False)
+            for func in (evaluateR2derivs, evaluatez2derivs, evaluateRzderivs)
+        )
+    except PotentialError as e:
+        if not numerical or not "deriv" in str(e):
+            raise
+        # Central finite differences of the forces
+        h = 1e-5 * numpy.sqrt(R**2.0 + z**2.0)
+        R2deriv = -(
+            _evaluate_broadcast(_evaluateRforces, pot, R + h, z, phi=None)
+            - _evaluate_broadcast(_evaluateRforces, pot, R - h, z, phi=None)
+        ) / (2.0 * h)
+        z2deriv = -(
+            _evaluate_broadcast(_evaluatezforces, pot, R, z + h, phi=None)
+            - _evaluate_broadcast(_evaluatezforces, pot, R, z - h, phi=None)
+        ) / (2.0 * h)
+        Rzderiv = -(
+            _evaluate_broadcast(_evaluateRforces, pot, R, z + h, phi=None)
+            - _evaluate_broadcast(_evaluateRforces, pot, R, z - h, phi=None)
+        ) / (2.0 * h)
+    return (
+        z**2.0
+        - R**2.0  # eqn. (9) has a sign error
+        + (3.0 * R * zforce - 3.0 * z * Rforce + R * z * (R2deriv - z2deriv)) / Rzderiv
+    )
+
+
+# Grid of the delta(R,z) tables, which are interpolated in (ln R, ln |z|)
+_DELTA2_TABLE_RGRID = numpy.geomspace(1e-3, 100.0, 201)
+_DELTA2_TABLE_ZGRID = numpy.geomspace(1e-4, 100.0, 161)
+_delta2_tables = {}
+
+
+def _delta2_table(pot, cache=None):
+    """Table of delta^2 on the (_DELTA2_TABLE_RGRID,_DELTA2_TABLE_ZGRID) grid for a potential, computed only once"""
+    key = content_hash(__version__, pot, _DELTA2_TABLE_RGRID, _DELTA2_TABLE_ZGRID)
+    if key in _delta2_tables:
+        return _delta2_tables[key]
+    cachefile = (
+        None if cache is None else os.path.join(cache, f"deltaStaeckel-{key}.npz")
+    )
+    if cachefile is not None and os.path.exists(cachefile):
+        table = load_table(cachefile, mmap=False)["delta2"]
+    else:
+        Rs, zs = numpy.meshgrid(_DELTA2_TABLE_RGRID, _DELTA2_TABLE_ZGRID, indexing="ij")
+        with numpy.errstate(all="ignore"):
+            table = _estimate_delta2(
+                pot, Rs.flatten(), zs.flatten(), numerical=True
+            ).reshape(Rs.shape)
+        if cachefile is not None:
+            cache_table(cachefile, delta2=table)
+    if len(_delta2_tables) >= 16:  # don't let the in-memory tables pile up
+        _delta2_tables.pop(next(iter(_delta2_tables)))
+    _delta2_tables[key] = table
+    return table
+
+
+def _interp_delta2(pot, R, z, cache=None):
+    """delta^2 interpolated from the potential's table; points outside of the table (or in NaN cells) are evaluated directly"""
+    scalarOut = numpy.ndim(R) == 0 and numpy.ndim(z) == 0
+    R, z = numpy.broadcast_arrays(
+        numpy.atleast_1d(R).astype("float"), numpy.atleast_1d(z).astype("float")
+    )
+    out = RegularGridInterpolator(
+        (numpy.log(_DELTA2_TABLE_RGRID), numpy.log(_DELTA2_TABLE_ZGRID)),
+        _delta2_table(pot, cache=cache),
+        bounds_error=False,
+        fill_value=numpy.nan,
+    )(
+        numpy.stack(
+            [
+                numpy.log(R),
+                numpy.log(numpy.maximum(numpy.fabs(z), _DELTA2_TABLE_ZGRID[0])),
+            ],
+            axis=-1,
+        )
+    )
+    indx = numpy.isnan(out)
+    if numpy.any(indx):
+        out[indx] = _estimate_delta2(pot, R[indx], z[indx], numerical=True)
+    return out[0] if scalarOut else out
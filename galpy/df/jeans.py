@@ -1,13 +1,15 @@
 # jeans.py: utilities related to the Jeans equations
 import numpy
-from scipy import integrate
+from scipy import integrate, interpolate
 
 from ..potential.Potential import (
+    _evaluate_broadcast,
     evaluateDensities,
     evaluaterforces,
     evaluateSurfaceDensities,
 )
 from ..potential.Potential import flatten as flatten_pot
+from ..util import conversion
 from ..util.conversion import physical_conversion, potential_physical_input
 
 _INVSQRTTWO = 1.0 / numpy.sqrt(2.0)
@@ -78,6 +80,123 @@ def sigmar(Pot, r, dens=None, beta=0.0):
     )
 
 
+def sigmar_profile(Pot, rmin, rmax, nr=1001, dens=None, beta=0.0):
+    """
+    NAME:
+
+       sigmar_profile
+
+    PURPOSE:
+
+       Compute the radial velocity dispersion profile using the spherical Jeans equation on a whole grid of radii at once
+
+    INPUT:
+
+       Pot - potential or list of potentials (evaluated at R=r/sqrt(2),z=r/sqrt(2), sphericity not checked)
+
+       rmin, rmax - range of Galactocentric radii of the profile (can be Quantity); rmin=0 is replaced by 10^-4 rmax
+
+       nr= (1001) number of logarithmically-spaced radii on which to solve the Jeans equation
+
+       dens= (None) tracer density profile (function of r); if None, the density is assumed to be that corresponding to the potential
+
+       beta= (0.) anisotropy; can be a constant or a function of r
+
+    OUTPUT:
+
+       spline of sigma_r(r) (function of r in internal units that returns sigma_r in internal units; the spline returns the values at rmin and rmax for radii outside of the range and NaN at radii where sigma_r is undefined, e.g., where the density is zero)
+
+    HISTORY:
+
+       2026-10-19 - Written
+
+    """
+    Pot = flatten_pot(Pot)
+    ro = conversion.get_physical(Pot)["ro"]
+    rmin = conversion.parse_length(rmin, ro=ro)
+    rmax = conversion.parse_length(rmax, ro=ro)
+    if rmin <= 0.0:
+        rmin = 1e-4 * rmax
+    if dens is None:
+        dens = lambda r: evaluateDensities(
+            Pot,
+            r * _INVSQRTTWO,
+            r * _INVSQRTTWO,
+            phi=numpy.pi / 4.0,
+            use_physical=False,
+        )
+    rforce = lambda r: _evaluate_broadcast(
+        evaluaterforces,
+        Pot,
+        r * _INVSQRTTWO,
+        r * _INVSQRTTWO,
+        phi=numpy.pi / 4.0,
+        use_physical=False,
+    )
+    rs = numpy.geomspace(rmin, rmax, nr)
+    lnrs = numpy.log(rs)
+    densrs = _evaluate_vectorized(dens, rs)
+    # Integrating factor exp(2 int beta/r dr), normalized to one at rmax
+    if callable(beta):
+        betars = _evaluate_vectorized(beta, rs)
+        intbeta = interpolate.InterpolatedUnivariateSpline(
+            lnrs, betars, k=3
+        ).antiderivative()(lnrs)
+        intFactors = numpy.exp(2.0 * (intbeta - intbeta[-1]))
+        intFactor = lambda x: numpy.exp(
+            2.0 * integrate.quad(lambda y: beta(y) / y, rmax, x)[0]
+        )
+    else:  # assume to be number
+        intFactors = (rs / rmax) ** (2.0 * beta)
+        intFactor = lambda x: (x / rmax) ** (2.0 * beta)
+    # Solve d(dens sigma_r^2 intFactor)/dr = dens intFactor F_r backwards from
+    # infinity: quadrature beyond rmax (normalized by the integrand at rmax,
+    # which is typically tiny), cumulative spline integral within
+    integrand = -intFactors * densrs * rforce(rs) * rs  # d/dlnr
+    integrand[True ^ numpy.isfinite(integrand)] = 0.0
+    tailnorm = numpy.fabs(integrand[-1]) / rmax if integrand[-1] != 0.0 else 1.0
+    tail = (
+        tailnorm
+        * integrate.quad(
+            lambda x: -intFactor(x) * dens(x) * rforce(x) / tailnorm,
+            rmax,
+            numpy.inf,
+        )[0]
+    )
+    # Accumulate inwards from rmax (in -lnr), to avoid cancellation between
+    # the large integrals from rmin when the integrand drops steeply
+    outint = interpolate.InterpolatedUnivariateSpline(
+        -lnrs[::-1], integrand[::-1], k=3
+    ).antiderivative()(-lnrs[::-1])[::-1]
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        sigmars = numpy.sqrt((tail + outint) / densrs / intFactors)
+    # Radii where sigma_r is undefined (e.g., zero density) are left out of the
+    # spline, such that they do not spoil it elsewhere, and return NaN
+    good = numpy.isfinite(sigmars)
+    spl = interpolate.InterpolatedUnivariateSpline(rs[good], sigmars[good], k=3, ext=3)
+    if numpy.all(good):
+        return spl
+    isbad = interpolate.interp1d(
+        lnrs,
+        True ^ good,
+        kind="nearest",
+        bounds_error=False,
+        fill_value=(not good[0], not good[-1]),
+    )
+    return lambda r: numpy.where(isbad(numpy.log(r)) > 0.5, numpy.nan, spl(r))
+
+
+def _evaluate_vectorized(func, rs):
+    """Evaluate func on an array of radii, looping over them if func does not accept arrays"""
+    try:
+        out = numpy.asarray(func(rs), dtype="float")
+    except (TypeError, ValueError):
+        out = None
+    if out is None or out.shape != rs.shape:
+        out = numpy.array([func(r) for r in rs])
+    return out
+
+
 @potential_physical_input
 @physical_conversion("velocity", pop=True)
 def sigmalos(Pot, R, dens=None, surfdens=None, beta=0.0, sigma_r=None):
@@ -112,6 +231,8 @@ def sigmalos(Pot, R, dens=None, surfdens=None, beta=0.0, sigma_r=None):
 
        2018-08-27 - Written - Bovy (UofT)
 
+       2026-10-19 - Solve the Jeans equation on a grid of radii at once using sigmar_profile
+
     """
     Pot = flatten_pot(Pot)
     if dens is None:
@@ -142,7 +263,14 @@ def sigmalos(Pot, R, dens=None, surfdens=None, beta=0.0, sigma_r=None):
     else:
         call_beta = lambda x: beta
     if sigma_r is None:
-        call_sigma_r = lambda r: sigmar(Pot, r, dens=dens, beta=beta)
+        # Solve the Jeans equation once on a grid of radii that covers the
+        # bulk of the line-of-sight integral, use sigmar directly beyond
+        sigma_r_spline = sigmar_profile(Pot, R, 1000.0 * R, dens=dens, beta=beta)
+        call_sigma_r = lambda r: (
+            sigma_r_spline(r)
+            if r <= 1000.0 * R
+            else sigmar(Pot, r, dens=dens, beta=beta, use_physical=False)
+        )
     elif not callable(sigma_r):
         call_sigma_r = lambda x: sigma_r
     else:
@@ -5,6 +5,7 @@ from ..orbit import Orbit
 from ..potential import evaluateRforces
 from ..potential import flatten as flatten_potential
 from ..potential import rtide
+from ..potential.Potential import _evaluate_broadcast
 from ..util import _rotate_to_arbitrary_vector, conversion, coords
 from ..util._optional_deps import _APY_LOADED, _APY_UNITS
 
@@ -186,53 +187,29 @@ class streamspraydf(df):
             self._meankvec
             + numpy.random.normal(size=n)[:, numpy.newaxis] * self._sigkvec
         )
-        try:
-            rtides = rtide(
+        # rtide and _evaluate_broadcast fall back to a loop over points for
+        # potentials that do not support array inputs
+        rtides = rtide(
+            self._rtpot,
+            Rpt,
+            Zpt,
+            phi=phipt,
+            t=-dt,
+            M=self._progenitor_mass,
+            use_physical=False,
+        )
+        vcs = numpy.sqrt(
+            -Rpt
+            * _evaluate_broadcast(
+                evaluateRforces,
                 self._rtpot,
                 Rpt,
                 Zpt,
                 phi=phipt,
                 t=-dt,
-                M=self._progenitor_mass,
                 use_physical=False,
             )
-            vcs = numpy.sqrt(
-                -Rpt
-                * evaluateRforces(
-                    self._rtpot, Rpt, Zpt, phi=phipt, t=-dt, use_physical=False
-                )
-            )
-        except (ValueError, TypeError):
-            rtides = numpy.array(
-                [
-                    rtide(
-                        self._rtpot,
-                        Rpt[ii],
-                        Zpt[ii],
-                        phi=phipt[ii],
-                        t=-dt[ii],
-                        M=self._progenitor_mass,
-                        use_physical=False,
-                    )
-                    for ii in range(len(Rpt))
-                ]
-            )
-            vcs = numpy.array(
-                [
-                    numpy.sqrt(
-                        -Rpt[ii]
-                        * evaluateRforces(
-                            self._rtpot,
-                            Rpt[ii],
-                            Zpt[ii],
-                            phi=phipt[ii],
-                            t=-dt[ii],
-                            use_physical=False,
-                        )
-                    )
-                    for ii in range(len(Rpt))
-                ]
-            )
+        )
         rtides_as_frac = rtides / Rpt
         RpZst = numpy.array(
             [
@@ -45,6 +45,7 @@ from ..util._optional_deps import (
     _ASTROQUERY_LOADED,
     _NUMEXPR_LOADED,
 )
+from ..util._table_cache import load_table, save_table
 from ..util.conversion import (
     physical_compatible,
     physical_conversion,
@@ -52,8 +53,12 @@ from ..util.conversion import (
 )
 from ..util.coords import _K
 from .integrateFullOrbit import (
+    _cyl_to_rect,
     integrateFullOrbit,
     integrateFullOrbit_c,
+    integrateFullOrbit_crossings_c,
+    integrateFullOrbit_dxdv,
+    integrateFullOrbit_lyapunov_c,
     integrateFullOrbit_sos,
     integrateFullOrbit_sos_c,
 )
@@ -62,9 +67,13 @@ from .integrateLinearOrbit import (
     integrateLinearOrbit,
     integrateLinearOrbit_c,
 )
+from .integrateMassiveBodies import integrateMassiveBodies, reflexAcceleration
 from .integratePlanarOrbit import (
+    _EVENT_TYPES,
+    _eval_dense_output,
     integratePlanarOrbit,
     integratePlanarOrbit_c,
+    integratePlanarOrbit_crossings_c,
     integratePlanarOrbit_dxdv,
     integratePlanarOrbit_sos,
     integratePlanarOrbit_sos_c,
@@ -1010,6 +1019,103 @@ class Orbit:
         # Setup with these new initial conditions
         return cls(new_vxvv, ro=ro, vo=vo, zo=zo, solarmotion=solarmotion)
 
+    def save(self, filename):
+        """
+        NAME:
+
+           save
+
+        PURPOSE:
+
+           save the initial conditions and, if integrated, the orbits to a file, such that they can be loaded with Orbit.from_file; the orbits are stored in the precision in which they were integrated (see the dtype= keyword of Orbit.integrate) and the times are stored as (start,end,number) if they are evenly spaced; the coordinate-transformation parameters (ro,vo,zo,solarmotion) are preserved, but the potential in which the orbits were integrated is not
+
+        INPUT:
+
+           filename - name of the file (a .npz file, written without compression such that the orbits can be memory-mapped when loading)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        out = {
+            "vxvv": numpy.reshape(self.vxvv, self.shape + (self.phasedim(),)),
+            "ro": self._ro,
+            "vo": self._vo,
+            "roSet": self._roSet,
+            "voSet": self._voSet,
+            "zo": numpy.nan if self._zo is None else self._zo,
+            "solarmotion": (
+                numpy.zeros(0) if self._solarmotion is None else self._solarmotion
+            ),
+        }
+        if "orbit" in self.__dict__:
+            out["orbit"] = self.orbit
+            out["integrate_t_asQuantity"] = self._integrate_t_asQuantity
+            if len(self.t) > 2 and numpy.array_equal(
+                numpy.linspace(self.t[0], self.t[-1], len(self.t)), self.t
+            ):
+                out["tgrid"] = numpy.array([self.t[0], self.t[-1], len(self.t)])
+            else:
+                out["t"] = self.t
+        save_table(filename, **out)
+        return None
+
+    @classmethod
+    def from_file(cls, filename, mmap=False):
+        """
+        NAME:
+
+           from_file
+
+        PURPOSE:
+
+           load orbits saved with Orbit.save
+
+        INPUT:
+
+           filename - name of the file
+
+           mmap= (False) if True, memory-map the integrated orbits rather than reading them into memory; the memory-mapped orbits are read-only and the file is never modified: operations that change the integrated orbits in-place (flip(inplace=True)) first copy them into memory, while re-integrating replaces them with a new in-memory array
+
+        OUTPUT:
+
+           Orbit instance
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        data = load_table(filename, mmap=mmap)
+        out = cls(
+            numpy.array(data["vxvv"]),
+            ro=float(data["ro"]),
+            vo=float(data["vo"]),
+            zo=None if numpy.isnan(data["zo"]) else float(data["zo"]),
+            solarmotion=(
+                None
+                if len(data["solarmotion"]) == 0
+                else numpy.array(data["solarmotion"])
+            ),
+        )
+        out._roSet = bool(data["roSet"])
+        out._voSet = bool(data["voSet"])
+        if "orbit" in data:
+            out.orbit = data["orbit"]
+            out._integrate_t_asQuantity = bool(data["integrate_t_asQuantity"])
+            if "tgrid" in data:
+                out.t = numpy.linspace(
+                    data["tgrid"][0], data["tgrid"][1], int(data["tgrid"][2])
+                )
+            else:
+                out.t = numpy.array(data["t"])
+        return out
+
     def __len__(self):
         return 1 if self.shape == () else self.shape[0]
 
@@ -1340,14 +1446,20 @@ class Orbit:
         return None
 
     @staticmethod
-    def check_integrator(method, no_symplec=False):
+    def check_integrator(method, no_symplec=False, no_lockstep=False):
         valid_methods = [
             "odeint",
             "leapfrog",
             "dop853",
+            "leapfrog_vec",
+            "symplec4_vec",
+            "rk4_vec",
             "leapfrog_c",
             "symplec4_c",
             "symplec6_c",
+            "leapfrog_adaptive_c",
+            "symplec4_adaptive_c",
+            "symplec6_adaptive_c",
             "rk4_c",
             "rk6_c",
             "dopr54_c",
@@ -1356,11 +1468,22 @@ class Orbit:
         if no_symplec:
             symplec_methods = [
                 "leapfrog",
+                "leapfrog_vec",
+                "symplec4_vec",
                 "leapfrog_c",
                 "symplec4_c",
                 "symplec6_c",
+                "leapfrog_adaptive_c",
+                "symplec4_adaptive_c",
+                "symplec6_adaptive_c",
             ]
             [valid_methods.remove(symplec_method) for symplec_method in symplec_methods]
+        if no_lockstep:
+            [
+                valid_methods.remove(lockstep_method)
+                for lockstep_method in valid_methods[:]
+                if lockstep_method.endswith("_vec")
+            ]
         if method.lower() not in valid_methods:
             raise ValueError(f"{method:s} is not a valid `method`")
         return None
@@ -1392,6 +1515,8 @@ class Orbit:
         if _isDissipative(pot) and ("leapfrog" in method or "symplec" in method):
             if "_c" in method:
                 method = "dopr54_c"
+            elif "_vec" in method:
+                method = "rk4_vec"
             else:
                 method = "odeint"
             warnings.warn(
@@ -1401,6 +1526,95 @@ class Orbit:
             )
         return method
 
+    def _clear_integration_caches(self):
+        """Delete attributes for interpolation and rperi etc. determination"""
+        for attr in [
+            "_orbInterp",
+            "_dense",
+            "_events",
+            "_observables_cache",
+            "_tterm",
+        ]:
+            if hasattr(self, attr):
+                delattr(self, attr)
+        return None
+
+    def _integrate_massive(self, t, pot, massive, reflex):
+        """Integrate the massive bodies of a restricted N-body integration, set their orbits, and return the list of forces felt by the test particles"""
+        from ..potential import MovingObjectPopulationPotential, NonInertialFrameForce
+
+        if self.dim() != 3:
+            raise ValueError(
+                "Integration with massive bodies is only supported for 3D orbits"
+            )
+        pot = flatten_potential([pot])
+        orbs = [body[0] for body in massive]
+        pots = [flatten_potential(body[1]) for body in massive]
+        dynfrics = [body[2] if len(body) > 2 else None for body in massive]
+        for orb in orbs:
+            if orb.dim() != 3 or orb.phasedim() != 6 or orb.size != 1:
+                raise ValueError(
+                    "The orbits of massive bodies need to be single-object, 3D Orbit instances with azimuth"
+                )
+            _check_consistent_units(self, orb)
+        xvs = numpy.array(
+            [
+                [
+                    orb.x(use_physical=False),
+                    orb.y(use_physical=False),
+                    orb.z(use_physical=False),
+                    orb.vx(use_physical=False),
+                    orb.vy(use_physical=False),
+                    orb.vz(use_physical=False),
+                ]
+                for orb in orbs
+            ]
+        ).reshape(len(orbs), 6)
+        # The forces of the bodies use their trajectories tabulated on an
+        # internal grid, such that they do not depend on the output times
+        taborbs = [orb() for orb in orbs]
+        out, ttab, outtab = integrateMassiveBodies(
+            pot, xvs, pots, dynfrics, t, reflex=reflex
+        )
+        for xv, orb in zip(out, orbs):
+            orb._clear_integration_caches()
+            _set_massive_body_orbit(orb, t, xv)
+            orb._integrate_t_asQuantity = self._integrate_t_asQuantity
+        for xv, orb in zip(outtab, taborbs):
+            _set_massive_body_orbit(orb, ttab, xv)
+        # Forces due to each body on everything else
+        bodyforces = [
+            MovingObjectPopulationPotential(orb, pot=p, ro=self._ro, vo=self._vo)
+            for orb, p in zip(taborbs, pots)
+        ]
+        if reflex:
+            movers = list(bodyforces)
+
+            def a0(t, ii):
+                return reflexAcceleration(
+                    [mover._positions(t)[0] for mover in movers], pots, t=t
+                )[ii]
+
+            bodyforces.append(
+                NonInertialFrameForce(
+                    a0=[
+                        numpy.vectorize(lambda t, ii=ii: a0(t, ii), otypes=[float])
+                        for ii in range(3)
+                    ],
+                    tabulate=[numpy.amin(t), numpy.amax(t)],
+                    ro=self._ro,
+                    vo=self._vo,
+                )
+            )
+        for ii, orb in enumerate(orbs):
+            orb._pot = (
+                pot
+                + bodyforces[:ii]
+                + bodyforces[ii + 1 :]
+                + ([] if dynfrics[ii] is None else [dynfrics[ii]])
+            )
+        return pot + bodyforces
+
     def integrate(
         self,
         t,
@@ -1410,6 +1624,12 @@ class Orbit:
         dt=None,
         numcores=_NUMCORES,
         force_map=False,
+        dense_output=False,
+        events=None,
+        terminate=None,
+        dtype=numpy.float64,
+        massive=None,
+        reflex=False,
     ):
         """
         NAME:
@@ -1431,20 +1651,34 @@ class Orbit:
                      'leapfrog_c' for a simple leapfrog implementation in C
                      'symplec4_c' for a 4th order symplectic integrator in C
                      'symplec6_c' for a 6th order symplectic integrator in C
+                     'leapfrog_adaptive_c', 'symplec4_adaptive_c', 'symplec6_adaptive_c' for time-symmetric, adaptive-step versions of the symplectic integrators in C
                      'rk4_c' for a 4th-order Runge-Kutta integrator in C
                      'rk6_c' for a 6-th order Runge-Kutta integrator in C
                      'dopr54_c' for a 5-4 Dormand-Prince integrator in C
                      'dop853' for a 8-5-3 Dormand-Prince integrator in Python
                      'dop853_c' for a 8-5-3 Dormand-Prince integrator in C
+                     'leapfrog_vec', 'symplec4_vec', 'rk4_vec' for leapfrog, 4th order symplectic, and 4th-order Runge-Kutta integrators in Python that advance all orbits together with a common, fixed stepsize, such that each step requires only a single, vectorized force evaluation for all orbits (fast for many orbits in potentials without a C implementation)
 
             progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
 
-            dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize (only works for the C integrators that use a fixed stepsize) (can be Quantity)
+            dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize (only works for the integrators that use a fixed stepsize; for the adaptive symplectic integrators, this is the maximum stepsize) (can be Quantity)
 
             numcores - number of cores to use for Python-based multiprocessing (pure Python or using force_map=True); default = OMP_NUM_THREADS
 
             force_map= (False) if True, force use of Python-based multiprocessing (not recommended)
 
+            dense_output= (False) if True, store the dense output (continuous interpolant) of the integrator, such that the orbit can be evaluated at arbitrary times within the integration range without spline interpolation; only for 'dopr54_c' and 'dop853_c', which then take their natural adaptive steps independent of the output times
+
+            events= (None) list of events to detect during the integration, by finding the roots of an event function on the integrator's dense output; 'pericenter', 'apocenter', 'zcross' (crossing the z=0 plane), 'zmax' (maximum of abs(z)), or ('escape',r) (moving outside of radius r, can be Quantity); only for 'dopr54_c' and 'dop853_c'; get the times and phase-space positions of the events with getEvents
+
+            terminate= (None) list of event names that stop the integration of an orbit when they occur (e.g., ['escape']); the orbit is NaN at later times
+
+            dtype= (numpy.float64) precision in which to store the integrated orbits: numpy.float64 or numpy.float32; the integration itself is always performed in double precision, and for the C integrators, the orbits are converted to single precision in C, such that no double-precision copy of all orbits is ever held in memory
+
+            massive= (None) list of massive bodies that are integrated self-consistently under the influence of pot and of each other's gravity before integrating the orbits in pot and the potentials of all massive bodies (restricted N-body integration; only for 3D orbits); each entry is [orbit,bodypot] or [orbit,bodypot,dynfric], where orbit is a single-object 3D Orbit instance with the initial condition of the body at t[0] (its integrated orbit is set to that of the body), bodypot is the (spherical) potential of the body centered on the origin, and dynfric an optional ChandrasekharDynamicalFrictionForce that acts on the body; the bodies are integrated with an adaptive integrator and their trajectories are interpolated between the steps of this integrator, such that the results do not depend on how finely t samples them
+
+            reflex= (False) if True and massive= is given, integrate in the frame of the center of pot, which is accelerated by the massive bodies, such that all orbits include the reflex motion of the host (e.g., of the Milky Way due to the LMC)
+
         OUTPUT:
 
             None (get the actual orbit using getOrbit())
@@ -1455,8 +1689,28 @@ class Orbit:
 
             2018-12-26 - Written to use OpenMP C implementation - Bovy (UofT)
 
+            2026-10-19 - Added adaptive-step symplectic integrators
+
+            2026-10-19 - Added dense_output and events
+
+            2026-10-19 - Added dtype
+
+            2026-10-19 - Added massive= and reflex=
+
+            2026-10-19 - Added lockstep integrators
+
         """
         self.check_integrator(method)
+        if not numpy.dtype(dtype) in [
+            numpy.dtype(numpy.float64),
+            numpy.dtype(numpy.float32),
+        ]:
+            raise ValueError("dtype= must be numpy.float64 or numpy.float32")
+        if dense_output and not method.lower() in ["dopr54_c", "dop853_c"]:
+            raise ValueError(
+                "dense_output=True is only supported for method='dopr54_c' or 'dop853_c'"
+            )
+        c_events = self._parse_events(events, terminate, method)
         pot = flatten_potential(pot)
         _check_potential_dim(self, pot)
         _check_consistent_units(self, pot)
@@ -1475,13 +1729,13 @@ class Orbit:
                 "Use of MWPotential as a Milky-Way-like potential is deprecated; galpy.potential.MWPotential2014, a potential fit to a large variety of dynamical constraints (see Bovy 2015), is the preferred Milky-Way-like potential in galpy",
                 galpyWarning,
             )
-        if not _check_integrate_dt(t, dt):
+        if not "adaptive" in method.lower() and not _check_integrate_dt(t, dt):
             raise ValueError(
                 "dt input (integrator stepsize) for Orbit.integrate must be an integer divisor of the output stepsize"
             )
-        # Delete attributes for interpolation and rperi etc. determination
-        if hasattr(self, "_orbInterp"):
-            delattr(self, "_orbInterp")
+        if not massive is None:
+            pot = self._integrate_massive(t, pot, massive, reflex)
+        self._clear_integration_caches()
         if self.dim() == 2:
             thispot = toPlanarPotential(pot)
         else:
@@ -1490,6 +1744,10 @@ class Orbit:
         self._pot = thispot
         method = self._check_method_c_compatible(method, self._pot)
         method = self._check_method_dissipative_compatible(method, self._pot)
+        if not c_events is None and (not "_c" in method or force_map):
+            raise ValueError(
+                "events can only be detected with the C integrators, but C integration is not possible for this potential or force_map=True"
+            )
         # Implementation with parallel_map in Python
         if not "_c" in method or not ext_loaded or force_map:
             if self.dim() == 1:
@@ -1522,18 +1780,21 @@ class Orbit:
                     numcores=numcores,
                     dt=dt,
                 )
+            out = out.astype(dtype, copy=False)
         else:
             warnings.warn(
                 "Using C implementation to integrate orbits", galpyWarningVerbose
             )
             if self.dim() == 1:
-                out, msg = integrateLinearOrbit_c(
+                out = integrateLinearOrbit_c(
                     self._pot,
                     numpy.copy(self.vxvv),
                     t,
                     method,
                     progressbar=progressbar,
                     dt=dt,
+                    dense_output=dense_output,
+                    dtype=dtype,
                 )
             else:
                 if self.phasedim() == 3 or self.phasedim() == 5:
@@ -1544,16 +1805,36 @@ class Orbit:
                 else:
                     vxvvs = numpy.copy(self.vxvv)
                 if self.dim() == 2:
-                    out, msg = integratePlanarOrbit_c(
-                        self._pot, vxvvs, t, method, progressbar=progressbar, dt=dt
+                    out = integratePlanarOrbit_c(
+                        self._pot,
+                        vxvvs,
+                        t,
+                        method,
+                        progressbar=progressbar,
+                        dt=dt,
+                        dense_output=dense_output,
+                        events=c_events,
+                        dtype=dtype,
                     )
                 else:
-                    out, msg = integrateFullOrbit_c(
-                        self._pot, vxvvs, t, method, progressbar=progressbar, dt=dt
+                    out = integrateFullOrbit_c(
+                        self._pot,
+                        vxvvs,
+                        t,
+                        method,
+                        progressbar=progressbar,
+                        dt=dt,
+                        dense_output=dense_output,
+                        events=c_events,
+                        dtype=dtype,
                     )
-
-                if self.phasedim() == 3 or self.phasedim() == 5:
-                    out = out[:, :, :-1]
+            if dense_output:
+                self._dense = out[2]
+            if not c_events is None:
+                self._store_events(out[-1], c_events)
+            out, msg = out[:2]
+            if self.dim() > 1 and (self.phasedim() == 3 or self.phasedim() == 5):
+                out = out[:, :, :-1]
         # Store orbit internally
         self.orbit = out
         # Check whether r ever < minr if dynamical friction is included
@@ -1672,7 +1953,7 @@ class Orbit:
         """
         if self.dim() == 1:
             raise NotImplementedError("SOS integration is not supported for 1D orbits")
-        self.check_integrator(method, no_symplec=True)
+        self.check_integrator(method, no_symplec=True, no_lockstep=True)
         pot = flatten_potential(pot)
         _check_potential_dim(self, pot)
         _check_consistent_units(self, pot)
@@ -1690,8 +1971,7 @@ class Orbit:
                 galpyWarning,
             )
         # Delete attributes for interpolation and rperi etc. determination
-        if hasattr(self, "_orbInterp"):
-            delattr(self, "_orbInterp")
+        self._clear_integration_caches()
         if self.dim() == 2:
             thispot = toPlanarPotential(pot)
         else:
@@ -1788,7 +2068,7 @@ class Orbit:
 
         INPUT:
 
-           dxdv - [dR,dvR,dvT,dphi], shape=(*input_shape,4)
+           dxdv - [dR,dvR,dvT,dphi] for 4D orbits or [dR,dvR,dvT,dz,dvz,dphi] for 6D orbits, shape=(*input_shape,phasedim)
 
            t - list of times at which to output (0 has to be in this!) (can be Quantity)
 
@@ -1799,10 +2079,12 @@ class Orbit:
            dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize (only works for the C integrators that use a fixed stepsize) (can be Quantity)
 
            method = 'odeint' for scipy's odeint
+                    'dop853' for a 8-5-3 Dormand-Prince integrator in Python
                     'rk4_c' for a 4th-order Runge-Kutta integrator in C
                     'rk6_c' for a 6-th order Runge-Kutta integrator in C
                     'dopr54_c' for a 5-4 Dormand-Prince integrator in C
                     'dopr853_c' for a 8-5-3 Dormand-Prince integrator in C
+                    'leapfrog_c', 'symplec4_c', 'symplec6_c' for symplectic integrators in C (6D orbits only; these integrate the tangent map symplectically)
 
            rectIn= (False) if True, input dxdv is in rectangular coordinates
 
@@ -1824,19 +2106,17 @@ class Orbit:
 
            2019-05-21 - Parallelized and incorporated into new Orbits class - Bovy (UofT)
 
+           2026-10-19 - Added support for 6D orbits
+
         """
-        if not self.phasedim() == 4:
+        if not self.phasedim() in [4, 6]:
             raise AttributeError(
-                "integrate_dxdv is only implemented for 4D (planar) orbits"
+                "integrate_dxdv is only implemented for 4D (planar) and 6D (full) orbits"
             )
-        if method.lower() not in [
-            "odeint",
-            "dop853",
-            "rk4_c",
-            "rk6_c",
-            "dopr54_c",
-            "dop853_c",
-        ]:
+        valid_methods = ["odeint", "dop853", "rk4_c", "rk6_c", "dopr54_c", "dop853_c"]
+        if self.phasedim() == 6:
+            valid_methods.extend(["leapfrog_c", "symplec4_c", "symplec6_c"])
+        if method.lower() not in valid_methods:
             if "leapfrog" in method.lower() or "symplec" in method.lower():
                 raise ValueError(
                     f"{method:s} is not a valid `method for integrate_dxdv, because symplectic integrators cannot be used`"
@@ -1848,6 +2128,10 @@ class Orbit:
         pot = flatten_potential(pot)
         _check_potential_dim(self, pot)
         _check_consistent_units(self, pot)
+        if _isDissipative(pot):
+            raise NotImplementedError(
+                "integrate_dxdv is not implemented for dissipative forces"
+            )
         # Parse t
         if _APY_LOADED and isinstance(t, units.Quantity):
             self._integrate_t_asQuantity = True
@@ -1863,16 +2147,18 @@ class Orbit:
         else:
             dxdv = numpy.atleast_2d(dxdv)
         # Delete attributes for interpolation and rperi etc. determination
-        if hasattr(self, "_orbInterp"):
-            delattr(self, "_orbInterp")
+        self._clear_integration_caches()
         if self.dim() == 2:
             thispot = toPlanarPotential(pot)
+        else:
+            thispot = pot
         self.t = numpy.array(t)
         self._pot_dxdv = thispot
         self._pot = thispot
         # First check that the potential has C
         if "_c" in method:
-            allHasC = _check_c(pot) and _check_c(pot, dxdv=True)
+            # The 3D C code computes the Jacobian from the C forces
+            allHasC = _check_c(pot) and (self.dim() == 3 or _check_c(pot, dxdv=True))
             if not ext_loaded or (
                 not allHasC and not "leapfrog" in method and not "symplec" in method
             ):
@@ -1903,9 +2189,22 @@ class Orbit:
                     numcores=numcores,
                     dt=dt,
                 )
+            else:
+                out, msg = integrateFullOrbit_dxdv(
+                    self._pot,
+                    self.vxvv,
+                    dxdv,
+                    t,
+                    method,
+                    rectIn,
+                    rectOut,
+                    progressbar=progressbar,
+                    numcores=numcores,
+                    dt=dt,
+                )
         # Store orbit internally
         self.orbit_dxdv = out
-        self.orbit = self.orbit_dxdv[..., :4]
+        self.orbit = self.orbit_dxdv[..., : self.phasedim()]
         return None
 
     def flip(self, inplace=False):
@@ -1930,6 +2229,8 @@ class Orbit:
 
            2019-03-02 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copying read-only, memory-mapped orbits into memory before flipping them in-place
+
         """
         if inplace:
             self.vxvv[..., 1] = -self.vxvv[..., 1]
@@ -1938,13 +2239,16 @@ class Orbit:
             if self.phasedim() > 4:
                 self.vxvv[..., 4] = -self.vxvv[..., 4]
             if hasattr(self, "orbit"):
+                if not self.orbit.flags.writeable:
+                    # Memory-mapped orbits loaded with from_file(mmap=True)
+                    # are read-only: copy them into memory before flipping
+                    self.orbit = numpy.array(self.orbit)
                 self.orbit[..., 1] = -self.orbit[..., 1]
                 if self.phasedim() > 2:
                     self.orbit[..., 2] = -self.orbit[..., 2]
                 if self.phasedim() > 4:
                     self.orbit[..., 4] = -self.orbit[..., 4]
-                if hasattr(self, "_orbInterp"):
-                    delattr(self, "_orbInterp")
+                self._clear_integration_caches()
             return None
         orbSetupKwargs = {
             "ro": self._ro,
@@ -2011,7 +2315,7 @@ class Orbit:
         return out
 
     @shapeDecorator
-    def getOrbit(self):
+    def getOrbit(self, copy=True):
         """
 
         NAME:
@@ -2024,7 +2328,7 @@ class Orbit:
 
         INPUT:
 
-           (none)
+           copy= (True) if False, return a view of the stored orbits rather than a copy (the view should not be modified)
 
         OUTPUT:
 
@@ -2034,8 +2338,99 @@ class Orbit:
 
            2019-03-02 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
+        """
+        return self.orbit.copy() if copy else self.orbit
+
+    def getEvents(self, event):
+        """
+
+        NAME:
+
+           getEvents
+
+        PURPOSE:
+
+           return the events detected during the previous integration (with events=)
+
+        INPUT:
+
+           event - name of the event ('pericenter', 'apocenter', 'zcross', 'zmax', or 'escape')
+
+        OUTPUT:
+
+           (indx,t,vxvv) with indx the (flattened) index of the orbit for each event, t the time of each event, and vxvv[nevent,nphasedim] the phase-space position at each event
+
+        HISTORY:
+
+           2026-10-19 - Written
+
         """
-        return self.orbit.copy()
+        if not "_events" in self.__dict__ or not event in self._events:
+            raise ValueError(
+                f"Event {event} was not detected during the previous integration; integrate with events= including it"
+            )
+        return tuple(e.copy() for e in self._events[event])
+
+    def _parse_events(self, events, terminate, method):
+        """Parse the events= and terminate= inputs of integrate into a list of (name,parameter,terminal)"""
+        if events is None:
+            if not terminate is None:
+                raise ValueError("terminate= requires events=")
+            return None
+        if not method.lower() in ["dopr54_c", "dop853_c"]:
+            raise ValueError(
+                "events are only supported for method='dopr54_c' or 'dop853_c'"
+            )
+        if self.dim() == 1:
+            raise ValueError("events are not supported for one-dimensional orbits")
+        if terminate is None:
+            terminate = []
+        out = []
+        for event in events:
+            if isinstance(event, str):
+                name, par = event, 0.0
+            else:
+                name, par = event
+                par = conversion.parse_length(par, ro=self._ro)
+            if not name in _EVENT_TYPES:
+                raise ValueError(f"{name} is not a valid event")
+            if name == "escape" and isinstance(event, str):
+                raise ValueError("The escape event requires a radius: ('escape',r)")
+            if name in ["zcross", "zmax"] and self.dim() == 2:
+                raise ValueError(f"{name} event is not supported for planar orbits")
+            out.append((name, par, name in terminate))
+        for name in terminate:
+            if not name in [ev[0] for ev in out]:
+                raise ValueError(f"Terminating event {name} is not included in events=")
+        return out
+
+    def _store_events(self, events, c_events):
+        """Store the events detected by the C integrators as (indx,t,vxvv) for each event name"""
+        indx = numpy.concatenate(
+            [numpy.full(len(ev[0]), ii, dtype="int") for ii, ev in enumerate(events)]
+        )
+        t = numpy.concatenate([ev[0] for ev in events])
+        event_indx = numpy.concatenate([ev[1] for ev in events])
+        rect = numpy.concatenate([ev[2] for ev in events], axis=0)
+        vxvv = self._rect_to_phasespace(rect.T).T
+        self._events = {}
+        # Time at which each orbit was terminated (inf if not)
+        sgn = numpy.sign(self.t[-1] - self.t[0])
+        self._tterm = numpy.full(len(events), sgn * numpy.inf)
+        for ii, (name, _, terminal) in enumerate(c_events):
+            tindx = event_indx == ii
+            if terminal:
+                self._tterm[indx[tindx]] = t[tindx]
+            # Sort by orbit and time
+            sindx = numpy.lexsort((sgn * t[tindx], indx[tindx]))
+            self._events[name] = (
+                indx[tindx][sindx],
+                t[tindx][sindx],
+                vxvv[tindx][sindx],
+            )
+        return None
 
     @shapeDecorator
     def getOrbit_dxdv(self):
@@ -2062,7 +2457,108 @@ class Orbit:
            2019-05-21 - Written - Bovy (UofT)
 
         """
-        return self.orbit_dxdv[..., 4:].copy()
+        return self.orbit_dxdv[..., self.phasedim() :].copy()
+
+    @physical_conversion("frequency")
+    @shapeDecorator
+    def lyapunov_exponents(
+        self,
+        t,
+        pot,
+        nexp=1,
+        method="dopr54_c",
+        progressbar=True,
+        dt=None,
+        **kwargs,
+    ):
+        """
+        NAME:
+
+           lyapunov_exponents
+
+        PURPOSE:
+
+           estimate the Lyapunov exponents of the orbit by integrating the variational equations in C, re-orthonormalizing the deviation vectors at each time in t
+
+        INPUT:
+
+           t - list of times at which to re-orthonormalize and output the running estimate (can be Quantity)
+
+           pot - potential instance or list of instances
+
+           nexp= (1) number of Lyapunov exponents to compute (the largest nexp, between 1 and 6)
+
+           method= ('dopr54_c') C integrator to use ('leapfrog_c', 'symplec4_c', 'symplec6_c', 'rk4_c', 'rk6_c', 'dopr54_c', 'dop853_c')
+
+           progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+
+           dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize (only works for the C integrators that use a fixed stepsize) (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert
+
+           vo= (Object-wide default) physical scale for velocities to use to convert
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           running estimates of the Lyapunov exponents [*input_shape,nt,nexp] (the estimate at t[0] is NaN)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        if not self.phasedim() == 6:
+            raise AttributeError(
+                "lyapunov_exponents is only implemented for 6D (full) orbits"
+            )
+        if not ext_loaded:  # pragma: no cover
+            raise RuntimeError(
+                "lyapunov_exponents requires the C extension to be loaded"
+            )
+        if method.lower() not in [
+            "leapfrog_c",
+            "symplec4_c",
+            "symplec6_c",
+            "rk4_c",
+            "rk6_c",
+            "dopr54_c",
+            "dop853_c",
+        ]:
+            raise ValueError(
+                f"{method:s} is not a valid `method for lyapunov_exponents` (only C integrators are supported)"
+            )
+        if nexp < 1 or nexp > 6:
+            raise ValueError("nexp must be between 1 and 6")
+        pot = flatten_potential(pot)
+        _check_potential_dim(self, pot)
+        _check_consistent_units(self, pot)
+        if _isDissipative(pot):
+            raise NotImplementedError(
+                "lyapunov_exponents is not implemented for dissipative forces"
+            )
+        if not _check_c(pot):
+            raise NotImplementedError(
+                "lyapunov_exponents requires all potentials to have a C implementation"
+            )
+        t = conversion.parse_time(t, ro=self._ro, vo=self._vo)
+        t = numpy.array(t, dtype="float")
+        if not dt is None:
+            dt = conversion.parse_time(dt, ro=self._ro, vo=self._vo)
+        lnstretch, msg = integrateFullOrbit_lyapunov_c(
+            pot,
+            _cyl_to_rect(self.vxvv),
+            t,
+            method,
+            nexp=nexp,
+            progressbar=progressbar,
+            dt=dt,
+        )
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            out = lnstretch / (t - t[0])[:, None]
+        out[:, 0] = numpy.nan
+        return out
 
     @physical_conversion("energy")
     @shapeDecorator
@@ -2586,7 +3082,10 @@ class Orbit:
                 "Orbit action-angle methods are not supported for 1D orbits"
             )
         delta = kwargs.pop("delta", None)
-        if not delta is None:
+        delta_interp = isinstance(delta, str) and delta.lower() == "interp"
+        if delta_interp:
+            delta = None
+        elif not delta is None:
             delta = conversion.parse_length(delta, ro=self._ro)
         b = kwargs.pop("b", None)
         if not b is None:
@@ -2610,6 +3109,10 @@ class Orbit:
                     and hasattr(self, "_aA_delta_automagic")
                     and not self._aA_delta_automagic
                 )
+                or (
+                    hasattr(self, "_aA_delta_interp")
+                    and delta_interp != self._aA_delta_interp
+                )
                 or (
                     not b is None
                     and hasattr(self._aA, "_aAI")
@@ -2644,6 +3147,7 @@ class Orbit:
                 * 1e-10
             )
             self._aA_delta_automagic = False
+            self._aA_delta_interp = delta_interp
             if delta is None:
                 self._aA_delta_automagic = True
                 try:
@@ -2652,6 +3156,7 @@ class Orbit:
                         self.R(use_physical=False, dontreshape=True),
                         tz,
                         no_median=True,
+                        interp=delta_interp,
                         use_physical=False,
                     )
                 except PotentialError as e:
@@ -3820,6 +4325,8 @@ class Orbit:
 
            use_physical= use to override Object-wide default for using a physical scale for output
 
+           copy= (True) if False, return a view of the stored orbit rather than a copy when evaluating at the integration times without physical conversion (the view should not be modified)
+
         OUTPUT:
 
            R(t) [*input_shape,nt]
@@ -3828,8 +4335,10 @@ class Orbit:
 
            2019-02-01 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
         """
-        return self._call_internal(*args, **kwargs)[0].T
+        return self._component(0, *args, **kwargs)
 
     @physical_conversion("position")
     @shapeDecorator
@@ -3886,6 +4395,8 @@ class Orbit:
 
            use_physical= use to override Object-wide default for using a physical scale for output
 
+           copy= (True) if False, return a view of the stored orbit rather than a copy when evaluating at the integration times without physical conversion (the view should not be modified)
+
         OUTPUT:
 
            vR(t) [*input_shape,nt]
@@ -3894,8 +4405,10 @@ class Orbit:
 
            2019-02-20 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
         """
-        return self._call_internal(*args, **kwargs)[1].T
+        return self._component(1, *args, **kwargs)
 
     @physical_conversion("velocity")
     @shapeDecorator
@@ -3917,6 +4430,8 @@ class Orbit:
 
            use_physical= use to override Object-wide default for using a physical scale for output
 
+           copy= (True) if False, return a view of the stored orbit rather than a copy when evaluating at the integration times without physical conversion (the view should not be modified)
+
         OUTPUT:
 
            vT(t) [*input_shape,nt]
@@ -3925,8 +4440,10 @@ class Orbit:
 
            2019-02-20 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
         """
-        return self._call_internal(*args, **kwargs)[2].T
+        return self._component(2, *args, **kwargs)
 
     @physical_conversion("position")
     @shapeDecorator
@@ -3948,6 +4465,8 @@ class Orbit:
 
            use_physical= use to override Object-wide default for using a physical scale for output
 
+           copy= (True) if False, return a view of the stored orbit rather than a copy when evaluating at the integration times without physical conversion (the view should not be modified)
+
         OUTPUT:
 
            z(t) [*input_shape,nt]
@@ -3956,10 +4475,12 @@ class Orbit:
 
            2019-02-20 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
         """
         if self.dim() < 3:
             raise AttributeError("linear and planar orbits do not have z()")
-        return self._call_internal(*args, **kwargs)[3].T
+        return self._component(3, *args, **kwargs)
 
     @physical_conversion("velocity")
     @shapeDecorator
@@ -3981,6 +4502,8 @@ class Orbit:
 
            use_physical= use to override Object-wide default for using a physical scale for output
 
+           copy= (True) if False, return a view of the stored orbit rather than a copy when evaluating at the integration times without physical conversion (the view should not be modified)
+
         OUTPUT:
 
            vz(t) [*input_shape,nt]
@@ -3989,10 +4512,12 @@ class Orbit:
 
            2019-02-20 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
         """
         if self.dim() < 3:
             raise AttributeError("linear and planar orbits do not have vz()")
-        return self._call_internal(*args, **kwargs)[4].T
+        return self._component(4, *args, **kwargs)
 
     @physical_conversion("angle")
     @shapeDecorator
@@ -4010,6 +4535,8 @@ class Orbit:
 
            t - (optional) time at which to get the azimuth
 
+           copy= (True) if False, return a view of the stored orbit rather than a copy when evaluating at the integration times without physical conversion (the view should not be modified)
+
         OUTPUT:
 
            phi(t) [*input_shape,nt] in [-pi,pi]
@@ -4018,10 +4545,12 @@ class Orbit:
 
            2019-02-20 - Written - Bovy (UofT)
 
+           2026-10-19 - Added copy=
+
         """
         if self.phasedim() != 4 and self.phasedim() != 6:
             raise AttributeError("Orbit must track azimuth to use phi()")
-        return self._call_internal(*args, **kwargs)[-1].T
+        return self._component(-1, *args, **kwargs)
 
     @physical_conversion("position")
     @shapeDecorator
@@ -4052,10 +4581,10 @@ class Orbit:
            2019-02-20 - Written - Bovy (UofT)
 
         """
-        thiso = self._call_internal(*args, **kwargs)
         if self.dim() == 1:
-            return thiso[0].T
-        elif self.phasedim() != 4 and self.phasedim() != 6:
+            return self._component(0, *args, **kwargs)
+        thiso = self._call_internal(*args, **kwargs)
+        if self.phasedim() != 4 and self.phasedim() != 6:
             raise AttributeError("Orbit must track azimuth to use x()")
         else:
             return (thiso[0] * numpy.cos(thiso[-1, :])).T
@@ -4124,10 +4653,10 @@ class Orbit:
            2019-02-20 - Written - Bovy (UofT)
 
         """
-        thiso = self._call_internal(*args, **kwargs)
         if self.dim() == 1:
-            return thiso[1].T
-        elif self.phasedim() != 4 and self.phasedim() != 6:
+            return self._component(1, *args, **kwargs)
+        thiso = self._call_internal(*args, **kwargs)
+        if self.phasedim() != 4 and self.phasedim() != 6:
             raise AttributeError("Orbit must track azimuth to use vx()")
         else:
             return (thiso[1] * numpy.cos(thiso[-1]) - thiso[2] * numpy.sin(thiso[-1])).T
@@ -4228,12 +4757,11 @@ class Orbit:
            2020-07-01 - Written - James Lane (UofT)
 
         """
+        if self.dim() != 3:
+            return self._component(1, *args, **kwargs)
         thiso = self._call_internal(*args, **kwargs)
-        if self.dim() == 3:
-            r = numpy.sqrt(thiso[0] ** 2.0 + thiso[3] ** 2.0)
-            return ((thiso[0] * thiso[1] + thiso[3] * thiso[4]) / r).T
-        else:
-            return thiso[1].T
+        r = numpy.sqrt(thiso[0] ** 2.0 + thiso[3] ** 2.0)
+        return ((thiso[0] * thiso[1] + thiso[3] * thiso[4]) / r).T
 
     @physical_conversion("velocity")
     @shapeDecorator
@@ -4337,10 +4865,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "ra")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _radec(self, thiso, *args, **kwargs).T[0].reshape(thiso_shape[1:]).T
+        return _observables(self, ["ra"], *args, **kwargs)["ra"].T
 
     @physical_conversion("angle_deg")
     @shapeDecorator
@@ -4377,10 +4902,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "dec")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _radec(self, thiso, *args, **kwargs).T[1].reshape(thiso_shape[1:]).T
+        return _observables(self, ["dec"], *args, **kwargs)["dec"].T
 
     @physical_conversion("angle_deg")
     @shapeDecorator
@@ -4417,10 +4939,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "ll")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _lbd(self, thiso, *args, **kwargs).T[0].reshape(thiso_shape[1:]).T
+        return _observables(self, ["ll"], *args, **kwargs)["ll"].T
 
     @physical_conversion("angle_deg")
     @shapeDecorator
@@ -4457,10 +4976,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "bb")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _lbd(self, thiso, *args, **kwargs).T[1].reshape(thiso_shape[1:]).T
+        return _observables(self, ["bb"], *args, **kwargs)["bb"].T
 
     @physical_conversion("position_kpc")
     @shapeDecorator
@@ -4497,10 +5013,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "dist")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _lbd(self, thiso, *args, **kwargs).T[2].reshape(thiso_shape[1:]).T
+        return _observables(self, ["dist"], *args, **kwargs)["dist"].T
 
     @physical_conversion("proper-motion_masyr")
     @shapeDecorator
@@ -4540,10 +5053,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "pmra")
         _check_voSet(self, kwargs, "pmra")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _pmrapmdec(self, thiso, *args, **kwargs).T[0].reshape(thiso_shape[1:]).T
+        return _observables(self, ["pmra"], *args, **kwargs)["pmra"].T
 
     @physical_conversion("proper-motion_masyr")
     @shapeDecorator
@@ -4583,10 +5093,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "pmdec")
         _check_voSet(self, kwargs, "pmdec")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _pmrapmdec(self, thiso, *args, **kwargs).T[1].reshape(thiso_shape[1:]).T
+        return _observables(self, ["pmdec"], *args, **kwargs)["pmdec"].T
 
     @physical_conversion("proper-motion_masyr")
     @shapeDecorator
@@ -4626,12 +5133,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "pmll")
         _check_voSet(self, kwargs, "pmll")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return (
-            _lbdvrpmllpmbb(self, thiso, *args, **kwargs).T[4].reshape(thiso_shape[1:]).T
-        )
+        return _observables(self, ["pmll"], *args, **kwargs)["pmll"].T
 
     @physical_conversion("proper-motion_masyr")
     @shapeDecorator
@@ -4671,12 +5173,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "pmbb")
         _check_voSet(self, kwargs, "pmbb")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return (
-            _lbdvrpmllpmbb(self, thiso, *args, **kwargs).T[5].reshape(thiso_shape[1:]).T
-        )
+        return _observables(self, ["pmbb"], *args, **kwargs)["pmbb"].T
 
     @physical_conversion("velocity_kms")
     @shapeDecorator
@@ -4716,12 +5213,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "vlos")
         _check_voSet(self, kwargs, "vlos")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return (
-            _lbdvrpmllpmbb(self, thiso, *args, **kwargs).T[3].reshape(thiso_shape[1:]).T
-        )
+        return _observables(self, ["vlos"], *args, **kwargs)["vlos"].T
 
     @shapeDecorator
     def vra(self, *args, **kwargs):
@@ -4966,10 +5458,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "helioX")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _helioXYZ(self, thiso, *args, **kwargs)[0].reshape(thiso_shape[1:]).T
+        return _observables(self, ["helioX"], *args, **kwargs)["helioX"].T
 
     @physical_conversion("position_kpc")
     @shapeDecorator
@@ -5006,10 +5495,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "helioY")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _helioXYZ(self, thiso, *args, **kwargs)[1].reshape(thiso_shape[1:]).T
+        return _observables(self, ["helioY"], *args, **kwargs)["helioY"].T
 
     @physical_conversion("position_kpc")
     @shapeDecorator
@@ -5046,10 +5532,7 @@ class Orbit:
 
         """
         _check_roSet(self, kwargs, "helioZ")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _helioXYZ(self, thiso, *args, **kwargs)[2].reshape(thiso_shape[1:]).T
+        return _observables(self, ["helioZ"], *args, **kwargs)["helioZ"].T
 
     @physical_conversion("velocity_kms")
     @shapeDecorator
@@ -5089,10 +5572,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "U")
         _check_voSet(self, kwargs, "U")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _XYZvxvyvz(self, thiso, *args, **kwargs)[3].reshape(thiso_shape[1:]).T
+        return _observables(self, ["U"], *args, **kwargs)["U"].T
 
     @physical_conversion("velocity_kms")
     @shapeDecorator
@@ -5132,10 +5612,7 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "V")
         _check_voSet(self, kwargs, "V")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _XYZvxvyvz(self, thiso, *args, **kwargs)[4].reshape(thiso_shape[1:]).T
+        return _observables(self, ["V"], *args, **kwargs)["V"].T
 
     @physical_conversion("velocity_kms")
     @shapeDecorator
@@ -5175,10 +5652,58 @@ class Orbit:
         """
         _check_roSet(self, kwargs, "W")
         _check_voSet(self, kwargs, "W")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        return _XYZvxvyvz(self, thiso, *args, **kwargs)[5].reshape(thiso_shape[1:]).T
+        return _observables(self, ["W"], *args, **kwargs)["W"].T
+
+    def observables(self, *args, **kwargs):
+        """
+        NAME:
+
+           observables
+
+        PURPOSE:
+
+           return several heliocentric and on-sky observables at once, computing them in a single pass that shares the orbit evaluation and all coordinate transformations; the results are memoised, such that subsequently calling the individual methods (e.g., ra, pmra) for the same times, ro, vo, zo, solarmotion, and obs is free
+
+        INPUT:
+
+           t - (optional) time at which to get the observables
+
+           which= (['ra','dec','dist','pmra','pmdec','vlos']) list of observables to return, any of 'ra', 'dec', 'dist', 'll', 'bb', 'helioX', 'helioY', 'helioZ', 'pmra', 'pmdec', 'pmll', 'pmbb', 'vlos', 'U', 'V', and 'W'
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer
+                         (in kpc and km/s) (default=Object-wide default)
+                         OR Orbit object that corresponds to the orbit
+                         of the observer (the observables are not memoised in this case);
+                         Note that when Y is non-zero, the coordinate system is
+                         rotated around z such that Y'=0
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           dictionary with each observable in which as returned by the method of the same name [*input_shape,nt]
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        which = kwargs.pop("which", ["ra", "dec", "dist", "pmra", "pmdec", "vlos"])
+        for name in which:
+            if not name in _OBSERVABLES_POS + _OBSERVABLES_VEL:
+                raise ValueError(f"{name} is not a valid observable")
+        _check_roSet(self, kwargs, "observables")
+        if numpy.any([name in _OBSERVABLES_VEL for name in which]):
+            _check_voSet(self, kwargs, "observables")
+        with warnings.catch_warnings():  # Only warn about ro/vo once
+            warnings.simplefilter("ignore", galpyWarning)
+            # Compute all observables in one pass, such that they are memoised
+            # for the individual methods below
+            if _observables_cache_key(self, args, kwargs) is not None:
+                _observables(self, which, *args, **kwargs)
+            return {name: getattr(self, name)(*args, **kwargs) for name in which}
 
     @shapeDecorator
     def SkyCoord(self, *args, **kwargs):
@@ -5216,27 +5741,19 @@ class Orbit:
 
         """
         kwargs.pop("quantity", None)  # rm useless keyword to no conflict later
-        kwargs["dontreshape"] = True
         _check_roSet(self, kwargs, "SkyCoord")
-        thiso = self._call_internal(*args, **kwargs)
-        thiso_shape = thiso.shape
-        thiso = thiso.reshape((thiso_shape[0], -1))
-        radec = _radec(self, thiso, *args, **kwargs).T.reshape((2,) + thiso_shape[1:])
-        tdist = self.dist(quantity=False, *args, **kwargs).T
         if not _APY3:  # pragma: no cover
-            kwargs.pop("dontreshape")
+            obs = _observables(self, ["ra", "dec", "dist"], *args, **kwargs)
             return coordinates.SkyCoord(
-                radec[0] * units.degree,
-                radec[1] * units.degree,
-                distance=tdist * units.kpc,
+                obs["ra"] * units.degree,
+                obs["dec"] * units.degree,
+                distance=obs["dist"] * units.kpc,
                 frame="icrs",
             ).T
         _check_voSet(self, kwargs, "SkyCoord")
-        pmrapmdec = _pmrapmdec(self, thiso, *args, **kwargs).T.reshape(
-            (2,) + thiso_shape[1:]
+        obs = _observables(
+            self, ["ra", "dec", "dist", "pmra", "pmdec", "vlos"], *args, **kwargs
         )
-        tvlos = self.vlos(quantity=False, *args, **kwargs).T
-        kwargs.pop("dontreshape")
         # Also return the Galactocentric frame used
         v_sun = coordinates.CartesianDifferential(
             numpy.array(
@@ -5250,12 +5767,12 @@ class Orbit:
             / units.s
         )
         return coordinates.SkyCoord(
-            radec[0] * units.degree,
-            radec[1] * units.degree,
-            distance=tdist * units.kpc,
-            pm_ra_cosdec=pmrapmdec[0] * units.mas / units.yr,
-            pm_dec=pmrapmdec[1] * units.mas / units.yr,
-            radial_velocity=tvlos * units.km / units.s,
+            obs["ra"] * units.degree,
+            obs["dec"] * units.degree,
+            distance=obs["dist"] * units.kpc,
+            pm_ra_cosdec=obs["pmra"] * units.mas / units.yr,
+            pm_dec=obs["pmdec"] * units.mas / units.yr,
+            radial_velocity=obs["vlos"] * units.km / units.s,
             frame="icrs",
             galcen_distance=numpy.sqrt(self._ro**2.0 + self._zo**2.0) * units.kpc,
             z_sun=self._zo * units.kpc,
@@ -5274,6 +5791,7 @@ class Orbit:
         progressbar=True,
         numcores=_NUMCORES,
         force_map=False,
+        tmax=None,
         **kwargs,
     ):
         """
@@ -5312,6 +5830,8 @@ class Orbit:
 
                 force_map= (False) if True, force use of Python-based multiprocessing (not recommended)
 
+            tmax= (None) if set, integrate in time for at most tmax (can be Quantity) and find the crossings on the dense output of the integrator using crossings, which is typically faster (only for method='dopr54_c' or 'dop853_c'); crossings that do not occur before t0+tmax are NaN
+
         OUTPUT:
 
             (R,vR) for 3D orbits, (y,vy) for 2D orbits when surface=='x', (x,vx) for 2D orbits when surface=='y'
@@ -5320,6 +5840,8 @@ class Orbit:
 
             2023-03-16 - Written - Bovy (UofT)
 
+            2026-10-19 - Added tmax
+
         """
         if self.dim() == 3:
             init_psis = numpy.arctan2(
@@ -5365,6 +5887,32 @@ class Orbit:
             raise RuntimeError(
                 "An orbit appears to be within the SOS surface. Refusing to perform specialized SOS integration, please use normal integration instead"
             )
+        if not tmax is None:
+            _, vxvv = self.crossings(
+                pot,
+                tmax,
+                ncross=ncross,
+                surface=surface,
+                t0=t0,
+                method=method,
+                progressbar=progressbar,
+            )
+            # As for the integration in psi, an initial condition that is in
+            # the surface is the first point of the SOS
+            vxvv = vxvv.reshape((self.size, ncross, self.phasedim()))
+            insos = numpy.fabs(numpy.atleast_1d(init_psis).flatten()) <= 1e-10
+            vxvv[insos, 1:] = vxvv[insos, :-1]
+            vxvv[insos, 0] = self.vxvv[insos]
+            vxvv = vxvv.reshape(self.shape + (ncross, self.phasedim()))
+            if self.dim() == 3:
+                return (vxvv[..., 0], vxvv[..., 1])
+            R, vR, vT, phi = (vxvv[..., ii] for ii in range(4))
+            if not surface is None and surface.lower() == "y":
+                return (
+                    R * numpy.cos(phi),
+                    vR * numpy.cos(phi) - vT * numpy.sin(phi),
+                )
+            return (R * numpy.sin(phi), vR * numpy.sin(phi) + vT * numpy.cos(phi))
         if numpy.any(numpy.fabs(init_psis) > 1e-10):
             # Integrate to the next crossing
             init_psis = numpy.atleast_1d(
@@ -5426,6 +5974,111 @@ class Orbit:
             self.vxvv = old_vxvv
         return out
 
+    def crossings(
+        self,
+        pot,
+        tmax,
+        ncross=500,
+        surface=None,
+        t0=0.0,
+        method="dop853_c",
+        dt=None,
+        progressbar=True,
+    ):
+        """
+        NAME:
+
+            crossings
+
+        PURPOSE:
+
+            compute the crossings of the orbit with a surface of section by integrating in time in C and finding the crossings with root-finding on the continuous extension of each integration step; only the crossings are computed and stored, which makes this an efficient way to compute surfaces of section and return maps for many orbits
+
+        INPUT:
+
+            pot - Potential or list of such instances
+
+            tmax - maximum integration time (can be Quantity); the integration of each orbit stops once it has crossed the surface ncross times or at t0+tmax (can be negative to integrate backwards)
+
+            ncross= (500) number of times to cross the surface
+
+            surface= (None) surface to punch through (this has no effect in 3D, where the surface is always z=0, but in 2D it can be 'x' or 'y' for x=0 or y=0); only upward crossings (v(x/y/z) > 0) are counted
+
+            t0= (0.) time of the initial condition (can be a Quantity; can be an array with a different time for each orbit)
+
+            method= ('dop853_c') 'dopr54_c' or 'dop853_c'
+
+            dt= (None) initial step size to use (can be Quantity; default: determine automatically)
+
+            progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+
+        OUTPUT:
+
+            (t,vxvv) with t[shape,ncross] the times of the crossings and vxvv[shape,ncross,phasedim] the phase-space positions at the crossings (in internal units); crossings that do not occur before t0+tmax are NaN
+
+        HISTORY:
+
+            2026-10-19 - Written
+
+        """
+        if self.dim() == 1 or self.phasedim() == 3:
+            raise NotImplementedError(
+                "SOS not implemented for 1D orbits or 2D orbits without phi"
+            )
+        if not method.lower() in ["dopr54_c", "dop853_c"]:
+            raise ValueError(
+                "crossings are only supported for method='dopr54_c' or 'dop853_c'"
+            )
+        pot = flatten_potential(pot)
+        _check_potential_dim(self, pot)
+        _check_consistent_units(self, pot)
+        if self.dim() == 2:
+            pot = toPlanarPotential(pot)
+        if not ext_loaded or not _check_c(pot):
+            raise ValueError(
+                "crossings can only be computed with the C integrators, but C integration is not possible for this potential"
+            )
+        if _APY_LOADED and isinstance(tmax, units.Quantity):
+            tmax = conversion.parse_time(tmax, ro=self._ro, vo=self._vo)
+        if _APY_LOADED and isinstance(t0, units.Quantity):
+            t0 = conversion.parse_time(t0, ro=self._ro, vo=self._vo)
+        if _APY_LOADED and isinstance(dt, units.Quantity):
+            dt = conversion.parse_time(dt, ro=self._ro, vo=self._vo)
+        if self.phasedim() == 5:
+            # We hack this by putting in a dummy phi=0
+            vxvvs = numpy.pad(
+                self.vxvv, ((0, 0), (0, 1)), "constant", constant_values=0
+            )
+        else:
+            vxvvs = numpy.copy(self.vxvv)
+        if self.dim() == 2:
+            out, msg = integratePlanarOrbit_crossings_c(
+                pot,
+                vxvvs,
+                ncross,
+                t0,
+                tmax,
+                method,
+                surface="x" if surface is None else surface.lower(),
+                progressbar=progressbar,
+                dt=dt,
+            )
+        else:
+            out, msg = integrateFullOrbit_crossings_c(
+                pot, vxvvs, ncross, t0, tmax, method, progressbar=progressbar, dt=dt
+            )
+            if self.phasedim() == 5:
+                out = out[:, :, [0, 1, 2, 3, 4, 6]]
+        if numpy.any(msg != 0):
+            warnings.warn(
+                "The integration of some orbits reached the maximum step-size reduction, so their crossings may be inaccurate",
+                galpyWarning,
+            )
+        return (
+            out[:, :, -1].reshape(self.shape + (ncross,)),
+            out[:, :, :-1].reshape(self.shape + (ncross, self.phasedim())),
+        )
+
     def __call__(self, *args, **kwargs):
         """
         NAME:
@@ -5458,7 +6111,7 @@ class Orbit:
             "zo": self._zo,
             "solarmotion": self._solarmotion,
         }
-        thiso = self._call_internal(*args, **kwargs)
+        thiso = numpy.array(self._call_internal(*args, **kwargs))
         out = Orbit(
             vxvv=numpy.reshape(thiso.T, self.shape + thiso.T.shape[1:]),
             **orbSetupKwargs,
@@ -5467,6 +6120,18 @@ class Orbit:
         out._voSet = self._voSet
         return out
 
+    def _component(self, indx, *args, **kwargs):
+        """Return the phase-space coordinate indx at time t, as a view of the stored orbit if copy=False"""
+        out = self._call_internal(*args, **kwargs)[indx].T
+        orbit = self.__dict__.get("orbit", None)
+        if (
+            kwargs.get("copy", True)
+            and not orbit is None
+            and numpy.may_share_memory(out, orbit)
+        ):
+            return out.copy()
+        return out
+
     def _call_internal(self, *args, **kwargs):
         """
         NAME:
@@ -5521,8 +6186,9 @@ class Orbit:
             )
         if (
             t_exact_integration_times
-        ):  # Common case where one wants all integrated times
-            return self.orbit.T.copy()
+        ):  # Common case where one wants all integrated times; callers that
+            # return the output without a new array being created copy
+            return self.orbit.T
         elif (
             isinstance(t, (int, float, numpy.number))
             and hasattr(self, "t")
@@ -5539,6 +6205,9 @@ class Orbit:
                 t < numpy.nanmin(self.t)
             ):
                 raise ValueError("Found time value not in the integration time domain")
+            if "_dense" in self.__dict__:  # Use the integrator's dense output
+                out = self._eval_dense(t)
+                return out[:, 0] if nt == 1 else out
             try:
                 self._setupOrbitInterp()
             except:
@@ -5651,6 +6320,35 @@ class Orbit:
         out._voSet = self._voSet
         return out
 
+    def _eval_dense(self, t):
+        """Evaluate the orbits at times t using the dense output of the integrator; returns [phasedim,nt,norb]"""
+        out = numpy.empty((self.phasedim(), len(t), self.size))
+        sgn = numpy.sign(self.t[-1] - self.t[0])
+        for ii, (tstep, coeff) in enumerate(self._dense):
+            out[:, :, ii] = self._rect_to_phasespace(
+                _eval_dense_output(tstep, coeff, t).T
+            )
+            if "_tterm" in self.__dict__:  # NaN after a terminal event
+                out[:, sgn * t > sgn * self._tterm[ii], ii] = numpy.nan
+        return out
+
+    def _rect_to_phasespace(self, rect):
+        """Convert rectangular coordinates as used by the C integrators [dim,N] to the phase-space coordinates of this Orbit [phasedim,N]"""
+        if self.dim() == 1:
+            return rect
+        elif self.dim() == 2:
+            x, y, vx, vy = rect
+            z, vz = 0.0, 0.0
+        else:
+            x, y, z, vx, vy, vz = rect
+        R, phi, z = coords.rect_to_cyl(x, y, z)
+        vR, vT, vz = coords.rect_to_cyl_vec(vx, vy, vz, x, y, z)
+        if self.dim() == 2:
+            cyl = [R, vR, vT, phi]
+        else:
+            cyl = [R, vR, vT, z, vz, phi]
+        return numpy.array(cyl[: self.phasedim()])
+
     def _setupOrbitInterp(self):
         if hasattr(self, "_orbInterp"):
             return None
@@ -6006,6 +6704,7 @@ class Orbit:
         method="dop853_c",
         skip=100,
         progressbar=True,
+        tmax=None,
         **kwargs,
     ):
         """
@@ -6040,6 +6739,8 @@ class Orbit:
 
                 progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
 
+                tmax= (None) if set, integrate in time for at most tmax (can be Quantity) and find the crossings on the dense output of the integrator (see SOS)
+
                 for more control of the integrator, use the SOS method directly and plot its results
 
            matplotlib.plot inputs+galpy.util.plot.plot inputs
@@ -6052,6 +6753,8 @@ class Orbit:
 
            2023-03-16 - Written - Bovy (UofT)
 
+           2026-10-19 - Added tmax
+
         """
         if (kwargs.get("use_physical", False) and kwargs.get("ro", self._roSet)) or (
             not "use_physical" in kwargs and kwargs.get("ro", self._roSet)
@@ -6078,6 +6781,7 @@ class Orbit:
             method=method,
             skip=skip,
             progressbar=progressbar,
+            tmax=tmax,
             **kwargs,
         )
         x = numpy.atleast_2d(x)
@@ -6105,7 +6809,9 @@ class Orbit:
                 kwargs["marker"] = "."
         for ii, (tx, ty) in enumerate(zip(x, y)):
             kwargs["label"] = labels[ii]
-            line2d = plot.plot(tx, ty, *args, **kwargs)[0]
+            # Crossings that did not occur before tmax are NaN
+            indx = numpy.isfinite(tx)
+            line2d = plot.plot(tx[indx], ty[indx], *args, **kwargs)[0]
             kwargs["overplot"] = True
         if auto_scale:
             line2d.axes.autoscale(enable=True)
@@ -7925,22 +8631,6 @@ def _helioXYZ(orb, thiso, *args, **kwargs):
     return (X * ro, Y * ro, Z * ro)
 
 
-def _lbd(orb, thiso, *args, **kwargs):
-    """Calculate l,b, and d"""
-    obs, ro, vo = _parse_radec_kwargs(orb, kwargs, dontpop=True)
-    X, Y, Z = _helioXYZ(orb, thiso, *args, **kwargs)
-    bad_indx = (X == 0.0) * (Y == 0.0) * (Z == 0.0)
-    if True in bad_indx:
-        X[bad_indx] += 1e-15
-    return coords.XYZ_to_lbd(X, Y, Z, degree=True)
-
-
-def _radec(orb, thiso, *args, **kwargs):
-    """Calculate ra and dec"""
-    lbd = _lbd(orb, thiso, *args, **kwargs)
-    return coords.lb_to_radec(lbd[:, 0], lbd[:, 1], degree=True, epoch=None)
-
-
 def _XYZvxvyvz(orb, thiso, *args, **kwargs):
     """Calculate X,Y,Z,U,V,W"""
     obs, ro, vo = _parse_radec_kwargs(orb, kwargs, vel=True)
@@ -8101,29 +8791,100 @@ def _XYZvxvyvz(orb, thiso, *args, **kwargs):
     return (X * ro, Y * ro, Z * ro, vX * vo, vY * vo, vZ * vo)
 
 
-def _lbdvrpmllpmbb(orb, thiso, *args, **kwargs):
-    """Calculate l,b,d,vr,pmll,pmbb"""
-    obs, ro, vo = _parse_radec_kwargs(orb, kwargs, dontpop=True)
-    X, Y, Z, vX, vY, vZ = _XYZvxvyvz(orb, thiso, *args, **kwargs)
-    bad_indx = (X == 0.0) * (Y == 0.0) * (Z == 0.0)
-    if True in bad_indx:
-        X[bad_indx] += ro / 10000.0
-    return coords.rectgal_to_sphergal(X, Y, Z, vX, vY, vZ, degree=True)
-
-
-def _pmrapmdec(orb, thiso, *args, **kwargs):
-    """Calculate pmra and pmdec"""
-    lbdvrpmllpmbb = _lbdvrpmllpmbb(orb, thiso, *args, **kwargs)
-    return coords.pmllpmbb_to_pmrapmdec(
-        lbdvrpmllpmbb[:, 4],
-        lbdvrpmllpmbb[:, 5],
-        lbdvrpmllpmbb[:, 0],
-        lbdvrpmllpmbb[:, 1],
-        degree=True,
-        epoch=None,
+_OBSERVABLES_POS = ["ra", "dec", "dist", "ll", "bb", "helioX", "helioY", "helioZ"]
+_OBSERVABLES_VEL = ["pmra", "pmdec", "pmll", "pmbb", "vlos", "U", "V", "W"]
+
+
+def _observables_cache_key(orb, args, kwargs):
+    """Key for memoising observables: (t,ro,vo,zo,solarmotion,obs); None if the observables should not be memoised"""
+    obs = kwargs.get("obs", None)
+    if isinstance(obs, Orbit):
+        return None
+    elif obs is not None:
+        obs = tuple(str(o) for o in obs)
+    t = args[0] if len(args) > 0 else kwargs.get("t", None)
+    if t is not None:
+        tunit = str(t.unit) if _APY_LOADED and isinstance(t, units.Quantity) else None
+        if tunit is None and orb.__dict__.get("_integrate_t_asQuantity", False):
+            # Don't memoise, such that _call_internal warns about the units
+            return None
+        t = numpy.asarray(t.value if tunit else t, dtype="float")
+        t = (t.shape, t.tobytes(), tunit)
+    return (
+        t,
+        conversion.parse_length_kpc(kwargs.get("ro", orb._ro)),
+        conversion.parse_velocity_kms(kwargs.get("vo", orb._vo)),
+        orb._zo,
+        tuple(orb._solarmotion),
+        obs,
     )
 
 
+def _observables(orb, names, *args, **kwargs):
+    """Calculate the heliocentric and sky observables in names in a single pass, sharing all intermediate steps, and memoise them per (t,ro,vo,zo,solarmotion,obs); returns dict of observables with shape [nt,*flattened input_shape]"""
+    key = _observables_cache_key(orb, args, kwargs)
+    if key is None or not "_observables_cache" in orb.__dict__:
+        cache = {}
+    elif orb._observables_cache[0] != key:
+        cache = {}
+    else:
+        cache = orb._observables_cache[1]
+    todo = [name for name in names if not name in cache]
+    if len(todo) > 0:
+        thiso = orb._call_internal(*args, **kwargs)
+        thiso_shape = thiso.shape
+        thiso = thiso.reshape((thiso_shape[0], -1))
+        vel = numpy.any([name in _OBSERVABLES_VEL for name in todo])
+        if vel:
+            X, Y, Z, vX, vY, vZ = _XYZvxvyvz(orb, thiso, *args, **kwargs)
+            out = {"U": vX, "V": vY, "W": vZ}
+        else:
+            X, Y, Z = _helioXYZ(orb, thiso, *args, **kwargs)
+            out = {}
+        out.update({"helioX": X, "helioY": Y, "helioZ": Z})
+        bad_indx = (X == 0.0) * (Y == 0.0) * (Z == 0.0)
+        if numpy.any([name in ["ra", "dec", "dist", "ll", "bb"] for name in todo]):
+            lbd = coords.XYZ_to_lbd(X + 1e-15 * bad_indx, Y, Z, degree=True)
+            out.update({"ll": lbd[:, 0], "bb": lbd[:, 1], "dist": lbd[:, 2]})
+            if "ra" in todo or "dec" in todo:
+                radec = coords.lb_to_radec(
+                    lbd[:, 0], lbd[:, 1], degree=True, epoch=None
+                )
+                out.update({"ra": radec[:, 0], "dec": radec[:, 1]})
+        if numpy.any(
+            [name in ["pmra", "pmdec", "pmll", "pmbb", "vlos"] for name in todo]
+        ):
+            obs, ro, vo = _parse_radec_kwargs(orb, kwargs, dontpop=True)
+            if True in bad_indx or not "ll" in out:
+                lbd = coords.XYZ_to_lbd(X + ro / 10000.0 * bad_indx, Y, Z, degree=True)
+            vrpmllpmbb = coords.vxvyvz_to_vrpmllpmbb(
+                vX, vY, vZ, lbd[:, 0], lbd[:, 1], lbd[:, 2], degree=True
+            )
+            out.update(
+                {
+                    "vlos": vrpmllpmbb[:, 0],
+                    "pmll": vrpmllpmbb[:, 1],
+                    "pmbb": vrpmllpmbb[:, 2],
+                }
+            )
+            if "pmra" in todo or "pmdec" in todo:
+                pmrapmdec = coords.pmllpmbb_to_pmrapmdec(
+                    vrpmllpmbb[:, 1],
+                    vrpmllpmbb[:, 2],
+                    lbd[:, 0],
+                    lbd[:, 1],
+                    degree=True,
+                    epoch=None,
+                )
+                out.update({"pmra": pmrapmdec[:, 0], "pmdec": pmrapmdec[:, 1]})
+        for name in out:
+            if not name in cache:
+                cache[name] = out[name].reshape(thiso_shape[1:])
+        if not key is None:
+            orb._observables_cache = (key, cache)
+    return {name: cache[name].copy() for name in names}
+
+
 def _parse_radec_kwargs(orb, kwargs, vel=False, dontpop=False):
     if "obs" in kwargs:
         obs = kwargs["obs"]
@@ -8192,6 +8953,17 @@ def _check_potential_dim(orb, pot):
     )
 
 
+def _set_massive_body_orbit(orb, t, xv):
+    """Set the integrated orbit of a massive body from its rectangular phase-space positions xv [nt,6] at times t"""
+    R, phi, z = coords.rect_to_cyl(xv[:, 0], xv[:, 1], xv[:, 2])
+    vR, vT, vz = coords.rect_to_cyl_vec(
+        xv[:, 3], xv[:, 4], xv[:, 5], xv[:, 0], xv[:, 1], xv[:, 2]
+    )
+    orb.t = numpy.array(t)
+    orb.orbit = numpy.array([[R, vR, vT, z, vz, phi]]).transpose(0, 2, 1)
+    return None
+
+
 def _check_consistent_units(orb, pot):
     if pot is None:
         return None
@@ -7,20 +7,31 @@ from numpy.ctypeslib import ndpointer
 from scipy import integrate
 
 from .. import potential
+from ..potential.DissipativeForce import DissipativeForce
 from ..potential.Potential import (
+    _evaluate_broadcast,
     _evaluatephitorques,
     _evaluateRforces,
     _evaluatezforces,
 )
-from ..util import _load_extension_libs, galpyWarning, symplecticode
+from ..util import _load_extension_libs, galpyWarning, lockstepode, symplecticode
 from ..util._optional_deps import _TQDM_LOADED
 from ..util.leung_dop853 import dop853
 from ..util.multi import parallel_map
 from .integratePlanarOrbit import (
+    _collect_dense_output,
+    _flatten_pot_args,
+    _moving_object_population_args,
+    _parse_compiled_pot,
+    _parse_cylfourier_pot,
+    _parse_events,
     _parse_integrator,
+    _parse_multipole_pot,
     _parse_scf_pot,
+    _parse_tdscf_pot,
     _parse_tol,
     _prep_tfuncs,
+    _tfuncs_tables,
 )
 
 if _TQDM_LOADED:
@@ -28,6 +39,10 @@ if _TQDM_LOADED:
 
 _lib, _ext_loaded = _load_extension_libs.load_libgalpy()
 
+# Relative step for finite-difference Jacobians, same as in the C code
+_DXDV_FD_STEP = numpy.finfo(float).eps ** (1.0 / 3.0)
+_DXDV_FD_MINSCALE = 1e-3
+
 
 def _parse_pot(pot, potforactions=False, potfortorus=False):
     """Parse the potential so it can be fed to C"""
@@ -77,6 +92,17 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
         elif isinstance(p, potential.JaffePotential):
             pot_type.append(10)
             pot_args.extend([p._amp, p.a])
+        elif (
+            isinstance(p, potential.DoubleExponentialDiskPotential) and p._tab_enable_c
+        ):  # Use the tabulated potential, through interpRZPotential's C code
+            pot_type.append(13)
+            pot_args.extend([len(p._tab_rgrid), len(p._tab_zgrid)])
+            pot_args.extend(p._tab_logrgrid)
+            pot_args.extend(p._tab_zgrid)
+            pot_args.extend(p._tab_potGrid_splinecoeffs.flatten(order="C"))
+            pot_args.extend(p._tab_rforceGrid_splinecoeffs.flatten(order="C"))
+            pot_args.extend(p._tab_zforceGrid_splinecoeffs.flatten(order="C"))
+            pot_args.extend([p._amp, 1])
         elif isinstance(p, potential.DoubleExponentialDiskPotential):
             pot_type.append(11)
             pot_args.extend(
@@ -214,6 +240,18 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
                     for ii in range(p._glorder)
                 ]
             )
+        elif isinstance(p, potential.CompiledPotential):
+            # Type 45, see stand-alone parser in integratePlanarOrbit
+            pt, pa, ptf = _parse_compiled_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif isinstance(p, potential.TimeDependentSCFPotential):
+            # Type 44, see stand-alone parser in integratePlanarOrbit
+            pt, pa, ptf = _parse_tdscf_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         elif isinstance(p, potential.SCFPotential):
             # Type 24, see stand-alone parser below
             pt, pa, ptf = _parse_scf_pot(p)
@@ -265,7 +303,7 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
             pot_type.append(27)
             pot_args.extend(
                 [
-                    len(p._Cs),
+                    len(p._Cs0),
                     p._amp,
                     p._N,
                     p._sin_alpha,
@@ -277,7 +315,7 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
                     p._omega,
                 ]
             )
-            pot_args.extend(p._Cs)
+            pot_args.extend(p._Cs0)
         # 30: PerfectEllipsoidPotential, done with others above
         # 31: KGPotential
         # 32: IsothermalDiskPotential
@@ -329,6 +367,7 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
                     pot_args.extend(p._Omegadot)
                 else:
                     pot_args.extend([0.0, 0.0, 0.0])
+            ntfuncs = len(pot_tfuncs)
             if p._lin_acc:
                 pot_tfuncs.extend([p._a0[0], p._a0[1], p._a0[2]])
                 if p._rot_acc:
@@ -348,9 +387,41 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
                             p._Omegadot[2],
                         ]
                     )
+            # C only reads the tables when there are functions of time
+            if len(pot_tfuncs) > ntfuncs:
+                pot_args.extend(_tfuncs_tables(p, pot_tfuncs[ntfuncs:]))
         elif isinstance(p, potential.NullPotential):
             pot_type.append(40)
             # No arguments, zero forces
+        elif isinstance(p, potential.interp3DPotential):
+            pot_type.append(41)
+            pot_args.extend(
+                [
+                    p._amp,
+                    len(p._xgrid),
+                    len(p._zgrid),
+                    p._nphi,
+                    p._xgrid[0],
+                    p._dx,
+                    p._zgrid[0],
+                    p._dz,
+                    p._dphi,
+                    int(p._logR),
+                    int(p._zsym),
+                    p._omegab,
+                    p._pa,
+                ]
+            )
+            pot_args.extend([numpy.nan] * 7)  # for caching
+            pot_args.append(p._tables.flatten())
+        elif isinstance(p, potential.MultipoleExpansionPotential):
+            pt, pa, ptf = _parse_multipole_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+        elif isinstance(p, potential.CylindricalFourierExpansionPotential):
+            pt, pa, ptf = _parse_cylfourier_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
         ############################## WRAPPERS ###############################
         elif isinstance(p, potential.DehnenSmoothWrapperPotential):
             pot_type.append(-1)
@@ -410,6 +481,16 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
             pot_args.extend(p._orb.z(p._orb.t, use_physical=False))
             pot_args.extend([p._amp])
             pot_args.extend([p._orb.t[0], p._orb.t[-1]])  # t_0, t_f
+        elif isinstance(p, potential.MovingObjectPopulationPotential):
+            pot_type.append(-10)
+            wrap_npot, wrap_pot_type, wrap_pot_args, wrap_pot_tfuncs = _parse_pot(
+                p._pot, potforactions=potforactions, potfortorus=potfortorus
+            )
+            pot_args.append(wrap_npot)
+            pot_type.extend(wrap_pot_type)
+            pot_args.extend(wrap_pot_args)
+            pot_tfuncs.extend(wrap_pot_tfuncs)
+            pot_args.extend(_moving_object_population_args(p))
         elif isinstance(p, potential.ChandrasekharDynamicalFrictionForce):
             pot_type.append(-7)
             wrap_npot, wrap_pot_type, wrap_pot_args, wrap_pot_tfuncs = _parse_pot(
@@ -466,13 +547,24 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
             pot_tfuncs.extend(wrap_pot_tfuncs)
             pot_args.append(p._amp)
             pot_tfuncs.append(p._A)
+            pot_args.extend(_tfuncs_tables(p, [p._A]))
     pot_type = numpy.array(pot_type, dtype=numpy.int32, order="C")
-    pot_args = numpy.array(pot_args, dtype=numpy.float64, order="C")
+    pot_args = _flatten_pot_args(pot_args)
     return (npot, pot_type, pot_args, pot_tfuncs)
 
 
 def integrateFullOrbit_c(
-    pot, yo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+    pot,
+    yo,
+    t,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    dense_output=False,
+    events=None,
+    dtype=numpy.float64,
 ):
     """
     NAME:
@@ -487,8 +579,11 @@ def integrateFullOrbit_c(
        rtol, atol
        progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
        dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+       dense_output= (False) if True, also return the dense output (continuous interpolant) of each orbit, in rectangular coordinates (only for 'dopr54_c' and 'dop853_c')
+       events= (None) list of events (name,parameter,terminal) to detect on the dense output, with name 'pericenter', 'apocenter', 'zcross', 'zmax', or 'escape' (for which the parameter is the escape radius), and terminal whether the event stops the integration (output after that is NaN); only for 'dopr54_c' and 'dop853_c'
+       dtype= (numpy.float64) precision in which to store the output, numpy.float64 or numpy.float32 (the integration itself is always performed in double precision)
     OUTPUT:
-       (y,err)
+       (y,err), followed by dense if dense_output and events if events, with dense a list of (tstep,coeff) and events a list of (t,indx,state) for each object in rectangular coordinates (see _collect_dense_output)
        y : array, shape (N,len(t),6)  or (len(t),6) if N = 1
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
@@ -497,6 +592,8 @@ def integrateFullOrbit_c(
        2011-11-13 - Written - Bovy (IAS)
        2018-12-21 - Adapted to allow multiple objects - Bovy (UofT)
        2022-04-12 - Add progressbar - Bovy (UofT)
+       2026-10-19 - Added dense_output and events
+       2026-10-19 - Added dtype
     """
     if len(yo.shape) == 1:
         single_obj = True
@@ -511,8 +608,13 @@ def integrateFullOrbit_c(
     if dt is None:
         dt = -9999.99
 
-    # Set up result array
-    result = numpy.empty((nobj, len(t), 6))
+    # Set up result array; for single-precision output, the C code writes the
+    # output to result_single instead
+    single = numpy.dtype(dtype) == numpy.dtype(numpy.float32)
+    result = numpy.empty((0,) if single else (nobj, len(t), 6))
+    result_single = (
+        numpy.empty((nobj, len(t), 6), dtype=numpy.float32) if single else None
+    )
     err = numpy.zeros(nobj, dtype=numpy.int32)
 
     # Set up progressbar
@@ -543,6 +645,13 @@ def integrateFullOrbit_c(
         ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
         ctypes.c_int,
         ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.c_int,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_void_p,
     ]
 
     # Array requirements, first store old order
@@ -552,6 +661,10 @@ def integrateFullOrbit_c(
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
     err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
 
+    # Set up the handle for the dense output and the events
+    dense = ctypes.c_void_p()
+    nevent, event_type, event_par, event_terminal = _parse_events(events)
+
     # Run the C code
     integrationFunc(
         ctypes.c_int(nobj),
@@ -569,6 +682,13 @@ def integrateFullOrbit_c(
         err,
         ctypes.c_int(int_method_c),
         pbar_c,
+        ctypes.byref(dense) if dense_output or nevent > 0 else None,
+        ctypes.c_int(dense_output),
+        ctypes.c_int(nevent),
+        event_type,
+        event_par,
+        event_terminal,
+        result_single.ctypes.data_as(ctypes.c_void_p) if single else None,
     )
 
     if nobj > 1 and progressbar:
@@ -577,56 +697,92 @@ def integrateFullOrbit_c(
     if numpy.any(err == -10):  # pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
+    if single:
+        result = result_single
+
+    if dense_output or nevent > 0:
+        dense, events = _collect_dense_output(
+            dense, nobj, 6, 5 if int_method_c == 5 else 8, events=True
+        )
+
     # Reset input arrays
     if f_cont[0]:
         yo = numpy.asfortranarray(yo)
     if f_cont[1]:
         t = numpy.asfortranarray(t)
 
+    out = (result, err)
+    if dense_output:
+        out += (dense,)
+    if nevent > 0:
+        out += (events,)
     if single_obj:
-        return (result[0], err[0])
+        return tuple(o[0] for o in out)
     else:
-        return (result, err)
+        return out
 
 
 def integrateFullOrbit_dxdv_c(
-    pot, yo, dyo, t, int_method, rtol=None, atol=None
-):  # pragma: no cover because not included in v1, uncover when included
+    pot, yo, dyo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+):
     """
     NAME:
        integrateFullOrbit_dxdv_c
     PURPOSE:
-       C integrate an ode for a planarOrbit+phase space volume dxdv
+       C integrate an ode for a FullOrbit+phase space volume dxdv
     INPUT:
        pot - Potential or list of such instances
-       yo - initial condition [q,p]
-       dyo - initial condition [dq,dp]
+       yo - initial condition [q,p] in rectangular coordinates, shape [N,6] or [6]
+       dyo - initial condition [dq,dp] in rectangular coordinates, shape [N,6] or [6]
        t - set of times at which one wants the result
-       int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
+       int_method= 'leapfrog_c', 'symplec4_c', 'symplec6_c', 'rk4_c', 'rk6_c', 'dopr54_c', 'dop853_c'
        rtol, atol
+       progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
     OUTPUT:
        (y,err)
-       y : array, shape (len(y0), len(t))
+       y : array, shape (N,len(t),12) or (len(t),12) if N = 1, with the last dimension (x,y,z,vx,vy,vz,dx,dy,dz,dvx,dvy,dvz)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
        err: error message if not zero, 1: maximum step reduction happened for adaptive integrators
     HISTORY:
        2011-11-13 - Written - Bovy (IAS)
+       2026-10-19 - Implemented for multiple objects using the tangent map of the C integrators
     """
+    if len(yo.shape) == 1:
+        single_obj = True
+    else:
+        single_obj = False
+    yo = numpy.atleast_2d(yo)
+    dyo = numpy.atleast_2d(dyo)
+    nobj = len(yo)
     rtol, atol = _parse_tol(rtol, atol)
     npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
     pot_tfuncs = _prep_tfuncs(pot_tfuncs)
     int_method_c = _parse_integrator(int_method)
-    yo = numpy.concatenate((yo, dyo))
+    if dt is None:
+        dt = -9999.99
+    # C code expects (x,y,z,dx,dy,dz,vx,vy,vz,dvx,dvy,dvz)
+    yo = numpy.hstack((yo[:, :3], dyo[:, :3], yo[:, 3:], dyo[:, 3:]))
 
     # Set up result array
-    result = numpy.empty((len(t), 12))
-    err = ctypes.c_int(0)
+    result = numpy.empty((nobj, len(t), 12))
+    err = numpy.zeros(nobj, dtype=numpy.int32)
+
+    # Set up progressbar
+    progressbar *= _TQDM_LOADED
+    if nobj > 1 and progressbar:
+        pbar = tqdm.tqdm(total=nobj, leave=False)
+        pbar_func_ctype = ctypes.CFUNCTYPE(None)
+        pbar_c = pbar_func_ctype(pbar.update)
+    else:  # pragma: no cover
+        pbar_c = None
 
     # Set up the C code
     ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
     integrationFunc = _lib.integrateFullOrbit_dxdv
     integrationFunc.argtypes = [
+        ctypes.c_int,
         ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
         ctypes.c_int,
         ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
@@ -636,19 +792,23 @@ def integrateFullOrbit_dxdv_c(
         ctypes.c_void_p,
         ctypes.c_double,
         ctypes.c_double,
+        ctypes.c_double,
         ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
-        ctypes.POINTER(ctypes.c_int),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
         ctypes.c_int,
+        ctypes.c_void_p,
     ]
 
     # Array requirements, first store old order
-    f_cont = [yo.flags["F_CONTIGUOUS"], t.flags["F_CONTIGUOUS"]]
+    f_cont = [t.flags["F_CONTIGUOUS"]]
     yo = numpy.require(yo, dtype=numpy.float64, requirements=["C", "W"])
     t = numpy.require(t, dtype=numpy.float64, requirements=["C", "W"])
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
+    err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
 
     # Run the C code
     integrationFunc(
+        ctypes.c_int(nobj),
         yo,
         ctypes.c_int(len(t)),
         t,
@@ -656,23 +816,323 @@ def integrateFullOrbit_dxdv_c(
         pot_type,
         pot_args,
         pot_tfuncs,
+        ctypes.c_double(dt),
         ctypes.c_double(rtol),
         ctypes.c_double(atol),
         result,
-        ctypes.byref(err),
+        err,
         ctypes.c_int(int_method_c),
+        pbar_c,
     )
 
-    if int(err.value) == -10:  # pragma: no cover
+    if nobj > 1 and progressbar:
+        pbar.close()
+
+    if numpy.any(err == -10):  # pragma: no cover
+        raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
+
+    # Reset input arrays
+    if f_cont[0]:
+        t = numpy.asfortranarray(t)
+
+    # Back to (x,y,z,vx,vy,vz,dx,dy,dz,dvx,dvy,dvz)
+    result = result[..., [0, 1, 2, 6, 7, 8, 3, 4, 5, 9, 10, 11]]
+    if single_obj:
+        return (result[0], err[0])
+    else:
+        return (result, err)
+
+
+def integrateFullOrbit_lyapunov_c(
+    pot,
+    yo,
+    t,
+    int_method,
+    nexp=1,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+):
+    """
+    NAME:
+       integrateFullOrbit_lyapunov_c
+    PURPOSE:
+       C integrate a FullOrbit together with nexp deviation vectors that are re-orthonormalized at each time in t, to compute Lyapunov exponents
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p] in rectangular coordinates, shape [N,6]
+       t - set of times at which the deviation vectors are re-orthonormalized
+       int_method= 'leapfrog_c', 'symplec4_c', 'symplec6_c', 'rk4_c', 'rk6_c', 'dopr54_c', 'dop853_c'
+       nexp= (1) number of deviation vectors (1 to 6)
+       rtol, atol
+       progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+    OUTPUT:
+       (lnstretch,err)
+       lnstretch : array, shape (N,len(t),nexp) with the cumulative logarithmic stretching of each of the orthonormalized deviation vectors
+       err: error message if not zero, 1: maximum step reduction happened for adaptive integrators
+    HISTORY:
+       2026-10-19 - Written
+    """
+    yo = numpy.atleast_2d(yo)
+    nobj = len(yo)
+    rtol, atol = _parse_tol(rtol, atol)
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+    int_method_c = _parse_integrator(int_method)
+    if dt is None:
+        dt = -9999.99
+    # Initial deviation vectors are the first nexp unit vectors, laid out as
+    # (x,y,z,dx_1,dy_1,dz_1,...,vx,vy,vz,dvx_1,dvy_1,dvz_1,...)
+    dyo = numpy.eye(6)[:nexp]
+    yo = numpy.hstack(
+        (
+            yo[:, :3],
+            numpy.tile(dyo[:, :3].flatten(), (nobj, 1)),
+            yo[:, 3:],
+            numpy.tile(dyo[:, 3:].flatten(), (nobj, 1)),
+        )
+    )
+
+    # Set up result array
+    result = numpy.empty((nobj, len(t), nexp))
+    err = numpy.zeros(nobj, dtype=numpy.int32)
+
+    # Set up progressbar
+    progressbar *= _TQDM_LOADED
+    if nobj > 1 and progressbar:
+        pbar = tqdm.tqdm(total=nobj, leave=False)
+        pbar_func_ctype = ctypes.CFUNCTYPE(None)
+        pbar_c = pbar_func_ctype(pbar.update)
+    else:  # pragma: no cover
+        pbar_c = None
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    integrationFunc = _lib.integrateFullOrbit_lyapunov
+    integrationFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ctypes.c_double,
+        ctypes.c_double,
+        ctypes.c_double,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+
+    # Array requirements, first store old order
+    f_cont = [t.flags["F_CONTIGUOUS"]]
+    yo = numpy.require(yo, dtype=numpy.float64, requirements=["C", "W"])
+    t = numpy.require(t, dtype=numpy.float64, requirements=["C", "W"])
+    result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
+    err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
+
+    # Run the C code
+    integrationFunc(
+        ctypes.c_int(nobj),
+        yo,
+        ctypes.c_int(nexp),
+        ctypes.c_int(len(t)),
+        t,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        ctypes.c_double(dt),
+        ctypes.c_double(rtol),
+        ctypes.c_double(atol),
+        result,
+        err,
+        ctypes.c_int(int_method_c),
+        pbar_c,
+    )
+
+    if nobj > 1 and progressbar:
+        pbar.close()
+
+    if numpy.any(err == -10):  # pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
     # Reset input arrays
     if f_cont[0]:
-        yo = numpy.asfortranarray(yo)
-    if f_cont[1]:
         t = numpy.asfortranarray(t)
 
-    return (result, err.value)
+    return (result, err)
+
+
+def integrateFullOrbit_dxdv(
+    pot,
+    yo,
+    dyo,
+    t,
+    int_method,
+    rectIn,
+    rectOut,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    numcores=1,
+):
+    """
+    NAME:
+       integrateFullOrbit_dxdv
+    PURPOSE:
+       Integrate an ode for a FullOrbit+phase space volume dxdv
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p], shape [N,6]
+       dyo - initial condition [dq,dp], shape [N,6]
+       t - set of times at which one wants the result
+       int_method= 'odeint', 'dop853', 'leapfrog_c', 'symplec4_c', 'symplec6_c', 'rk4_c', 'rk6_c', 'dopr54_c', 'dop853_c'
+       rectIn= (False) if True, input dyo is in rectangular coordinates
+       rectOut= (False) if True, output dyo is in rectangular coordinates
+       rtol, atol= tolerances (not always used...)
+       numcores= (1) number of cores to use for multi-processing (only for the Python integrators)
+       progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+    OUTPUT:
+       (y,err)
+       y : array, shape (N,len(t),12)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+    HISTORY:
+       2026-10-19 - Written based on integratePlanarOrbit_dxdv
+    """
+    # go to the rectangular frame
+    this_yo = _cyl_to_rect(yo)
+    if not rectIn:
+        this_dyo = _cyl_to_rect_dxdv(yo, dyo)
+    else:
+        this_dyo = dyo
+    if int_method.lower() == "dop853" or int_method.lower() == "odeint":
+        if rtol is None:
+            rtol = 1e-8
+        if int_method.lower() == "dop853":
+            integrator = dop853
+            extra_kwargs = {}
+        else:
+            integrator = integrate.odeint
+            extra_kwargs = {"rtol": rtol}
+
+        def integrate_for_map(vxvv):
+            return integrator(_EOM_dxdv, vxvv, t=t, args=(pot,), **extra_kwargs)
+
+        this_yo = numpy.hstack((this_yo, this_dyo))
+        if len(this_yo) == 1:  # Can't map a single value...
+            out = numpy.atleast_3d(integrate_for_map(this_yo[0]).T).T
+        else:
+            out = numpy.array(
+                parallel_map(
+                    integrate_for_map,
+                    this_yo,
+                    progressbar=progressbar,
+                    numcores=numcores,
+                )
+            )
+        err = numpy.zeros(len(yo))
+    else:
+        out, err = integrateFullOrbit_dxdv_c(
+            pot,
+            this_yo,
+            this_dyo,
+            t,
+            int_method,
+            rtol=rtol,
+            atol=atol,
+            progressbar=progressbar,
+            dt=dt,
+        )
+    # go back to the cylindrical frame
+    if rectOut:
+        dout = out[..., 6:].copy()
+    else:
+        dout = _rect_to_cyl_dxdv(out[..., :6], out[..., 6:])
+    out[..., :6] = _rect_to_cyl(out[..., :6])
+    out[..., 6:] = dout
+    return out, err
+
+
+def _cyl_to_rect(vxvv):
+    """(R,vR,vT,z,vz,phi) --> (x,y,z,vx,vy,vz)"""
+    cp, sp = numpy.cos(vxvv[..., 5]), numpy.sin(vxvv[..., 5])
+    return numpy.stack(
+        [
+            vxvv[..., 0] * cp,
+            vxvv[..., 0] * sp,
+            vxvv[..., 3],
+            vxvv[..., 1] * cp - vxvv[..., 2] * sp,
+            vxvv[..., 2] * cp + vxvv[..., 1] * sp,
+            vxvv[..., 4],
+        ],
+        axis=-1,
+    )
+
+
+def _rect_to_cyl(xv):
+    """(x,y,z,vx,vy,vz) --> (R,vR,vT,z,vz,phi)"""
+    R = numpy.sqrt(xv[..., 0] ** 2.0 + xv[..., 1] ** 2.0)
+    phi = numpy.arctan2(xv[..., 1], xv[..., 0]) % (2.0 * numpy.pi)
+    cp, sp = numpy.cos(phi), numpy.sin(phi)
+    return numpy.stack(
+        [
+            R,
+            xv[..., 3] * cp + xv[..., 4] * sp,
+            xv[..., 4] * cp - xv[..., 3] * sp,
+            xv[..., 2],
+            xv[..., 5],
+            phi,
+        ],
+        axis=-1,
+    )
+
+
+def _cyl_to_rect_dxdv(vxvv, dxdv):
+    """Linearized transformation of [dR,dvR,dvT,dz,dvz,dphi] at (R,vR,vT,z,vz,phi) to [dx,dy,dz,dvx,dvy,dvz]"""
+    R, vR, vT, phi = vxvv[..., 0], vxvv[..., 1], vxvv[..., 2], vxvv[..., 5]
+    cp, sp = numpy.cos(phi), numpy.sin(phi)
+    dR, dvR, dvT, dphi = dxdv[..., 0], dxdv[..., 1], dxdv[..., 2], dxdv[..., 5]
+    return numpy.stack(
+        [
+            cp * dR - R * sp * dphi,
+            sp * dR + R * cp * dphi,
+            dxdv[..., 3],
+            cp * dvR - sp * dvT - (vR * sp + vT * cp) * dphi,
+            sp * dvR + cp * dvT + (vR * cp - vT * sp) * dphi,
+            dxdv[..., 4],
+        ],
+        axis=-1,
+    )
+
+
+def _rect_to_cyl_dxdv(xv, dxdv):
+    """Linearized transformation of [dx,dy,dz,dvx,dvy,dvz] at (x,y,z,vx,vy,vz) to [dR,dvR,dvT,dz,dvz,dphi]"""
+    cyl = _rect_to_cyl(xv)
+    R, vR, vT, phi = cyl[..., 0], cyl[..., 1], cyl[..., 2], cyl[..., 5]
+    cp, sp = numpy.cos(phi), numpy.sin(phi)
+    dphi = (cp * dxdv[..., 1] - sp * dxdv[..., 0]) / R
+    return numpy.stack(
+        [
+            cp * dxdv[..., 0] + sp * dxdv[..., 1],
+            cp * dxdv[..., 3] + sp * dxdv[..., 4] + vT * dphi,
+            cp * dxdv[..., 4] - sp * dxdv[..., 3] - vR * dphi,
+            dxdv[..., 2],
+            dxdv[..., 5],
+            dphi,
+        ],
+        axis=-1,
+    )
 
 
 def integrateFullOrbit(
@@ -687,11 +1147,11 @@ def integrateFullOrbit(
        pot - Potential or list of such instances
        yo - initial condition [q,p], shape [N,5] or [N,6]
        t - set of times at which one wants the result
-       int_method= 'leapfrog', 'odeint', or 'dop853'
-       rtol, atol= tolerances (not always used...)
+       int_method= 'leapfrog', 'odeint', 'dop853', or 'leapfrog_vec', 'symplec4_vec', 'rk4_vec' (all orbits integrated in lockstep)
+       rtol, atol= tolerances (not always used...; both are used by the lockstep integrators)
        numcores= (1) number of cores to use for multi-processing
        progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
-       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based and lockstep integrators)
     OUTPUT:
        (y,err)
        y : array, shape (N,len(t),5/6)
@@ -702,6 +1162,7 @@ def integrateFullOrbit(
        2010-08-01 - Written - Bovy (NYU)
        2019-04-09 - Adapted to allow multiple objects and parallel mapping - Bovy (UofT)
        2022-04-12 - Add progressbar - Bovy (UofT)
+       2026-10-19 - Added lockstep integrators
     """
     nophi = False
     if not int_method.lower() == "dop853" and not int_method == "odeint":
@@ -709,7 +1170,10 @@ def integrateFullOrbit(
             nophi = True
             # We hack this by putting in a dummy phi=0
             yo = numpy.pad(yo, ((0, 0), (0, 1)), "constant", constant_values=0)
-    if int_method.lower() == "leapfrog":
+    if int_method.lower().endswith("_vec"):
+        if rtol is None:
+            rtol = 1e-8
+    elif int_method.lower() == "leapfrog":
         if rtol is None:
             rtol = 1e-8
 
@@ -794,7 +1258,22 @@ def integrateFullOrbit(
         def integrate_for_map(vxvv):
             return integrateFullOrbit_c(pot, numpy.copy(vxvv), t, int_method, dt=dt)[0]
 
-    if len(yo) == 1:  # Can't map a single value...
+    if int_method.lower().endswith("_vec"):
+        # Advance all orbits together in the rectangular frame
+        xv = _cyl_to_rect(numpy.asarray(yo, dtype="float"))
+        out = _rect_to_cyl(
+            lockstepode.integrate_lockstep(
+                lambda x, v, tt: _rectForce_vec(x, v, pot, t=tt),
+                xv[:, :3],
+                xv[:, 3:],
+                t,
+                method=int_method.lower()[:-4],
+                dt=dt,
+                rtol=rtol,
+                atol=atol,
+            )
+        )
+    elif len(yo) == 1:  # Can't map a single value...
         out = numpy.atleast_3d(integrate_for_map(yo[0]).T).T
     else:
         out = numpy.array(
@@ -934,6 +1413,122 @@ def integrateFullOrbit_sos_c(
         return (result, err)
 
 
+def integrateFullOrbit_crossings_c(
+    pot,
+    yo,
+    ncross,
+    t0,
+    tmax,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+):
+    """
+    NAME:
+       integrateFullOrbit_crossings_c
+    PURPOSE:
+       Find the upward crossings of the z=0 plane of a FullOrbit in C, by integrating in time and detecting the crossings on the dense output of the integrator
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p], shape [N,6]
+       ncross - maximum number of crossings to find for each orbit
+       t0 - initial time (scalar or [N])
+       tmax - maximum integration time (the integration stops at t0+tmax if fewer than ncross crossings are found)
+       int_method= 'dopr54_c' or 'dop853_c'
+       rtol, atol= tolerances
+       progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+       dt= (None) initial step to use (default is to automatically determine one)
+    OUTPUT:
+       (y,err)
+       y : array, shape (N,ncross,7) with the phase-space position [R,vR,vT,z,vz,phi] at each crossing, followed by the time of the crossing; NaN for crossings that did not occur before t0+tmax
+       err: error message
+    HISTORY:
+       2026-10-19 - Written
+    """
+    if len(yo.shape) == 1:
+        single_obj = True
+    else:
+        single_obj = False
+    yo = numpy.atleast_2d(yo)
+    nobj = len(yo)
+    rtol, atol = _parse_tol(rtol, atol)
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+    int_method_c = _parse_integrator(int_method)
+    if dt is None:
+        dt = -9999.99
+    t = numpy.empty((nobj, 2))
+    t[:, 0] = t0
+    t[:, 1] = t[:, 0] + tmax
+    yoo = numpy.array(yo[:, :6], dtype=numpy.float64, order="C")
+
+    # Set up result array
+    result = numpy.empty((nobj, ncross, 7))
+    err = numpy.zeros(nobj, dtype=numpy.int32)
+
+    # Set up progressbar
+    progressbar *= _TQDM_LOADED
+    if nobj > 1 and progressbar:
+        pbar = tqdm.tqdm(total=nobj, leave=False)
+        pbar_func_ctype = ctypes.CFUNCTYPE(None)
+        pbar_c = pbar_func_ctype(pbar.update)
+    else:  # pragma: no cover
+        pbar_c = None
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    integrationFunc = _lib.integrateFullOrbit_crossings
+    integrationFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ctypes.c_double,
+        ctypes.c_double,
+        ctypes.c_double,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+
+    # Run the C code
+    integrationFunc(
+        ctypes.c_int(nobj),
+        yoo,
+        ctypes.c_int(ncross),
+        t,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        ctypes.c_double(dt),
+        ctypes.c_double(rtol),
+        ctypes.c_double(atol),
+        result,
+        err,
+        ctypes.c_int(int_method_c),
+        pbar_c,
+    )
+
+    if nobj > 1 and progressbar:
+        pbar.close()
+
+    if numpy.any(err == -10):  # pragma: no cover
+        raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
+
+    if single_obj:
+        return (result[0], err[0])
+    else:
+        return (result, err)
+
+
 def integrateFullOrbit_sos(
     pot,
     yo,
@@ -1106,6 +1701,40 @@ def _EOM(y, t, pot):
     ]
 
 
+def _EOM_dxdv(y, t, pot):
+    """
+    NAME:
+       _EOM_dxdv
+    PURPOSE:
+       implements the EOM, i.e., the right-hand side of the differential
+       equation, for integrating a 3D orbit and its variational equations
+       in rectangular coordinates
+    INPUT:
+       y - current phase-space position + dxdv, (x,y,z,vx,vy,vz,dx,dy,dz,dvx,dvy,dvz)
+       t - current time
+       pot - (list of) Potential instance(s)
+    OUTPUT:
+       dy/dt
+    HISTORY:
+       2026-10-19 - Written; Jacobian computed using finite differences, like in the C code
+    """
+    h = _DXDV_FD_STEP * numpy.amax(
+        [numpy.sqrt(y[0] ** 2.0 + y[1] ** 2.0 + y[2] ** 2.0), _DXDV_FD_MINSCALE]
+    )
+    jac = numpy.empty((3, 3))
+    for jj in range(3):
+        dx = numpy.zeros(3)
+        dx[jj] = h
+        jac[:, jj] = (
+            0.5
+            * (_rectForce(y[:3] + dx, pot, t=t) - _rectForce(y[:3] - dx, pot, t=t))
+            / h
+        )
+    return numpy.hstack(
+        (y[3:6], _rectForce(y[:3], pot, t=t), y[9:12], numpy.dot(jac, y[6:9]))
+    )
+
+
 def _SOSEOM(y, psi, pot):
     """
     NAME:
@@ -1164,3 +1793,67 @@ def _rectForce(x, pot, t=0.0):
             _evaluatezforces(pot, R, x[2], phi=phi, t=t),
         ]
     )
+
+
+def _rectForce_vec(x, v, pot, t=0.0):
+    """
+    NAME:
+       _rectForce_vec
+    PURPOSE:
+       returns the force in the rectangular frame for many orbits at once
+    INPUT:
+       x - current positions [N,3]
+       v - current velocities [N,3] (only used for dissipative forces)
+       pot - (list of) Potential instance(s)
+       t - current time
+    OUTPUT:
+       force [N,3]
+    HISTORY:
+       2026-10-19 - Written
+    """
+    R = numpy.sqrt(x[:, 0] ** 2.0 + x[:, 1] ** 2.0)
+    phi = numpy.arctan2(x[:, 1], x[:, 0])
+    cosphi, sinphi = numpy.cos(phi), numpy.sin(phi)
+    if not isinstance(pot, list):
+        pot = [pot]
+    # Potentials are evaluated for all orbits in a single call
+    conspot = [p for p in pot if not isinstance(p, DissipativeForce)]
+    Rforce = _evaluate_broadcast(_evaluateRforces, conspot, R, x[:, 2], phi=phi, t=t)
+    phitorque = _evaluate_broadcast(
+        _evaluatephitorques, conspot, R, x[:, 2], phi=phi, t=t
+    )
+    zforce = _evaluate_broadcast(_evaluatezforces, conspot, R, x[:, 2], phi=phi, t=t)
+    Rforce, phitorque, zforce = (
+        Rforce + numpy.zeros_like(R),
+        phitorque + numpy.zeros_like(R),
+        zforce + numpy.zeros_like(R),
+    )
+    # Dissipative forces are not vectorized, so loop over the orbits
+    disspot = [p for p in pot if isinstance(p, DissipativeForce)]
+    if len(disspot) > 0:
+        vcyl = numpy.stack(
+            [
+                cosphi * v[:, 0] + sinphi * v[:, 1],
+                -sinphi * v[:, 0] + cosphi * v[:, 1],
+                v[:, 2],
+            ],
+            axis=-1,
+        )
+        for ii in range(len(R)):
+            Rforce[ii] += _evaluateRforces(
+                disspot, R[ii], x[ii, 2], phi=phi[ii], t=t, v=vcyl[ii]
+            )
+            phitorque[ii] += _evaluatephitorques(
+                disspot, R[ii], x[ii, 2], phi=phi[ii], t=t, v=vcyl[ii]
+            )
+            zforce[ii] += _evaluatezforces(
+                disspot, R[ii], x[ii, 2], phi=phi[ii], t=t, v=vcyl[ii]
+            )
+    return numpy.stack(
+        [
+            cosphi * Rforce - 1.0 / R * sinphi * phitorque,
+            sinphi * Rforce + 1.0 / R * cosphi * phitorque,
+            zforce,
+        ],
+        axis=-1,
+    )
@@ -8,12 +8,17 @@ from scipy import integrate
 from .. import potential
 from ..potential.linearPotential import _evaluatelinearForces
 from ..potential.verticalPotential import verticalPotential
-from ..util import _load_extension_libs, symplecticode
+from ..util import _load_extension_libs, lockstepode, symplecticode
 from ..util._optional_deps import _TQDM_LOADED
 from ..util.leung_dop853 import dop853
 from ..util.multi import parallel_map
 from .integrateFullOrbit import _parse_pot as _parse_pot_full
-from .integratePlanarOrbit import _parse_integrator, _parse_tol, _prep_tfuncs
+from .integratePlanarOrbit import (
+    _collect_dense_output,
+    _parse_integrator,
+    _parse_tol,
+    _prep_tfuncs,
+)
 
 if _TQDM_LOADED:
     import tqdm
@@ -123,7 +128,16 @@ def _parse_pot(pot):
 
 
 def integrateLinearOrbit_c(
-    pot, yo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+    pot,
+    yo,
+    t,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    dense_output=False,
+    dtype=numpy.float64,
 ):
     """
     NAME:
@@ -138,8 +152,10 @@ def integrateLinearOrbit_c(
        rtol, atol
        progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
        dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+       dense_output= (False) if True, also return the dense output (continuous interpolant) of each orbit, in rectangular coordinates (only for 'dopr54_c' and 'dop853_c')
+       dtype= (numpy.float64) precision in which to store the output, numpy.float64 or numpy.float32 (the integration itself is always performed in double precision)
     OUTPUT:
-       (y,err)
+       (y,err) or (y,err,dense) if dense_output, with dense a list of (tstep,coeff) for each object (see _collect_dense_output)
        y : array, shape (N,len(t),2) or (len(y0),len(t)) if N=1
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
@@ -148,6 +164,8 @@ def integrateLinearOrbit_c(
        2018-10-06 - Written - Bovy (UofT)
        2018-10-14 - Adapted to allow multiple orbits to be integrated at once - Bovy (UofT)
        2022-04-12 - Add progressbar - Bovy (UofT)
+       2026-10-19 - Added dense_output
+       2026-10-19 - Added dtype
     """
     if len(yo.shape) == 1:
         single_obj = True
@@ -162,8 +180,13 @@ def integrateLinearOrbit_c(
     if dt is None:
         dt = -9999.99
 
-    # Set up result array
-    result = numpy.empty((nobj, len(t), 2))
+    # Set up result array; for single-precision output, the C code writes the
+    # output to result_single instead
+    single = numpy.dtype(dtype) == numpy.dtype(numpy.float32)
+    result = numpy.empty((0,) if single else (nobj, len(t), 2))
+    result_single = (
+        numpy.empty((nobj, len(t), 2), dtype=numpy.float32) if single else None
+    )
     err = numpy.zeros(nobj, dtype=numpy.int32)
 
     # Set up progressbar
@@ -194,6 +217,8 @@ def integrateLinearOrbit_c(
         ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
         ctypes.c_int,
         ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.c_void_p,
     ]
 
     # Array requirements, first store old order
@@ -203,6 +228,9 @@ def integrateLinearOrbit_c(
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
     err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
 
+    # Set up the handle for the dense output
+    dense = ctypes.c_void_p()
+
     # Run the C code
     integrationFunc(
         ctypes.c_int(nobj),
@@ -220,6 +248,8 @@ def integrateLinearOrbit_c(
         err,
         ctypes.c_int(int_method_c),
         pbar_c,
+        ctypes.byref(dense) if dense_output else None,
+        result_single.ctypes.data_as(ctypes.c_void_p) if single else None,
     )
 
     if nobj > 1 and progressbar:
@@ -228,14 +258,24 @@ def integrateLinearOrbit_c(
     if numpy.any(err == -10):  # pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
+    if single:
+        result = result_single
+
+    if dense_output:
+        dense = _collect_dense_output(dense, nobj, 2, 5 if int_method_c == 5 else 8)
+
     # Reset input arrays
     if f_cont[0]:
         yo = numpy.asfortranarray(yo)
     if f_cont[1]:
         t = numpy.asfortranarray(t)
 
-    if single_obj:
+    if single_obj and dense_output:
+        return (result[0], err[0], dense[0])
+    elif single_obj:
         return (result[0], err[0])
+    elif dense_output:
+        return (result, err, dense)
     else:
         return (result, err)
 
@@ -253,11 +293,11 @@ def integrateLinearOrbit(
        pot - Potential or list of such instances
        yo - initial condition [q,p], shape [N,2]
        t - set of times at which one wants the result
-       int_method= 'leapfrog', 'odeint', or 'dop853'
-       rtol, atol= tolerances (not always used...)
+       int_method= 'leapfrog', 'odeint', 'dop853', or 'leapfrog_vec', 'symplec4_vec', 'rk4_vec' (all orbits integrated in lockstep)
+       rtol, atol= tolerances (not always used...; both are used by the lockstep integrators)
        numcores= (1) number of cores to use for multi-processing
        progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
-       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based and lockstep integrators)
     OUTPUT:
        (y,err)
        y : array, shape (N,len(t),2)
@@ -268,8 +308,26 @@ def integrateLinearOrbit(
        2010-07-13- Written - Bovy (NYU)
        2019-04-08 - Adapted to allow multiple orbits to be integrated at once and moved to integrateLinearOrbit.py - Bovy (UofT)
        2022-04-12 - Add progressbar - Bovy (UofT)
+       2026-10-19 - Added lockstep integrators
     """
-    if int_method.lower() == "leapfrog":
+    if int_method.lower().endswith("_vec"):
+        if rtol is None:
+            rtol = 1e-8
+        yo = numpy.asarray(yo, dtype="float")
+        return (
+            lockstepode.integrate_lockstep(
+                lambda x, v, tt: _linearForce_vec(x, pot, t=tt),
+                yo[:, :1],
+                yo[:, 1:],
+                t,
+                method=int_method.lower()[:-4],
+                dt=dt,
+                rtol=rtol,
+                atol=atol,
+            ),
+            numpy.zeros(len(yo)),
+        )
+    elif int_method.lower() == "leapfrog":
         if rtol is None:
             rtol = 1e-8
 
@@ -315,6 +373,16 @@ def integrateLinearOrbit(
         )
 
 
+def _linearForce_vec(x, pot, t=0.0):
+    """Forces for positions x [N,1] of many orbits at once"""
+    try:
+        force = _evaluatelinearForces(pot, x[:, 0], t=t)
+    except (TypeError, ValueError):
+        # Fall back to a loop for potentials that do not accept arrays
+        force = numpy.array([_evaluatelinearForces(pot, xx, t=t) for xx in x[:, 0]])
+    return (force + numpy.zeros(len(x)))[:, None]
+
+
 def _linearEOM(y, t, pot):
     """
     NAME:
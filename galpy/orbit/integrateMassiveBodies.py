@@ -0,0 +1,143 @@
+###############################################################################
+#   integrateMassiveBodies.py: integrate a small number of massive bodies
+#                              under the influence of an external potential
+#                              and of each other's gravity (restricted N-body)
+###############################################################################
+import numpy
+from scipy import integrate
+
+from ..potential.Potential import (
+    _evaluatephitorques,
+    _evaluateRforces,
+    _evaluatezforces,
+)
+
+
+# Number of substeps of each step of the adaptive integrator at which the
+# trajectories of the bodies are tabulated for interpolation
+_NSUBSTEP = 8
+
+
+def integrateMassiveBodies(
+    pot, xvs, pots, dynfrics, t, reflex=False, rtol=1e-10, atol=1e-10
+):
+    """
+    NAME:
+       integrateMassiveBodies
+    PURPOSE:
+       integrate a set of massive bodies under the influence of an external potential and of each other's potential
+    INPUT:
+       pot - external potential (list of Potential instances) centered on the origin
+       xvs - initial rectangular phase-space positions of the bodies [nbody,6] in internal units
+       pots - list of the potentials of the bodies, each centered on the origin
+       dynfrics - list with for each body None or a ChandrasekharDynamicalFrictionForce instance that acts on the body
+       t - times at which to output (internal units), starting at the time of the initial conditions
+       reflex= (False) if True, integrate in the frame of the center of pot, which is accelerated by the bodies
+       rtol=, atol= (1e-10) tolerances for the integration
+    OUTPUT:
+       (rectangular phase-space positions at t [nbody,nt,6],
+        internal times at which to tabulate the bodies for interpolation [ntab], which only depend on t[0] and t[-1],
+        rectangular phase-space positions at these internal times [nbody,ntab,6])
+    HISTORY:
+       2026-10-19 - Written
+    """
+    nbody = len(xvs)
+    sol = integrate.solve_ivp(
+        lambda tt, y: _massiveEOM(tt, y, pot, pots, dynfrics, reflex),
+        (t[0], t[-1]),
+        numpy.array(xvs, dtype="float").flatten(),
+        method="DOP853",
+        dense_output=True,
+        rtol=rtol,
+        atol=atol,
+    )
+    # Subdivide the steps of the integrator, which follow the dynamical time
+    # of the bodies, such that cubic interpolation between them is accurate
+    ttab = numpy.append(
+        (
+            sol.t[:-1, None]
+            + numpy.diff(sol.t)[:, None] * numpy.arange(_NSUBSTEP)[None] / _NSUBSTEP
+        ).flatten(),
+        sol.t[-1],
+    )
+    return (
+        sol.sol(t).reshape(nbody, 6, len(t)).transpose(0, 2, 1),
+        ttab,
+        sol.sol(ttab).reshape(nbody, 6, len(ttab)).transpose(0, 2, 1),
+    )
+
+
+def _massiveEOM(t, y, pot, pots, dynfrics, reflex):
+    """
+    NAME:
+       _massiveEOM
+    PURPOSE:
+       implements the EOM, i.e., the right-hand side of the differential
+       equation, for a set of massive bodies
+    INPUT:
+       t - current time
+       y - current rectangular phase-space positions of all bodies (flattened)
+       pot - external potential
+       pots - potentials of the bodies
+       dynfrics - dynamical friction acting on each body (or None)
+       reflex - if True, include the acceleration of the center of pot
+    OUTPUT:
+       dy/dt
+    HISTORY:
+       2026-10-19 - Written
+    """
+    xv = y.reshape(-1, 6)
+    acc = numpy.zeros((len(xv), 3))
+    for ii in range(len(xv)):
+        acc[ii] = _rectForce(xv[ii, :3], pot, t=t, v=xv[ii, 3:])
+        for jj in range(len(xv)):
+            if jj == ii:
+                continue
+            acc[ii] += _rectForce(xv[ii, :3] - xv[jj, :3], pots[jj], t=t)
+        if not dynfrics[ii] is None:
+            acc[ii] += _rectForce(xv[ii, :3], dynfrics[ii], t=t, v=xv[ii, 3:])
+    if reflex:
+        acc -= reflexAcceleration(xv[:, :3], pots, t=t)
+    return numpy.hstack((xv[:, 3:], acc)).flatten()
+
+
+def reflexAcceleration(xs, pots, t=0.0):
+    """
+    NAME:
+       reflexAcceleration
+    PURPOSE:
+       compute the acceleration of the origin due to a set of bodies
+    INPUT:
+       xs - rectangular positions of the bodies [nbody,3]
+       pots - potentials of the bodies, each centered on the origin
+       t= (0.) time
+    OUTPUT:
+       rectangular acceleration [3]
+    HISTORY:
+       2026-10-19 - Written
+    """
+    return numpy.sum(
+        [_rectForce(-numpy.asarray(x), p, t=t) for x, p in zip(xs, pots)], axis=0
+    )
+
+
+def _rectForce(x, pot, t=0.0, v=None):
+    """Rectangular force of (list of) Potential instance(s) at rectangular position x, with rectangular velocity v for dissipative forces"""
+    R = numpy.sqrt(x[0] ** 2.0 + x[1] ** 2.0)
+    phi = numpy.arctan2(x[1], x[0])
+    cosphi, sinphi = numpy.cos(phi), numpy.sin(phi)
+    if not v is None:
+        v = [
+            cosphi * v[0] + sinphi * v[1],
+            -sinphi * v[0] + cosphi * v[1],
+            v[2],
+        ]
+    Rforce = _evaluateRforces(pot, R, x[2], phi=phi, t=t, v=v)
+    phitorque = _evaluatephitorques(pot, R, x[2], phi=phi, t=t, v=v)
+    return numpy.array(
+        [
+            cosphi * Rforce - 1.0 / R * sinphi * phitorque,
+            sinphi * Rforce + 1.0 / R * cosphi * phitorque,
+            _evaluatezforces(pot, R, x[2], phi=phi, t=t, v=v),
+        ]
+    )
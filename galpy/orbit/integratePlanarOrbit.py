@@ -1,9 +1,11 @@
 import ctypes
 import ctypes.util
+import warnings
+import weakref
 
 import numpy
 from numpy.ctypeslib import ndpointer
-from scipy import integrate
+from scipy import integrate, interpolate
 
 from .. import potential
 from ..potential.planarPotential import (
@@ -14,7 +16,7 @@ from ..potential.planarPotential import (
     planarPotentialFromRZPotential,
 )
 from ..potential.WrapperPotential import parentWrapperPotential
-from ..util import _load_extension_libs, symplecticode
+from ..util import _load_extension_libs, galpyWarning, lockstepode, symplecticode
 from ..util._optional_deps import _NUMBA_LOADED, _TQDM_LOADED
 from ..util.leung_dop853 import dop853
 from ..util.multi import parallel_map
@@ -156,6 +158,28 @@ def _parse_pot(pot):
         ):
             pot_type.append(10)
             pot_args.extend([p._Pot._amp, p._Pot.a])
+        elif (
+            isinstance(p, planarPotentialFromRZPotential)
+            and isinstance(p._Pot, potential.DoubleExponentialDiskPotential)
+            and p._Pot._tab_enable_c
+            and p._Pot._tab_zgrid[0] == 0.0
+        ):  # Use the z=0 row of the tabulation, through interpSphericalPotential's C code
+            pot_type.append(36)
+            rmin, rmax = p._Pot._tab_rgrid[0], p._Pot._tab_rgrid[-1]
+            Mmax = -p._Pot._tab_rforceGrid[-1, 0] * rmax**2.0
+            pot_args.append(len(p._Pot._tab_rgrid))
+            pot_args.extend(p._Pot._tab_rgrid)
+            pot_args.extend(p._Pot._tab_rforceGrid[:, 0])
+            pot_args.extend(
+                [
+                    p._Pot._amp,
+                    rmin,
+                    rmax,
+                    Mmax,
+                    p._Pot._tab_potGrid[0, 0],
+                    p._Pot._tab_potGrid[-1, 0] + Mmax / rmax,
+                ]
+            )
         elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
             p._Pot, potential.DoubleExponentialDiskPotential
         ):
@@ -283,6 +307,22 @@ def _parse_pot(pot):
         elif (
             isinstance(p, planarPotentialFromFullPotential)
             or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.TimeDependentSCFPotential):
+            pt, pa, ptf = _parse_tdscf_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.CompiledPotential):
+            pt, pa, ptf = _parse_compiled_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
         ) and isinstance(p._Pot, potential.SCFPotential):
             pt, pa, ptf = _parse_scf_pot(p._Pot)
             pot_type.append(pt)
@@ -349,7 +389,7 @@ def _parse_pot(pot):
             pot_type.append(27)
             pot_args.extend(
                 [
-                    len(p._Pot._Cs),
+                    len(p._Pot._Cs0),
                     p._Pot._amp,
                     p._Pot._N,
                     p._Pot._sin_alpha,
@@ -361,7 +401,7 @@ def _parse_pot(pot):
                     p._Pot._omega,
                 ]
             )
-            pot_args.extend(p._Pot._Cs)
+            pot_args.extend(p._Pot._Cs0)
         elif isinstance(p, potential.CosmphiDiskPotential):
             pot_type.append(28)
             pot_args.extend(
@@ -413,6 +453,43 @@ def _parse_pot(pot):
             p._Pot, potential.NullPotential
         ):
             pot_type.append(40)
+        elif isinstance(p, planarPotentialFromFullPotential) and isinstance(
+            p._Pot, potential.interp3DPotential
+        ):
+            pot_type.append(41)
+            pot_args.extend(
+                [
+                    p._Pot._amp,
+                    len(p._Pot._xgrid),
+                    len(p._Pot._zgrid),
+                    p._Pot._nphi,
+                    p._Pot._xgrid[0],
+                    p._Pot._dx,
+                    p._Pot._zgrid[0],
+                    p._Pot._dz,
+                    p._Pot._dphi,
+                    int(p._Pot._logR),
+                    int(p._Pot._zsym),
+                    p._Pot._omegab,
+                    p._Pot._pa,
+                ]
+            )
+            pot_args.extend([numpy.nan] * 7)  # for caching
+            pot_args.append(p._Pot._tables.flatten())
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.MultipoleExpansionPotential):
+            pt, pa, ptf = _parse_multipole_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.CylindricalFourierExpansionPotential):
+            pt, pa, ptf = _parse_cylfourier_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
         ############################## WRAPPERS ###############################
         elif (
             (
@@ -501,6 +578,24 @@ def _parse_pot(pot):
             pot_args.extend(p._orb.y(p._orb.t, use_physical=False))
             pot_args.extend([p._amp])
             pot_args.extend([p._orb.t[0], p._orb.t[-1]])  # t_0, t_f
+        elif (
+            (
+                isinstance(p, planarPotentialFromFullPotential)
+                or isinstance(p, planarPotentialFromRZPotential)
+            )
+            and isinstance(p._Pot, potential.MovingObjectPopulationPotential)
+        ) or isinstance(p, potential.MovingObjectPopulationPotential):
+            if not isinstance(p, potential.MovingObjectPopulationPotential):
+                p = p._Pot
+            pot_type.append(-10)
+            wrap_npot, wrap_pot_type, wrap_pot_args, wrap_pot_tfuncs = _parse_pot(
+                potential.toPlanarPotential(p._pot)
+            )
+            pot_args.append(wrap_npot)
+            pot_type.extend(wrap_pot_type)
+            pot_args.extend(wrap_pot_args)
+            pot_tfuncs.extend(wrap_pot_tfuncs)
+            pot_args.extend(_moving_object_population_args(p))
         elif (
             (
                 isinstance(p, planarPotentialFromFullPotential)
@@ -531,11 +626,41 @@ def _parse_pot(pot):
             pot_tfuncs.extend(wrap_pot_tfuncs)
             pot_args.append(p._amp)
             pot_tfuncs.append(p._A)
+            pot_args.extend(_tfuncs_tables(p, [p._A]))
     pot_type = numpy.array(pot_type, dtype=numpy.int32, order="C")
-    pot_args = numpy.array(pot_args, dtype=numpy.float64, order="C")
+    pot_args = _flatten_pot_args(pot_args)
     return (npot, pot_type, pot_args, pot_tfuncs)
 
 
+def _moving_object_population_args(p):
+    """Arguments of a MovingObjectPopulationPotential: amp, rmax^2 (-1 for none), nt, nobj, 7 for caching, time grid, amplitude and scale factors, and the phase-space positions as a single table"""
+    return (
+        [
+            p._amp,
+            -1.0 if p._rmax is None else p._rmax**2.0,
+            len(p._ts),
+            p._nobj,
+        ]
+        + [numpy.nan] * 7
+        + [p._ts, p._amps, p._scales, p._xv]
+    )
+
+
+def _flatten_pot_args(pot_args):
+    """Convert the list of potential arguments, which may contain arrays holding large tables (added with append rather than extend to avoid converting them element-by-element), into a single array"""
+    out = []
+    scalars = []
+    for arg in pot_args:
+        if isinstance(arg, numpy.ndarray) and arg.ndim > 0:
+            out.append(numpy.array(scalars, dtype=numpy.float64))
+            out.append(arg.flatten())
+            scalars = []
+        else:
+            scalars.append(arg)
+    out.append(numpy.array(scalars, dtype=numpy.float64))
+    return numpy.ascontiguousarray(numpy.concatenate(out), dtype=numpy.float64)
+
+
 def _parse_integrator(int_method):
     """parse the integrator method to pass to C"""
     # Pick integrator
@@ -551,6 +676,12 @@ def _parse_integrator(int_method):
         int_method_c = 5
     elif int_method.lower() == "dop853_c":
         int_method_c = 6
+    elif int_method.lower() == "leapfrog_adaptive_c":
+        int_method_c = 7
+    elif int_method.lower() == "symplec4_adaptive_c":
+        int_method_c = 8
+    elif int_method.lower() == "symplec6_adaptive_c":
+        int_method_c = 9
     else:
         int_method_c = 0
     return int_method_c
@@ -582,6 +713,95 @@ def _parse_scf_pot(p, extra_amp=1.0):
     return (24, pot_args, [])  # latter is pot_tfuncs
 
 
+def _parse_tdscf_pot(p):
+    # Stand-alone parser for TimeDependentSCFPotential, bc re-used
+    isNonAxi = p.isNonAxi
+    nt, N, L, M = p._Acos_t.shape
+    pot_args = [nt, p._cubic, isNonAxi, N, L, M, numpy.nan]  # last for caching
+    pot_args.append(p._tgrid)
+    series = p._amp * numpy.asarray(p._Acos_t) * p._NN
+    if isNonAxi:
+        series = numpy.concatenate(
+            (series, p._amp * numpy.asarray(p._Asin_t) * p._NN), axis=1
+        )
+    pot_args.append(series.flatten(order="C"))
+    # SCFPotential arguments, coefficients are filled in for the current time
+    pot_args.extend([p._a, isNonAxi, N, L, M])
+    pot_args.append(numpy.zeros((1 + isNonAxi) * N * L * M))
+    pot_args.extend([-1.0, 0, 0, 0, 0, 0, 0])
+    return (44, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_compiled_pot(p):
+    # Stand-alone parser for CompiledPotential, bc re-used
+    from ..potential.CompiledPotential import _C_FUNCS
+
+    pot_args = [p._amp]
+    nfuncs = 0
+    for name in _C_FUNCS:
+        if name in p._funcs:
+            pot_args.append(nfuncs)
+            nfuncs += 1
+        else:
+            pot_args.append(-1)
+    pot_args.append(nfuncs)
+    pot_args.append(0.0)  # functions are not tabulated
+    # Compiled functions f(R,z,phi,t) are passed as the functions of time
+    return (45, pot_args, p._c_funcs())
+
+
+def _parse_multipole_pot(p):
+    # Stand-alone parser for MultipoleExpansionPotential, bc re-used
+    nlm = len(p._l)
+    pot_args = [p._amp, p._L, len(p._rgrid)]
+    pot_args.extend([numpy.nan] * 7)  # for caching
+    pot_args.append(p._logrgrid)
+    pot_args.append(
+        numpy.stack((p._Acos, p._dAcos, p._Asin, p._dAsin), axis=-1)
+        .transpose(1, 0, 2)
+        .flatten()
+    )
+    pot_args.append(numpy.zeros(2 * nlm + 2 * (p._L + 1)))  # scratch space
+    return (42, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_cylfourier_pot(p):
+    # Stand-alone parser for CylindricalFourierExpansionPotential, bc re-used
+    pot_args = [
+        p._amp,
+        p._M,
+        len(p._Rgrid),
+        len(p._zgrid),
+        p._Rgrid[0],
+        p._dR,
+        p._zgrid[0],
+        p._dz,
+        int(p._zsym),
+        p._totmass,
+    ]
+    pot_args.extend([numpy.nan] * 7)  # for caching
+    pot_args.append(p._table.flatten())
+    pot_args.append(numpy.zeros(6 * (p._M + 1)))  # scratch space
+    return (43, pot_args, [])  # latter is pot_tfuncs
+
+
+# numba-compiled functions of time, such that they are only compiled once
+_numba_tfuncs = weakref.WeakKeyDictionary()
+
+
+def _numba_tfunc(func):
+    try:
+        return _numba_tfuncs[func]
+    except (KeyError, TypeError):
+        pass
+    out = cfunc(types.double(types.double), nopython=True)(func)
+    try:
+        _numba_tfuncs[func] = out
+    except TypeError:  # pragma: no cover
+        pass  # cannot be weakly referenced, don't cache
+    return out
+
+
 def _prep_tfuncs(pot_tfuncs):
     if len(pot_tfuncs) == 0:
         pot_tfuncs = None  # NULL
@@ -589,19 +809,172 @@ def _prep_tfuncs(pot_tfuncs):
         func_ctype = ctypes.CFUNCTYPE(
             ctypes.c_double, ctypes.c_double  # Return type
         )  # time
-        try:  # using numba
-            if not _NUMBA_LOADED:
-                raise
-            nb_c_sig = types.double(types.double)
-            func_pyarr = [cfunc(nb_c_sig, nopython=True)(a).ctypes for a in pot_tfuncs]
-        except:  # Any Exception, switch to regular ctypes wrapping
-            func_pyarr = [func_ctype(a) for a in pot_tfuncs]
+        func_pyarr = [_prep_tfunc(a, func_ctype) for a in pot_tfuncs]
         pot_tfuncs = (func_ctype * len(func_pyarr))(*func_pyarr)
     return pot_tfuncs
 
 
+def _prep_tfunc(func, func_ctype):
+    if isinstance(func, ctypes._CFuncPtr):
+        # Already compiled (e.g., for CompiledPotential), C casts it back to
+        # its actual signature
+        return ctypes.cast(func, func_ctype)
+    try:  # using numba
+        if not _NUMBA_LOADED:
+            raise
+        return _numba_tfunc(func).ctypes
+    except:  # Any Exception, switch to regular ctypes wrapping
+        return func_ctype(func)
+
+
+def _tfuncs_tables(p, tfuncs):
+    """Arguments for C that describe the spline tables of the functions of time tfuncs of potential p: a zero if p does not tabulate them, otherwise a one followed by the start time, time spacing, number of intervals, and polynomial coefficients of each function's table"""
+    if getattr(p, "_tfuncs_tabulate", None) is None:
+        return [0.0]
+    if getattr(p, "_tfuncs_tables_cache", None) is None:
+        tmin, tmax, tol = p._tfuncs_tabulate
+        p._tfuncs_tables_cache = [
+            _tabulate_tfunc(func, tmin, tmax, tol) for func in tfuncs
+        ]
+    out = [1.0]
+    for spl in p._tfuncs_tables_cache:
+        out.extend([spl.x[0], spl.x[1] - spl.x[0], len(spl.x) - 1, spl.c.T.flatten()])
+    return out
+
+
+def _tabulate_tfunc(func, tmin, tmax, tol, nmax=2**20 + 1):
+    """Cubic spline of a function of time on a uniform grid in [tmin,tmax] that is refined until the spline is accurate to tol relative to the maximum absolute value of the function"""
+    ts = numpy.linspace(tmin, tmax, 257)
+    fs = _evaluate_tfunc(func, ts)
+    while True:
+        spl = interpolate.CubicSpline(ts, fs)
+        tmids = 0.5 * (ts[1:] + ts[:-1])
+        fmids = _evaluate_tfunc(func, tmids)
+        scale = numpy.amax(numpy.fabs(numpy.concatenate((fs, fmids))))
+        if scale == 0.0:
+            scale = 1.0
+        err = numpy.amax(numpy.fabs(spl(tmids) - fmids)) / scale
+        if err <= tol:
+            break
+        if 2 * len(ts) - 1 > nmax:
+            warnings.warn(
+                f"Spline table of function of time only reached a relative accuracy of {err:.2g} (requested: {tol:.2g}) with {len(ts)} points; consider tabulating a smaller time range",
+                galpyWarning,
+            )
+            break
+        newts = numpy.empty(2 * len(ts) - 1)
+        newts[::2] = ts
+        newts[1::2] = tmids
+        newfs = numpy.empty(2 * len(ts) - 1)
+        newfs[::2] = fs
+        newfs[1::2] = fmids
+        ts, fs = newts, newfs
+    return spl
+
+
+def _evaluate_tfunc(func, ts):
+    """Evaluate a function of time on an array of times, looping over the times if the function does not accept arrays"""
+    try:
+        out = numpy.asarray(func(ts), dtype="float")
+    except Exception:
+        out = None
+    if out is None or out.shape != ts.shape:
+        out = numpy.array([func(t) for t in ts], dtype="float")
+    return out
+
+
+# Built-in events, see galpy/util/dense_output.h
+_EVENT_TYPES = {"pericenter": 0, "apocenter": 1, "zcross": 2, "zmax": 3, "escape": 4}
+
+
+def _parse_events(events):
+    """Parse a list of events (name,parameter,terminal) to pass to C"""
+    if events is None:
+        events = []
+    event_type = numpy.array(
+        [_EVENT_TYPES[ev[0]] for ev in events], dtype=numpy.int32, order="C"
+    )
+    event_par = numpy.array([ev[1] for ev in events], dtype=numpy.float64, order="C")
+    event_terminal = numpy.array([ev[2] for ev in events], dtype=numpy.int32, order="C")
+    return (len(events), event_type, event_par, event_terminal)
+
+
+def _collect_dense_output(dense, nobj, dim, ncoeff, events=False):
+    """Copy the dense output of nobj objects from C into numpy arrays and free the C storage; returns a list of (tstep,coeff), with tstep=(nstep,2) array of (start time,step size) and coeff=(nstep,ncoeff,dim) array of interpolation coefficients, and, if events, a list of (t,indx,state) of the detected events, with indx the index of the event in the input list and state=(nevent,dim)"""
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    nstepFunc = _lib.denseOutput_nstep
+    nstepFunc.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    nstepFunc.restype = ctypes.c_int
+    copyFunc = _lib.denseOutput_copy
+    copyFunc.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+    ]
+    neventFunc = _lib.denseOutput_nevent
+    neventFunc.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    neventFunc.restype = ctypes.c_int
+    copyEventsFunc = _lib.denseOutput_copy_events
+    copyEventsFunc.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+    ]
+    freeFunc = _lib.free_denseOutput
+    freeFunc.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    out = []
+    out_events = []
+    for ii in range(nobj):
+        nstep = nstepFunc(dense, ctypes.c_int(ii))
+        tstep = numpy.empty((nstep, 2))
+        coeff = numpy.empty((nstep, ncoeff, dim))
+        copyFunc(dense, ctypes.c_int(ii), tstep, coeff)
+        out.append((tstep, coeff))
+        if events:
+            nevent = neventFunc(dense, ctypes.c_int(ii))
+            tevent = numpy.empty(nevent)
+            indx = numpy.empty(nevent, dtype=numpy.int32)
+            state = numpy.empty((nevent, dim))
+            copyEventsFunc(dense, ctypes.c_int(ii), tevent, indx, state)
+            out_events.append((tevent, indx, state))
+    freeFunc(dense, ctypes.c_int(nobj))
+    if events:
+        return (out, out_events)
+    return out
+
+
+def _eval_dense_output(tstep, coeff, t):
+    """Evaluate the dense output (tstep,coeff) of a single object (see _collect_dense_output) at times t; returns (len(t),dim) array"""
+    t = numpy.atleast_1d(t)
+    # Steps are ordered in the direction of integration
+    sgn = numpy.sign(tstep[0, 1])
+    indx = numpy.searchsorted(sgn * tstep[:, 0], sgn * t, side="right") - 1
+    indx = numpy.clip(indx, 0, len(tstep) - 1)
+    s = ((t - tstep[indx, 0]) / tstep[indx, 1])[:, None]
+    s1 = 1.0 - s
+    # y = c1 + s*(c2 + s1*(c3 + s*(c4 + s1*(c5 + ...)))), from the inside out
+    c = coeff[indx]
+    out = c[:, -1]
+    for ii in range(coeff.shape[1] - 2, -1, -1):
+        out = c[:, ii] + (s if ii % 2 == 0 else s1) * out
+    return out
+
+
 def integratePlanarOrbit_c(
-    pot, yo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+    pot,
+    yo,
+    t,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    dense_output=False,
+    events=None,
+    dtype=numpy.float64,
 ):
     """
     NAME:
@@ -616,8 +989,11 @@ def integratePlanarOrbit_c(
        rtol, atol
        progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
        dt= (None) force integrator to use this stepsize (default is to automatically determine one)
+       dense_output= (False) if True, also return the dense output (continuous interpolant) of each orbit, in rectangular coordinates (only for 'dopr54_c' and 'dop853_c')
+       events= (None) list of events (name,parameter,terminal) to detect on the dense output, with name 'pericenter', 'apocenter', 'zcross', 'zmax', or 'escape' (for which the parameter is the escape radius), and terminal whether the event stops the integration (output after that is NaN); only for 'dopr54_c' and 'dop853_c'
+       dtype= (numpy.float64) precision in which to store the output, numpy.float64 or numpy.float32 (the integration itself is always performed in double precision)
    OUTPUT:
-       (y,err)
+       (y,err), followed by dense if dense_output and events if events, with dense a list of (tstep,coeff) and events a list of (t,indx,state) for each object in rectangular coordinates (see _collect_dense_output)
        y : array, shape (len(y0),len(t),4)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
@@ -626,6 +1002,8 @@ def integratePlanarOrbit_c(
        2011-10-03 - Written - Bovy (IAS)
        2018-12-20 - Adapted to allow multiple objects - Bovy (UofT)
        2022-04-12 - Add progressbar - Bovy (UofT)
+       2026-10-19 - Added dense_output and events
+       2026-10-19 - Added dtype
     """
     if len(yo.shape) == 1:
         single_obj = True
@@ -640,8 +1018,13 @@ def integratePlanarOrbit_c(
     if dt is None:
         dt = -9999.99
 
-    # Set up result array
-    result = numpy.empty((nobj, len(t), 4))
+    # Set up result array; for single-precision output, the C code writes the
+    # output to result_single instead
+    single = numpy.dtype(dtype) == numpy.dtype(numpy.float32)
+    result = numpy.empty((0,) if single else (nobj, len(t), 4))
+    result_single = (
+        numpy.empty((nobj, len(t), 4), dtype=numpy.float32) if single else None
+    )
     err = numpy.zeros(nobj, dtype=numpy.int32)
 
     # Set up progressbar
@@ -672,6 +1055,13 @@ def integratePlanarOrbit_c(
         ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
         ctypes.c_int,
         ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.c_int,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_void_p,
     ]
 
     # Array requirements, first store old order
@@ -681,6 +1071,10 @@ def integratePlanarOrbit_c(
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
     err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
 
+    # Set up the handle for the dense output and the events
+    dense = ctypes.c_void_p()
+    nevent, event_type, event_par, event_terminal = _parse_events(events)
+
     # Run the C code
     integrationFunc(
         ctypes.c_int(nobj),
@@ -698,6 +1092,13 @@ def integratePlanarOrbit_c(
         err,
         ctypes.c_int(int_method_c),
         pbar_c,
+        ctypes.byref(dense) if dense_output or nevent > 0 else None,
+        ctypes.c_int(dense_output),
+        ctypes.c_int(nevent),
+        event_type,
+        event_par,
+        event_terminal,
+        result_single.ctypes.data_as(ctypes.c_void_p) if single else None,
     )
 
     if nobj > 1 and progressbar:
@@ -706,16 +1107,29 @@ def integratePlanarOrbit_c(
     if numpy.any(err == -10):  # pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
+    if single:
+        result = result_single
+
+    if dense_output or nevent > 0:
+        dense, events = _collect_dense_output(
+            dense, nobj, 4, 5 if int_method_c == 5 else 8, events=True
+        )
+
     # Reset input arrays
     if f_cont[0]:
         yo = numpy.asfortranarray(yo)
     if f_cont[1]:
         t = numpy.asfortranarray(t)
 
+    out = (result, err)
+    if dense_output:
+        out += (dense,)
+    if nevent > 0:
+        out += (events,)
     if single_obj:
-        return (result[0], err[0])
+        return tuple(o[0] for o in out)
     else:
-        return (result, err)
+        return out
 
 
 def integratePlanarOrbit_dxdv_c(
@@ -821,11 +1235,11 @@ def integratePlanarOrbit(
        pot - Potential or list of such instances
        yo - initial condition [q,p], shape [N,3] or [N,4]
        t - set of times at which one wants the result
-       int_method= 'leapfrog', 'odeint', or 'dop853'
-       rtol, atol= tolerances (not always used...)
+       int_method= 'leapfrog', 'odeint', 'dop853', or 'leapfrog_vec', 'symplec4_vec', 'rk4_vec' (all orbits integrated in lockstep)
+       rtol, atol= tolerances (not always used...; both are used by the lockstep integrators)
        numcores= (1) number of cores to use for multi-processing
        progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
-       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators!)
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one; only for C-based and lockstep integrators!)
     OUTPUT:
        (y,err)
        y : array, shape (N,len(t),3/4)
@@ -836,6 +1250,7 @@ def integratePlanarOrbit(
        2010-07-20 - Written - Bovy (NYU)
        2019-04-09 - Adapted to allow multiple objects and parallel mapping - Bovy (UofT)
        2022-04-12 - Add progressbar - Bovy (UofT)
+       2026-10-19 - Added lockstep integrators
     """
     nophi = False
     if not int_method.lower() == "dop853" and not int_method == "odeint":
@@ -843,7 +1258,10 @@ def integratePlanarOrbit(
             nophi = True
             # We hack this by putting in a dummy phi=0
             yo = numpy.pad(yo, ((0, 0), (0, 1)), "constant", constant_values=0)
-    if int_method.lower() == "leapfrog":
+    if int_method.lower().endswith("_vec"):
+        if rtol is None:
+            rtol = 1e-8
+    elif int_method.lower() == "leapfrog":
         if rtol is None:
             rtol = 1e-8
 
@@ -925,7 +1343,36 @@ def integratePlanarOrbit(
                 0
             ]
 
-    if len(yo) == 1:  # Can't map a single value...
+    if int_method.lower().endswith("_vec"):
+        # Advance all orbits together in the rectangular frame
+        yo = numpy.asarray(yo, dtype="float")
+        cp, sp = numpy.cos(yo[:, 3]), numpy.sin(yo[:, 3])
+        tmp_out = lockstepode.integrate_lockstep(
+            lambda x, v, tt: _planarRectForce_vec(x, v, pot, t=tt),
+            numpy.stack([yo[:, 0] * cp, yo[:, 0] * sp], axis=-1),
+            numpy.stack(
+                [yo[:, 1] * cp - yo[:, 2] * sp, yo[:, 2] * cp + yo[:, 1] * sp],
+                axis=-1,
+            ),
+            t,
+            method=int_method.lower()[:-4],
+            dt=dt,
+            rtol=rtol,
+            atol=atol,
+        )
+        # go back to the cylindrical frame
+        phi = numpy.arctan2(tmp_out[..., 1], tmp_out[..., 0]) % (2.0 * numpy.pi)
+        cp, sp = numpy.cos(phi), numpy.sin(phi)
+        out = numpy.stack(
+            [
+                numpy.sqrt(tmp_out[..., 0] ** 2.0 + tmp_out[..., 1] ** 2.0),
+                tmp_out[..., 2] * cp + tmp_out[..., 3] * sp,
+                tmp_out[..., 3] * cp - tmp_out[..., 2] * sp,
+                phi,
+            ],
+            axis=-1,
+        )
+    elif len(yo) == 1:  # Can't map a single value...
         out = numpy.atleast_3d(integrate_for_map(yo[0]).T).T
     else:
         out = numpy.array(
@@ -1209,6 +1656,126 @@ def integratePlanarOrbit_sos_c(
         return (result, err)
 
 
+def integratePlanarOrbit_crossings_c(
+    pot,
+    yo,
+    ncross,
+    t0,
+    tmax,
+    int_method,
+    surface="x",
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+):
+    """
+    NAME:
+       integratePlanarOrbit_crossings_c
+    PURPOSE:
+       Find the upward crossings of x=0 or y=0 of a PlanarOrbit in C, by integrating in time and detecting the crossings on the dense output of the integrator
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p], shape [N,4]
+       ncross - maximum number of crossings to find for each orbit
+       t0 - initial time (scalar or [N])
+       tmax - maximum integration time (the integration stops at t0+tmax if fewer than ncross crossings are found)
+       int_method= 'dopr54_c' or 'dop853_c'
+       surface= ('x') surface to use ('x' for finding x=0, vx>0; 'y' for finding y=0, vy>0)
+       rtol, atol= tolerances
+       progressbar= (True) if True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!)
+       dt= (None) initial step to use (default is to automatically determine one)
+    OUTPUT:
+       (y,err)
+       y : array, shape (N,ncross,5) with the phase-space position [R,vR,vT,phi] at each crossing, followed by the time of the crossing; NaN for crossings that did not occur before t0+tmax
+       err: error message
+    HISTORY:
+       2026-10-19 - Written
+    """
+    if len(yo.shape) == 1:
+        single_obj = True
+    else:
+        single_obj = False
+    yo = numpy.atleast_2d(yo)
+    nobj = len(yo)
+    rtol, atol = _parse_tol(rtol, atol)
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+    int_method_c = _parse_integrator(int_method)
+    if dt is None:
+        dt = -9999.99
+    t = numpy.empty((nobj, 2))
+    t[:, 0] = t0
+    t[:, 1] = t[:, 0] + tmax
+    yoo = numpy.array(yo[:, :4], dtype=numpy.float64, order="C")
+
+    # Set up result array
+    result = numpy.empty((nobj, ncross, 5))
+    err = numpy.zeros(nobj, dtype=numpy.int32)
+
+    # Set up progressbar
+    progressbar *= _TQDM_LOADED
+    if nobj > 1 and progressbar:
+        pbar = tqdm.tqdm(total=nobj, leave=False)
+        pbar_func_ctype = ctypes.CFUNCTYPE(None)
+        pbar_c = pbar_func_ctype(pbar.update)
+    else:  # pragma: no cover
+        pbar_c = None
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    integrationFunc = _lib.integratePlanarOrbit_crossings
+    integrationFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ctypes.c_double,
+        ctypes.c_double,
+        ctypes.c_double,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+
+    # Run the C code
+    integrationFunc(
+        ctypes.c_int(nobj),
+        yoo,
+        ctypes.c_int(ncross),
+        t,
+        ctypes.c_int(1 if surface == "y" else 0),
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        ctypes.c_double(dt),
+        ctypes.c_double(rtol),
+        ctypes.c_double(atol),
+        result,
+        err,
+        ctypes.c_int(int_method_c),
+        pbar_c,
+    )
+
+    if nobj > 1 and progressbar:
+        pbar.close()
+
+    if numpy.any(err == -10):  # pragma: no cover
+        raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
+
+    if single_obj:
+        return (result[0], err[0])
+    else:
+        return (result, err)
+
+
 def integratePlanarOrbit_sos(
     pot,
     yo,
@@ -1284,7 +1851,7 @@ def integratePlanarOrbit_sos(
                     this_vxvv,
                     t=psi + init_psi,
                     args=(pot,),
-                    **extra_kwargs
+                    **extra_kwargs,
                 )
                 # go back to the cylindrical frame
                 x = intOut[:, 2] * numpy.sin(psi + init_psi)
@@ -1309,7 +1876,7 @@ def integratePlanarOrbit_sos(
                     this_vxvv,
                     t=psi + init_psi,
                     args=(pot,),
-                    **extra_kwargs
+                    **extra_kwargs,
                 )
                 # go back to the cylindrical frame
                 x = intOut[:, 0]
@@ -1557,3 +2124,42 @@ def _planarRectForce(x, pot, t=0.0):
             sinphi * Rforce + 1.0 / R * cosphi * phitorque,
         ]
     )
+
+
+def _planarRectForce_vec(x, v, pot, t=0.0):
+    """
+    NAME:
+       _planarRectForce_vec
+    PURPOSE:
+       returns the planar force in the rectangular frame for many orbits at once
+    INPUT:
+       x - current positions [N,2]
+       v - current velocities [N,2] (same signature as _rectForce_vec; unused, because dissipative forces cannot be converted to planar forces)
+       pot - (list of) Potential instance(s)
+       t - current time
+    OUTPUT:
+       force [N,2]
+    HISTORY:
+       2026-10-19 - Written
+    """
+    R = numpy.sqrt(x[:, 0] ** 2.0 + x[:, 1] ** 2.0)
+    phi = numpy.arctan2(x[:, 1], x[:, 0])
+    cosphi, sinphi = numpy.cos(phi), numpy.sin(phi)
+    try:
+        Rforce = _evaluateplanarRforces(pot, R, phi=phi, t=t)
+        phitorque = _evaluateplanarphitorques(pot, R, phi=phi, t=t)
+    except (TypeError, ValueError):
+        # Fall back to a loop for potentials that do not accept arrays
+        Rforce = numpy.array(
+            [_evaluateplanarRforces(pot, RR, phi=pp, t=t) for RR, pp in zip(R, phi)]
+        )
+        phitorque = numpy.array(
+            [_evaluateplanarphitorques(pot, RR, phi=pp, t=t) for RR, pp in zip(R, phi)]
+        )
+    return numpy.stack(
+        [
+            cosphi * Rforce - 1.0 / R * sinphi * phitorque,
+            sinphi * Rforce + 1.0 / R * cosphi * phitorque,
+        ],
+        axis=-1,
+    )
@@ -23,6 +23,9 @@
 #ifndef ORBITS_CHUNKSIZE
 #define ORBITS_CHUNKSIZE 1
 #endif
+// Relative step for finite-difference Jacobians: DBL_EPSILON^(1/3)
+#define DXDV_FD_STEP 6.0554544523933395e-06
+#define DXDV_FD_MINSCALE 1e-3
 //Macros to export functions in DLL on different OS
 #if defined(_WIN32)
 #define EXPORT __declspec(dllexport)
@@ -51,8 +54,8 @@ void evalRectDeriv(double, double *, double *,
 			 int, struct potentialArg *);
 void evalSOSDeriv(double, double *, double *,
 			 int, struct potentialArg *);
-void evalRectDeriv_dxdv(double,double *, double *,
-			      int, struct potentialArg *);
+void evalRectForce_dxdv(double, double *, double *,
+			int, struct potentialArg *,int);
 void initMovingObjectSplines(struct potentialArg *, double ** pot_args);
 void initChandrasekharDynamicalFrictionSplines(struct potentialArg *, double ** pot_args);
 /*
@@ -529,6 +532,66 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
+    case 41: //interp3DPotential, 20 arguments + padded table
+      potentialArgs->potentialEval= &interp3DPotentialEval;
+      potentialArgs->Rforce= &interp3DPotentialRforce;
+      potentialArgs->zforce= &interp3DPotentialzforce;
+      potentialArgs->phitorque= &interp3DPotentialphitorque;
+      potentialArgs->nargs= (int) (20 + 4 * ( *(*pot_args+1) + 2 )
+				   * ( *(*pot_args+2) + 2 )
+				   * ( *(*pot_args+3) + 3 ));
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 42: //MultipoleExpansionPotential, 10 + nr arguments + table + scratch
+      potentialArgs->potentialEval= &MultipoleExpansionPotentialEval;
+      potentialArgs->Rforce= &MultipoleExpansionPotentialRforce;
+      potentialArgs->zforce= &MultipoleExpansionPotentialzforce;
+      potentialArgs->phitorque= &MultipoleExpansionPotentialphitorque;
+      potentialArgs->nargs= (int) (10 + *(*pot_args+2)
+				   + ( *(*pot_args+1) + 1 ) * ( *(*pot_args+1) + 2 )
+				   * ( 2 * *(*pot_args+2) + 1 )
+				   + 2 * ( *(*pot_args+1) + 1 ));
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 43: //CylindricalFourierExpansionPotential, 17 arguments + table + scratch
+      potentialArgs->potentialEval= &CylindricalFourierExpansionPotentialEval;
+      potentialArgs->Rforce= &CylindricalFourierExpansionPotentialRforce;
+      potentialArgs->zforce= &CylindricalFourierExpansionPotentialzforce;
+      potentialArgs->phitorque= &CylindricalFourierExpansionPotentialphitorque;
+      potentialArgs->nargs= (int) (17 + 6 * ( *(*pot_args+1) + 1 )
+				   * ( ( *(*pot_args+2) + 2 )
+				       * ( *(*pot_args+3) + 2 ) + 1 ));
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 44: //TimeDependentSCFPotential, 7 + nt + (nt+1) x coefficients + 12 arguments
+      potentialArgs->potentialEval= &TimeDependentSCFPotentialEval;
+      potentialArgs->Rforce= &TimeDependentSCFPotentialRforce;
+      potentialArgs->zforce= &TimeDependentSCFPotentialzforce;
+      potentialArgs->phitorque= &TimeDependentSCFPotentialphitorque;
+      potentialArgs->dens= &TimeDependentSCFPotentialDens;
+      potentialArgs->nargs= (int) (7 + *(*pot_args)
+				   + ( *(*pot_args) + 1 ) * ( 1 + *(*pot_args+2) )
+				   * *(*pot_args+3) * *(*pot_args+4) * *(*pot_args+5)
+				   + 12);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 45: //CompiledPotential, 10 arguments
+      if ( *(*pot_args+1) >= 0 )
+	potentialArgs->potentialEval= &CompiledPotentialEval;
+      potentialArgs->Rforce= &CompiledPotentialRforce;
+      potentialArgs->zforce= &CompiledPotentialzforce;
+      potentialArgs->phitorque= ( *(*pot_args+4) >= 0 ) ? \
+	&CompiledPotentialphitorque : &ZeroForce;
+      if ( *(*pot_args+5) >= 0 )
+	potentialArgs->dens= &CompiledPotentialDens;
+      potentialArgs->nargs= 10;
+      potentialArgs->ntfuncs= (int) *(*pot_args+9);
+      potentialArgs->requiresVelocity= false;
+      break;
 //////////////////////////////// WRAPPERS /////////////////////////////////////
     case -1: //DehnenSmoothWrapperPotential
       potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
@@ -597,9 +660,17 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->ntfuncs= 1;
       potentialArgs->requiresVelocity= false;
       break;
+    case -10: //MovingObjectPopulationPotential, nargs set below
+      potentialArgs->Rforce= &MovingObjectPopulationPotentialRforce;
+      potentialArgs->zforce= &MovingObjectPopulationPotentialzforce;
+      potentialArgs->phitorque= &MovingObjectPopulationPotentialphitorque;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
     }
     int setupMovingObjectSplines = *(*pot_type-1) == -6 ? 1 : 0;
     int setupChandrasekharDynamicalFrictionSplines = *(*pot_type-1) == -7 ? 1 : 0;
+    int setupMovingObjectPopulation = *(*pot_type-1) == -10 ? 1 : 0;
     if ( *(*pot_type-1) < 0 ) { // Parse wrapped potential for wrappers
       potentialArgs->nwrapped= (int) *(*pot_args)++;
       potentialArgs->wrappedPotentialArg= \
@@ -613,6 +684,10 @@ void parse_leapFuncArgs_Full(int npot,
       initMovingObjectSplines(potentialArgs, pot_args);
     if (setupChandrasekharDynamicalFrictionSplines)
       initChandrasekharDynamicalFrictionSplines(potentialArgs,pot_args);
+    if (setupMovingObjectPopulation) // 11 + nt + 2 nobj + 6 nt nobj
+      potentialArgs->nargs= (int) ( 11 + *(*pot_args+2)
+				    + 2 * *(*pot_args+3)
+				    + 6 * *(*pot_args+2) * *(*pot_args+3) );
     // Now load each potential's parameters
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -624,6 +699,7 @@ void parse_leapFuncArgs_Full(int npot,
     if ( potentialArgs->ntfuncs > 0 ) {
       potentialArgs->tfuncs= (*pot_tfuncs);
       (*pot_tfuncs)+= potentialArgs->ntfuncs;
+      init_tfuncs_tables(potentialArgs,pot_args);
     }
     potentialArgs++;
   }
@@ -643,11 +719,19 @@ EXPORT void integrateFullOrbit(int nobj,
 			       double *result,
 			       int * err,
 			       int odeint_type,
-             orbint_callback_type cb){
+             orbint_callback_type cb,
+             struct denseOutput ** dense_out,
+             int store_dense,
+             int nevent_type,
+             int * event_type,
+             double * event_par,
+             int * event_terminal,
+             float * result_single){
   //Set up the forces, first count
   int ii,jj;
   int dim;
   int max_threads;
+  double * thread_result;
   int * thread_pot_type;
   double * thread_pot_args;
   tfuncs_type_arr thread_pot_tfuncs;
@@ -709,15 +793,53 @@ EXPORT void integrateFullOrbit(int nobj,
     odeint_deriv_func= &evalRectDeriv;
     dim= 6;
     break;
+  case 7: //leapfrog_adaptive
+    odeint_func= &leapfrog_adaptive;
+    odeint_deriv_func= &evalRectForce;
+    dim= 3;
+    break;
+  case 8: //symplec4_adaptive
+    odeint_func= &symplec4_adaptive;
+    odeint_deriv_func= &evalRectForce;
+    dim= 3;
+    break;
+  case 9: //symplec6_adaptive
+    odeint_func= &symplec6_adaptive;
+    odeint_deriv_func= &evalRectForce;
+    dim= 3;
+    break;
   }
-#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj) num_threads(max_threads)
+  // Set up the storage for the dense output and events, if requested
+  if ( dense_out )
+    *dense_out= alloc_denseOutput(nobj,dim,odeint_type == 5 ? 5 : 8,
+				  store_dense,nevent_type,event_type,
+				  event_par,event_terminal);
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj,thread_result) num_threads(max_threads)
   for (ii=0; ii < nobj; ii++) {
+    // Integrate into a temporary double-precision buffer when the output
+    // is stored in single precision
+    thread_result= result_single ? (double *) malloc ( 6 * nt * sizeof(double) )
+      : result+6*nt*ii;
     cyl_to_rect_galpy(yo+6*ii);
-    odeint_func(odeint_deriv_func,dim,yo+6*ii,nt,dt,t,
-		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+6*nt*ii,err+ii);
+    if ( dense_out && odeint_type == 5 )
+      bovy_dopr54_dense(odeint_deriv_func,dim,yo+6*ii,nt,dt,t,
+			npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+			thread_result,err+ii,*dense_out+ii);
+    else if ( dense_out && odeint_type == 6 )
+      dop853_dense(odeint_deriv_func,dim,yo+6*ii,nt,dt,t,
+		   npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		   thread_result,err+ii,*dense_out+ii);
+    else
+      odeint_func(odeint_deriv_func,dim,yo+6*ii,nt,dt,t,
+		  npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		  thread_result,err+ii);
     for (jj=0; jj < nt; jj++)
-      rect_to_cyl_galpy(result+6*jj+6*nt*ii);
+      rect_to_cyl_galpy(thread_result+6*jj);
+    if ( result_single ) {
+      for (jj=0; jj < 6*nt; jj++)
+        *(result_single+6*nt*ii+jj)= (float) *(thread_result+jj);
+      free(thread_result);
+    }
     if ( cb ) // Callback if not void
       cb();
   }
@@ -811,79 +933,333 @@ EXPORT void integrateFullOrbit_sos(
   free(potentialArgs);
   //Done!
 }
-// LCOV_EXCL_START
-void integrateOrbit_dxdv(double *yo,
-			 int nt,
-			 double *t,
-			 int npot,
-			 int * pot_type,
-			 double * pot_args,
-       tfuncs_type_arr pot_tfuncs,
-			 double rtol,
-			 double atol,
-			 double *result,
-			 int * err,
-			 int odeint_type){
-  //Set up the forces, first count
-  int dim;
-  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
-  parse_leapFuncArgs_Full(npot,potentialArgs,&pot_type,&pot_args,&pot_tfuncs);
-  //Integrate
-  void (*odeint_func)(void (*func)(double, double *, double *,
-			   int, struct potentialArg *),
-		      int,
-		      double *,
-		      int, double, double *,
-		      int, struct potentialArg *,
-		      double, double,
-		      double *,int *);
-  void (*odeint_deriv_func)(double, double *, double *,
-			    int,struct potentialArg *);
+/*
+  Surface-of-section crossings: integrate in time with the Dormand-Prince
+  integrators and find the upward crossings of z=0 on the dense output of
+  each step, stopping once ncross crossings have been found or at the end
+  time (t is an nobj x 2 array of start and end times); only the crossings
+  are returned, as (R,vR,vT,z,vz,phi,t) for each crossing, with NaN for
+  crossings that did not occur before the end time
+*/
+EXPORT void integrateFullOrbit_crossings(int nobj,
+					 double *yo,
+					 int ncross,
+					 double *t,
+					 int npot,
+					 int * pot_type,
+					 double * pot_args,
+					 tfuncs_type_arr pot_tfuncs,
+					 double dt,
+					 double rtol,
+					 double atol,
+					 double *result,
+					 int * err,
+					 int odeint_type,
+					 orbint_callback_type cb){
+  int ii,jj,kk;
+  int max_threads;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+  double * thread_result;
+  double * thread_cross;
+  struct denseOutput * dense;
+  int event_type= EVENT_SECTION;
+  double event_par= 2.; // z
+  int event_terminal= 0;
+  max_threads= ( nobj < omp_get_max_threads() ) ? nobj : omp_get_max_threads();
+  // Because potentialArgs may cache, safest to have one / thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+#pragma omp parallel for schedule(static,1) private(ii,thread_pot_type,thread_pot_args,thread_pot_tfuncs) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++) {
+    thread_pot_type= pot_type; // need to make thread-private pointers, bc
+    thread_pot_args= pot_args; // these pointers are changed in parse_...
+    thread_pot_tfuncs= pot_tfuncs; // ...
+    parse_leapFuncArgs_Full(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj,kk,thread_result,thread_cross,dense) num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+    // Only detect the crossings, the steps themselves are not stored
+    dense= alloc_denseOutput(1,6,odeint_type == 5 ? 5 : 8,0,1,&event_type,
+			     &event_par,&event_terminal);
+    dense->event_max= ncross;
+    thread_result= (double *) malloc ( 12 * sizeof(double) );
+    cyl_to_rect_galpy(yo+6*ii);
+    if ( odeint_type == 5 )
+      bovy_dopr54_dense(&evalRectDeriv,6,yo+6*ii,2,dt,t+2*ii,
+			npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+			thread_result,err+ii,dense);
+    else
+      dop853_dense(&evalRectDeriv,6,yo+6*ii,2,dt,t+2*ii,
+		   npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		   thread_result,err+ii,dense);
+    for (jj=0; jj < ncross; jj++) {
+      thread_cross= result+7*(ncross*ii+jj);
+      if ( jj < dense->nevent ) {
+	for (kk=0; kk < 6; kk++)
+	  *(thread_cross+kk)= *(dense->event_state+6*jj+kk);
+	rect_to_cyl_galpy(thread_cross);
+	*(thread_cross+6)= *(dense->event_t+jj);
+      }
+      else
+	for (kk=0; kk < 7; kk++) *(thread_cross+kk)= NAN;
+    }
+    free(thread_result);
+    free_denseOutput(dense,1);
+    if ( cb ) // Callback if not void
+      cb();
+  }
+  //Free allocated memory
+#pragma omp parallel for schedule(static,1) private(ii) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
+  free(potentialArgs);
+  //Done!
+}
+/*
+  Integration of the variational equations: ndev deviation vectors are
+  integrated alongside the orbit. The state is laid out as
+  (x,y,z,dx_1,dy_1,dz_1,...,dx_n,dy_n,dz_n,vx,vy,vz,dvx_1,dvy_1,dvz_1,...)
+  such that the symplectic integrators (which only need the 'force' on the
+  first half) integrate the tangent map of the orbit integration, while the
+  Runge-Kutta integrators simply integrate the full set of ODEs
+*/
+#define DXDV_MAX_NDEV 6
+#define DEFINE_DXDV_FUNCS(N)						\
+  static void evalRectForce_dxdv_##N(double t, double *q, double *a,	\
+				     int nargs,				\
+				     struct potentialArg * potentialArgs){ \
+    evalRectForce_dxdv(t,q,a,nargs,potentialArgs,N);			\
+  }									\
+  static void evalRectDeriv_dxdv_##N(double t, double *q, double *a,	\
+				     int nargs,				\
+				     struct potentialArg * potentialArgs){ \
+    int ii;								\
+    for (ii=0; ii < 3*(N+1); ii++)					\
+      *(a+ii)= *(q+3*(N+1)+ii);						\
+    evalRectForce_dxdv(t,q,a+3*(N+1),nargs,potentialArgs,N);		\
+  }
+DEFINE_DXDV_FUNCS(1)
+DEFINE_DXDV_FUNCS(2)
+DEFINE_DXDV_FUNCS(3)
+DEFINE_DXDV_FUNCS(4)
+DEFINE_DXDV_FUNCS(5)
+DEFINE_DXDV_FUNCS(6)
+static void (*evalRectForce_dxdv_funcs[DXDV_MAX_NDEV])(double, double *,
+						       double *,int,
+						       struct potentialArg *)= \
+  {&evalRectForce_dxdv_1,&evalRectForce_dxdv_2,&evalRectForce_dxdv_3,
+   &evalRectForce_dxdv_4,&evalRectForce_dxdv_5,&evalRectForce_dxdv_6};
+static void (*evalRectDeriv_dxdv_funcs[DXDV_MAX_NDEV])(double, double *,
+						       double *,int,
+						       struct potentialArg *)= \
+  {&evalRectDeriv_dxdv_1,&evalRectDeriv_dxdv_2,&evalRectDeriv_dxdv_3,
+   &evalRectDeriv_dxdv_4,&evalRectDeriv_dxdv_5,&evalRectDeriv_dxdv_6};
+typedef void (*odeint_func_type)(void (*func)(double, double *, double *,
+					      int, struct potentialArg *),
+				 int,
+				 double *,
+				 int, double, double *,
+				 int, struct potentialArg *,
+				 double, double,
+				 double *,int *);
+typedef void (*odeint_deriv_func_type)(double, double *, double *,
+				       int,struct potentialArg *);
+static void set_dxdv_integrator(int odeint_type,int ndev,
+				odeint_func_type * odeint_func,
+				odeint_deriv_func_type * odeint_deriv_func,
+				int * dim){
   switch ( odeint_type ) {
   case 0: //leapfrog
-    odeint_func= &leapfrog;
-    odeint_deriv_func= &evalRectForce;
-    dim= 6;
+    *odeint_func= &leapfrog;
     break;
   case 1: //RK4
-    odeint_func= &bovy_rk4;
-    odeint_deriv_func= &evalRectDeriv_dxdv;
-    dim= 12;
+    *odeint_func= &bovy_rk4;
     break;
   case 2: //RK6
-    odeint_func= &bovy_rk6;
-    odeint_deriv_func= &evalRectDeriv_dxdv;
-    dim= 12;
+    *odeint_func= &bovy_rk6;
     break;
   case 3: //symplec4
-    odeint_func= &symplec4;
-    odeint_deriv_func= &evalRectForce;
-    dim= 6;
+    *odeint_func= &symplec4;
     break;
   case 4: //symplec6
-    odeint_func= &symplec6;
-    odeint_deriv_func= &evalRectForce;
-    dim= 6;
+    *odeint_func= &symplec6;
     break;
   case 5: //DOPR54
-    odeint_func= &bovy_dopr54;
-    odeint_deriv_func= &evalRectDeriv_dxdv;
-    dim= 12;
+    *odeint_func= &bovy_dopr54;
     break;
   case 6: //DOP853
-    odeint_func= &dop853;
-    odeint_deriv_func= &evalRectDeriv_dxdv;
-    dim= 12;
+    *odeint_func= &dop853;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,-9999.99,t,npot,potentialArgs,
-	      rtol,atol,result,err);
+  if ( odeint_type == 0 || odeint_type == 3 || odeint_type == 4 ) {
+    // symplectic: only need the forces on the positions
+    *odeint_deriv_func= evalRectForce_dxdv_funcs[ndev-1];
+    *dim= 3*(ndev+1);
+  }
+  else {
+    *odeint_deriv_func= evalRectDeriv_dxdv_funcs[ndev-1];
+    *dim= 6*(ndev+1);
+  }
+}
+EXPORT void integrateFullOrbit_dxdv(int nobj,
+				    double *yo,
+				    int nt,
+				    double *t,
+				    int npot,
+				    int * pot_type,
+				    double * pot_args,
+				    tfuncs_type_arr pot_tfuncs,
+				    double dt,
+				    double rtol,
+				    double atol,
+				    double *result,
+				    int * err,
+				    int odeint_type,
+				    orbint_callback_type cb){
+  // yo and result are in rectangular coordinates, layout as above for ndev=1
+  int ii;
+  int dim;
+  int max_threads;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+  max_threads= ( nobj < omp_get_max_threads() ) ? nobj : omp_get_max_threads();
+  // Because potentialArgs may cache, safest to have one / thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+#pragma omp parallel for schedule(static,1) private(ii,thread_pot_type,thread_pot_args,thread_pot_tfuncs) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++) {
+    thread_pot_type= pot_type; // need to make thread-private pointers, bc
+    thread_pot_args= pot_args; // these pointers are changed in parse_...
+    thread_pot_tfuncs= pot_tfuncs; // ...
+    parse_leapFuncArgs_Full(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+  //Integrate
+  odeint_func_type odeint_func;
+  odeint_deriv_func_type odeint_deriv_func;
+  set_dxdv_integrator(odeint_type,1,&odeint_func,&odeint_deriv_func,&dim);
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii) num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+    odeint_func(odeint_deriv_func,dim,yo+12*ii,nt,dt,t,
+		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		result+12*nt*ii,err+ii);
+    if ( cb ) // Callback if not void
+      cb();
+  }
   //Free allocated memory
-  free_potentialArgs(npot,potentialArgs);
+#pragma omp parallel for schedule(static,1) private(ii) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
+  free(potentialArgs);
+  //Done!
+}
+EXPORT void integrateFullOrbit_lyapunov(int nobj,
+					double *yo,
+					int ndev,
+					int nt,
+					double *t,
+					int npot,
+					int * pot_type,
+					double * pot_args,
+					tfuncs_type_arr pot_tfuncs,
+					double dt,
+					double rtol,
+					double atol,
+					double *result,
+					int * err,
+					int odeint_type,
+					orbint_callback_type cb){
+  // Integrate the orbit and ndev deviation vectors, re-orthonormalizing the
+  // deviation vectors at each time t using Gram-Schmidt (Benettin et al. 1980)
+  // yo: rectangular initial conditions with orthonormal deviation vectors,
+  // layout as above; result: (nobj,nt,ndev) cumulative log stretching
+  int ii,jj,kk,ll,mm;
+  int dim, ndim;
+  int max_threads;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+  double norm, proj;
+  double * y, * tmp_result;
+  double tseg[2];
+  int thiserr;
+  max_threads= ( nobj < omp_get_max_threads() ) ? nobj : omp_get_max_threads();
+  // Because potentialArgs may cache, safest to have one / thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+#pragma omp parallel for schedule(static,1) private(ii,thread_pot_type,thread_pot_args,thread_pot_tfuncs) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++) {
+    thread_pot_type= pot_type; // need to make thread-private pointers, bc
+    thread_pot_args= pot_args; // these pointers are changed in parse_...
+    thread_pot_tfuncs= pot_tfuncs; // ...
+    parse_leapFuncArgs_Full(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+  //Integrate
+  odeint_func_type odeint_func;
+  odeint_deriv_func_type odeint_deriv_func;
+  set_dxdv_integrator(odeint_type,ndev,&odeint_func,&odeint_deriv_func,&dim);
+  ndim= 6*(ndev+1);
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj,kk,ll,mm,norm,proj,y,tmp_result,tseg,thiserr) num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+    y= yo+ndim*ii;
+    tmp_result= (double *) malloc ( 2 * ndim * sizeof(double) );
+    for (jj=0; jj < ndev; jj++)
+      *(result+nt*ndev*ii+jj)= 0.;
+    for (kk=0; kk < nt-1; kk++) {
+      tseg[0]= *(t+kk);
+      tseg[1]= *(t+kk+1);
+      odeint_func(odeint_deriv_func,dim,y,2,dt,tseg,
+		  npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		  tmp_result,&thiserr);
+      if ( thiserr != 0 )
+	*(err+ii)= thiserr;
+      for (ll=0; ll < ndim; ll++)
+	*(y+ll)= *(tmp_result+ndim+ll);
+      // Modified Gram-Schmidt on the 6D deviation vectors, whose position
+      // part is at 3+3*jj and whose velocity part is at 3*(ndev+2)+3*jj
+      for (jj=0; jj < ndev; jj++) {
+	for (mm=0; mm < jj; mm++) {
+	  proj= 0.;
+	  for (ll=0; ll < 3; ll++)
+	    proj+= *(y+3+3*jj+ll) * *(y+3+3*mm+ll)
+	      + *(y+3*(ndev+2)+3*jj+ll) * *(y+3*(ndev+2)+3*mm+ll);
+	  for (ll=0; ll < 3; ll++) {
+	    *(y+3+3*jj+ll)-= proj * *(y+3+3*mm+ll);
+	    *(y+3*(ndev+2)+3*jj+ll)-= proj * *(y+3*(ndev+2)+3*mm+ll);
+	  }
+	}
+	norm= 0.;
+	for (ll=0; ll < 3; ll++)
+	  norm+= *(y+3+3*jj+ll) * *(y+3+3*jj+ll)
+	    + *(y+3*(ndev+2)+3*jj+ll) * *(y+3*(ndev+2)+3*jj+ll);
+	norm= sqrt(norm);
+	for (ll=0; ll < 3; ll++) {
+	  *(y+3+3*jj+ll)/= norm;
+	  *(y+3*(ndev+2)+3*jj+ll)/= norm;
+	}
+	*(result+nt*ndev*ii+ndev*(kk+1)+jj)= \
+	  *(result+nt*ndev*ii+ndev*kk+jj) + log(norm);
+      }
+      if ( thiserr == -10 ) { // interrupted
+	for (ll=kk+2; ll < nt; ll++)
+	  for (jj=0; jj < ndev; jj++)
+	    *(result+nt*ndev*ii+ndev*ll+jj)= NAN;
+	break;
+      }
+    }
+    free(tmp_result);
+    if ( cb ) // Callback if not void
+      cb();
+  }
+  //Free allocated memory
+#pragma omp parallel for schedule(static,1) private(ii) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
   free(potentialArgs);
   //Done!
 }
-// LCOV_EXCL_STOP
 void evalRectForce(double t, double *q, double *a,
 		   int nargs, struct potentialArg * potentialArgs){
   double sinphi, cosphi, x, y, phi,R,Rforce,phitorque, z;
@@ -903,6 +1279,57 @@ void evalRectForce(double t, double *q, double *a,
   *a++= sinphi*Rforce+1./R*cosphi*phitorque;
   *a= calczforce(R,z,phi,t,nargs,potentialArgs);
 }
+void evalRectForce_dxdv(double t, double *q, double *a,
+			int nargs, struct potentialArg * potentialArgs,
+			int ndev){
+  // Force on the orbit and Jacobian of the force times the ndev deviation
+  // vectors; the Jacobian is computed using central finite differences of
+  // the force, such that all potentials with C forces can be used
+  int ii,jj,kk;
+  double h, norm;
+  double xp[3], xm[3], ap[3], am[3], jac[9];
+  evalRectForce(t,q,a,nargs,potentialArgs);
+  h= DXDV_FD_STEP * fmax(sqrt(*q * *q + *(q+1) * *(q+1) + *(q+2) * *(q+2)),
+			 DXDV_FD_MINSCALE);
+  if ( ndev < 3 ) { // Directional derivatives are cheaper
+    for (ii=0; ii < ndev; ii++) {
+      norm= sqrt(*(q+3+3*ii) * *(q+3+3*ii)
+		 + *(q+4+3*ii) * *(q+4+3*ii)
+		 + *(q+5+3*ii) * *(q+5+3*ii));
+      if ( norm == 0. ) {
+	for (kk=0; kk < 3; kk++) *(a+3+3*ii+kk)= 0.;
+	continue;
+      }
+      for (kk=0; kk < 3; kk++) {
+	xp[kk]= *(q+kk) + h * *(q+3+3*ii+kk) / norm;
+	xm[kk]= *(q+kk) - h * *(q+3+3*ii+kk) / norm;
+      }
+      evalRectForce(t,xp,ap,nargs,potentialArgs);
+      evalRectForce(t,xm,am,nargs,potentialArgs);
+      for (kk=0; kk < 3; kk++)
+	*(a+3+3*ii+kk)= 0.5 * norm * ( ap[kk] - am[kk] ) / h;
+    }
+  }
+  else { // Full Jacobian, jac[3*kk+jj] = dF_kk / dx_jj
+    for (jj=0; jj < 3; jj++) {
+      for (kk=0; kk < 3; kk++) {
+	xp[kk]= *(q+kk);
+	xm[kk]= *(q+kk);
+      }
+      xp[jj]+= h;
+      xm[jj]-= h;
+      evalRectForce(t,xp,ap,nargs,potentialArgs);
+      evalRectForce(t,xm,am,nargs,potentialArgs);
+      for (kk=0; kk < 3; kk++)
+	jac[3*kk+jj]= 0.5 * ( ap[kk] - am[kk] ) / h;
+    }
+    for (ii=0; ii < ndev; ii++)
+      for (kk=0; kk < 3; kk++)
+	*(a+3+3*ii+kk)= jac[3*kk]   * *(q+3+3*ii)
+	  +             jac[3*kk+1] * *(q+4+3*ii)
+	  +             jac[3*kk+2] * *(q+5+3*ii);
+  }
+}
 void evalRectDeriv(double t, double *q, double *a,
 		   int nargs, struct potentialArg * potentialArgs){
   double sinphi, cosphi, x, y, phi,R,Rforce,phitorque,z,vR,vT;
@@ -1043,65 +1470,3 @@ void initChandrasekharDynamicalFrictionSplines(struct potentialArg * potentialAr
   *pot_args = *pot_args + (int) (1+(1+potentialArgs->nspline1d)*nPts);
   free(r);
 }
-
-// LCOV_EXCL_START
-void evalRectDeriv_dxdv(double t, double *q, double *a,
-			int nargs, struct potentialArg * potentialArgs){
-  double sinphi, cosphi, x, y, phi,R,Rforce,phitorque,z,zforce;
-  double R2deriv, phi2deriv, Rphideriv, dFxdx, dFxdy, dFydx, dFydy;
-  //first three derivatives are just the velocities
-  *a++= *(q+3);
-  *a++= *(q+4);
-  *a++= *(q+5);
-  //Rest is force
-  //q is rectangular so calculate R and phi
-  x= *q;
-  y= *(q+1);
-  z= *(q+2);
-  R= sqrt(x*x+y*y);
-  phi= acos(x/R);
-  sinphi= y/R;
-  cosphi= x/R;
-  if ( y < 0. ) phi= 2.*M_PI-phi;
-  //Calculate the forces
-  Rforce= calcRforce(R,z,phi,t,nargs,potentialArgs);
-  zforce= calczforce(R,z,phi,t,nargs,potentialArgs);
-  phitorque= calcphitorque(R,z,phi,t,nargs,potentialArgs);
-  *a++= cosphi*Rforce-1./R*sinphi*phitorque;
-  *a++= sinphi*Rforce+1./R*cosphi*phitorque;
-  *a++= zforce;
-  //dx derivatives are just dv
-  *a++= *(q+9);
-  *a++= *(q+10);
-  *a++= *(q+11);
-  //for the dv derivatives we need also R2deriv, phi2deriv, and Rphideriv
-  R2deriv= calcR2deriv(R,z,phi,t,nargs,potentialArgs);
-  phi2deriv= calcphi2deriv(R,z,phi,t,nargs,potentialArgs);
-  Rphideriv= calcRphideriv(R,z,phi,t,nargs,potentialArgs);
-  //..and dFxdx, dFxdy, dFydx, dFydy
-  dFxdx= -cosphi*cosphi*R2deriv
-    +2.*cosphi*sinphi/R/R*phitorque
-    +sinphi*sinphi/R*Rforce
-    +2.*sinphi*cosphi/R*Rphideriv
-    -sinphi*sinphi/R/R*phi2deriv;
-  dFxdy= -sinphi*cosphi*R2deriv
-    +(sinphi*sinphi-cosphi*cosphi)/R/R*phitorque
-    -cosphi*sinphi/R*Rforce
-    -(cosphi*cosphi-sinphi*sinphi)/R*Rphideriv
-    +cosphi*sinphi/R/R*phi2deriv;
-  dFydx= -cosphi*sinphi*R2deriv
-    +(sinphi*sinphi-cosphi*cosphi)/R/R*phitorque
-    +(sinphi*sinphi-cosphi*cosphi)/R*Rphideriv
-    -sinphi*cosphi/R*Rforce
-    +sinphi*cosphi/R/R*phi2deriv;
-  dFydy= -sinphi*sinphi*R2deriv
-    -2.*sinphi*cosphi/R/R*phitorque
-    -2.*sinphi*cosphi/R*Rphideriv
-    +cosphi*cosphi/R*Rforce
-    -cosphi*cosphi/R/R*phi2deriv;
-  *a++= dFxdx * *(q+4) + dFxdy * *(q+5);
-  *a++= dFydx * *(q+4) + dFydy * *(q+5);
-  *a= 0; //BOVY: PUT IN Z2DERIVS
-}
-
-// LCOV_EXCL_STOP
@@ -126,11 +126,14 @@ EXPORT void integrateLinearOrbit(int nobj,
 				 double *result,
 				 int * err,
 				 int odeint_type,
-         orbint_callback_type cb){
+         orbint_callback_type cb,
+         struct denseOutput ** dense_out,
+         float * result_single){
   //Set up the forces, first count
   int dim;
-  int ii;
+  int ii,jj;
   int max_threads;
+  double * thread_result;
   int * thread_pot_type;
   double * thread_pot_args;
   tfuncs_type_arr thread_pot_tfuncs;
@@ -192,12 +195,49 @@ EXPORT void integrateLinearOrbit(int nobj,
     odeint_deriv_func= &evalLinearDeriv;
     dim= 2;
     break;
+  case 7: //leapfrog_adaptive
+    odeint_func= &leapfrog_adaptive;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  case 8: //symplec4_adaptive
+    odeint_func= &symplec4_adaptive;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  case 9: //symplec6_adaptive
+    odeint_func= &symplec6_adaptive;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
   }
-#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii) num_threads(max_threads)
+  // Set up the storage for the dense output, if requested
+  if ( dense_out )
+    *dense_out= alloc_denseOutput(nobj,dim,odeint_type == 5 ? 5 : 8,
+				  1,0,NULL,NULL,NULL);
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj,thread_result) num_threads(max_threads)
   for (ii=0; ii < nobj; ii++) {
-    odeint_func(odeint_deriv_func,dim,yo+2*ii,nt,dt,t,
-		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+2*nt*ii,err+ii);
+    // Integrate into a temporary double-precision buffer when the output
+    // is stored in single precision
+    thread_result= result_single ? (double *) malloc ( 2 * nt * sizeof(double) )
+      : result+2*nt*ii;
+    if ( dense_out && odeint_type == 5 )
+      bovy_dopr54_dense(odeint_deriv_func,dim,yo+2*ii,nt,dt,t,
+			npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+			thread_result,err+ii,*dense_out+ii);
+    else if ( dense_out && odeint_type == 6 )
+      dop853_dense(odeint_deriv_func,dim,yo+2*ii,nt,dt,t,
+		   npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		   thread_result,err+ii,*dense_out+ii);
+    else
+      odeint_func(odeint_deriv_func,dim,yo+2*ii,nt,dt,t,
+		  npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		  thread_result,err+ii);
+    if ( result_single ) {
+      for (jj=0; jj < 2*nt; jj++)
+        *(result_single+2*nt*ii+jj)= (float) *(thread_result+jj);
+      free(thread_result);
+    }
     if ( cb ) // Callback if not void
       cb();
   }
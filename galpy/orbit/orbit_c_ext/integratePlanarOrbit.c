@@ -449,6 +449,65 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->nargs= 0;
       potentialArgs->ntfuncs= 0;
       break;
+    case 41: //interp3DPotential, 20 arguments + padded table
+      potentialArgs->potentialEval= &interp3DPotentialEval;
+      potentialArgs->planarRforce= &interp3DPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &interp3DPotentialPlanarphitorque;
+      potentialArgs->nargs= (int) (20 + 4 * ( *(*pot_args+1) + 2 )
+				   * ( *(*pot_args+2) + 2 )
+				   * ( *(*pot_args+3) + 3 ));
+      potentialArgs->ntfuncs= 0;
+      break;
+    case 42: //MultipoleExpansionPotential, 10 + nr arguments + table + scratch
+      potentialArgs->potentialEval= &MultipoleExpansionPotentialEval;
+      potentialArgs->planarRforce= &MultipoleExpansionPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &MultipoleExpansionPotentialPlanarphitorque;
+      potentialArgs->nargs= (int) (10 + *(*pot_args+2)
+				   + ( *(*pot_args+1) + 1 ) * ( *(*pot_args+1) + 2 )
+				   * ( 2 * *(*pot_args+2) + 1 )
+				   + 2 * ( *(*pot_args+1) + 1 ));
+      potentialArgs->ntfuncs= 0;
+      break;
+    case 43: //CylindricalFourierExpansionPotential, 17 arguments + table + scratch
+      potentialArgs->potentialEval= &CylindricalFourierExpansionPotentialEval;
+      potentialArgs->planarRforce= &CylindricalFourierExpansionPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &CylindricalFourierExpansionPotentialPlanarphitorque;
+      potentialArgs->nargs= (int) (17 + 6 * ( *(*pot_args+1) + 1 )
+				   * ( ( *(*pot_args+2) + 2 )
+				       * ( *(*pot_args+3) + 2 ) + 1 ));
+      potentialArgs->ntfuncs= 0;
+      break;
+    case 44: //TimeDependentSCFPotential, 7 + nt + (nt+1) x coefficients + 12 arguments
+      potentialArgs->potentialEval= &TimeDependentSCFPotentialEval;
+      potentialArgs->planarRforce= &TimeDependentSCFPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &TimeDependentSCFPotentialPlanarphitorque;
+      potentialArgs->planarR2deriv= &TimeDependentSCFPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &TimeDependentSCFPotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &TimeDependentSCFPotentialPlanarRphideriv;
+      potentialArgs->nargs= (int) (7 + *(*pot_args)
+				   + ( *(*pot_args) + 1 ) * ( 1 + *(*pot_args+2) )
+				   * *(*pot_args+3) * *(*pot_args+4) * *(*pot_args+5)
+				   + 12);
+      potentialArgs->ntfuncs= 0;
+      break;
+    case 45: //CompiledPotential, 10 arguments
+      if ( *(*pot_args+1) >= 0 )
+	potentialArgs->potentialEval= &CompiledPotentialEval;
+      potentialArgs->planarRforce= &CompiledPotentialPlanarRforce;
+      if ( *(*pot_args+4) >= 0 ) {
+	potentialArgs->planarphitorque= &CompiledPotentialPlanarphitorque;
+	potentialArgs->planarphi2deriv= &CompiledPotentialPlanarphi2deriv;
+	potentialArgs->planarRphideriv= &CompiledPotentialPlanarRphideriv;
+      }
+      else {
+	potentialArgs->planarphitorque= &ZeroPlanarForce;
+	potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+	potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      }
+      potentialArgs->planarR2deriv= &CompiledPotentialPlanarR2deriv;
+      potentialArgs->nargs= 10;
+      potentialArgs->ntfuncs= (int) *(*pot_args+9);
+      break;
 //////////////////////////////// WRAPPERS /////////////////////////////////////
     case -1: //DehnenSmoothWrapperPotential
       potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
@@ -502,11 +561,17 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->planarR2deriv= &TimeDependentAmplitudeWrapperPotentialPlanarR2deriv;
       potentialArgs->planarphi2deriv= &TimeDependentAmplitudeWrapperPotentialPlanarphi2deriv;
       potentialArgs->planarRphideriv= &TimeDependentAmplitudeWrapperPotentialPlanarRphideriv;
-      potentialArgs->nargs= 4;
+      potentialArgs->nargs= 1;
       potentialArgs->ntfuncs= 1;
       break;
+    case -10: //MovingObjectPopulationPotential, nargs set below
+      potentialArgs->planarRforce= &MovingObjectPopulationPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &MovingObjectPopulationPotentialPlanarphitorque;
+      potentialArgs->ntfuncs= 0;
+      break;
     }
     int setupSplines = *(*pot_type-1) == -6 ? 1 : 0;
+    int setupMovingObjectPopulation = *(*pot_type-1) == -10 ? 1 : 0;
     if ( *(*pot_type-1) < 0) { // Parse wrapped potential for wrappers
       potentialArgs->nwrapped= (int) *(*pot_args)++;
       potentialArgs->wrappedPotentialArg= \
@@ -517,6 +582,10 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
 			 pot_type,pot_args,pot_tfuncs);
     }
     if (setupSplines) initPlanarMovingObjectSplines(potentialArgs, pot_args);
+    if (setupMovingObjectPopulation) // 11 + nt + 2 nobj + 6 nt nobj
+      potentialArgs->nargs= (int) ( 11 + *(*pot_args+2)
+				    + 2 * *(*pot_args+3)
+				    + 6 * *(*pot_args+2) * *(*pot_args+3) );
     // Now load each potential's parameters
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -528,6 +597,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
     if ( potentialArgs->ntfuncs > 0 ) {
       potentialArgs->tfuncs= (*pot_tfuncs);
       (*pot_tfuncs)+= potentialArgs->ntfuncs;
+      init_tfuncs_tables(potentialArgs,pot_args);
     }
     potentialArgs++;
   }
@@ -547,11 +617,19 @@ EXPORT void integratePlanarOrbit(int nobj,
 				 double *result,
 				 int * err,
 				 int odeint_type,
-         orbint_callback_type cb){
+         orbint_callback_type cb,
+         struct denseOutput ** dense_out,
+         int store_dense,
+         int nevent_type,
+         int * event_type,
+         double * event_par,
+         int * event_terminal,
+         float * result_single){
   //Set up the forces, first count
   int ii,jj;
   int dim;
   int max_threads;
+  double * thread_result;
   int * thread_pot_type;
   double * thread_pot_args;
   tfuncs_type_arr thread_pot_tfuncs;
@@ -613,15 +691,53 @@ EXPORT void integratePlanarOrbit(int nobj,
     odeint_deriv_func= &evalPlanarRectDeriv;
     dim= 4;
     break;
+  case 7: //leapfrog_adaptive
+    odeint_func= &leapfrog_adaptive;
+    odeint_deriv_func= &evalPlanarRectForce;
+    dim= 2;
+    break;
+  case 8: //symplec4_adaptive
+    odeint_func= &symplec4_adaptive;
+    odeint_deriv_func= &evalPlanarRectForce;
+    dim= 2;
+    break;
+  case 9: //symplec6_adaptive
+    odeint_func= &symplec6_adaptive;
+    odeint_deriv_func= &evalPlanarRectForce;
+    dim= 2;
+    break;
   }
-#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj) num_threads(max_threads)
+  // Set up the storage for the dense output and events, if requested
+  if ( dense_out )
+    *dense_out= alloc_denseOutput(nobj,dim,odeint_type == 5 ? 5 : 8,
+				  store_dense,nevent_type,event_type,
+				  event_par,event_terminal);
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj,thread_result) num_threads(max_threads)
   for (ii=0; ii < nobj; ii++) {
+    // Integrate into a temporary double-precision buffer when the output
+    // is stored in single precision
+    thread_result= result_single ? (double *) malloc ( 4 * nt * sizeof(double) )
+      : result+4*nt*ii;
     polar_to_rect_galpy(yo+4*ii);
-    odeint_func(odeint_deriv_func,dim,yo+4*ii,nt,dt,t,
-		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+4*nt*ii,err+ii);
+    if ( dense_out && odeint_type == 5 )
+      bovy_dopr54_dense(odeint_deriv_func,dim,yo+4*ii,nt,dt,t,
+			npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+			thread_result,err+ii,*dense_out+ii);
+    else if ( dense_out && odeint_type == 6 )
+      dop853_dense(odeint_deriv_func,dim,yo+4*ii,nt,dt,t,
+		   npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		   thread_result,err+ii,*dense_out+ii);
+    else
+      odeint_func(odeint_deriv_func,dim,yo+4*ii,nt,dt,t,
+		  npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		  thread_result,err+ii);
     for (jj= 0; jj < nt; jj++)
-      rect_to_polar_galpy(result+4*jj+4*nt*ii);
+      rect_to_polar_galpy(thread_result+4*jj);
+    if ( result_single ) {
+      for (jj=0; jj < 4*nt; jj++)
+        *(result_single+4*nt*ii+jj)= (float) *(thread_result+jj);
+      free(thread_result);
+    }
     if ( cb ) // Callback if not void
       cb();
   }
@@ -724,6 +840,92 @@ EXPORT void integratePlanarOrbit_sos(
   free(potentialArgs);
   //Done!
 }
+/*
+  Surface-of-section crossings: integrate in time with the Dormand-Prince
+  integrators and find the upward crossings of x=0 (surface=0) or y=0
+  (surface=1) on the dense output of each step, stopping once ncross
+  crossings have been found or at the end time (t is an nobj x 2 array of
+  start and end times); only the crossings are returned, as
+  (R,vR,vT,phi,t) for each crossing, with NaN for crossings that did not
+  occur before the end time
+*/
+EXPORT void integratePlanarOrbit_crossings(int nobj,
+					   double *yo,
+					   int ncross,
+					   double *t,
+					   int surface,
+					   int npot,
+					   int * pot_type,
+					   double * pot_args,
+					   tfuncs_type_arr pot_tfuncs,
+					   double dt,
+					   double rtol,
+					   double atol,
+					   double *result,
+					   int * err,
+					   int odeint_type,
+					   orbint_callback_type cb){
+  int ii,jj,kk;
+  int max_threads;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+  double * thread_result;
+  double * thread_cross;
+  struct denseOutput * dense;
+  int event_type= EVENT_SECTION;
+  double event_par= (double) surface;
+  int event_terminal= 0;
+  max_threads= ( nobj < omp_get_max_threads() ) ? nobj : omp_get_max_threads();
+  // Because potentialArgs may cache, safest to have one / thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+#pragma omp parallel for schedule(static,1) private(ii,thread_pot_type,thread_pot_args,thread_pot_tfuncs) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++) {
+    thread_pot_type= pot_type; // need to make thread-private pointers, bc
+    thread_pot_args= pot_args; // these pointers are changed in parse_...
+    thread_pot_tfuncs= pot_tfuncs; // ...
+    parse_leapFuncArgs(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+#pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj,kk,thread_result,thread_cross,dense) num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+    // Only detect the crossings, the steps themselves are not stored
+    dense= alloc_denseOutput(1,4,odeint_type == 5 ? 5 : 8,0,1,&event_type,
+			     &event_par,&event_terminal);
+    dense->event_max= ncross;
+    thread_result= (double *) malloc ( 8 * sizeof(double) );
+    polar_to_rect_galpy(yo+4*ii);
+    if ( odeint_type == 5 )
+      bovy_dopr54_dense(&evalPlanarRectDeriv,4,yo+4*ii,2,dt,t+2*ii,
+			npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+			thread_result,err+ii,dense);
+    else
+      dop853_dense(&evalPlanarRectDeriv,4,yo+4*ii,2,dt,t+2*ii,
+		   npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
+		   thread_result,err+ii,dense);
+    for (jj=0; jj < ncross; jj++) {
+      thread_cross= result+5*(ncross*ii+jj);
+      if ( jj < dense->nevent ) {
+	for (kk=0; kk < 4; kk++)
+	  *(thread_cross+kk)= *(dense->event_state+4*jj+kk);
+	rect_to_polar_galpy(thread_cross);
+	*(thread_cross+4)= *(dense->event_t+jj);
+      }
+      else
+	for (kk=0; kk < 5; kk++) *(thread_cross+kk)= NAN;
+    }
+    free(thread_result);
+    free_denseOutput(dense,1);
+    if ( cb ) // Callback if not void
+      cb();
+  }
+  //Free allocated memory
+#pragma omp parallel for schedule(static,1) private(ii) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
+  free(potentialArgs);
+  //Done!
+}
 EXPORT void integratePlanarOrbit_dxdv(double *yo,
 				      int nt,
 				      double *t,
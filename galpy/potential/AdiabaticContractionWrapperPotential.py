@@ -4,12 +4,16 @@
 #                                            to the growth of a baryonic
 #                                            component
 ###############################################################################
+import os
+
 import numpy
 from scipy import integrate
 from scipy.interpolate import interp1d
 from scipy.optimize import fixed_point
 
+from .. import __version__
 from ..util import conversion
+from ..util._table_cache import cache_table, content_hash, load_table
 from .Force import Force
 from .interpSphericalPotential import interpSphericalPotential
 
@@ -35,6 +39,7 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
         rmax=50.0,
         ro=None,
         vo=None,
+        cache=None,
     ):
         """
         NAME:
@@ -65,6 +70,8 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
 
            rmax= (50.) maximum radius to consider (can be Quantity)
 
+           cache= (None) if set to a directory, the contracted force profile and its interpolation table are stored in files in this directory whose names contain a hash of all of the inputs; when these files already exist, the potential is re-built from the (memory-mapped) files rather than computed
+
            ro, vo= standard unit-conversion parameters
 
         OUTPUT:
@@ -75,6 +82,8 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
 
            2021-03-21 - Started based on Marius Cautun's code - Bovy (UofT)
 
+           2026-10-19 - Added cache=
+
         """
         # Initialize with Force just to parse (ro,vo)
         Force.__init__(self, ro=ro, vo=vo)
@@ -84,31 +93,25 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
             if not rmin is None
             else rmax / 2500.0
         )
-        # Compute baryon and DM enclosed masses on radial grid
-        from ..potential import mass
-
         rgrid = numpy.geomspace(rmin, rmax, 301)
-        baryon_mass = numpy.array(
-            [mass(baryonpot, r, use_physical=False) for r in rgrid]
-        )
-        dm_mass = numpy.array([mass(pot, r, use_physical=False) for r in rgrid])
-        # Adiabatic contraction
-        if f_bar is None:
-            f_bar = baryon_mass[-1] / (baryon_mass[-1] + dm_mass[-1])
-        if method.lower() == "cautun":
-            new_rforce = _contraction_Cautun2020(rgrid, dm_mass, baryon_mass, f_bar)
-        elif method.lower() == "gnedin":
-            new_rforce = _contraction_Gnedin2004(
-                rgrid,
-                dm_mass,
-                baryon_mass,
-                pot.rvir(overdens=180.0, wrtcrit=False),
-                f_bar,
+        table = {}
+        if cache is not None:
+            cachefile = os.path.join(
+                cache,
+                "AdiabaticContractionWrapperPotential-{}.npz".format(
+                    content_hash(
+                        __version__, pot, baryonpot, method.lower(), f_bar, rgrid
+                    )
+                ),
             )
-        elif method.lower() == "blumenthal":
-            new_rforce = _contraction_Blumenthal1986(rgrid, dm_mass, baryon_mass, f_bar)
-        else:  # pragma: no cover
-            raise ValueError(f"Adiabatic contraction method '{method}' not recognized")
+            if os.path.exists(cachefile):
+                table = load_table(cachefile, mmap=True)
+        if table:
+            new_rforce = numpy.asarray(table["new_rforce"])
+        else:
+            new_rforce = _contract(pot, baryonpot, method, f_bar, rgrid)
+            if cache is not None:
+                cache_table(cachefile, new_rforce=new_rforce)
         # Add central point
         rgrid = numpy.concatenate(([0.0], rgrid))
         new_rforce = numpy.concatenate(([0.0], new_rforce))
@@ -120,8 +123,40 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
             - new_rforce[-1] * rgrid[-1]
         )
         interpSphericalPotential.__init__(
-            self, rforce=new_rforce_func, rgrid=rgrid, Phi0=Phi0, ro=ro, vo=vo
+            self,
+            rforce=new_rforce_func,
+            rgrid=rgrid,
+            Phi0=Phi0,
+            ro=ro,
+            vo=vo,
+            cache=cache,
+        )
+
+
+def _contract(pot, baryonpot, method, f_bar, rgrid):
+    # Compute baryon and DM enclosed masses on radial grid
+    from ..potential import mass
+
+    baryon_mass = numpy.array([mass(baryonpot, r, use_physical=False) for r in rgrid])
+    dm_mass = numpy.array([mass(pot, r, use_physical=False) for r in rgrid])
+    # Adiabatic contraction
+    if f_bar is None:
+        f_bar = baryon_mass[-1] / (baryon_mass[-1] + dm_mass[-1])
+    if method.lower() == "cautun":
+        new_rforce = _contraction_Cautun2020(rgrid, dm_mass, baryon_mass, f_bar)
+    elif method.lower() == "gnedin":
+        new_rforce = _contraction_Gnedin2004(
+            rgrid,
+            dm_mass,
+            baryon_mass,
+            pot.rvir(overdens=180.0, wrtcrit=False),
+            f_bar,
         )
+    elif method.lower() == "blumenthal":
+        new_rforce = _contraction_Blumenthal1986(rgrid, dm_mass, baryon_mass, f_bar)
+    else:  # pragma: no cover
+        raise ValueError(f"Adiabatic contraction method '{method}' not recognized")
+    return new_rforce
 
 
 def _contraction_Cautun2020(r, M_DMO, Mbar, fbar):
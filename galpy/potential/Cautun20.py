@@ -85,40 +85,54 @@ hzdict = [
     {"type": "exp", "h": zd_thick},
 ]
 
+
+def _define_cached_components():
+    """Bulge, disk, and halo, whose SCF coefficients and adiabatic contraction are cached on disk if this is turned on in the configuration file when this function is called"""
+    cachedir = mwpot_helpers._cache_dir()
+    with numpy.errstate(all="ignore"):
+        bulge = SCFPotential(
+            Acos=scf_compute_coeffs_axi(bulge_dens, 20, 10, a=0.1, cache=cachedir)[0],
+            a=0.1,
+            ro=ro,
+            vo=vo,
+        )
+        disk = DiskSCFPotential(
+            dens=lambda R, z: gas_dens(R, z) + stellar_dens(R, z),
+            Sigma=sigmadict,
+            hz=hzdict,
+            a=2.5,
+            N=30,
+            L=30,
+            ro=ro,
+            vo=vo,
+            cache=cachedir,
+        )
+        halo = AdiabaticContractionWrapperPotential(
+            pot=NFWPotential(
+                conc=conc,
+                mvir=m200 / 1.0e12,
+                vo=vo,
+                ro=ro,
+                H=67.77,
+                Om=0.307,
+                overdens=200.0 * (1.0 - fb),
+                wrtcrit=True,
+            ),
+            baryonpot=bulge + Cautun_cgm + disk,
+            f_bar=fb,
+            method="cautun",
+            ro=ro,
+            vo=vo,
+            cache=cachedir,
+        )
+    return bulge, disk, halo
+
+
 # generate separate disk and halo potential - and combined potential
-Cautun_bulge = SCFPotential(
-    Acos=scf_compute_coeffs_axi(bulge_dens, 20, 10, a=0.1)[0], a=0.1, ro=ro, vo=vo
-)
 Cautun_cgm = PowerSphericalPotentialwCutoff(
     amp=cgm_amp, alpha=-Beta, r1=R200, rc=2.0 * R200, ro=ro, vo=vo
 )
-Cautun_disk = DiskSCFPotential(
-    dens=lambda R, z: gas_dens(R, z) + stellar_dens(R, z),
-    Sigma=sigmadict,
-    hz=hzdict,
-    a=2.5,
-    N=30,
-    L=30,
-    ro=ro,
-    vo=vo,
-)
-Cautun_halo = AdiabaticContractionWrapperPotential(
-    pot=NFWPotential(
-        conc=conc,
-        mvir=m200 / 1.0e12,
-        vo=vo,
-        ro=ro,
-        H=67.77,
-        Om=0.307,
-        overdens=200.0 * (1.0 - fb),
-        wrtcrit=True,
-    ),
-    baryonpot=Cautun_bulge + Cautun_cgm + Cautun_disk,
-    f_bar=fb,
-    method="cautun",
-    ro=ro,
-    vo=vo,
-)
+Cautun_bulge, Cautun_disk, Cautun_halo = _define_cached_components()
 Cautun20 = Cautun_halo + Cautun_disk + Cautun_bulge + Cautun_cgm
 # Go back to old floating-point warnings settings
 numpy.seterr(**old_error_settings)
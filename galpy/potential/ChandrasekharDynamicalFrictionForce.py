@@ -35,6 +35,9 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
 
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_force_hash", "_cached_force")
+
     def __init__(
         self,
         amp=1.0,
@@ -97,6 +100,8 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
 
            2018-07-23 - Calculate sigmar from the Jeans equation and interpolate it; allow GMs and rhm to be set on the fly - Bovy (UofT)
 
+           2026-10-19 - Solve the Jeans equation on the whole interpolation grid at once
+
         """
         DissipativeForce.__init__(self, amp=amp * GMs, ro=ro, vo=vo, amp_units="mass")
         rhm = conversion.parse_length(rhm, ro=self._ro)
@@ -123,16 +128,22 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
         self._dens = lambda R, z, phi=0.0, t=0.0: evaluateDensities(
             self._dens_pot, R, z, phi=phi, t=t, use_physical=False
         )
+        self._sigmar_rs_4interp = numpy.linspace(self._minr, self._maxr, nr)
         if sigmar is None:
             from ..df import jeans
 
+            # Solve the Jeans equation on the whole grid at once
+            self._sigmars_4interp = jeans.sigmar_profile(
+                self._dens_pot, self._minr, self._maxr, beta=0.0
+            )(self._sigmar_rs_4interp)
+            # Direct solution, only used as sigmar_orig
             sigmar = lambda x: jeans.sigmar(
                 self._dens_pot, x, beta=0.0, use_physical=False
             )
-        self._sigmar_rs_4interp = numpy.linspace(self._minr, self._maxr, nr)
-        self._sigmars_4interp = numpy.array(
-            [sigmar(x) for x in self._sigmar_rs_4interp]
-        )
+        else:
+            self._sigmars_4interp = numpy.array(
+                [sigmar(x) for x in self._sigmar_rs_4interp]
+            )
         if numpy.any(numpy.isnan(self._sigmars_4interp)):
             # Check for case where density is zero, in that case, just
             # paint in the nearest neighbor for the interpolation
@@ -0,0 +1,235 @@
+###############################################################################
+#   CompiledPotential.py: potential defined by compiled functions of
+#                         (R,z,phi,t) that can be used in C
+###############################################################################
+import ctypes
+
+import numpy
+
+from ..util._optional_deps import _NUMBA_LOADED
+from .Potential import Potential
+
+if _NUMBA_LOADED:
+    from numba import cfunc, types
+
+# Order matters: this is the order in which the C code expects the functions
+_C_FUNCS = [
+    "Phi",
+    "Rforce",
+    "zforce",
+    "phitorque",
+    "dens",
+    "R2deriv",
+    "phi2deriv",
+    "Rphideriv",
+]
+_compiled_func_ctype = ctypes.CFUNCTYPE(
+    ctypes.c_double,  # Return type
+    ctypes.c_double,  # R
+    ctypes.c_double,  # z
+    ctypes.c_double,  # phi
+    ctypes.c_double,  # t
+)
+
+
+class CompiledPotential(Potential):
+    """Class that implements a potential defined by user-supplied functions f(R,z,phi,t) for the potential, forces, density, and second derivatives, which are used directly by galpy's C code (orbit integration, actionAngleStaeckel, interpRZPotential, ...). The functions can be `numba <https://numba.pydata.org/>`__ ``cfunc`` objects, ``ctypes`` function pointers (e.g., obtained from a compiled library or from ``cffi``), or plain Python functions, which are compiled with ``numba`` when possible. The functions should take (R,z,phi,t) in internal units and return the quantity in internal units for unit amplitude. Compiled functions run in C without the Python GIL, such that orbits in this potential can be integrated in parallel with full C speed."""
+
+    def __init__(
+        self,
+        amp=1.0,
+        Phi=None,
+        Rforce=None,
+        zforce=None,
+        phitorque=None,
+        dens=None,
+        R2deriv=None,
+        z2deriv=None,
+        Rzderiv=None,
+        phi2deriv=None,
+        Rphideriv=None,
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a CompiledPotential
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1)
+
+           Phi= (None) potential; required for using the potential in C
+
+           Rforce=, zforce= radial and vertical force (required)
+
+           phitorque= (None) azimuthal torque; if None, the potential is axisymmetric
+
+           dens= (None) density
+
+           R2deriv=, z2deriv=, Rzderiv=, phi2deriv=, Rphideriv= (None) second derivatives of the potential (z2deriv and Rzderiv are only used in Python)
+
+           All functions have signature f(R,z,phi,t) -> float and can be a numba cfunc with signature float64(float64,float64,float64,float64), a ctypes function pointer or an integer address of a compiled function with the corresponding C signature double(double,double,double,double), or a Python function (compiled with numba.cfunc if numba is installed and can compile it, otherwise called back from C, which is slow)
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo)
+        if Rforce is None or zforce is None:
+            raise ValueError(
+                "CompiledPotential requires at least the Rforce= and zforce= functions"
+            )
+        self._funcs = {
+            name: func
+            for name, func in zip(
+                [
+                    "Phi",
+                    "Rforce",
+                    "zforce",
+                    "phitorque",
+                    "dens",
+                    "R2deriv",
+                    "z2deriv",
+                    "Rzderiv",
+                    "phi2deriv",
+                    "Rphideriv",
+                ],
+                [
+                    Phi,
+                    Rforce,
+                    zforce,
+                    phitorque,
+                    dens,
+                    R2deriv,
+                    z2deriv,
+                    Rzderiv,
+                    phi2deriv,
+                    Rphideriv,
+                ],
+            )
+            if func is not None
+        }
+        self._pyfuncs = {
+            name: _python_callable(func) for name, func in self._funcs.items()
+        }
+        self._cfuncs = None  # compiled on first use in C
+        self.isNonAxi = "phitorque" in self._funcs
+        # C code that uses the potential (e.g., actionAngleStaeckel) needs Phi
+        self.hasC = "Phi" in self._funcs
+        self.hasC_dxdv = (
+            self.hasC
+            and "R2deriv" in self._funcs
+            and (
+                not self.isNonAxi
+                or ("phi2deriv" in self._funcs and "Rphideriv" in self._funcs)
+            )
+        )
+        self.hasC_dens = "dens" in self._funcs
+        return None
+
+    def _c_funcs(self):
+        """Return the ctypes function pointers in the order expected by the C code, compiling them if necessary"""
+        if self._cfuncs is None:
+            # Keep the compiled objects alive together with their pointers
+            self._cfuncs = [
+                _compile(self._funcs[name]) for name in _C_FUNCS if name in self._funcs
+            ]
+        return [cfunc_ptr for _, cfunc_ptr in self._cfuncs]
+
+    def _call(self, name, R, z, phi, t):
+        try:
+            func = self._pyfuncs[name]
+        except KeyError:
+            raise AttributeError(f"'{name}' function not supplied")
+        if numpy.ndim(R) == 0 and numpy.ndim(z) == 0 and numpy.ndim(phi) == 0:
+            return func(R, z, phi, t)
+        return numpy.vectorize(func, otypes=[float])(R, z, phi, t)
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._call("Phi", R, z, phi, t)
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._call("Rforce", R, z, phi, t)
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._call("zforce", R, z, phi, t)
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        if not self.isNonAxi:
+            return 0.0
+        return self._call("phitorque", R, z, phi, t)
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        return self._call("dens", R, z, phi, t)
+
+    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._call("R2deriv", R, z, phi, t)
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._call("z2deriv", R, z, phi, t)
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+        return self._call("Rzderiv", R, z, phi, t)
+
+    def _phi2deriv(self, R, z, phi=0.0, t=0.0):
+        if not self.isNonAxi:
+            return 0.0
+        return self._call("phi2deriv", R, z, phi, t)
+
+    def _Rphideriv(self, R, z, phi=0.0, t=0.0):
+        if not self.isNonAxi:
+            return 0.0
+        return self._call("Rphideriv", R, z, phi, t)
+
+    def __getstate__(self):
+        # Compiled functions cannot be pickled, re-compile after unpickling
+        state = self.__dict__.copy()
+        state["_cfuncs"] = None
+        return state
+
+
+def _is_numba_cfunc(func):
+    return hasattr(func, "ctypes") and hasattr(func, "address")
+
+
+def _python_callable(func):
+    """Return a Python-callable version of a user-supplied function"""
+    if _is_numba_cfunc(func):
+        return func.ctypes
+    elif isinstance(func, int):
+        return _compiled_func_ctype(func)
+    return func
+
+
+def _compile(func):
+    """Return the compiled object and a ctypes function pointer to it with signature double(double,double,double,double) for a user-supplied function"""
+    if _is_numba_cfunc(func):
+        return func, func.ctypes
+    elif isinstance(func, ctypes._CFuncPtr):
+        return func, func
+    elif isinstance(func, int):
+        return func, _compiled_func_ctype(func)
+    try:  # using numba
+        if not _NUMBA_LOADED:
+            raise
+        compiled = cfunc(
+            types.double(types.double, types.double, types.double, types.double),
+            nopython=True,
+        )(func)
+        return compiled, compiled.ctypes
+    except:  # Any Exception, switch to regular ctypes wrapping
+        compiled = _compiled_func_ctype(func)
+        return compiled, compiled
@@ -0,0 +1,492 @@
+###############################################################################
+#   CylindricalFourierExpansionPotential.py: potential expanded in azimuthal
+#                                            Fourier harmonics with each
+#                                            harmonic tabulated on a (R,z) grid
+###############################################################################
+import numpy
+from scipy import special
+
+from ..util import conversion
+from .interp3DPotential import _cell_weights, _pad_table
+from .NumericalPotentialDerivativesMixin import NumericalPotentialDerivativesMixin
+from .Potential import Potential, PotentialError
+
+# Maximum number of points to process at once, to limit memory use
+_CHUNKSIZE = 2**14
+# Maximum number of particle-grid-point pairs to process at once
+_PAIRS_CHUNKSIZE = 2**18
+
+
+class CylindricalFourierExpansionPotential(
+    Potential, NumericalPotentialDerivativesMixin
+):
+    """Class that implements an expansion of a general potential in azimuthal Fourier harmonics, with each harmonic tabulated on a grid in :math:`(R,z)`
+
+    .. math::
+
+        \\Phi(R,z,\\phi) = \\mathrm{amp}\\,\\sum_{m=0}^{M} \\left(A_{\\mathrm{cos},m}(R,z)\\cos m\\phi + A_{\\mathrm{sin},m}(R,z)\\sin m\\phi\\right)
+
+    The harmonics :math:`A_m(R,z)` and their radial and vertical forces are tabulated on a regular grid and are evaluated using bicubic (Catmull-Rom) interpolation, which is done in the same way in Python and C. Outside of the grid, the potential is approximated as that of a point mass with the total mass of the expansion; inside the smallest radius of the grid, the harmonics are evaluated at the smallest radius. This expansion is well suited for disks, for which a multipole expansion requires many terms.
+
+    Use ``CylindricalFourierExpansionPotential.from_nbody`` to compute the expansion for a set of particles.
+    """
+
+    def __init__(
+        self,
+        amp=1.0,
+        Rgrid=(0.0, 5.0, 101),
+        zgrid=(0.0, 2.0, 101),
+        Acos=None,
+        Asin=None,
+        zsym=True,
+        totmass=1.0,
+        normalize=False,
+        ro=None,
+        vo=None,
+        **kwargs,
+    ):
+        """
+        NAME:
+
+            __init__
+
+        PURPOSE:
+
+            initialize a cylindrical Fourier-expansion potential from tabulated harmonics (use CylindricalFourierExpansionPotential.from_nbody to directly initialize from a set of particles)
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1); can be a Quantity with units of mass or Gxmass
+
+           Rgrid= (0.,5.,101) regular grid in R as (Rmin,Rmax,nR)
+
+           zgrid= (0.,2.,101) regular grid in z as (zmin,zmax,nz); zmin should be zero for zsym=True
+
+           Acos - harmonics multiplying cos(m phi) at the grid points, shape (M+1,3,nR,nz) indexed as [m,q,R,z], where q=0,1,2 are the potential, the radial force, and the vertical force
+
+           Asin= (None) harmonics multiplying sin(m phi) at the grid points, same shape as Acos (None for axisymmetric potentials)
+
+           zsym= (True) if True, the potential is assumed to be symmetric with respect to the mid-plane and only z >= 0 is tabulated
+
+           totmass= (1.) total mass, used to approximate the potential outside of the grid as that of a point mass (in internal units)
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           CylindricalFourierExpansionPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        NumericalPotentialDerivativesMixin.__init__(self, kwargs)
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo, amp_units="mass")
+        Rgrid = [conversion.parse_length(x, ro=self._ro) for x in Rgrid[:2]] + [
+            int(Rgrid[2])
+        ]
+        zgrid = [conversion.parse_length(x, ro=self._ro) for x in zgrid[:2]] + [
+            int(zgrid[2])
+        ]
+        if Rgrid[2] < 4 or zgrid[2] < 4:
+            raise PotentialError(
+                "CylindricalFourierExpansionPotential grids need at least 4 points in each dimension"
+            )
+        if Rgrid[0] < 0.0:
+            raise PotentialError(
+                "The R grid of a CylindricalFourierExpansionPotential cannot extend to R < 0"
+            )
+        if zsym and zgrid[0] != 0.0:
+            raise PotentialError(
+                "The z grid of a CylindricalFourierExpansionPotential with zsym=True has to start at z=0"
+            )
+        Acos = numpy.asarray(Acos, dtype="float")
+        shape = (Acos.shape[0], 3, Rgrid[2], zgrid[2])
+        if Asin is None:
+            Asin = numpy.zeros_like(Acos)
+        Asin = numpy.asarray(Asin, dtype="float")
+        if Acos.shape != shape or Asin.shape != shape:
+            raise PotentialError(
+                "Acos and Asin must have shape (M+1,3,nR,nz), with nR and nz the number of grid points"
+            )
+        self._Rgrid = numpy.linspace(*Rgrid)
+        self._zgrid = numpy.linspace(*zgrid)
+        self._dR = self._Rgrid[1] - self._Rgrid[0]
+        self._dz = self._zgrid[1] - self._zgrid[0]
+        self._zsym = bool(zsym)
+        self._M = Acos.shape[0] - 1
+        self._totmass = float(totmass)
+        self._Acos, self._Asin = Acos, Asin
+        # Padded table with (pot,Rforce,zforce) for cos and sin for each m
+        # at each grid point, such that the stencil is always available
+        table = numpy.stack((Acos, Asin), axis=1).reshape(
+            (6 * (self._M + 1),) + shape[2:]
+        )
+        self._table = _pad_table(
+            numpy.moveaxis(table, 0, -1),
+            numpy.tile([1.0, 1.0, -1.0], 2 * (self._M + 1)) if self._zsym else None,
+            periodic=False,
+        )
+        self._mm = numpy.arange(self._M + 1)
+        self.isNonAxi = bool(numpy.any(Acos[1:] != 0.0) or numpy.any(Asin != 0.0))
+        self.hasC = True
+        self.hasC_dxdv = False
+        if normalize or (
+            isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
+        ):  # pragma: no cover
+            self.normalize(normalize)
+        return None
+
+    @classmethod
+    def from_nbody(
+        cls,
+        pos,
+        M,
+        Rgrid=(0.0, 5.0, 101),
+        zgrid=(0.0, 2.0, 101),
+        mass=1.0,
+        zsym=True,
+        eps=None,
+        chunksize=_PAIRS_CHUNKSIZE,
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+            from_nbody
+
+        PURPOSE:
+
+            initialize a cylindrical Fourier-expansion potential from a set of particles
+
+        INPUT:
+
+           pos - positions of particles in rectangular coordinates with shape [3,n] (can be Quantity)
+
+           M - maximum azimuthal order m of the expansion
+
+           Rgrid= (0.,5.,101) regular grid in R as (Rmin,Rmax,nR) (can be Quantities)
+
+           zgrid= (0.,2.,101) regular grid in z as (zmin,zmax,nz) (can be Quantities); zmin should be zero for zsym=True
+
+           mass= (1.) mass of particles (scalar or array with size n; can be Quantity)
+
+           zsym= (True) if True, symmetrize the potential with respect to the mid-plane
+
+           eps= (None) Plummer softening length (can be Quantity); default: half of the smallest grid spacing
+
+           chunksize= number of particle-grid-point pairs to process at once
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           CylindricalFourierExpansionPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        # Dummy object for ro/vo handling, to ensure consistency
+        dumm = cls(
+            Rgrid=(0.0, 1.0, 4),
+            zgrid=(0.0, 1.0, 4),
+            Acos=numpy.zeros((1, 3, 4, 4)),
+            ro=ro,
+            vo=vo,
+        )
+        pos = conversion.parse_length(pos, ro=dumm._ro)
+        mass = conversion.parse_mass(mass, ro=dumm._ro, vo=dumm._vo)
+        Rgrid = [conversion.parse_length(x, ro=dumm._ro) for x in Rgrid[:2]] + [
+            int(Rgrid[2])
+        ]
+        zgrid = [conversion.parse_length(x, ro=dumm._ro) for x in zgrid[:2]] + [
+            int(zgrid[2])
+        ]
+        if eps is None:
+            eps = 0.5 * min(
+                (Rgrid[1] - Rgrid[0]) / (Rgrid[2] - 1),
+                (zgrid[1] - zgrid[0]) / (zgrid[2] - 1),
+            )
+        eps = conversion.parse_length(eps, ro=dumm._ro)
+        Acos, Asin = cylindrical_fourier_compute_coeffs_nbody(
+            pos,
+            M,
+            numpy.linspace(*Rgrid),
+            numpy.linspace(*zgrid),
+            mass=mass,
+            zsym=zsym,
+            eps=eps,
+            chunksize=chunksize,
+        )
+        return cls(
+            Rgrid=Rgrid,
+            zgrid=zgrid,
+            Acos=Acos,
+            Asin=Asin,
+            zsym=zsym,
+            totmass=numpy.sum(numpy.ones(pos.shape[1]) * mass),
+            ro=ro,
+            vo=vo,
+        )
+
+    def save(self, filename):
+        """
+        NAME:
+
+           save
+
+        PURPOSE:
+
+           save the expansion to a file, such that it can be loaded with CylindricalFourierExpansionPotential.from_file
+
+        INPUT:
+
+           filename - name of the file (a .npz file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        numpy.savez(
+            filename,
+            amp=self._amp,
+            Rgrid=[self._Rgrid[0], self._Rgrid[-1], len(self._Rgrid)],
+            zgrid=[self._zgrid[0], self._zgrid[-1], len(self._zgrid)],
+            Acos=self._Acos,
+            Asin=self._Asin,
+            zsym=self._zsym,
+            totmass=self._totmass,
+            ro=self._ro if self._roSet else numpy.nan,
+            vo=self._vo if self._voSet else numpy.nan,
+        )
+        return None
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        NAME:
+
+           from_file
+
+        PURPOSE:
+
+           load an expansion saved with CylindricalFourierExpansionPotential.save
+
+        INPUT:
+
+           filename - name of the file
+
+        OUTPUT:
+
+           CylindricalFourierExpansionPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        with numpy.load(filename) as data:
+            return cls(
+                amp=float(data["amp"]),
+                Rgrid=tuple(data["Rgrid"]),
+                zgrid=tuple(data["zgrid"]),
+                Acos=data["Acos"],
+                Asin=data["Asin"],
+                zsym=bool(data["zsym"]),
+                totmass=float(data["totmass"]),
+                ro=None if numpy.isnan(data["ro"]) else float(data["ro"]),
+                vo=None if numpy.isnan(data["vo"]) else float(data["vo"]),
+            )
+
+    def _compute(self, R, z, phi):
+        """Compute the potential, Rforce, zforce, and phitorque at arrays of points"""
+        if not self.isNonAxi and phi is None:
+            phi = 0.0
+        R, z, phi = numpy.broadcast_arrays(
+            numpy.asarray(R, dtype="float"),
+            numpy.asarray(z, dtype="float"),
+            numpy.asarray(phi, dtype="float"),
+        )
+        shape = R.shape
+        R, z, phi = R.flatten(), z.flatten(), phi.flatten()
+        if self._zsym:
+            zsign = numpy.where(z < 0.0, -1.0, 1.0)
+            z = numpy.fabs(z)
+        else:
+            zsign = numpy.ones_like(z)
+        ingrid = (R <= self._Rgrid[-1]) * (z >= self._zgrid[0]) * (z <= self._zgrid[-1])
+        out = numpy.empty((4, len(R)))
+        nchannel = 6 * (self._M + 1)
+        for start in range(0, len(R), _CHUNKSIZE):
+            sl = slice(start, start + _CHUNKSIZE)
+            ii, wR = _cell_weights(R[sl], self._Rgrid[0], self._dR, len(self._Rgrid), 0)
+            jj, wz = _cell_weights(z[sl], self._zgrid[0], self._dz, len(self._zgrid), 0)
+            vals = numpy.zeros((len(ii), nchannel))
+            for ll in range(4):
+                for mm in range(4):
+                    vals += (wR[:, ll] * wz[:, mm])[:, None] * self._table[
+                        ii + ll, jj + mm
+                    ]
+            vals = vals.reshape((len(ii), self._M + 1, 2, 3))
+            cosmphi = numpy.cos(self._mm * phi[sl, None])
+            sinmphi = numpy.sin(self._mm * phi[sl, None])
+            out[:3, sl] = numpy.sum(
+                vals[:, :, 0] * cosmphi[..., None] + vals[:, :, 1] * sinmphi[..., None],
+                axis=1,
+            ).T
+            out[3, sl] = numpy.sum(
+                self._mm * (vals[:, :, 0, 0] * sinmphi - vals[:, :, 1, 0] * cosmphi),
+                axis=1,
+            )
+        out[2] *= zsign
+        # Outside of the grid: point mass
+        if not numpy.all(ingrid):
+            z = z * zsign
+            r = numpy.sqrt(R[~ingrid] ** 2 + z[~ingrid] ** 2)
+            out[0, ~ingrid] = -self._totmass / r
+            out[1, ~ingrid] = -self._totmass * R[~ingrid] / r**3
+            out[2, ~ingrid] = -self._totmass * z[~ingrid] / r**3
+            out[3, ~ingrid] = 0.0
+        if shape == ():
+            return out[:, 0]
+        return out.reshape((4,) + shape)
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi)[0]
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi)[1]
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi)[2]
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi)[3]
+
+
+def _legendreQ_halfint(M, chi):
+    """Compute the Legendre functions of the second kind Q_{m-1/2}(chi) for m=0..M and their derivatives with respect to chi (chi > 1), returned as two (M+1,len(chi)) arrays"""
+    Q = numpy.empty((M + 2, len(chi)))  # Q_{m-1/2} for m=-1..M
+    dQ = numpy.empty((M + 1, len(chi)))
+    # Close to chi=1: complete elliptic integrals and upward recurrence,
+    # which is only used where it amplifies round-off errors by < 1e4
+    g = 10.0 ** (2.0 / max(M, 1))
+    near = chi <= min(1.5, 0.5 * (g + 1.0 / g))
+    c = chi[near]
+    k2 = 2.0 / (c + 1.0)
+    K = special.ellipkm1((c - 1.0) / (c + 1.0))
+    Q[1, near] = numpy.sqrt(k2) * K
+    Q[0, near] = c * Q[1, near] - numpy.sqrt(2.0 * (c + 1.0)) * special.ellipe(k2)
+    if M >= 1:
+        Q[2, near] = Q[0, near]
+    for m in range(1, M):
+        Q[m + 2, near] = (2.0 * m * c * Q[m + 1, near] - (m - 0.5) * Q[m, near]) / (
+            m + 0.5
+        )
+    for m in range(M + 1):
+        dQ[m, near] = (m - 0.5) * (c * Q[m + 1, near] - Q[m, near]) / (c**2 - 1.0)
+    # Far from chi=1: hypergeometric series in 1/chi^2
+    c = chi[~near]
+    for m in range(M + 1):
+        nu = m - 0.5
+        a, b, cc = (nu + 2.0) / 2.0, (nu + 1.0) / 2.0, nu + 1.5
+        pref = numpy.exp(
+            0.5 * numpy.log(numpy.pi)
+            + special.gammaln(nu + 1.0)
+            - special.gammaln(nu + 1.5)
+            - (nu + 1.0) * numpy.log(2.0 * c)
+        )
+        F = special.hyp2f1(a, b, cc, 1.0 / c**2)
+        dF = a * b / cc * special.hyp2f1(a + 1.0, b + 1.0, cc + 1.0, 1.0 / c**2)
+        Q[m + 1, ~near] = pref * F
+        dQ[m, ~near] = -pref * ((nu + 1.0) / c * F + 2.0 / c**3 * dF)
+    return (Q[1:], dQ)
+
+
+def cylindrical_fourier_compute_coeffs_nbody(
+    pos, M, Rgrid, zgrid, mass=1.0, zsym=True, eps=0.01, chunksize=_PAIRS_CHUNKSIZE
+):
+    """
+    NAME:
+
+       cylindrical_fourier_compute_coeffs_nbody
+
+    PURPOSE:
+
+       Compute the azimuthal Fourier harmonics of the (Plummer-softened) potential and forces of a set of particles on a grid in (R,z), using the expansion of the inverse distance in Legendre functions of the second kind of half-integer degree
+
+    INPUT:
+
+       pos - positions of particles in rectangular coordinates with shape [3,n]
+
+       M - maximum azimuthal order m of the expansion
+
+       Rgrid - grid in R (1D array)
+
+       zgrid - grid in z (1D array)
+
+       mass= (1.) mass of particles (scalar or array with size n)
+
+       zsym= (True) if True, symmetrize the potential with respect to the mid-plane
+
+       eps= (0.01) Plummer softening length
+
+       chunksize= number of particle-grid-point pairs to process at once
+
+    OUTPUT:
+
+       (Acos,Asin) - harmonics of the potential, radial force, and vertical force on the grid, each with shape (M+1,3,len(Rgrid),len(zgrid)), that can be given to CylindricalFourierExpansionPotential.__init__
+
+    HISTORY:
+
+       2026-10-19 - Written
+
+    """
+    pos = numpy.asarray(pos, dtype="float")
+    mass = numpy.ones(pos.shape[1]) * mass
+    if zsym:
+        pos = numpy.concatenate(
+            (pos, pos * numpy.array([[1.0], [1.0], [-1.0]])), axis=1
+        )
+        mass = numpy.concatenate((mass, mass)) / 2.0
+    Rgrid = numpy.asarray(Rgrid, dtype="float")
+    zgrid = numpy.asarray(zgrid, dtype="float")
+    # Evaluate the harmonics at a small, non-zero R on the axis
+    Rmin = 1e-8 * numpy.amax(Rgrid)
+    R, z = numpy.meshgrid(numpy.maximum(Rgrid, Rmin), zgrid, indexing="ij")
+    R, z = R.flatten(), z.flatten()
+    Rp = numpy.maximum(numpy.sqrt(pos[0] ** 2 + pos[1] ** 2), Rmin)
+    phip = numpy.arctan2(pos[1], pos[0])
+    # epsilon_m / pi
+    pref = numpy.where(numpy.arange(M + 1) > 0, 2.0, 1.0)[:, None] / numpy.pi
+    out = numpy.zeros((M + 1, 2, 3, len(R)))
+    nchunk = max(1, chunksize // len(R))
+    for start in range(0, pos.shape[1], nchunk):
+        sl = slice(start, start + nchunk)
+        Rpc, zpc = Rp[sl, None], pos[2, sl, None]
+        chi = (R**2 + Rpc**2 + (z - zpc) ** 2 + eps**2) / (2.0 * R * Rpc)
+        Q, dQ = _legendreQ_halfint(M, chi.flatten())
+        Q = Q.reshape((M + 1,) + chi.shape)
+        dQ = dQ.reshape((M + 1,) + chi.shape)
+        isqrtRRp = 1.0 / numpy.sqrt(R * Rpc)
+        G = Q * isqrtRRp
+        dGdR = (dQ * (1.0 / Rpc - chi / R) - 0.5 * Q / R) * isqrtRRp
+        dGdz = dQ * (z - zpc) / R / Rpc * isqrtRRp
+        for ii, trig in enumerate([numpy.cos, numpy.sin]):
+            w = pref * mass[sl] * trig(numpy.arange(M + 1)[:, None] * phip[sl])
+            out[:, ii, 0] -= numpy.einsum("mi,mij->mj", w, G)
+            out[:, ii, 1] += numpy.einsum("mi,mij->mj", w, dGdR)
+            out[:, ii, 2] += numpy.einsum("mi,mij->mj", w, dGdz)
+    out = out.reshape((M + 1, 2, 3, len(Rgrid), len(zgrid)))
+    return (out[:, 0], out[:, 1])
@@ -31,6 +31,8 @@ q_halo = 0.8
 
 
 def define_dehnenbinney98_models(model=1):
+    # Directory in which to cache the SCF coefficients (None: no caching)
+    cachedir = mwpot_helpers._cache_dir()
     # Suppress the numpy floating-point warnings that this code generates...
     old_error_settings = numpy.seterr(all="ignore")
     if model == 1:
@@ -129,7 +131,7 @@ def define_dehnenbinney98_models(model=1):
     ]
     # Now put together the potential
     DB98_bulge = SCFPotential(
-        Acos=scf_compute_coeffs_axi(bulge_dens, 30, 10, a=0.025)[0],
+        Acos=scf_compute_coeffs_axi(bulge_dens, 30, 10, a=0.025, cache=cachedir)[0],
         a=0.025,
         ro=ro,
         vo=vo,
@@ -143,6 +145,7 @@ def define_dehnenbinney98_models(model=1):
         L=30,
         ro=ro,
         vo=vo,
+        cache=cachedir,
     )
     DB98_halo = TwoPowerTriaxialPotential(
         amp=rho0_halo * (4 * numpy.pi * r0_halo**3),
@@ -62,6 +62,7 @@ class DiskSCFPotential(Potential):
         phi_order=None,
         ro=None,
         vo=None,
+        cache=None,
     ):
         """
         NAME:
@@ -106,6 +107,8 @@ class DiskSCFPotential(Potential):
 
               In both of these cases lists of arguments can be given for multiple disk components; can't mix (a) and (b) in these lists;  if hz is a single item the same vertical profile is assumed for all Sigma
 
+           cache= (None) if set to a directory, the SCF coefficients for Phi_ME are stored in a file in this directory whose name contains a hash of all of the inputs; when such a file already exists, the coefficients are read from it rather than computed
+
         OUTPUT:
 
            DiskSCFPotential object
@@ -113,6 +116,9 @@ class DiskSCFPotential(Potential):
         HISTORY:
 
            2016-12-26 - Written - Bovy (UofT)
+
+           2026-10-19 - Added cache=
+
         """
         Potential.__init__(self, amp=amp, ro=ro, vo=vo, amp_units=None)
         a = conversion.parse_length(a, ro=self._ro)
@@ -146,6 +152,7 @@ class DiskSCFPotential(Potential):
                 a=a,
                 radial_order=radial_order,
                 costheta_order=costheta_order,
+                cache=cache,
             )
         else:
             dens_func = lambda R, z, phi: phiME_dens(
@@ -169,6 +176,7 @@ class DiskSCFPotential(Potential):
                 radial_order=radial_order,
                 costheta_order=costheta_order,
                 phi_order=phi_order,
+                cache=cache,
             )
         self._phiME_dens_func = dens_func
         self._scf = SCFPotential(amp=1.0, Acos=Acos, Asin=Asin, a=a, ro=None, vo=None)
@@ -5,10 +5,16 @@
 #                                      rho(R,z) = rho_0 e^-R/h_R e^-|z|/h_z
 ###############################################################################
 import numpy
-from scipy import special
+from scipy import interpolate, special
 
-from ..util import conversion
-from .Potential import Potential, check_potential_inputs_not_arrays
+from ..util import _load_extension_libs, conversion
+from .interpRZPotential import calc_2dsplinecoeffs_c, calc_potential_c
+from .Potential import Potential
+
+_, ext_loaded = _load_extension_libs.load_libgalpy()
+# Maximum number of (point,node) pairs evaluated at once in the quadrature,
+# to limit memory usage for array inputs
+_DE_MAXSIZE = 2**22
 
 
 def _de_psi(t):
@@ -40,6 +46,10 @@ class DoubleExponentialDiskPotential(Potential):
         vo=None,
         de_h=1e-3,
         de_n=10000,
+        tabulate=False,
+        tab_rgrid=(numpy.log(0.01), numpy.log(20.0), 201),
+        tab_zgrid=(0.0, 1.0, 201),
+        tab_enable_c=False,
     ):
         """
         NAME:
@@ -64,6 +74,14 @@ class DoubleExponentialDiskPotential(Potential):
 
            de_b= (10000) number of points used in numerical integration (use 1000 for a lower accuracy version that is typically still high accuracy enough, but faster)
 
+           tabulate= (False) if True, tabulate the potential, forces, and second derivatives on a grid in (log R,|z|) when the instance is set up and evaluate them using spline interpolation within the grid (the numerical integration is used outside of the grid); for the default grid, the potential and forces are accurate to better than ~1e-6 and the second derivatives to ~1e-4 relative to the numerical integration (relative to the typical magnitude of each), and setting up the tabulation takes a few seconds
+
+           tab_rgrid= (log(0.01),log(20.),201) grid in log R for the tabulation, given to linspace as in logrs= linspace(*tab_rgrid)
+
+           tab_zgrid= (0.,1.,201) grid in |z| for the tabulation, given to linspace as in zs= linspace(*tab_zgrid)
+
+           tab_enable_c= (False) if True, also use the tabulated potential and forces in C (e.g., for orbit integration); note that in C the tabulation is used everywhere, so the grid needs to cover the entire orbit (for planar orbits, the z=0 row of the tabulation is used, which requires the |z| grid to start at zero)
+
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
         OUTPUT:
@@ -78,6 +96,8 @@ class DoubleExponentialDiskPotential(Potential):
 
            2020-12-24 - Re-implemented again using more accurate integration techniques for Bessel integrals - Bovy (UofT)
 
+           2026-10-19 - Added tabulate
+
         """
         Potential.__init__(self, amp=amp, ro=ro, vo=vo, amp_units="density")
         hr = conversion.parse_length(hr, ro=self._ro)
@@ -127,13 +147,96 @@ class DoubleExponentialDiskPotential(Potential):
             + numpy.log(1.0 + _gamma / numpy.sqrt(1.0 + _gamma2))
         ) / (2.0 * (1.0 + _gamma2) ** 1.5)
         self._pot_zero *= -4.0 * numpy.pi / self._alpha**2.0
+        # Tabulate?
+        self._tabulated = False
+        self._tab_enable_c = False
+        if tabulate:
+            self._setup_tabulation(tab_rgrid, tab_zgrid, tab_enable_c)
         # Normalize?
         if normalize or (
             isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
         ):  # pragma: no cover
             self.normalize(normalize)
 
-    def _evaluate(self, R, z, phi=0.0, t=0.0, dR=0, dphi=0):
+    def _setup_tabulation(self, rgrid, zgrid, enable_c):
+        """Tabulate the potential and forces on a grid in (log R,|z|) and set up their spline interpolation"""
+        self._tab_logrgrid = numpy.linspace(*rgrid)
+        self._tab_rgrid = numpy.exp(self._tab_logrgrid)
+        self._tab_zgrid = numpy.linspace(*zgrid)
+        if ext_loaded:  # Much faster to compute the grids in C
+            self._tab_potGrid, self._tab_rforceGrid, self._tab_zforceGrid = (
+                calc_potential_c(
+                    self, self._tab_rgrid, self._tab_zgrid, rforce=rforce, zforce=zforce
+                )[0]
+                / self._amp
+                for rforce, zforce in [(False, False), (True, False), (False, True)]
+            )
+        else:
+            Rs, zs = numpy.meshgrid(self._tab_rgrid, self._tab_zgrid, indexing="ij")
+            self._tab_potGrid = self._evaluate(Rs, zs)
+            self._tab_rforceGrid = self._Rforce(Rs, zs)
+            self._tab_zforceGrid = self._zforce(Rs, zs)
+        self._tab_potInterp, self._tab_rforceInterp, self._tab_zforceInterp = (
+            interpolate.RectBivariateSpline(
+                self._tab_logrgrid, self._tab_zgrid, grid, kx=3, ky=3, s=0.0
+            )
+            for grid in [
+                self._tab_potGrid,
+                self._tab_rforceGrid,
+                self._tab_zforceGrid,
+            ]
+        )
+        self._tabulated = True
+        if enable_c and ext_loaded:
+            self._tab_enable_c = True
+            self._tab_potGrid_splinecoeffs = calc_2dsplinecoeffs_c(self._tab_potGrid)
+            self._tab_rforceGrid_splinecoeffs = calc_2dsplinecoeffs_c(
+                self._tab_rforceGrid
+            )
+            self._tab_zforceGrid_splinecoeffs = calc_2dsplinecoeffs_c(
+                self._tab_zforceGrid
+            )
+        return None
+
+    def _tab_eval(self, interp, func, R, z, dx=0, dy=0):
+        """Evaluate a tabulated quantity (or its derivative in (log R,|z|)) within the grid and use the numerical integration func outside of it"""
+        R, z = numpy.broadcast_arrays(R, z)
+        shape = R.shape
+        R = R.flatten().astype("float")
+        z = numpy.fabs(z.flatten())
+        out = numpy.empty(len(R))
+        indx = (
+            (R >= self._tab_rgrid[0])
+            * (R <= self._tab_rgrid[-1])
+            * (z <= self._tab_zgrid[-1])
+            * (z >= self._tab_zgrid[0])
+        )
+        if numpy.any(indx):
+            out[indx] = interp.ev(numpy.log(R[indx]), z[indx], dx=dx, dy=dy)
+        if numpy.any(True ^ indx):
+            out[True ^ indx] = func(R[True ^ indx], z[True ^ indx], tab=False)
+        if shape == ():
+            return out[0]
+        return out.reshape(shape)
+
+    def _de_integrate(self, integrand, xs, weights, R, z):
+        """Compute the sum over the nodes xs of integrand(xs,R,|z|) x weights for (arrays of) R and z, in chunks to limit memory usage"""
+        R, z = numpy.broadcast_arrays(R, z)
+        shape = R.shape
+        R = R.flatten()[:, numpy.newaxis]
+        z = numpy.fabs(z.flatten())[:, numpy.newaxis]
+        out = numpy.empty(len(R))
+        chunk = max(1, _DE_MAXSIZE // len(xs))
+        for ii in range(0, len(R), chunk):
+            out[ii : ii + chunk] = numpy.nansum(
+                integrand(xs, R[ii : ii + chunk], z[ii : ii + chunk]) * weights,
+                axis=1,
+            )
+        if shape == ():
+            return out[0]
+        return out.reshape(shape)
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0, dR=0, dphi=0, tab=True):
         """
         NAME:
            _evaluate
@@ -151,43 +254,27 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
            2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
-        if isinstance(R, (float, int)):
-            floatIn = True
-            R = numpy.atleast_1d(R)
-            z = numpy.atleast_1d(z)
-        else:
-            if isinstance(z, float):
-                z = z * numpy.ones_like(R)
-            floatIn = False
-            outShape = R.shape  # this code can't do arbitrary shapes
-            R = R.flatten()
-            z = z.flatten()
+        if tab and self._tabulated:
+            return self._tab_eval(self._tab_potInterp, self._evaluate, R, z)
         fun = (
-            lambda x: (self._alpha**2.0 + (x / R[:, numpy.newaxis]) ** 2.0) ** -1.5
-            * (
-                self._beta
-                * numpy.exp(-x / R[:, numpy.newaxis] * numpy.fabs(z[:, numpy.newaxis]))
-                - x
-                / R[:, numpy.newaxis]
-                * numpy.exp(-self._beta * numpy.fabs(z[:, numpy.newaxis]))
-            )
-            / (self._beta**2.0 - (x / R[:, numpy.newaxis]) ** 2.0)
-        )
-        out = (
-            -4.0
-            * numpy.pi
-            * self._alpha
-            / R
-            * numpy.nansum(fun(self._de_j0_xs) * self._de_j0_weights, axis=1)
+            lambda x, R, z: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
+            * (self._beta * numpy.exp(-x / R * z) - x / R * numpy.exp(-self._beta * z))
+            / (self._beta**2.0 - (x / R) ** 2.0)
         )
-        out[(R == 0) * (z == 0)] = self._pot_zero
-        if floatIn:
-            return out[0]
-        else:
-            return numpy.reshape(out, outShape)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            out = (
+                -4.0
+                * numpy.pi
+                * self._alpha
+                / numpy.asarray(R, dtype="float")
+                * self._de_integrate(fun, self._de_j0_xs, self._de_j0_weights, R, z)
+            )
+        if numpy.ndim(out) == 0:
+            return self._pot_zero if R == 0 and z == 0 else out
+        out[(R == 0) * (z == 0) * numpy.ones(out.shape, dtype="bool")] = self._pot_zero
+        return out
 
-    @check_potential_inputs_not_arrays
-    def _Rforce(self, R, z, phi=0.0, t=0.0):
+    def _Rforce(self, R, z, phi=0.0, t=0.0, tab=True):
         """
         NAME:
            Rforce
@@ -205,13 +292,12 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
            2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
+        if tab and self._tabulated:
+            return self._tab_eval(self._tab_rforceInterp, self._Rforce, R, z)
         fun = (
-            lambda x: x
+            lambda x, R, z: x
             * (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
-            * (
-                self._beta * numpy.exp(-x / R * numpy.fabs(z))
-                - x / R * numpy.exp(-self._beta * numpy.fabs(z))
-            )
+            * (self._beta * numpy.exp(-x / R * z) - x / R * numpy.exp(-self._beta * z))
             / (self._beta**2.0 - (x / R) ** 2.0)
         )
         return (
@@ -219,11 +305,10 @@ class DoubleExponentialDiskPotential(Potential):
             * numpy.pi
             * self._alpha
             / R**2.0
-            * numpy.nansum(fun(self._de_j1_xs) * self._de_j1_weights)
+            * self._de_integrate(fun, self._de_j1_xs, self._de_j1_weights, R, z)
         )
 
-    @check_potential_inputs_not_arrays
-    def _zforce(self, R, z, phi=0.0, t=0.0):
+    def _zforce(self, R, z, phi=0.0, t=0.0, tab=True):
         """
         NAME:
            zforce
@@ -241,31 +326,31 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
            2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
-        fun = (
-            lambda x: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
-            * x
-            / R
-            * (
-                numpy.exp(-x / R * numpy.fabs(z))
-                - numpy.exp(-self._beta * numpy.fabs(z))
+        if tab and self._tabulated:
+            out = self._tab_eval(self._tab_zforceInterp, self._zforce, R, z)
+        else:
+            fun = (
+                lambda x, R, z: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
+                * x
+                / R
+                * (numpy.exp(-x / R * z) - numpy.exp(-self._beta * z))
+                / (self._beta**2.0 - (x / R) ** 2.0)
             )
-            / (self._beta**2.0 - (x / R) ** 2.0)
-        )
-        out = (
-            -4.0
-            * numpy.pi
-            * self._alpha
-            * self._beta
-            / R
-            * numpy.nansum(fun(self._de_j0_xs) * self._de_j0_weights)
+            out = (
+                -4.0
+                * numpy.pi
+                * self._alpha
+                * self._beta
+                / R
+                * self._de_integrate(fun, self._de_j0_xs, self._de_j0_weights, R, z)
+            )
+        return (
+            numpy.where(z > 0.0, out, -out)
+            if numpy.ndim(out) > 0
+            else (out if z > 0.0 else -out)
         )
-        if z > 0.0:
-            return out
-        else:
-            return -out
 
-    @check_potential_inputs_not_arrays
-    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+    def _R2deriv(self, R, z, phi=0.0, t=0.0, tab=True):
         """
         NAME:
            R2deriv
@@ -282,13 +367,15 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-27 - Written - Bovy (IAS)
            2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
+        if tab and self._tabulated:
+            return -(
+                self._tab_eval(self._tab_rforceInterp, self._R2deriv_dlnR, R, z, dx=1)
+                / R
+            )
         fun = (
-            lambda x: x**2
+            lambda x, R, z: x**2
             * (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
-            * (
-                self._beta * numpy.exp(-x / R * numpy.fabs(z))
-                - x / R * numpy.exp(-self._beta * numpy.fabs(z))
-            )
+            * (self._beta * numpy.exp(-x / R * z) - x / R * numpy.exp(-self._beta * z))
             / (self._beta**2.0 - (x / R) ** 2.0)
         )
         return (
@@ -296,14 +383,19 @@ class DoubleExponentialDiskPotential(Potential):
             * numpy.pi
             * self._alpha
             / R**3.0
-            * numpy.nansum(
-                fun(self._de_j0_xs) * self._de_j0_weights
-                - fun(self._de_j1_xs) / self._de_j1_xs * self._de_j1_weights
+            * (
+                self._de_integrate(fun, self._de_j0_xs, self._de_j0_weights, R, z)
+                - self._de_integrate(
+                    fun, self._de_j1_xs, self._de_j1_weights / self._de_j1_xs, R, z
+                )
             )
         )
 
-    @check_potential_inputs_not_arrays
-    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+    def _R2deriv_dlnR(self, R, z, tab=False):
+        """-R x R2deriv, the derivative of the radial force with respect to log R, used outside of the tabulation grid"""
+        return -R * self._R2deriv(R, z, tab=tab)
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0, tab=True):
         """
         NAME:
            z2deriv
@@ -320,14 +412,15 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-26 - Written - Bovy (IAS)
            2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
+        if tab and self._tabulated:
+            return -self._tab_eval(
+                self._tab_zforceInterp, self._z2deriv_neg, R, z, dy=1
+            )
         fun = (
-            lambda x: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
+            lambda x, R, z: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
             * x
             / R
-            * (
-                x / R * numpy.exp(-x / R * numpy.fabs(z))
-                - self._beta * numpy.exp(-self._beta * numpy.fabs(z))
-            )
+            * (x / R * numpy.exp(-x / R * z) - self._beta * numpy.exp(-self._beta * z))
             / (self._beta**2.0 - (x / R) ** 2.0)
         )
         return (
@@ -336,11 +429,14 @@ class DoubleExponentialDiskPotential(Potential):
             * self._alpha
             * self._beta
             / R
-            * numpy.nansum(fun(self._de_j0_xs) * self._de_j0_weights)
+            * self._de_integrate(fun, self._de_j0_xs, self._de_j0_weights, R, z)
         )
 
-    @check_potential_inputs_not_arrays
-    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+    def _z2deriv_neg(self, R, z, tab=False):
+        """-z2deriv, the derivative of the vertical force with respect to |z|, used outside of the tabulation grid"""
+        return -self._z2deriv(R, z, tab=tab)
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0, tab=True):
         """
         NAME:
            Rzderiv
@@ -357,27 +453,32 @@ class DoubleExponentialDiskPotential(Potential):
            2013-08-28 - Written - Bovy (IAS)
            2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
-        fun = (
-            lambda x: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
-            * (x / R) ** 2.0
-            * (
-                numpy.exp(-x / R * numpy.fabs(z))
-                - numpy.exp(-self._beta * numpy.fabs(z))
+        if tab and self._tabulated:
+            out = -self._tab_eval(self._tab_rforceInterp, self._Rzderiv_abs, R, z, dy=1)
+        else:
+            fun = (
+                lambda x, R, z: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
+                * (x / R) ** 2.0
+                * (numpy.exp(-x / R * z) - numpy.exp(-self._beta * z))
+                / (self._beta**2.0 - (x / R) ** 2.0)
             )
-            / (self._beta**2.0 - (x / R) ** 2.0)
-        )
-        out = (
-            -4.0
-            * numpy.pi
-            * self._alpha
-            * self._beta
-            / R
-            * numpy.nansum(fun(self._de_j1_xs) * self._de_j1_weights)
+            out = (
+                -4.0
+                * numpy.pi
+                * self._alpha
+                * self._beta
+                / R
+                * self._de_integrate(fun, self._de_j1_xs, self._de_j1_weights, R, z)
+            )
+        return (
+            numpy.where(z > 0.0, out, -out)
+            if numpy.ndim(out) > 0
+            else (out if z > 0.0 else -out)
         )
-        if z > 0.0:
-            return out
-        else:
-            return -out
+
+    def _Rzderiv_abs(self, R, z, tab=False):
+        """-Rzderiv at |z|, the derivative of the radial force with respect to |z|, used outside of the tabulation grid"""
+        return -self._Rzderiv(R, numpy.fabs(z), tab=tab)
 
     def _dens(self, R, z, phi=0.0, t=0.0):
         """
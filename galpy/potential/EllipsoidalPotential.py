@@ -8,13 +8,24 @@
 #                            with m^2 = x^2+y^2/b^2+z^2/c^2
 #
 ###############################################################################
+import ctypes
 import hashlib
 
 import numpy
+from numpy.ctypeslib import ndpointer
 from scipy import integrate
 
-from ..util import _rotate_to_arbitrary_vector, conversion, coords
-from .Potential import Potential, check_potential_inputs_not_arrays
+from ..util import _load_extension_libs, _rotate_to_arbitrary_vector, conversion, coords
+from .Potential import Potential
+
+_lib, ext_loaded = _load_extension_libs.load_libgalpy()
+
+# Maximum number of points x quadrature nodes evaluated at once for array input
+_MAX_VEC_SIZE = 2**18
+# Minimum number of points for which array input is evaluated in C
+_MIN_C_SIZE = 32
+# Index of the (i,j) second derivative in the output of the C array evaluation
+_D2_INDX = [[0, 1, 2], [1, 3, 4], [2, 4, 5]]
 
 
 class EllipsoidalPotential(Potential):
@@ -35,6 +46,9 @@ class EllipsoidalPotential(Potential):
     See PerfectEllipsoidPotential for an example and `Merritt & Fridman (1996) <http://adsabs.harvard.edu/abs/1996ApJ...460..136M>`_ for the formalism.
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_force_hash", "_cached_Fx", "_cached_Fy", "_cached_Fz")
+
     def __init__(
         self,
         amp=1.0,
@@ -138,7 +152,6 @@ class EllipsoidalPotential(Potential):
             self._glw *= 0.5
         return None
 
-    @check_potential_inputs_not_arrays
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -157,13 +170,16 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        if numpy.isinf(R):
-            y = 0.0
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
+        if numpy.ndim(x) == 0:
+            if numpy.isinf(R):
+                y = 0.0
+        else:
+            y = numpy.where(numpy.isinf(R), 0.0, y)
         if self._aligned:
             return self._evaluate_xyz(x, y, z)
         else:
-            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
+            xyzp = _rotate(self._rot, x, y, z)
             return self._evaluate_xyz(xyzp[0], xyzp[1], xyzp[2])
 
     def _evaluate_xyz(self, x, y, z):
@@ -179,7 +195,6 @@ class EllipsoidalPotential(Potential):
             )
         )
 
-    @check_potential_inputs_not_arrays
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -198,32 +213,9 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest()
-        if new_hash == self._force_hash:
-            Fx = self._cached_Fx
-            Fy = self._cached_Fy
-            Fz = self._cached_Fz
-        else:
-            if self._aligned:
-                xp, yp, zp = x, y, z
-            else:
-                xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-                xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
-            Fx = self._force_xyz(xp, yp, zp, 0)
-            Fy = self._force_xyz(xp, yp, zp, 1)
-            Fz = self._force_xyz(xp, yp, zp, 2)
-            self._force_hash = new_hash
-            self._cached_Fx = Fx
-            self._cached_Fy = Fy
-            self._cached_Fz = Fz
-        if not self._aligned:
-            Fxyz = numpy.dot(self._rot.T, numpy.array([Fx, Fy, Fz]))
-            Fx, Fy = Fxyz[0], Fxyz[1]
+        Fx, Fy, _ = self._xyzforces(R, z, phi)
         return numpy.cos(phi) * Fx + numpy.sin(phi) * Fy
 
-    @check_potential_inputs_not_arrays
     def _phitorque(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -242,32 +234,9 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest()
-        if new_hash == self._force_hash:
-            Fx = self._cached_Fx
-            Fy = self._cached_Fy
-            Fz = self._cached_Fz
-        else:
-            if self._aligned:
-                xp, yp, zp = x, y, z
-            else:
-                xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-                xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
-            Fx = self._force_xyz(xp, yp, zp, 0)
-            Fy = self._force_xyz(xp, yp, zp, 1)
-            Fz = self._force_xyz(xp, yp, zp, 2)
-            self._force_hash = new_hash
-            self._cached_Fx = Fx
-            self._cached_Fy = Fy
-            self._cached_Fz = Fz
-        if not self._aligned:
-            Fxyz = numpy.dot(self._rot.T, numpy.array([Fx, Fy, Fz]))
-            Fx, Fy = Fxyz[0], Fxyz[1]
+        Fx, Fy, _ = self._xyzforces(R, z, phi)
         return R * (-numpy.sin(phi) * Fx + numpy.cos(phi) * Fy)
 
-    @check_potential_inputs_not_arrays
     def _zforce(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -286,9 +255,13 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        return self._xyzforces(R, z, phi)[2]
+
+    def _xyzforces(self, R, z, phi):
+        """Rectangular forces (Fx,Fy,Fz) at (R,z,phi), caching the forces in the aligned frame for the last input"""
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest()
+        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest() + str(numpy.shape(x))
         if new_hash == self._force_hash:
             Fx = self._cached_Fx
             Fy = self._cached_Fy
@@ -297,19 +270,20 @@ class EllipsoidalPotential(Potential):
             if self._aligned:
                 xp, yp, zp = x, y, z
             else:
-                xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-                xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
-            Fx = self._force_xyz(xp, yp, zp, 0)
-            Fy = self._force_xyz(xp, yp, zp, 1)
-            Fz = self._force_xyz(xp, yp, zp, 2)
+                xp, yp, zp = _rotate(self._rot, x, y, z)
+            if self._use_c(xp):
+                Fx, Fy, Fz = self._xyz_c(xp, yp, zp)[0]
+            else:
+                Fx = self._force_xyz(xp, yp, zp, 0)
+                Fy = self._force_xyz(xp, yp, zp, 1)
+                Fz = self._force_xyz(xp, yp, zp, 2)
             self._force_hash = new_hash
             self._cached_Fx = Fx
             self._cached_Fy = Fy
             self._cached_Fz = Fz
         if not self._aligned:
-            Fxyz = numpy.dot(self._rot.T, numpy.array([Fx, Fy, Fz]))
-            Fz = Fxyz[2]
-        return Fz
+            Fx, Fy, Fz = _rotate(self._rot.T, Fx, Fy, Fz)
+        return (Fx, Fy, Fz)
 
     def _force_xyz(self, x, y, z, i):
         """Evaluation of the i-th force component as a function of (x,y,z)"""
@@ -331,7 +305,6 @@ class EllipsoidalPotential(Potential):
             )
         )
 
-    @check_potential_inputs_not_arrays
     def _R2deriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -350,21 +323,18 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if not self._aligned:
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa); use RotateAndTiltWrapperPotential for this functionality instead"
             )
-        phixx = self._2ndderiv_xyz(x, y, z, 0, 0)
-        phixy = self._2ndderiv_xyz(x, y, z, 0, 1)
-        phiyy = self._2ndderiv_xyz(x, y, z, 1, 1)
+        phixx, phixy, phiyy = self._2ndderivs_xyz(x, y, z, [(0, 0), (0, 1), (1, 1)])
         return (
             numpy.cos(phi) ** 2.0 * phixx
             + numpy.sin(phi) ** 2.0 * phiyy
             + 2.0 * numpy.cos(phi) * numpy.sin(phi) * phixy
         )
 
-    @check_potential_inputs_not_arrays
     def _Rzderiv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -383,16 +353,14 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if not self._aligned:
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        phixz = self._2ndderiv_xyz(x, y, z, 0, 2)
-        phiyz = self._2ndderiv_xyz(x, y, z, 1, 2)
+        phixz, phiyz = self._2ndderivs_xyz(x, y, z, [(0, 2), (1, 2)])
         return numpy.cos(phi) * phixz + numpy.sin(phi) * phiyz
 
-    @check_potential_inputs_not_arrays
     def _z2deriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -411,14 +379,13 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if not self._aligned:
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        return self._2ndderiv_xyz(x, y, z, 2, 2)
+        return self._2ndderivs_xyz(x, y, z, [(2, 2)])[0]
 
-    @check_potential_inputs_not_arrays
     def _phi2deriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -437,23 +404,19 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if not self._aligned:
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        Fx = self._force_xyz(x, y, z, 0)
-        Fy = self._force_xyz(x, y, z, 1)
-        phixx = self._2ndderiv_xyz(x, y, z, 0, 0)
-        phixy = self._2ndderiv_xyz(x, y, z, 0, 1)
-        phiyy = self._2ndderiv_xyz(x, y, z, 1, 1)
+        Fx, Fy, _ = self._xyzforces(R, z, phi)
+        phixx, phixy, phiyy = self._2ndderivs_xyz(x, y, z, [(0, 0), (0, 1), (1, 1)])
         return R**2.0 * (
             numpy.sin(phi) ** 2.0 * phixx
             + numpy.cos(phi) ** 2.0 * phiyy
             - 2.0 * numpy.cos(phi) * numpy.sin(phi) * phixy
         ) + R * (numpy.cos(phi) * Fx + numpy.sin(phi) * Fy)
 
-    @check_potential_inputs_not_arrays
     def _Rphideriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -472,16 +435,13 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if not self._aligned:
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        Fx = self._force_xyz(x, y, z, 0)
-        Fy = self._force_xyz(x, y, z, 1)
-        phixx = self._2ndderiv_xyz(x, y, z, 0, 0)
-        phixy = self._2ndderiv_xyz(x, y, z, 0, 1)
-        phiyy = self._2ndderiv_xyz(x, y, z, 1, 1)
+        Fx, Fy, _ = self._xyzforces(R, z, phi)
+        phixx, phixy, phiyy = self._2ndderivs_xyz(x, y, z, [(0, 0), (0, 1), (1, 1)])
         return (
             R * numpy.cos(phi) * numpy.sin(phi) * (phiyy - phixx)
             + R * numpy.cos(2.0 * phi) * phixy
@@ -489,7 +449,6 @@ class EllipsoidalPotential(Potential):
             - numpy.cos(phi) * Fy
         )
 
-    @check_potential_inputs_not_arrays
     def _phizderiv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -508,15 +467,21 @@ class EllipsoidalPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if not self._aligned:
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        phixz = self._2ndderiv_xyz(x, y, z, 0, 2)
-        phiyz = self._2ndderiv_xyz(x, y, z, 1, 2)
+        phixz, phiyz = self._2ndderivs_xyz(x, y, z, [(0, 2), (1, 2)])
         return R * (numpy.cos(phi) * phiyz - numpy.sin(phi) * phixz)
 
+    def _2ndderivs_xyz(self, x, y, z, ijs):
+        """List of the 2nd derivatives (i,j) in ijs as a function of (x,y,z) in the aligned coordinate frame"""
+        if self._use_c(x):
+            d2 = self._xyz_c(x, y, z, do_2nd=True)[1]
+            return [d2[_D2_INDX[i][j]] for i, j in ijs]
+        return [self._2ndderiv_xyz(x, y, z, i, j) for i, j in ijs]
+
     def _2ndderiv_xyz(self, x, y, z, i, j):
         """General 2nd derivative of the potential as a function of (x,y,z)
         in the aligned coordinate frame"""
@@ -540,7 +505,54 @@ class EllipsoidalPotential(Potential):
             )
         )
 
-    @check_potential_inputs_not_arrays
+    def _use_c(self, x):
+        """Whether to evaluate the forces and 2nd derivatives at x in C"""
+        return self.hasC and ext_loaded and numpy.size(x) >= _MIN_C_SIZE
+
+    def _xyz_c(self, x, y, z, do_2nd=False):
+        """Rectangular forces [3,...] and, if do_2nd, 2nd derivatives [(xx,xy,xz,yy,yz,zz),...] (otherwise None) for arrays of points (x,y,z) in the aligned coordinate frame, evaluated in C"""
+        from ..orbit.integrateFullOrbit import (  # here bc otherwise there is an infinite loop
+            _parse_pot,
+        )
+        from ..orbit.integratePlanarOrbit import _prep_tfuncs
+
+        npot, pot_type, pot_args, pot_tfuncs = _parse_pot(self)
+        pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+        shape = numpy.shape(x)
+        x, y, z = (numpy.array(numpy.ravel(a), dtype=numpy.float64) for a in (x, y, z))
+        F = numpy.empty((len(x), 3))
+        d2 = numpy.empty((len(x) if do_2nd else 1, 6))
+        ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+        xyz_array_func = _lib.EllipsoidalPotential_xyz_array
+        xyz_array_func.argtypes = [
+            ctypes.c_int,
+            ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+            ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+            ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+            ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+            ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+            ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ]
+        xyz_array_func(
+            len(x),
+            x,
+            y,
+            z,
+            pot_type,
+            pot_args,
+            pot_tfuncs,
+            ctypes.c_int(do_2nd),
+            F,
+            d2,
+        )
+        return (
+            F.T.reshape((3,) + shape),
+            d2.T.reshape((6,) + shape) if do_2nd else None,
+        )
+
     def _dens(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -557,12 +569,11 @@ class EllipsoidalPotential(Potential):
         HISTORY:
            2018-08-06 - Written - Bovy (UofT)
         """
-        x, y, z = coords.cyl_to_rect(R, phi, z)
+        x, y, z = _broadcast_xyz(*coords.cyl_to_rect(R, phi, z))
         if self._aligned:
             xp, yp, zp = x, y, z
         else:
-            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-            xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
+            xp, yp, zp = _rotate(self._rot, x, y, z)
         m = numpy.sqrt(xp**2.0 + yp**2.0 / self._b2 + zp**2.0 / self._c2)
         return self._mdens(m)
 
@@ -607,25 +618,57 @@ class EllipsoidalPotential(Potential):
         return 0.0
 
 
+def _broadcast_xyz(x, y, z):
+    """Broadcast x, y, and z to a common shape if any of them is an array"""
+    if numpy.ndim(x) == 0 and numpy.ndim(y) == 0 and numpy.ndim(z) == 0:
+        return (x, y, z)
+    return numpy.broadcast_arrays(x, y, z)
+
+
+def _rotate(rot, x, y, z):
+    """Apply the rotation matrix rot to (x,y,z), which can be arrays"""
+    return numpy.tensordot(rot, numpy.array([x, y, z]), axes=1)
+
+
+def _glquad(integrand, x, y, z, glx=None, glw=None):
+    """Integrate integrand(s,x,y,z) over s from 0 to 1 using Gauss-Legendre quadrature if glx is set (vectorized over points x nodes, in chunks of bounded size for array input), otherwise using scipy's quad"""
+    if numpy.ndim(x) == 0 and numpy.ndim(y) == 0 and numpy.ndim(z) == 0:
+        if glx is None:
+            return integrate.quad(integrand, 0.0, 1.0, args=(x, y, z))[0]
+        return numpy.sum(glw * integrand(glx, x, y, z))
+    x, y, z = numpy.broadcast_arrays(x, y, z)
+    shape = x.shape
+    x, y, z = numpy.ravel(x), numpy.ravel(y), numpy.ravel(z)
+    out = numpy.empty(len(x))
+    if glx is None:
+        for ii in range(len(x)):
+            out[ii] = integrate.quad(integrand, 0.0, 1.0, args=(x[ii], y[ii], z[ii]))[0]
+    else:
+        chunk = max(1, _MAX_VEC_SIZE // len(glx))
+        for ii in range(0, len(x), chunk):
+            sl = slice(ii, ii + chunk)
+            out[sl] = numpy.sum(
+                glw * integrand(glx, x[sl, None], y[sl, None], z[sl, None]), axis=-1
+            )
+    return out.reshape(shape)
+
+
 def _potInt(x, y, z, psi, b2, c2, glx=None, glw=None):
     r"""int_0^\infty [psi(m)-psi(\infy)]/sqrt([1+tau]x[b^2+tau]x[c^2+tau])dtau"""
 
-    def integrand(s):
+    def integrand(s, x, y, z):
         t = 1 / s**2.0 - 1.0
         return psi(
             numpy.sqrt(x**2.0 / (1.0 + t) + y**2.0 / (b2 + t) + z**2.0 / (c2 + t))
         ) / numpy.sqrt((1.0 + (b2 - 1.0) * s**2.0) * (1.0 + (c2 - 1.0) * s**2.0))
 
-    if glx is None:
-        return integrate.quad(integrand, 0.0, 1.0)[0]
-    else:
-        return numpy.sum(glw * integrand(glx))
+    return _glquad(integrand, x, y, z, glx=glx, glw=glw)
 
 
 def _forceInt(x, y, z, dens, b2, c2, i, glx=None, glw=None):
     """Integral that gives the force in x,y,z"""
 
-    def integrand(s):
+    def integrand(s, x, y, z):
         t = 1 / s**2.0 - 1.0
         return (
             dens(
@@ -641,16 +684,13 @@ def _forceInt(x, y, z, dens, b2, c2, i, glx=None, glw=None):
             / numpy.sqrt((1.0 + (b2 - 1.0) * s**2.0) * (1.0 + (c2 - 1.0) * s**2.0))
         )
 
-    if glx is None:
-        return integrate.quad(integrand, 0.0, 1.0)[0]
-    else:
-        return numpy.sum(glw * integrand(glx))
+    return _glquad(integrand, x, y, z, glx=glx, glw=glw)
 
 
 def _2ndDerivInt(x, y, z, dens, densDeriv, b2, c2, i, j, glx=None, glw=None):
     """Integral that gives the 2nd derivative of the potential in x,y,z"""
 
-    def integrand(s):
+    def integrand(s, x, y, z):
         t = 1 / s**2.0 - 1.0
         m = numpy.sqrt(x**2.0 / (1.0 + t) + y**2.0 / (b2 + t) + z**2.0 / (c2 + t))
         return (
@@ -675,7 +715,4 @@ def _2ndDerivInt(x, y, z, dens, densDeriv, b2, c2, i, j, glx=None, glw=None):
             )
         ) / numpy.sqrt((1.0 + (b2 - 1.0) * s**2.0) * (1.0 + (c2 - 1.0) * s**2.0))
 
-    if glx is None:
-        return integrate.quad(integrand, 0.0, 1.0)[0]
-    else:
-        return numpy.sum(glw * integrand(glx))
+    return _glquad(integrand, x, y, z, glx=glx, glw=glw)
@@ -16,6 +16,19 @@ from scipy.special import gamma
 from ..util import conversion, coords
 from .Potential import Potential
 
+# Maximum number of points x nodes to evaluate at once in the vectorized
+# quadrature for array input
+_MAX_VEC_SIZE = 2**18
+# Gauss-Legendre nodes and weights for the vectorized quadrature over tau from
+# lambda to infinity, using tau = lambda + a^2 (1/s^2-1) with s = 1-(1-v)^2 for
+# v in [0,1], which makes the integrands smooth at tau = lambda
+_GLORDER = 50
+_glv, _glw = numpy.polynomial.legendre.leggauss(_GLORDER)
+_glv = 0.5 * (_glv + 1.0)
+_gls = 1.0 - (1.0 - _glv) ** 2.0
+_glu = 1.0 / _gls**2.0 - 1.0
+_glw = _glw * (1.0 - _glv) * 2.0 / _gls**3.0
+
 
 class FerrersPotential(Potential):
     """Class that implements triaxial Ferrers potential for the ellipsoidal density profile with the short axis along the z-direction
@@ -33,9 +46,12 @@ class FerrersPotential(Potential):
     and :math:`(x',y',z')` is a rotated frame wrt :math:`(x,y,z)`
     so that the major axis is aligned with :math:`x'`.
 
-    Note that this potential has not yet been optimized for speed and has no C implementation, so orbit integration is currently slow.
+    Note that this potential has no C implementation, so orbit integration is currently slow. Array input is evaluated using fixed-order Gauss-Legendre quadrature for all points at once, which is much faster than evaluating points one by one.
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_force_hash", "_cached_Fx", "_cached_Fy", "_cached_Fz")
+
     def __init__(
         self,
         amp=1.0,
@@ -125,9 +141,7 @@ class FerrersPotential(Potential):
         """
         if not self.isNonAxi:
             phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        xy = numpy.dot(self.rot(t), numpy.array([x, y]))
-        x, y = xy[0], xy[1]
+        x, y, z = self._compute_xyz(R, phi, z, t)
         return self._evaluate_xyz(x, y, z)
 
     def _evaluate_xyz(self, x, y, z=0.0):
@@ -209,7 +223,9 @@ class FerrersPotential(Potential):
 
     def _compute_xyzforces(self, R, z, phi, t):
         # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([R, phi, z, t])).hexdigest()
+        new_hash = hashlib.md5(
+            numpy.array(numpy.broadcast_arrays(R, phi, z, t))
+        ).hexdigest() + str(numpy.shape(R * phi * z * t))
         if new_hash == self._force_hash:
             Fx = self._cached_Fx
             Fy = self._cached_Fy
@@ -365,13 +381,12 @@ class FerrersPotential(Potential):
         x, y, z = self._compute_xyz(R, phi, z, t)
         Fx = self._xforce_xyz(x, y, z)
         Fy = self._yforce_xyz(x, y, z)
-        Fxy = numpy.dot(self.rot(t, transposed=True), numpy.array([Fx, Fy]))
-        Fx, Fy = Fxy[0], Fxy[1]
         phixxa = self._2ndderiv_xyz(x, y, z, 0, 0)
         phixya = self._2ndderiv_xyz(x, y, z, 0, 1)
         phiyya = self._2ndderiv_xyz(x, y, z, 1, 1)
         ang = self._omegab * t + self._pa
         c, s = numpy.cos(ang), numpy.sin(ang)
+        Fx, Fy = c * Fx - s * Fy, s * Fx + c * Fy
         phixx = c**2 * phixxa + 2.0 * c * s * phixya + s**2 * phiyya
         phixy = (c**2 - s**2) * phixya + c * s * (phiyya - phixxa)
         phiyy = s**2 * phixxa - 2.0 * c * s * phixya + c**2 * phiyya
@@ -400,13 +415,12 @@ class FerrersPotential(Potential):
         x, y, z = self._compute_xyz(R, phi, z, t)
         Fx = self._xforce_xyz(x, y, z)
         Fy = self._yforce_xyz(x, y, z)
-        Fxy = numpy.dot(self.rot(t, transposed=True), numpy.array([Fx, Fy]))
-        Fx, Fy = Fxy[0], Fxy[1]
         phixxa = self._2ndderiv_xyz(x, y, z, 0, 0)
         phixya = self._2ndderiv_xyz(x, y, z, 0, 1)
         phiyya = self._2ndderiv_xyz(x, y, z, 1, 1)
         ang = self._omegab * t + self._pa
         c, s = numpy.cos(ang), numpy.sin(ang)
+        Fx, Fy = c * Fx - s * Fy, s * Fx + c * Fy
         phixx = c**2 * phixxa + 2.0 * c * s * phixya + s**2 * phiyya
         phixy = (c**2 - s**2) * phixya + c * s * (phiyya - phixxa)
         phiyy = s**2 * phixxa - 2.0 * c * s * phixya + c**2 * phiyya
@@ -438,9 +452,9 @@ class FerrersPotential(Potential):
         x, y, z = self._compute_xyz(R, phi, z, t)
         phixza = self._2ndderiv_xyz(x, y, z, 0, 2)
         phiyza = self._2ndderiv_xyz(x, y, z, 1, 2)
-        phixz, phiyz = numpy.dot(
-            self.rot(t, transposed=True), numpy.array([phixza, phiyza])
-        )
+        ang = self._omegab * t + self._pa
+        c, s = numpy.cos(ang), numpy.sin(ang)
+        phixz, phiyz = c * phixza - s * phiyza, s * phixza + c * phiyza
         return R * (numpy.cos(phi) * phiyz - numpy.sin(phi) * phixz)
 
     def _2ndderiv_xyz(self, x, y, z, i, j):
@@ -481,10 +495,10 @@ class FerrersPotential(Potential):
         """
         x, y, z = self._compute_xyz(R, phi, z, t)
         m2 = x**2 / self._a2 + y**2 / self._b2 + z**2 / self._c2
-        if m2 < 1:
-            return self._rhoc_M * (1.0 - m2 / self.a**2) ** self.n
-        else:
-            return 0.0
+        with numpy.errstate(invalid="ignore"):
+            return numpy.where(
+                m2 < 1, self._rhoc_M * (1.0 - m2 / self.a**2) ** self.n, 0.0
+            )[()]
 
     def OmegaP(self):
         """
@@ -529,12 +543,10 @@ def _potInt(x, y, z, a2, b2, c2, n):
     The lower limit lambda is given by lowerlim function.
     """
 
-    def integrand(tau):
+    def integrand(tau, x, y, z):
         return _FracInt(x, y, z, a2, b2, c2, tau, n + 1)
 
-    return integrate.quad(
-        integrand, lowerlim(x**2, y**2, z**2, a2, b2, c2), numpy.inf
-    )[0]
+    return _tauquad(integrand, x, y, z, a2, b2, c2)
 
 
 def _forceInt(x, y, z, a2, b2, c2, n, i):
@@ -545,16 +557,14 @@ def _forceInt(x, y, z, a2, b2, c2, n, i):
     The lower limit lambda is given by lowerlim function.
     """
 
-    def integrand(tau):
+    def integrand(tau, x, y, z):
         return (
             (x * (i == 0) + y * (i == 1) + z * (i == 2))
             / (a2 * (i == 0) + b2 * (i == 1) + c2 * (i == 2) + tau)
             * _FracInt(x, y, z, a2, b2, c2, tau, n)
         )
 
-    return integrate.quad(
-        integrand, lowerlim(x**2, y**2, z**2, a2, b2, c2), numpy.inf, epsabs=1e-12
-    )[0]
+    return _tauquad(integrand, x, y, z, a2, b2, c2, epsabs=1e-12)
 
 
 def _2ndDerivInt(x, y, z, a2, b2, c2, n, i, j):
@@ -570,7 +580,7 @@ def _2ndDerivInt(x, y, z, a2, b2, c2, n, i, j):
     This is a second derivative of _potInt.
     """
 
-    def integrand(tau):
+    def integrand(tau, x, y, z):
         if i != j:
             return (
                 _FracInt(x, y, z, a2, b2, c2, tau, n - 1)
@@ -586,9 +596,39 @@ def _2ndDerivInt(x, y, z, a2, b2, c2, n, i, j):
                 tau + coef2
             ) ** 2 + _FracInt(x, y, z, a2, b2, c2, tau, n) * (-2.0 / (tau + coef2))
 
-    return integrate.quad(
-        integrand, lowerlim(x**2, y**2, z**2, a2, b2, c2), numpy.inf
-    )[0]
+    return _tauquad(integrand, x, y, z, a2, b2, c2)
+
+
+def _tauquad(integrand, x, y, z, a2, b2, c2, epsabs=1.49e-8):
+    """Integrate integrand(tau,x,y,z) from lambda to infty with respect to tau,
+    using scipy's quad for scalar input and fixed-order Gauss-Legendre
+    quadrature for array input (vectorized over points x nodes, in chunks
+    of bounded size)"""
+    if numpy.ndim(x) == 0 and numpy.ndim(y) == 0 and numpy.ndim(z) == 0:
+        return integrate.quad(
+            integrand,
+            lowerlim(x**2, y**2, z**2, a2, b2, c2),
+            numpy.inf,
+            args=(x, y, z),
+            epsabs=epsabs,
+        )[0]
+    x, y, z = numpy.broadcast_arrays(x, y, z)
+    shape = x.shape
+    x, y, z = numpy.ravel(x), numpy.ravel(y), numpy.ravel(z)
+    lam = _lowerlim_array(x**2, y**2, z**2, a2, b2, c2)
+    out = numpy.empty(len(x))
+    chunk = max(1, _MAX_VEC_SIZE // _GLORDER)
+    for ii in range(0, len(x), chunk):
+        sl = slice(ii, ii + chunk)
+        out[sl] = numpy.sum(
+            a2
+            * _glw
+            * integrand(
+                lam[sl, None] + a2 * _glu, x[sl, None], y[sl, None], z[sl, None]
+            ),
+            axis=-1,
+        )
+    return out.reshape(shape)
 
 
 def _FracInt(x, y, z, a, b, c, tau, n):
@@ -598,9 +638,14 @@ def _FracInt(x, y, z, a, b, c, tau, n):
     sqrt(tau+a)(tau+b)(tau+c))       tau+a     tau+b     tau+c
     """
     denom = numpy.sqrt((a + tau) * (b + tau) * (c + tau))
+    # Clip round-off below zero close to the lower limit of the integrals
     return (
-        1.0 - x**2 / (a + tau) - y**2 / (b + tau) - z**2 / (c + tau)
-    ) ** n / denom
+        numpy.maximum(
+            1.0 - x**2 / (a + tau) - y**2 / (b + tau) - z**2 / (c + tau), 0.0
+        )
+        ** n
+        / denom
+    )
 
 
 def lowerlim(x, y, z, a, b, c):
@@ -617,3 +662,22 @@ def lowerlim(x, y, z, a, b, c):
         return ll[0].real
     else:
         return 0.0
+
+
+def _lowerlim_array(x, y, z, a, b, c):
+    """Returns lowerlim for arrays x, y, z: the positive root is the largest
+    root of the cubic, because the other two lie in between -a, -b, and -c"""
+    out = numpy.zeros(len(x))
+    indx = x / a + y / b + z / c > 1
+    if numpy.any(indx):
+        x, y, z = x[indx], y[indx], z[indx]
+        companion = numpy.zeros((len(x), 3, 3))
+        companion[:, 0, 0] = -(a + b + c - x - y - z)
+        companion[:, 0, 1] = -(
+            a * b + a * c + b * c - a * y - a * z - b * x - b * z - c * x - c * y
+        )
+        companion[:, 0, 2] = -(a * b * c - a * b * z - a * c * y - b * c * x)
+        companion[:, 1, 0] = 1.0
+        companion[:, 2, 1] = 1.0
+        out[indx] = numpy.amax(numpy.linalg.eigvals(companion).real, axis=1)
+    return out
@@ -22,6 +22,9 @@ if _APY_LOADED:
 class Force:
     """Top-level class for any force, conservative or dissipative"""
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_tfuncs_tables_cache",)
+
     def __init__(self, amp=1.0, ro=None, vo=None, amp_units=None):
         """
         NAME:
@@ -6,6 +6,7 @@ from ..potential import (
     NFWPotential,
     PlummerPotential,
     SCFPotential,
+    mwpot_helpers,
     scf_compute_coeffs_spherical,
 )
 from ..util import conversion
@@ -55,11 +56,24 @@ def Irrgang13I_halo_dens(
     )
 
 
-a_for_scf = 20.0
-# scf_compute_coeffs_spherical currently seems to require a function of 3 parameters...
-Acos = scf_compute_coeffs_spherical(
-    lambda r, z, p: Irrgang13I_halo_dens(r), 40, a=a_for_scf
-)[0]
+def _halo_scf_coeffs(model):
+    """SCF coefficients and scale of the halo of model I or II (model=1 or 2), which are cached on disk if this is turned on in the configuration file when this function is called"""
+    cachedir = mwpot_helpers._cache_dir()
+    # scf_compute_coeffs_spherical currently seems to require a function of 3 parameters...
+    if model == 1:
+        a_for_scf = 20.0
+        Acos = scf_compute_coeffs_spherical(
+            lambda r, z, p: Irrgang13I_halo_dens(r), 40, a=a_for_scf, cache=cachedir
+        )[0]
+    else:
+        a_for_scf = 0.15
+        Acos = scf_compute_coeffs_spherical(
+            lambda r, z, p: Irrgang13II_halo_dens(r), 75, a=a_for_scf, cache=cachedir
+        )[0]
+    return Acos, a_for_scf
+
+
+Acos, a_for_scf = _halo_scf_coeffs(1)
 Irrgang13I_halo = SCFPotential(Acos=Acos, a=a_for_scf, ro=ro, vo=vo)
 # Final model I
 Irrgang13I = Irrgang13I_bulge + Irrgang13I_disk + Irrgang13I_halo
@@ -91,11 +105,7 @@ def Irrgang13II_halo_dens(
     return amp / 4.0 / numpy.pi * ah**2.0 / r**2.0 / (r**2.0 + ah**2.0) ** 1.5
 
 
-a_for_scf = 0.15
-# scf_compute_coeffs_spherical currently seems to require a function of 3 parameters...
-Acos = scf_compute_coeffs_spherical(
-    lambda r, z, p: Irrgang13II_halo_dens(r), 75, a=a_for_scf
-)[0]
+Acos, a_for_scf = _halo_scf_coeffs(2)
 Irrgang13II_halo = SCFPotential(Acos=Acos, a=a_for_scf, ro=ro, vo=vo)
 # Final model II
 Irrgang13II = Irrgang13II_bulge + Irrgang13II_disk + Irrgang13II_halo
@@ -77,20 +77,33 @@ hzdict = [
     {"type": "exp", "h": zd_thick},
 ]
 
+
+def _define_scf_components():
+    """Bulge and disk, whose SCF coefficients are cached on disk if this is turned on in the configuration file when this function is called"""
+    cachedir = mwpot_helpers._cache_dir()
+    with numpy.errstate(all="ignore"):
+        bulge = SCFPotential(
+            Acos=scf_compute_coeffs_axi(bulge_dens, 20, 10, a=0.1, cache=cachedir)[0],
+            a=0.1,
+            ro=ro,
+            vo=vo,
+        )
+        disk = DiskSCFPotential(
+            dens=lambda R, z: gas_dens(R, z) + stellar_dens(R, z),
+            Sigma=sigmadict,
+            hz=hzdict,
+            a=2.5,
+            N=30,
+            L=30,
+            ro=ro,
+            vo=vo,
+            cache=cachedir,
+        )
+    return bulge, disk
+
+
 # generate separate disk and halo potential - and combined potential
-McMillan_bulge = SCFPotential(
-    Acos=scf_compute_coeffs_axi(bulge_dens, 20, 10, a=0.1)[0], a=0.1, ro=ro, vo=vo
-)
-McMillan_disk = DiskSCFPotential(
-    dens=lambda R, z: gas_dens(R, z) + stellar_dens(R, z),
-    Sigma=sigmadict,
-    hz=hzdict,
-    a=2.5,
-    N=30,
-    L=30,
-    ro=ro,
-    vo=vo,
-)
+McMillan_bulge, McMillan_disk = _define_scf_components()
 McMillan_halo = NFWPotential(
     amp=rho0_halo * (4 * numpy.pi * rh**3), a=rh, ro=ro, vo=vo
 )
@@ -0,0 +1,311 @@
+###############################################################################
+#   MovingObjectPopulationPotential.py: class that implements the potential
+#                                       coming from a population of moving
+#                                       objects
+###############################################################################
+import numpy
+
+from ..util import conversion
+from .PlummerPotential import PlummerPotential
+from .Potential import (
+    Potential,
+    _check_c,
+    _isNonAxi,
+    evaluateDensities,
+    evaluatePotentials,
+    evaluateRforces,
+    evaluatezforces,
+    flatten,
+)
+
+
+class MovingObjectPopulationPotential(Potential):
+    """Class that implements the potential coming from a population of moving objects (e.g., dark-matter subhalos), each of which has the same potential up to a rescaling of its amplitude and size and moves along a precomputed orbit. All orbits share a single time grid, and positions are interpolated between the grid points using cubic Hermite interpolation of the orbits' positions and velocities. That is, the potential is
+
+    .. math::
+
+        \\Phi(\\mathbf{x},t) = \\mathrm{amp}\\,\\sum_i a_i\\,\\Phi_0\\left(\\frac{\\mathbf{x}-\\mathbf{x}_i(t)}{b_i}\\right)\\,,
+
+    where :math:`\\Phi_0` is the potential of a single object, :math:`\\mathbf{x}_i(t)` is the orbit of object :math:`i`, and :math:`a_i` and :math:`b_i` are the amplitude and scale factors of object :math:`i`. Objects farther than ``rmax`` from the evaluation point are skipped, which speeds up the evaluation when only a small fraction of the objects is close to the orbit, but makes the forces discontinuous; use ``rmax`` with fixed-step integrators (e.g., ``symplec4_c``) or make it large enough that the neglected forces are below the integration tolerance. For planar orbit integration, the vertical positions of the objects are ignored.
+    """
+
+    def __init__(
+        self,
+        orbits,
+        pot=None,
+        amps=None,
+        scales=None,
+        rmax=None,
+        amp=1.0,
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a MovingObjectPopulationPotential
+
+        INPUT:
+
+           orbits - the orbits of the objects: an Orbit instance containing multiple objects or a list of Orbit instances, integrated on the same time grid
+
+           pot - A potential object or list of potential objects representing the potential of a single object; should be spherical, but this is not checked [default= PlummerPotential(amp=0.06,b=0.01)]
+
+           amps= (None) amplitude factor of each object (default: 1); for a potential Phi_0 ~ M/b, an object with mass M_i and size b_i times those of pot has amps[i] = M_i/b_i
+
+           scales= (None) size factor of each object (default: 1)
+
+           rmax= (None) ignore objects farther than this distance (can be Quantity); default: use all objects
+
+           amp (=1.) another amplitude to apply to the potential
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo)
+        # If no potential supplied use a default Plummer sphere
+        if pot is None:
+            pot = PlummerPotential(amp=0.06, b=0.01)
+        else:
+            pot = flatten(pot)
+            if _isNonAxi(pot):
+                raise NotImplementedError(
+                    "MovingObjectPopulationPotential for non-axisymmetric potentials is not currently supported"
+                )
+        self._pot = pot
+        if not isinstance(orbits, list):
+            orbits = [orbits]
+        if not all(hasattr(orb, "t") for orb in orbits):
+            raise ValueError(
+                "The orbits of a MovingObjectPopulationPotential need to be integrated"
+            )
+        ts = orbits[0].t
+        for orb in orbits[1:]:
+            if not numpy.array_equal(orb.t, ts):
+                raise ValueError(
+                    "All orbits of a MovingObjectPopulationPotential need to be integrated on the same time grid"
+                )
+        if len(ts) < 2:
+            raise ValueError(
+                "The orbits of a MovingObjectPopulationPotential need to be integrated"
+            )
+        # Phase-space positions, shape (nt,nobj,6)
+        self._xv = numpy.concatenate(
+            [_orbit_phasespace(orb) for orb in orbits], axis=0
+        ).transpose(1, 0, 2)
+        self._ts = numpy.array(ts, dtype="float")
+        if self._ts[-1] < self._ts[0]:  # integrated backwards
+            self._ts = self._ts[::-1]
+            self._xv = self._xv[::-1]
+        self._xv = numpy.ascontiguousarray(self._xv)
+        self._nobj = self._xv.shape[1]
+        self._amps = (
+            numpy.ones(self._nobj)
+            if amps is None
+            else numpy.array(amps, dtype="float") * numpy.ones(self._nobj)
+        )
+        self._scales = (
+            numpy.ones(self._nobj)
+            if scales is None
+            else numpy.array(scales, dtype="float") * numpy.ones(self._nobj)
+        )
+        self._rmax = (
+            None
+            if rmax is None
+            else conversion.parse_length(rmax, ro=self._ro, vo=self._vo)
+        )
+        self.isNonAxi = True
+        self.hasC = _check_c(self._pot)
+        return None
+
+    def _positions(self, t):
+        """Positions of all objects at time t (shape (nobj,3)) using cubic Hermite interpolation"""
+        t = numpy.clip(t, self._ts[0], self._ts[-1])
+        jj = numpy.clip(
+            numpy.searchsorted(self._ts, t, side="right") - 1, 0, len(self._ts) - 2
+        )
+        dt = self._ts[jj + 1] - self._ts[jj]
+        s = (t - self._ts[jj]) / dt
+        return (
+            (2.0 * s**3.0 - 3.0 * s**2.0 + 1.0) * self._xv[jj, :, :3]
+            + (s**3.0 - 2.0 * s**2.0 + s) * dt * self._xv[jj, :, 3:]
+            + (-2.0 * s**3.0 + 3.0 * s**2.0) * self._xv[jj + 1, :, :3]
+            + (s**3.0 - s**2.0) * dt * self._xv[jj + 1, :, 3:]
+        )
+
+    def _separations(self, R, z, phi, t):
+        """Separations between (R,z,phi) and the objects within rmax at time t, scaled by the objects' sizes; returns scaled cylindrical distance, scaled vertical distance, x and y separation, amplitude and scale factors"""
+        pos = self._positions(t)
+        dx = R * numpy.cos(phi) - pos[:, 0]
+        dy = R * numpy.sin(phi) - pos[:, 1]
+        dz = z - pos[:, 2]
+        indx = numpy.ones(self._nobj, dtype="bool")
+        if self._rmax is not None:
+            indx = dx**2.0 + dy**2.0 + dz**2.0 <= self._rmax**2.0
+        return (
+            numpy.sqrt(dx[indx] ** 2.0 + dy[indx] ** 2.0) / self._scales[indx],
+            dz[indx] / self._scales[indx],
+            dx[indx],
+            dy[indx],
+            self._amps[indx],
+            self._scales[indx],
+        )
+
+    def _xyzforces(self, R, z, phi, t):
+        """Cartesian forces summed over all objects"""
+        Rd, zd, dx, dy, amps, scales = self._separations(R, z, phi, t)
+        if len(Rd) == 0:
+            return (0.0, 0.0, 0.0)
+        RF = amps / scales * evaluateRforces(self._pot, Rd, zd, t=t, use_physical=False)
+        zF = amps / scales * evaluatezforces(self._pot, Rd, zd, t=t, use_physical=False)
+        # Force along the cylindrical separation vector, zero when aligned
+        RFoverRd = numpy.zeros_like(RF)
+        RFoverRd[Rd > 0.0] = RF[Rd > 0.0] / Rd[Rd > 0.0] / scales[Rd > 0.0]
+        return (
+            numpy.sum(RFoverRd * dx),
+            numpy.sum(RFoverRd * dy),
+            numpy.sum(zF),
+        )
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z, phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,z,phi)
+        HISTORY:
+           2026-10-19 - Written
+        """
+        if not numpy.ndim(R) == 0 or not numpy.ndim(z) == 0 or not numpy.ndim(phi) == 0:
+            return numpy.vectorize(self._evaluate, otypes=[float])(R, z, phi, t)
+        Rd, zd, _, _, amps, _ = self._separations(R, z, phi, t)
+        if len(Rd) == 0:
+            return 0.0
+        return numpy.sum(
+            amps * evaluatePotentials(self._pot, Rd, zd, t=t, use_physical=False)
+        )
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-19 - Written
+        """
+        if not numpy.ndim(R) == 0 or not numpy.ndim(z) == 0 or not numpy.ndim(phi) == 0:
+            return numpy.vectorize(self._Rforce, otypes=[float])(R, z, phi, t)
+        Fx, Fy, _ = self._xyzforces(R, z, phi, t)
+        return numpy.cos(phi) * Fx + numpy.sin(phi) * Fy
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-19 - Written
+        """
+        if not numpy.ndim(R) == 0 or not numpy.ndim(z) == 0 or not numpy.ndim(phi) == 0:
+            return numpy.vectorize(self._zforce, otypes=[float])(R, z, phi, t)
+        return self._xyzforces(R, z, phi, t)[2]
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        """
+        NAME:
+           _phitorque
+        PURPOSE:
+           evaluate the azimuthal torque for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal torque
+        HISTORY:
+           2026-10-19 - Written
+        """
+        if not numpy.ndim(R) == 0 or not numpy.ndim(z) == 0 or not numpy.ndim(phi) == 0:
+            return numpy.vectorize(self._phitorque, otypes=[float])(R, z, phi, t)
+        Fx, Fy, _ = self._xyzforces(R, z, phi, t)
+        return R * (numpy.cos(phi) * Fy - numpy.sin(phi) * Fx)
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the density
+        HISTORY:
+           2026-10-19 - Written
+        """
+        if not numpy.ndim(R) == 0 or not numpy.ndim(z) == 0 or not numpy.ndim(phi) == 0:
+            return numpy.vectorize(self._dens, otypes=[float])(R, z, phi, t)
+        Rd, zd, _, _, amps, scales = self._separations(R, z, phi, t)
+        if len(Rd) == 0:
+            return 0.0
+        return numpy.sum(
+            amps
+            / scales**2.0
+            * evaluateDensities(self._pot, Rd, zd, t=t, use_physical=False)
+        )
+
+
+def _orbit_phasespace(orb):
+    """Cartesian phase-space positions of the (possibly multiple) objects in an integrated Orbit instance, shape (nobj,nt,6); planar orbits are placed at z=0"""
+    coords = (
+        ["x", "y", "z", "vx", "vy", "vz"] if orb.dim() == 3 else ["x", "y", "vx", "vy"]
+    )
+    out = numpy.stack(
+        [
+            numpy.atleast_2d(getattr(orb, coord)(orb.t, use_physical=False))
+            for coord in coords
+        ],
+        axis=-1,
+    )
+    if orb.dim() == 2:
+        out = numpy.insert(out, [2, 4], 0.0, axis=-1)
+    return out
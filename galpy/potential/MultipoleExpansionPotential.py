@@ -0,0 +1,524 @@
+###############################################################################
+#   MultipoleExpansionPotential.py: potential expanded in spherical harmonics
+#                                   with radial functions tabulated on a grid
+###############################################################################
+import numpy
+from scipy import interpolate
+
+from ..util import conversion
+from .NumericalPotentialDerivativesMixin import NumericalPotentialDerivativesMixin
+from .Potential import Potential, PotentialError
+
+# Maximum number of points/particles to process at once, to limit memory use
+_CHUNKSIZE = 2**14
+
+
+class MultipoleExpansionPotential(Potential, NumericalPotentialDerivativesMixin):
+    """Class that implements a multipole expansion of a general potential, with the radial dependence of each term tabulated on a grid
+
+    .. math::
+
+        \\Phi(r,\\theta,\\phi) = \\mathrm{amp}\\,\\sum_{l=0}^{L} \\sum_{m=0}^{l} \\tilde{P}_{lm}(\\cos\\theta)\\,\\left(A_{\\mathrm{cos},lm}(r)\\cos m\\phi + A_{\\mathrm{sin},lm}(r)\\sin m\\phi\\right)
+
+    where :math:`\\tilde{P}_{lm}(x) = \\sqrt{\\frac{2l+1}{4\\pi}\\frac{(l-m)!}{(l+m)!}}\\,P_l^m(x)` are the normalized associated Legendre functions (without the Condon-Shortley phase). The radial functions :math:`A_{lm}(r)` and their derivatives with respect to :math:`\\ln r` are given on a grid in :math:`r` and are interpolated using cubic Hermite interpolation in :math:`\\ln r`. Inside the first and outside the last grid point, the radial functions are extrapolated as :math:`r^l` and :math:`r^{-(l+1)}`, respectively, which is exact if there is no mass inside the first or outside the last grid point.
+
+    Use ``MultipoleExpansionPotential.from_nbody`` to compute the expansion for a set of particles.
+    """
+
+    def __init__(
+        self,
+        amp=1.0,
+        rgrid=None,
+        Acos=None,
+        Asin=None,
+        dAcos=None,
+        dAsin=None,
+        normalize=False,
+        ro=None,
+        vo=None,
+        **kwargs,
+    ):
+        """
+        NAME:
+
+            __init__
+
+        PURPOSE:
+
+            initialize a multipole-expansion potential from tabulated radial functions (use MultipoleExpansionPotential.from_nbody to directly initialize from a set of particles)
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1); can be a Quantity with units of mass or Gxmass
+
+           rgrid - radial grid (increasing, at least 2 points; can be Quantity)
+
+           Acos - radial functions multiplying cos(m phi) at the grid points, shape (L+1,L+1,len(rgrid)) indexed as [l,m,r] (or (L+1,1,len(rgrid)) for axisymmetric potentials with Asin=None)
+
+           Asin= (None) radial functions multiplying sin(m phi) at the grid points, same shape as Acos
+
+           dAcos=, dAsin= (None) derivatives of Acos and Asin with respect to ln(r) at the grid points (same shape as Acos and Asin); if None, these are obtained from a cubic spline through Acos and Asin
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           MultipoleExpansionPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        NumericalPotentialDerivativesMixin.__init__(self, kwargs)
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo, amp_units="mass")
+        rgrid = conversion.parse_length(rgrid, ro=self._ro)
+        rgrid = numpy.asarray(rgrid, dtype="float")
+        Acos = numpy.asarray(Acos, dtype="float")
+        if Acos.ndim != 3 or Acos.shape[2] != len(rgrid):
+            raise PotentialError(
+                "Acos must be a 3 dimensional array with shape (L+1,L+1,len(rgrid)) or (L+1,1,len(rgrid))"
+            )
+        if len(rgrid) < 2 or numpy.any(numpy.diff(rgrid) <= 0.0) or rgrid[0] <= 0.0:
+            raise PotentialError(
+                "rgrid must be a positive, increasing array with at least 2 points"
+            )
+        L = Acos.shape[0] - 1
+        dAcos = _dlnr(rgrid, Acos, dAcos)
+        if Asin is None:
+            if Acos.shape[1] != 1 and numpy.any(Acos[:, 1:] != 0.0):
+                raise PotentialError(
+                    "Acos has non-zero elements at m > 0, but Asin=None implies an axisymmetric potential"
+                )
+            Acos = numpy.concatenate(
+                (Acos[:, :1], numpy.zeros((L + 1, L, len(rgrid)))), axis=1
+            )
+            dAcos = numpy.concatenate(
+                (dAcos[:, :1], numpy.zeros((L + 1, L, len(rgrid)))), axis=1
+            )
+            Asin = numpy.zeros_like(Acos)
+            dAsin = numpy.zeros_like(Acos)
+        else:
+            Asin = numpy.asarray(Asin, dtype="float")
+            dAsin = _dlnr(rgrid, Asin, dAsin)
+        if (
+            Acos.shape != (L + 1, L + 1, len(rgrid))
+            or dAcos.shape != Acos.shape
+            or Asin.shape != Acos.shape
+            or dAsin.shape != Acos.shape
+        ):
+            raise PotentialError(
+                "Acos, Asin, dAcos, and dAsin must all have shape (L+1,L+1,len(rgrid))"
+            )
+        self._rgrid = rgrid
+        self._logrgrid = numpy.log(rgrid)
+        self._L = L
+        # Store the radial functions as (nlm,nr) arrays with lm=l(l+1)/2+m
+        ll, mm = _lm_indices(L)
+        self._l, self._m = ll, mm
+        self._Acos, self._Asin = Acos[ll, mm], Asin[ll, mm]
+        self._dAcos, self._dAsin = dAcos[ll, mm], dAsin[ll, mm]
+        self.isNonAxi = bool(
+            numpy.any(self._Acos[mm > 0] != 0.0) or numpy.any(self._Asin != 0.0)
+        )
+        self.hasC = True
+        self.hasC_dxdv = False
+        if normalize or (
+            isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
+        ):  # pragma: no cover
+            self.normalize(normalize)
+        return None
+
+    @classmethod
+    def from_nbody(
+        cls,
+        pos,
+        L,
+        rgrid,
+        mass=1.0,
+        symmetry=None,
+        chunksize=_CHUNKSIZE,
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+            from_nbody
+
+        PURPOSE:
+
+            initialize a multipole-expansion potential from a set of particles
+
+        INPUT:
+
+           pos - positions of particles in rectangular coordinates with shape [3,n] (can be Quantity)
+
+           L - maximum order l of the expansion
+
+           rgrid - radial grid on which to tabulate the radial functions (can be Quantity)
+
+           mass= (1.) mass of particles (scalar or array with size n; can be Quantity)
+
+           symmetry= (None) symmetry of the potential to assume: 'spherical', 'axisymmetry', or None (for the general, non-axisymmetric case)
+
+           chunksize= number of particles to process at once
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           MultipoleExpansionPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        # Dummy object for ro/vo handling, to ensure consistency
+        dumm = cls(
+            rgrid=numpy.array([1.0, 2.0]), Acos=numpy.zeros((1, 1, 2)), ro=ro, vo=vo
+        )
+        pos = conversion.parse_length(pos, ro=dumm._ro)
+        rgrid = conversion.parse_length(rgrid, ro=dumm._ro)
+        mass = conversion.parse_mass(mass, ro=dumm._ro, vo=dumm._vo)
+        if symmetry is not None and symmetry.startswith("spher"):
+            L = 0
+        Acos, Asin, dAcos, dAsin = multipole_compute_coeffs_nbody(
+            pos, L, rgrid, mass=mass, chunksize=chunksize
+        )
+        if symmetry is not None and (
+            symmetry.startswith("spher") or symmetry.startswith("axi")
+        ):
+            Acos, dAcos, Asin, dAsin = Acos[:, :1], dAcos[:, :1], None, None
+        return cls(
+            rgrid=rgrid,
+            Acos=Acos,
+            Asin=Asin,
+            dAcos=dAcos,
+            dAsin=dAsin,
+            ro=ro,
+            vo=vo,
+        )
+
+    def save(self, filename):
+        """
+        NAME:
+
+           save
+
+        PURPOSE:
+
+           save the expansion to a file, such that it can be loaded with MultipoleExpansionPotential.from_file
+
+        INPUT:
+
+           filename - name of the file (a .npz file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        coeffs = {}
+        for name in ["Acos", "Asin", "dAcos", "dAsin"]:
+            coeffs[name] = numpy.zeros((self._L + 1, self._L + 1, len(self._rgrid)))
+            coeffs[name][self._l, self._m] = getattr(self, f"_{name}")
+        numpy.savez(
+            filename,
+            amp=self._amp,
+            rgrid=self._rgrid,
+            ro=self._ro if self._roSet else numpy.nan,
+            vo=self._vo if self._voSet else numpy.nan,
+            **coeffs,
+        )
+        return None
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        NAME:
+
+           from_file
+
+        PURPOSE:
+
+           load an expansion saved with MultipoleExpansionPotential.save
+
+        INPUT:
+
+           filename - name of the file
+
+        OUTPUT:
+
+           MultipoleExpansionPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        with numpy.load(filename) as data:
+            return cls(
+                amp=float(data["amp"]),
+                rgrid=data["rgrid"],
+                Acos=data["Acos"],
+                Asin=data["Asin"],
+                dAcos=data["dAcos"],
+                dAsin=data["dAsin"],
+                ro=None if numpy.isnan(data["ro"]) else float(data["ro"]),
+                vo=None if numpy.isnan(data["vo"]) else float(data["vo"]),
+            )
+
+    def _radial(self, r):
+        """Evaluate the radial functions and their ln(r) derivatives at r (1D array); returns four (nlm,len(r)) arrays"""
+        x = numpy.log(r)
+        nr = len(self._rgrid)
+        ii = numpy.clip(numpy.searchsorted(self._logrgrid, x) - 1, 0, nr - 2)
+        h = self._logrgrid[ii + 1] - self._logrgrid[ii]
+        s = (x - self._logrgrid[ii]) / h
+        # Cubic Hermite basis functions and their derivatives
+        h00 = (1.0 + 2.0 * s) * (1.0 - s) ** 2
+        h10 = s * (1.0 - s) ** 2 * h
+        h01 = s**2 * (3.0 - 2.0 * s)
+        h11 = s**2 * (s - 1.0) * h
+        d00 = 6.0 * s * (s - 1.0) / h
+        d10 = (1.0 - s) * (1.0 - 3.0 * s)
+        d01 = -d00
+        d11 = s * (3.0 * s - 2.0)
+        out = []
+        for A, dA in [(self._Acos, self._dAcos), (self._Asin, self._dAsin)]:
+            out.append(
+                h00 * A[:, ii]
+                + h10 * dA[:, ii]
+                + h01 * A[:, ii + 1]
+                + h11 * dA[:, ii + 1]
+            )
+            out.append(
+                d00 * A[:, ii]
+                + d10 * dA[:, ii]
+                + d01 * A[:, ii + 1]
+                + d11 * dA[:, ii + 1]
+            )
+        # Extrapolate as r^l inside and as r^-(l+1) outside of the grid
+        inside = x < self._logrgrid[0]
+        outside = x > self._logrgrid[-1]
+        for jj, A in [(0, self._Acos), (2, self._Asin)]:
+            if numpy.any(inside):
+                ratio = (r[inside] / self._rgrid[0]) ** self._l[:, None]
+                out[jj][:, inside] = A[:, :1] * ratio
+                out[jj + 1][:, inside] = self._l[:, None] * out[jj][:, inside]
+            if numpy.any(outside):
+                ratio = (self._rgrid[-1] / r[outside]) ** (self._l[:, None] + 1)
+                out[jj][:, outside] = A[:, -1:] * ratio
+                out[jj + 1][:, outside] = -(self._l[:, None] + 1) * out[jj][:, outside]
+        return out
+
+    def _compute(self, R, z, phi, forces):
+        """Compute the potential (forces=False) or the forces (forces=True) at arrays of points"""
+        if not self.isNonAxi and phi is None:
+            phi = 0.0
+        R, z, phi = numpy.broadcast_arrays(
+            numpy.asarray(R, dtype="float"),
+            numpy.asarray(z, dtype="float"),
+            numpy.asarray(phi, dtype="float"),
+        )
+        shape = R.shape
+        R, z, phi = R.flatten(), z.flatten(), phi.flatten()
+        out = numpy.empty((3 if forces else 1, len(R)))
+        for start in range(0, len(R), _CHUNKSIZE):
+            sl = slice(start, start + _CHUNKSIZE)
+            r = numpy.sqrt(R[sl] ** 2 + z[sl] ** 2)
+            r[r == 0.0] = 1e-30
+            costheta, sintheta = z[sl] / r, R[sl] / r
+            Plm, dPlm = _normalized_legendre(self._L, costheta, sintheta, forces)
+            cosmphi = numpy.cos(self._m[:, None] * phi[sl])
+            sinmphi = numpy.sin(self._m[:, None] * phi[sl])
+            Ac, dAc, As, dAs = self._radial(r)
+            if not forces:
+                out[0, sl] = numpy.sum(Plm * (Ac * cosmphi + As * sinmphi), axis=0)
+                continue
+            dPhidlnr = numpy.sum(Plm * (dAc * cosmphi + dAs * sinmphi), axis=0)
+            dPhidtheta = numpy.sum(dPlm * (Ac * cosmphi + As * sinmphi), axis=0)
+            out[0, sl] = -(dPhidlnr * sintheta + dPhidtheta * costheta) / r
+            out[1, sl] = -(dPhidlnr * costheta - dPhidtheta * sintheta) / r
+            out[2, sl] = -numpy.sum(
+                self._m[:, None] * Plm * (As * cosmphi - Ac * sinmphi), axis=0
+            )
+        if shape == ():
+            return out[:, 0]
+        return out.reshape((len(out),) + shape)
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi, False)[0]
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi, True)[0]
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi, True)[1]
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._compute(R, z, phi, True)[2]
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        # From the Poisson equation applied to each term of the expansion
+        if not self.isNonAxi and phi is None:
+            phi = 0.0
+        R, z, phi = numpy.broadcast_arrays(
+            numpy.asarray(R, dtype="float"),
+            numpy.asarray(z, dtype="float"),
+            numpy.asarray(phi, dtype="float"),
+        )
+        shape = R.shape
+        R, z, phi = R.flatten(), z.flatten(), phi.flatten()
+        r = numpy.sqrt(R**2 + z**2)
+        r[r == 0.0] = 1e-30
+        Plm, _ = _normalized_legendre(self._L, z / r, R / r, False)
+        cosmphi = numpy.cos(self._m[:, None] * phi)
+        sinmphi = numpy.sin(self._m[:, None] * phi)
+        # Second ln(r) derivative of the Hermite interpolant by finite
+        # differences of the analytic first derivative
+        eps = 1e-4
+        Ac, dAc, As, dAs = self._radial(r)
+        _, dAcp, _, dAsp = self._radial(r * numpy.exp(eps))
+        _, dAcm, _, dAsm = self._radial(r * numpy.exp(-eps))
+        ll = self._l[:, None]
+        lapc = (dAcp - dAcm) / 2.0 / eps + dAc - ll * (ll + 1) * Ac
+        laps = (dAsp - dAsm) / 2.0 / eps + dAs - ll * (ll + 1) * As
+        out = numpy.sum(Plm * (lapc * cosmphi + laps * sinmphi), axis=0) / (
+            4.0 * numpy.pi * r**2
+        )
+        if shape == ():
+            return out[0]
+        return out.reshape(shape)
+
+
+def _dlnr(rgrid, A, dA):
+    """Return dA as an array, computing it from a cubic spline through A in ln(r) if it is None"""
+    if dA is not None:
+        return numpy.asarray(dA, dtype="float")
+    if len(rgrid) < 3:
+        return numpy.zeros_like(A)
+    return interpolate.CubicSpline(numpy.log(rgrid), A, axis=-1)(numpy.log(rgrid), 1)
+
+
+def _lm_indices(L):
+    """Return arrays of l and m for all (l,m) with 0 <= m <= l <= L, ordered as lm=l(l+1)/2+m"""
+    ll = numpy.concatenate([numpy.full(l + 1, l) for l in range(L + 1)])
+    mm = numpy.concatenate([numpy.arange(l + 1) for l in range(L + 1)])
+    return (ll, mm)
+
+
+def _normalized_legendre(L, x, sintheta, deriv):
+    """Compute the normalized associated Legendre functions (without Condon-Shortley phase) for all 0 <= m <= l <= L at x = cos(theta), as a (nlm,len(x)) array ordered as lm=l(l+1)/2+m, and, if deriv, their derivative with respect to theta"""
+    nlm = (L + 1) * (L + 2) // 2
+    P = numpy.empty((nlm, len(x)))
+    Pmm = numpy.full(len(x), 1.0 / numpy.sqrt(4.0 * numpy.pi))
+    for m in range(L + 1):
+        if m > 0:
+            Pmm = numpy.sqrt((2.0 * m + 1.0) / 2.0 / m) * sintheta * Pmm
+        P[m * (m + 1) // 2 + m] = Pmm
+        if m == L:
+            break
+        P[(m + 1) * (m + 2) // 2 + m] = numpy.sqrt(2.0 * m + 3.0) * x * Pmm
+        for l in range(m + 2, L + 1):
+            a = numpy.sqrt((4.0 * l**2 - 1.0) / (l**2 - m**2))
+            b = numpy.sqrt(((l - 1.0) ** 2 - m**2) / (4.0 * (l - 1.0) ** 2 - 1.0))
+            P[l * (l + 1) // 2 + m] = a * (
+                x * P[(l - 1) * l // 2 + m] - b * P[(l - 2) * (l - 1) // 2 + m]
+            )
+    if not deriv:
+        return (P, None)
+    dP = numpy.zeros_like(P)
+    for l in range(1, L + 1):
+        indx = l * (l + 1) // 2
+        dP[indx] = -numpy.sqrt(l * (l + 1.0)) * P[indx + 1]
+        for m in range(1, l + 1):
+            dP[indx + m] = 0.5 * numpy.sqrt((l + m) * (l - m + 1.0)) * P[indx + m - 1]
+            if m < l:
+                dP[indx + m] -= (
+                    0.5 * numpy.sqrt((l + m + 1.0) * (l - m)) * P[indx + m + 1]
+                )
+    return (P, dP)
+
+
+def multipole_compute_coeffs_nbody(pos, L, rgrid, mass=1.0, chunksize=_CHUNKSIZE):
+    """
+    NAME:
+
+       multipole_compute_coeffs_nbody
+
+    PURPOSE:
+
+       Compute the radial functions of the multipole expansion of the potential of a set of particles on a radial grid
+
+    INPUT:
+
+       pos - positions of particles in rectangular coordinates with shape [3,n]
+
+       L - maximum order l of the expansion
+
+       rgrid - radial grid (increasing)
+
+       mass= (1.) mass of particles (scalar or array with size n)
+
+       chunksize= number of particles to process at once
+
+    OUTPUT:
+
+       (Acos,Asin,dAcos,dAsin) - radial functions and their derivatives with respect to ln(r), each with shape (L+1,L+1,len(rgrid)), that can be given to MultipoleExpansionPotential.__init__
+
+    HISTORY:
+
+       2026-10-19 - Written
+
+    """
+    pos = numpy.asarray(pos, dtype="float")
+    rgrid = numpy.asarray(rgrid, dtype="float")
+    mass = numpy.ones(pos.shape[1]) * mass
+    nr = len(rgrid)
+    ll, mm = _lm_indices(L)
+    nlm = len(ll)
+    # For each (l,m), sum m_i r_i^l Y_lm and m_i r_i^-(l+1) Y_lm of the
+    # particles in each radial bin, bin k containing rgrid[k-1] < r <= rgrid[k]
+    inner = numpy.zeros((2, nlm, nr + 1))
+    outer = numpy.zeros((2, nlm, nr + 1))
+    for start in range(0, pos.shape[1], chunksize):
+        x, y, z = pos[:, start : start + chunksize]
+        m = mass[start : start + chunksize]
+        r = numpy.sqrt(x**2 + y**2 + z**2)
+        r[r == 0.0] = 1e-30
+        phi = numpy.arctan2(y, x)
+        Plm, _ = _normalized_legendre(L, z / r, numpy.sqrt(x**2 + y**2) / r, False)
+        bins = numpy.searchsorted(rgrid, r)
+        for ii, trig in enumerate([numpy.cos, numpy.sin]):
+            Y = m * Plm * trig(mm[:, None] * phi)
+            for jj in range(nlm):
+                inner[ii, jj] += numpy.bincount(
+                    bins, weights=Y[jj] * r ** ll[jj], minlength=nr + 1
+                )
+                outer[ii, jj] += numpy.bincount(
+                    bins, weights=Y[jj] * r ** (-ll[jj] - 1.0), minlength=nr + 1
+                )
+    # Cumulative sums: particles with r <= rgrid[k] and with r > rgrid[k]
+    inner = numpy.cumsum(inner, axis=-1)[..., :nr]
+    outer = numpy.cumsum(outer[..., ::-1], axis=-1)[..., ::-1][..., 1:]
+    lcol = ll[:, None]
+    pref = -4.0 * numpy.pi / (2.0 * lcol + 1.0) * numpy.where(mm[:, None] > 0, 2.0, 1.0)
+    inner *= pref * rgrid ** (-lcol - 1.0)
+    outer *= pref * rgrid**lcol
+    A = inner + outer
+    dA = -(lcol + 1.0) * inner + lcol * outer
+    out = []
+    for arr in [A[0], A[1], dA[0], dA[1]]:
+        full = numpy.zeros((L + 1, L + 1, nr))
+        full[ll, mm] = arr
+        out.append(full)
+    return (out[0], out[1], out[2], out[3])
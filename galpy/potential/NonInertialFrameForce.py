@@ -59,6 +59,9 @@ class NonInertialFrameForce(DissipativeForce):
     running ``numba.njit`` on them and then evaluate them to check).
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_force_hash", "_cached_force")
+
     def __init__(
         self,
         amp=1.0,
@@ -67,6 +70,8 @@ class NonInertialFrameForce(DissipativeForce):
         x0=None,
         v0=None,
         a0=None,
+        tabulate=None,
+        tabulate_tol=1e-10,
         ro=None,
         vo=None,
     ):
@@ -93,6 +98,10 @@ class NonInertialFrameForce(DissipativeForce):
 
            a0= (None) Acceleration vector a_0 (cartesian) of the center of mass of the non-intertial frame (see definition in the class documentation); constant or a list of functions [a_0x,a_0y, a_0z] (functions need to take input time in internal units and output the acceleration in internal units; see galpy.util.conversion.time_in_Gyr and galpy.util.conversion.force_in_XXX conversion functions [force is actually acceleration in galpy])
 
+           tabulate= (None) if set to [tmin,tmax] (can be Quantities), tabulate the functions of time on a cubic-spline table covering this time range for orbit integration in C, such that the integration does not need to call back into Python within this range (outside of it, the functions are called directly)
+
+           tabulate_tol= (1e-10) relative accuracy of the spline tables
+
         OUTPUT:
 
            (none)
@@ -103,6 +112,8 @@ class NonInertialFrameForce(DissipativeForce):
 
            2022-03-26 - Generalized Omega to any function of time - Bovy (UofT)
 
+           2026-10-19 - Added tabulate=
+
         """
         DissipativeForce.__init__(self, amp=amp, ro=ro, vo=vo)
         self._rot_acc = not Omega is None
@@ -153,6 +164,14 @@ class NonInertialFrameForce(DissipativeForce):
             self._v0_py = lambda t: numpy.array(
                 [self._v0[0](t), self._v0[1](t), self._v0[2](t)]
             )
+        if tabulate is None:
+            self._tfuncs_tabulate = None
+        else:
+            self._tfuncs_tabulate = (
+                conversion.parse_time(tabulate[0], ro=self._ro, vo=self._vo),
+                conversion.parse_time(tabulate[1], ro=self._ro, vo=self._vo),
+                tabulate_tol,
+            )
         # Useful derived quantities
         self._Omega2 = (
             numpy.linalg.norm(self._Omega) ** 2.0
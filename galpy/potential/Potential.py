@@ -22,7 +22,7 @@ from functools import wraps
 import numpy
 from scipy import integrate, optimize
 
-from ..util import conversion, coords, galpyWarning, plot
+from ..util import _vectorized_rootfind, conversion, galpyWarning, plot
 from ..util._optional_deps import _APY_LOADED
 from ..util.conversion import (
     freq_in_Gyr,
@@ -1088,18 +1088,11 @@ class Potential(Force):
                 raise RuntimeError("When effective=True, you need to specify Lz=")
             Rs = numpy.linspace(xrange[0], xrange[1], nrs)
             zs = numpy.linspace(yrange[0], yrange[1], nzs)
-            potRz = numpy.zeros((nrs, nzs))
-            for ii in range(nrs):
-                for jj in range(nzs):
-                    if xy:
-                        R, phi, z = coords.rect_to_cyl(Rs[ii], zs[jj], 0.0)
-                    else:
-                        R, z = Rs[ii], zs[jj]
-                    potRz[ii, jj] = evaluatePotentials(
-                        self, R, z, t=t, phi=phi, use_physical=False
-                    )
-                if effective:
-                    potRz[ii, :] += 0.5 * Lz**2 / Rs[ii] ** 2.0
+            potRz = evaluate_on_grid(
+                self, Rs, zs, phi=phi, t=t, xy=xy, use_physical=False
+            )
+            if effective:
+                potRz += 0.5 * Lz**2 / Rs[:, None] ** 2.0
             # Don't plot outside of the desired range
             potRz[Rs < rmin, :] = numpy.nan
             potRz[Rs > rmax, :] = numpy.nan
@@ -1936,22 +1929,16 @@ class Potential(Force):
 
         OUTPUT:
 
-            Tidal Radius
+            Tidal Radius (array if any of the inputs are arrays)
 
         HISTORY:
 
             2018-03-21 - Written - Webb (UofT)
 
+            2026-10-19 - Allowed array inputs
+
         """
-        if M is None:
-            # Make sure an object mass is given
-            raise PotentialError(
-                "Mass parameter M= needs to be set to compute tidal radius"
-            )
-        r = numpy.sqrt(R**2.0 + z**2.0)
-        omegac2 = -self.rforce(R, z, phi=phi, t=t, use_physical=False) / r
-        d2phidr2 = self.r2deriv(R, z, phi=phi, t=t, use_physical=False)
-        return (M / (omegac2 - d2phidr2)) ** (1.0 / 3.0)
+        return rtide(self, R, z, phi=phi, t=t, M=M, use_physical=False)
 
     @potential_physical_input
     @physical_conversion("forcederivative", pop=True)
@@ -1980,66 +1967,16 @@ class Potential(Force):
 
         OUTPUT:
 
-            Tidal Tensor
+            Tidal Tensor; shape (3,3) for scalar inputs or (...,3,3) for array inputs; if eigenval, the eigenvalues, sorted in ascending order
 
         HISTORY:
 
             2018-03-21 - Written - Webb (UofT)
 
+            2026-10-19 - Allowed array inputs and return sorted eigenvalues
+
         """
-        if self.isNonAxi:
-            raise PotentialError(
-                "Tidal tensor calculation is currently only implemented for axisymmetric potentials"
-            )
-        # Evaluate forces, angles and derivatives
-        Rderiv = -self.Rforce(R, z, phi=phi, t=t, use_physical=False)
-        phideriv = -self.phitorque(R, z, phi=phi, t=t, use_physical=False)
-        R2deriv = self.R2deriv(R, z, phi=phi, t=t, use_physical=False)
-        z2deriv = self.z2deriv(R, z, phi=phi, t=t, use_physical=False)
-        phi2deriv = self.phi2deriv(R, z, phi=phi, t=t, use_physical=False)
-        Rzderiv = self.Rzderiv(R, z, phi=phi, t=t, use_physical=False)
-        Rphideriv = self.Rphideriv(R, z, phi=phi, t=t, use_physical=False)
-        # Temporarily set zphideriv to zero until zphideriv is added to Class
-        zphideriv = 0.0
-        cosphi = numpy.cos(phi)
-        sinphi = numpy.sin(phi)
-        cos2phi = cosphi**2.0
-        sin2phi = sinphi**2.0
-        R2 = R**2.0
-        R3 = R**3.0
-        # Tidal tensor
-        txx = (
-            R2deriv * cos2phi
-            - Rphideriv * 2.0 * cosphi * sinphi / R
-            + Rderiv * sin2phi / R
-            + phi2deriv * sin2phi / R2
-            + phideriv * 2.0 * cosphi * sinphi / R2
-        )
-        tyx = (
-            R2deriv * sinphi * cosphi
-            + Rphideriv * (cos2phi - sin2phi) / R
-            - Rderiv * sinphi * cosphi / R
-            - phi2deriv * sinphi * cosphi / R2
-            + phideriv * (sin2phi - cos2phi) / R2
-        )
-        tzx = Rzderiv * cosphi - zphideriv * sinphi / R
-        tyy = (
-            R2deriv * sin2phi
-            + Rphideriv * 2.0 * cosphi * sinphi / R
-            + Rderiv * cos2phi / R
-            + phi2deriv * cos2phi / R2
-            - phideriv * 2.0 * sinphi * cosphi / R2
-        )
-        txy = tyx
-        tzy = Rzderiv * sinphi + zphideriv * cosphi / R
-        txz = tzx
-        tyz = tzy
-        tzz = z2deriv
-        tij = -numpy.array([[txx, txy, txz], [tyx, tyy, tyz], [tzx, tzy, tzz]])
-        if eigenval:
-            return numpy.linalg.eigvals(tij)
-        else:
-            return tij
+        return ttensor(self, R, z, phi=phi, t=t, eigenval=eigenval, use_physical=False)
 
     @physical_conversion("position", pop=True)
     def zvc(self, R, E, Lz, phi=0.0, t=0.0):
@@ -3024,6 +2961,124 @@ def evaluater2derivs(Pot, R, z, phi=None, t=0.0):
         )
 
 
+@potential_positional_arg
+def evaluate_on_grid(
+    Pot,
+    xs,
+    ys,
+    which="potential",
+    phi=None,
+    t=0.0,
+    xy=False,
+    z=None,
+    use_c=True,
+    **kwargs,
+):
+    """
+    NAME:
+
+       evaluate_on_grid
+
+    PURPOSE:
+
+       evaluate the potential, a force, the density, or the surface density of a (list of) potential(s) on a grid in (R,z) or (x,y), evaluating the whole grid in a single vectorized call where possible (or in C); potentials that only support scalar input are evaluated point by point
+
+    INPUT:
+
+       Pot - Potential or list of Potential instances
+
+       xs - grid in R, or in x if xy (1D array; can be Quantity)
+
+       ys - grid in z, or in y if xy (1D array; can be Quantity); when not xy and which='surfacedensity', the height between which to integrate the density
+
+       which= ('potential') quantity to evaluate: 'potential', 'Rforce', 'zforce', 'phitorque', 'density', or 'surfacedensity'
+
+       phi= (None) azimuth to use for non-axisymmetric potentials when not xy (can be Quantity)
+
+       t= (0.) time (can be Quantity)
+
+       xy= (False) if True, the grid is in (x,y) at height z
+
+       z= (None) height of the (x,y) grid (can be Quantity); defaults to 0, or to infinity for the surface density
+
+       use_c= (True) if True, evaluate the potential and forces in C for potentials that do not support vectorized evaluation, but have a C implementation
+
+       ro=, vo=, use_physical=, quantity= control the physical output as for other functions
+
+    OUTPUT:
+
+       array with shape (len(xs),len(ys))
+
+    HISTORY:
+
+       2026-10-19 - Written
+
+    """
+    quantities = {
+        "potential": (_evaluatePotentials, "energy", 0),
+        "rforce": (_evaluateRforces, "force", 1),
+        "zforce": (_evaluatezforces, "force", 2),
+        "phitorque": (_evaluatephitorques, "energy", 3),
+        "density": (evaluateDensities, "density", None),
+        "surfacedensity": (evaluateSurfaceDensities, "surfacedensity", None),
+    }
+    if not which.lower() in quantities:
+        raise ValueError(
+            f"which= must be one of {', '.join(quantities)}, but is '{which}'"
+        )
+    evalfunc, qtype, c_indx = quantities[which.lower()]
+    Pot = flatten(Pot)
+    physical = get_physical(Pot)
+    xs = numpy.atleast_1d(conversion.parse_length(numpy.asanyarray(xs), **physical))
+    ys = numpy.atleast_1d(conversion.parse_length(numpy.asanyarray(ys), **physical))
+    t = conversion.parse_time(t, **physical)
+    if not phi is None:
+        phi = conversion.parse_angle(phi)
+    X, Y = numpy.meshgrid(xs, ys, indexing="ij")
+    if xy:
+        if z is None:
+            z = numpy.inf if qtype == "surfacedensity" else 0.0
+        R = numpy.sqrt(X**2.0 + Y**2.0).flatten()
+        zs = conversion.parse_length(z, **physical) * numpy.ones(R.size)
+        phi = numpy.arctan2(Y, X).flatten()
+    else:
+        R = numpy.fabs(X).flatten()
+        zs = Y.flatten()
+    evalkwargs = {} if c_indx is not None else {"use_physical": False}
+    try:
+        out = evalfunc(Pot, R, zs, phi=phi, t=t, **evalkwargs)
+    except (TypeError, ValueError):
+        out = None
+    if out is not None and not numpy.shape(out) in [(), R.shape]:
+        out = None
+    if (
+        out is None
+        and use_c
+        and not c_indx is None
+        and numpy.ndim(t) == 0
+        and (not phi is None or not _isNonAxi(Pot))
+        and _check_c(Pot)
+    ):
+        # Potentials that do not support array input: evaluate in C if possible
+        from .interp3DPotential import calc_potential_forces_3d_c, ext_loaded
+
+        if ext_loaded:
+            c_out, err = calc_potential_forces_3d_c(
+                Pot,
+                R,
+                zs,
+                numpy.zeros(R.size) if phi is None else phi * numpy.ones(R.size),
+                t=t,
+            )
+            # err: the potential (but not the forces) could not be evaluated in C
+            if not err or c_indx > 0:
+                out = c_out[c_indx]
+    if out is None:
+        out = _evaluate_broadcast(evalfunc, Pot, R, zs, phi=phi, t=t, **evalkwargs)
+    out = (out * numpy.ones(R.size)).reshape(X.shape)
+    return physical_conversion(qtype, pop=True)(lambda x, **kw: out)(Pot, **kwargs)
+
+
 @potential_positional_arg
 def plotPotentials(
     Pot,
@@ -3116,18 +3171,9 @@ def plotPotentials(
             raise RuntimeError("When effective=True, you need to specify Lz=")
         Rs = numpy.linspace(rmin, rmax, nrs)
         zs = numpy.linspace(zmin, zmax, nzs)
-        potRz = numpy.zeros((nrs, nzs))
-        for ii in range(nrs):
-            for jj in range(nzs):
-                if xy:
-                    R, phi, z = coords.rect_to_cyl(Rs[ii], zs[jj], 0.0)
-                else:
-                    R, z = Rs[ii], zs[jj]
-                potRz[ii, jj] = evaluatePotentials(
-                    Pot, numpy.fabs(R), z, phi=phi, t=t, use_physical=False
-                )
-            if effective:
-                potRz[ii, :] += 0.5 * Lz**2 / Rs[ii] ** 2.0
+        potRz = evaluate_on_grid(Pot, Rs, zs, phi=phi, t=t, xy=xy, use_physical=False)
+        if effective:
+            potRz += 0.5 * Lz**2 / Rs[:, None] ** 2.0
         if not savefilename == None:
             print("Writing savefile " + savefilename + " ...")
             savefile = open(savefilename, "wb")
@@ -3253,16 +3299,9 @@ def plotDensities(
     else:
         Rs = numpy.linspace(rmin, rmax, nrs)
         zs = numpy.linspace(zmin, zmax, nzs)
-        potRz = numpy.zeros((nrs, nzs))
-        for ii in range(nrs):
-            for jj in range(nzs):
-                if xy:
-                    R, phi, z = coords.rect_to_cyl(Rs[ii], zs[jj], 0.0)
-                else:
-                    R, z = Rs[ii], zs[jj]
-                potRz[ii, jj] = evaluateDensities(
-                    Pot, numpy.fabs(R), z, phi=phi, t=t, **physical_kwargs
-                )
+        potRz = evaluate_on_grid(
+            Pot, Rs, zs, which="density", phi=phi, t=t, xy=xy, **physical_kwargs
+        )
         if not savefilename == None:
             print("Writing savefile " + savefilename + " ...")
             savefile = open(savefilename, "wb")
@@ -3380,6 +3419,7 @@ def plotSurfaceDensities(
     xmax = conversion.parse_length(xmax, ro=ro)
     ymin = conversion.parse_length(ymin, ro=ro)
     ymax = conversion.parse_length(ymax, ro=ro)
+    z = conversion.parse_length(z, ro=ro)
     if not savefilename == None and os.path.exists(savefilename):
         print("Restoring savefile " + savefilename + " ...")
         savefile = open(savefilename, "rb")
@@ -3390,13 +3430,16 @@ def plotSurfaceDensities(
     else:
         xs = numpy.linspace(xmin, xmax, nxs)
         ys = numpy.linspace(ymin, ymax, nys)
-        surfxy = numpy.zeros((nxs, nys))
-        for ii in range(nxs):
-            for jj in range(nys):
-                R, phi, _ = coords.rect_to_cyl(xs[ii], ys[jj], 0.0)
-                surfxy[ii, jj] = evaluateSurfaceDensities(
-                    Pot, numpy.fabs(R), z, phi=phi, t=t, **physical_kwargs
-                )
+        surfxy = evaluate_on_grid(
+            Pot,
+            xs,
+            ys,
+            which="surfacedensity",
+            t=t,
+            xy=True,
+            z=z,
+            **physical_kwargs,
+        )
         if not savefilename == None:
             print("Writing savefile " + savefilename + " ...")
             savefile = open(savefilename, "wb")
@@ -4262,6 +4305,36 @@ def _isNonAxi(Pot):
     return nonAxi
 
 
+def _evaluate_broadcast(evalfunc, Pot, R, z, phi=0.0, t=0.0, **kwargs):
+    """Evaluate evalfunc(Pot,R,z,phi=phi,t=t,**kwargs) for array inputs, falling back to a loop over the inputs for potentials that do not accept arrays"""
+    try:
+        return evalfunc(Pot, R, z, phi=phi, t=t, **kwargs)
+    except (TypeError, ValueError):
+        if not (
+            numpy.ndim(R) > 0
+            or numpy.ndim(z) > 0
+            or numpy.ndim(phi) > 0
+            or numpy.ndim(t) > 0
+        ):
+            raise
+        R, z, phi, t = numpy.broadcast_arrays(R, z, phi, t)
+        out = numpy.empty(R.shape)
+        for ii in numpy.ndindex(R.shape):
+            out[ii] = evalfunc(Pot, R[ii], z[ii], phi=phi[ii], t=t[ii], **kwargs)
+        return out
+
+
+def _broadcast_if_array(*args, shape=()):
+    """Broadcast those inputs that are arrays to shape, leave scalars alone"""
+    return [
+        numpy.broadcast_to(arg, shape) if numpy.ndim(arg) > 0 else arg for arg in args
+    ]
+
+
+def _index_if_array(arg, indx):
+    return arg[indx] if numpy.ndim(arg) > 0 else arg
+
+
 def kms_to_kpcGyrDecorator(func):
     """Decorator to convert velocities from km/s to kpc/Gyr"""
 
@@ -4308,12 +4381,14 @@ def rtide(Pot, R, z, phi=0.0, t=0.0, M=None):
 
     OUTPUT:
 
-        Tidal Radius
+        Tidal Radius (array if any of the inputs are arrays)
 
     HISTORY:
 
         2018-03-21 - Written - Webb (UofT)
 
+        2026-10-19 - Allowed array inputs
+
     """
     Pot = flatten(Pot)
     if M is None:
@@ -4322,8 +4397,15 @@ def rtide(Pot, R, z, phi=0.0, t=0.0, M=None):
             "Mass parameter M= needs to be set to compute tidal radius"
         )
     r = numpy.sqrt(R**2.0 + z**2.0)
-    omegac2 = -evaluaterforces(Pot, R, z, phi=phi, t=t, use_physical=False) / r
-    d2phidr2 = evaluater2derivs(Pot, R, z, phi=phi, t=t, use_physical=False)
+    omegac2 = (
+        -_evaluate_broadcast(
+            evaluaterforces, Pot, R, z, phi=phi, t=t, use_physical=False
+        )
+        / r
+    )
+    d2phidr2 = _evaluate_broadcast(
+        evaluater2derivs, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
     return (M / (omegac2 - d2phidr2)) ** (1.0 / 3.0)
 
 
@@ -4357,11 +4439,13 @@ def ttensor(Pot, R, z, phi=0.0, t=0.0, eigenval=False):
 
     OUTPUT:
 
-        Tidal Tensor
+        Tidal Tensor; shape (3,3) for scalar inputs or (...,3,3) for array inputs; if eigenval, the eigenvalues, sorted in ascending order
 
     HISTORY:
 
         2018-03-21 - Written - Webb (UofT)
+
+        2026-10-19 - Allowed array inputs and return sorted eigenvalues
     """
     Pot = flatten(Pot)
     if _isNonAxi(Pot):
@@ -4369,13 +4453,27 @@ def ttensor(Pot, R, z, phi=0.0, t=0.0, eigenval=False):
             "Tidal tensor calculation is currently only implemented for axisymmetric potentials"
         )
     # Evaluate forces, angles and derivatives
-    Rderiv = -evaluateRforces(Pot, R, z, phi=phi, t=t, use_physical=False)
-    phideriv = -evaluatephitorques(Pot, R, z, phi=phi, t=t, use_physical=False)
-    R2deriv = evaluateR2derivs(Pot, R, z, phi=phi, t=t, use_physical=False)
-    z2deriv = evaluatez2derivs(Pot, R, z, phi=phi, t=t, use_physical=False)
-    phi2deriv = evaluatephi2derivs(Pot, R, z, phi=phi, t=t, use_physical=False)
-    Rzderiv = evaluateRzderivs(Pot, R, z, phi=phi, t=t, use_physical=False)
-    Rphideriv = evaluateRphiderivs(Pot, R, z, phi=phi, t=t, use_physical=False)
+    Rderiv = -_evaluate_broadcast(
+        evaluateRforces, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
+    phideriv = -_evaluate_broadcast(
+        evaluatephitorques, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
+    R2deriv = _evaluate_broadcast(
+        evaluateR2derivs, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
+    z2deriv = _evaluate_broadcast(
+        evaluatez2derivs, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
+    phi2deriv = _evaluate_broadcast(
+        evaluatephi2derivs, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
+    Rzderiv = _evaluate_broadcast(
+        evaluateRzderivs, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
+    Rphideriv = _evaluate_broadcast(
+        evaluateRphiderivs, Pot, R, z, phi=phi, t=t, use_physical=False
+    )
     # Temporarily set zphideriv to zero until zphideriv is added to Class
     zphideriv = 0.0
     cosphi = numpy.cos(phi)
@@ -4383,7 +4481,6 @@ def ttensor(Pot, R, z, phi=0.0, t=0.0, eigenval=False):
     cos2phi = cosphi**2.0
     sin2phi = sinphi**2.0
     R2 = R**2.0
-    R3 = R**3.0
     # Tidal tensor
     txx = (
         R2deriv * cos2phi
@@ -4407,14 +4504,20 @@ def ttensor(Pot, R, z, phi=0.0, t=0.0, eigenval=False):
         + phi2deriv * cos2phi / R2
         - phideriv * 2.0 * sinphi * cosphi / R2
     )
-    txy = tyx
     tzy = Rzderiv * sinphi + zphideriv * cosphi / R
-    txz = tzx
-    tyz = tzy
     tzz = z2deriv
-    tij = -numpy.array([[txx, txy, txz], [tyx, tyy, tyz], [tzx, tzy, tzz]])
-    if eigenval:
-        return numpy.linalg.eigvals(tij)
+    # Stack into (...,3,3), which is (3,3) for scalar input
+    txx, tyx, tzx, tyy, tzy, tzz = numpy.broadcast_arrays(txx, tyx, tzx, tyy, tzy, tzz)
+    tij = -numpy.stack(
+        [
+            numpy.stack([txx, tyx, tzx], axis=-1),
+            numpy.stack([tyx, tyy, tzy], axis=-1),
+            numpy.stack([tzx, tzy, tzz], axis=-1),
+        ],
+        axis=-2,
+    )
+    if eigenval:  # the tidal tensor is symmetric
+        return numpy.linalg.eigvalsh(tij)
     else:
         return tij
 
@@ -4448,16 +4551,20 @@ def zvc(Pot, R, E, Lz, phi=0.0, t=0.0):
 
     OUTPUT:
 
-        z such that Phi(R,z) + Lz/[2R^2] = E
+        z such that Phi(R,z) + Lz/[2R^2] = E (array if any of R, E, or Lz are arrays, with NaN where no solution exists)
 
     HISTORY:
 
         2020-08-20 - Written - Bovy (UofT)
+
+        2026-10-19 - Allowed array inputs
     """
     Pot = flatten(Pot)
     R = conversion.parse_length(R, **get_physical(Pot))
     E = conversion.parse_energy(E, **get_physical(Pot))
     Lz = conversion.parse_angmom(Lz, **get_physical(Pot))
+    if numpy.ndim(R) > 0 or numpy.ndim(E) > 0 or numpy.ndim(Lz) > 0:
+        return _zvc_array(Pot, R, E, Lz, phi=phi, t=t)
     Lz2over2R2 = Lz**2.0 / 2.0 / R**2.0
     # Check z=0 and whether a solution exists
     if (
@@ -4515,15 +4622,19 @@ def zvc_range(Pot, E, Lz, phi=0.0, t=0.0):
 
     OUTPUT:
 
-        Solutions R such that Phi(R,0) + Lz/[2R^2] = E
+        Solutions R such that Phi(R,0) + Lz/[2R^2] = E (shape (2,...) if E or Lz are arrays)
 
     HISTORY:
 
         2020-08-20 - Written - Bovy (UofT)
+
+        2026-10-19 - Allowed array inputs
     """
     Pot = flatten(Pot)
     E = conversion.parse_energy(E, **get_physical(Pot))
     Lz = conversion.parse_angmom(Lz, **get_physical(Pot))
+    if numpy.ndim(E) > 0 or numpy.ndim(Lz) > 0:
+        return _zvc_range_array(Pot, E, Lz, phi=phi, t=t)
     Lz2over2 = Lz**2.0 / 2.0
     # Check whether a solution exists
     RLz = rl(Pot, Lz, t=t, use_physical=False)
@@ -4565,6 +4676,107 @@ def zvc_range(Pot, E, Lz, phi=0.0, t=0.0):
     return numpy.array([Rmin, Rmax])
 
 
+def _zvc_array(Pot, R, E, Lz, phi=0.0, t=0.0):
+    """Vectorized version of zvc: bracket and solve for all (R,E,Lz) at once"""
+    R, E, Lz = (numpy.array(x, dtype="float") for x in numpy.broadcast_arrays(R, E, Lz))
+    phi, t = _broadcast_if_array(phi, t, shape=R.shape)
+    Lz2over2R2 = Lz**2.0 / 2.0 / R**2.0
+
+    def _zvcEq(z, indx):
+        return (
+            _evaluate_broadcast(
+                _evaluatePotentials,
+                Pot,
+                R[indx],
+                z,
+                phi=_index_if_array(phi, indx),
+                t=_index_if_array(t, indx),
+            )
+            + Lz2over2R2[indx]
+            - E[indx]
+        )
+
+    out = numpy.full(R.shape, numpy.nan)
+    # Check z=0 and whether a solution exists
+    feq = _zvcEq(numpy.zeros(R.shape), numpy.ones(R.shape, dtype="bool"))
+    out[numpy.fabs(feq) < 1e-8] = 0.0
+    indx = feq <= -1e-8
+    # Find starting values
+    zstart = numpy.ones(R.shape)
+    zmax = 1000.0
+    todo = indx.copy()
+    while numpy.any(todo):
+        todo[todo] = (_zvcEq(zstart[todo], todo) < 0.0) * (zstart[todo] < zmax)
+        zstart[todo] *= 2.0
+    # No solution within zmax, leave these at NaN
+    indx[indx] = _zvcEq(zstart[indx], indx) >= 0.0
+    out[indx] = _vectorized_rootfind(
+        lambda z: _zvcEq(z, indx), numpy.zeros(numpy.sum(indx)), zstart[indx]
+    )
+    return out
+
+
+def _zvc_range_array(Pot, E, Lz, phi=0.0, t=0.0):
+    """Vectorized version of zvc_range: bracket and solve for all (E,Lz) at once"""
+    E, Lz = (numpy.array(x, dtype="float") for x in numpy.broadcast_arrays(E, Lz))
+    phi, t = _broadcast_if_array(phi, t, shape=E.shape)
+    Lz2over2 = Lz**2.0 / 2.0
+
+    def _zvcrangeEq(R, indx):
+        return (
+            _evaluate_broadcast(
+                _evaluatePotentials,
+                Pot,
+                R,
+                numpy.zeros_like(R),
+                phi=_index_if_array(phi, indx),
+                t=_index_if_array(t, indx),
+            )
+            + Lz2over2[indx] / R**2.0
+            - E[indx]
+        )
+
+    out = numpy.full((2,) + E.shape, numpy.nan)
+    # Check whether a solution exists
+    RLz = _rl_array(Pot, Lz, t=t)
+    indx = _zvcrangeEq(RLz, numpy.ones(E.shape, dtype="bool")) <= 0.0
+    if not numpy.any(indx):
+        return out
+    RLz = RLz[indx]
+    # Find starting values for Rmin and Rmax, then solve
+    for ii, (Rlimit, fac) in enumerate([(1e-8, 0.5), (1000.0, 2.0)]):
+        Rstart = RLz.copy()
+        todo = numpy.ones(len(Rstart), dtype="bool")
+        while numpy.any(todo):
+            subindx = indx.copy()
+            subindx[indx] = todo
+            todo[todo] = (_zvcrangeEq(Rstart[todo], subindx) < 0.0) * (
+                (fac - 1.0) * (Rstart[todo] - Rlimit) < 0.0
+            )
+            Rstart[todo] *= fac
+        out[ii][indx] = _vectorized_rootfind(
+            lambda R: _zvcrangeEq(R, indx), Rstart, RLz
+        )
+    return out
+
+
+def _rl_array(Pot, lz, t=0.0):
+    """Vectorized version of rl for an array of lz"""
+    lz = numpy.fabs(lz)
+    rlfunc = lambda rl: rl * vcirc(Pot, rl, t=t, use_physical=False) - lz
+    rupper = 2.0 * lz
+    todo = rlfunc(rupper) < 0.0
+    while numpy.any(todo):
+        rupper[todo] *= 2.0
+        todo[todo] = rlfunc(rupper)[todo] < 0.0
+    rlower = 10.0**-5.0 * numpy.ones_like(lz)
+    todo = (rlfunc(rlower) > 0.0) * (rlower > 1e-12)
+    while numpy.any(todo):
+        rlower[todo] /= 2.0
+        todo[todo] = (rlfunc(rlower)[todo] > 0.0) * (rlower[todo] > 1e-12)
+    return _vectorized_rootfind(rlfunc, rlower, rupper)
+
+
 @potential_positional_arg
 @physical_conversion("position", pop=True)
 def rhalf(Pot, t=0.0, INF=numpy.inf):
@@ -10,7 +10,6 @@ from .Potential import (
     _evaluatePotentials,
     _evaluateRforces,
     _evaluatezforces,
-    check_potential_inputs_not_arrays,
     evaluateDensities,
     evaluatephi2derivs,
     evaluatephizderivs,
@@ -162,7 +161,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
     def __getattr__(self, attribute):
         return super().__getattr__(attribute)
 
-    @check_potential_inputs_not_arrays
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -179,17 +177,9 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         HISTORY:
            2021-04-18 - Written - Bovy (UofT)
         """
-        x, y, z = coords.cyl_to_rect(R, phi, z) if not numpy.isinf(R) else (R, 0.0, z)
-        if self._norot:
-            xyzp = numpy.array([x, y, z])
-        else:
-            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-        if self._offset is not None:
-            xyzp += self._offset
-        Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
+        Rp, phip, zp = self._transformed_coords(R, z, phi)
         return _evaluatePotentials(self._pot, Rp, zp, phi=phip, t=t)
 
-    @check_potential_inputs_not_arrays
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -209,7 +199,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
         return numpy.cos(phi) * Fxyz[0] + numpy.sin(phi) * Fxyz[1]
 
-    @check_potential_inputs_not_arrays
     def _phitorque(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -229,7 +218,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
         return R * (-numpy.sin(phi) * Fxyz[0] + numpy.cos(phi) * Fxyz[1])
 
-    @check_potential_inputs_not_arrays
     def _zforce(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -248,24 +236,39 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         """
         return self._force_xyz(R, z, phi=phi, t=t)[2]
 
-    def _force_xyz(self, R, z, phi=0.0, t=0.0):
-        """Get the rectangular forces in the transformed frame"""
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        if self._norot:
+    def _transformed_coords(self, R, z, phi):
+        """Cylindrical coordinates (Rp,phip,zp) in the frame of the wrapped potential, for scalar or array input"""
+        if numpy.ndim(R) == 0 and numpy.ndim(z) == 0 and numpy.ndim(phi) == 0:
+            x, y, z = (
+                coords.cyl_to_rect(R, phi, z) if not numpy.isinf(R) else (R, 0.0, z)
+            )
             xyzp = numpy.array([x, y, z])
         else:
-            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
+            R, z, phi = numpy.broadcast_arrays(R, z, phi)
+            x, y, z = coords.cyl_to_rect(R, phi, z)
+            x = numpy.where(numpy.isinf(R), R, x)
+            y = numpy.where(numpy.isinf(R), 0.0, y)
+            xyzp = numpy.array([x, y, z], dtype="float")
+        if not self._norot:
+            xyzp = numpy.tensordot(self._rot, xyzp, axes=1)
         if self._offset is not None:
-            xyzp += self._offset
-        Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
+            xyzp += numpy.reshape(self._offset, (3,) + (1,) * (xyzp.ndim - 1))
+        return coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
+
+    def _force_xyz(self, R, z, phi=0.0, t=0.0):
+        """Get the rectangular forces in the transformed frame"""
+        Rp, phip, zp = self._transformed_coords(R, z, phi)
         Rforcep = _evaluateRforces(self._pot, Rp, zp, phi=phip, t=t)
         phitorquep = _evaluatephitorques(self._pot, Rp, zp, phi=phip, t=t)
         zforcep = _evaluatezforces(self._pot, Rp, zp, phi=phip, t=t)
         xforcep = numpy.cos(phip) * Rforcep - numpy.sin(phip) * phitorquep / Rp
         yforcep = numpy.sin(phip) * Rforcep + numpy.cos(phip) * phitorquep / Rp
-        return numpy.dot(self._inv_rot, numpy.array([xforcep, yforcep, zforcep]))
+        return numpy.tensordot(
+            self._inv_rot,
+            numpy.array(numpy.broadcast_arrays(xforcep, yforcep, zforcep)),
+            axes=1,
+        )
 
-    @check_potential_inputs_not_arrays
     def _R2deriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -289,7 +292,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
             + 2.0 * numpy.cos(phi) * numpy.sin(phi) * phi2[0, 1]
         )
 
-    @check_potential_inputs_not_arrays
     def _Rzderiv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -309,7 +311,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         phi2 = self._2ndderiv_xyz(R, z, phi=phi, t=t)
         return numpy.cos(phi) * phi2[0, 2] + numpy.sin(phi) * phi2[1, 2]
 
-    @check_potential_inputs_not_arrays
     def _z2deriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -328,7 +329,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         """
         return self._2ndderiv_xyz(R, z, phi=phi, t=t)[2, 2]
 
-    @check_potential_inputs_not_arrays
     def _phi2deriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -353,7 +353,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
             - 2.0 * numpy.cos(phi) * numpy.sin(phi) * phi2[0, 1]
         ) + R * (numpy.cos(phi) * Fxyz[0] + numpy.sin(phi) * Fxyz[1])
 
-    @check_potential_inputs_not_arrays
     def _Rphideriv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -379,7 +378,6 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
             - numpy.cos(phi) * Fxyz[1]
         )
 
-    @check_potential_inputs_not_arrays
     def _phizderiv(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -401,14 +399,7 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
 
     def _2ndderiv_xyz(self, R, z, phi=0.0, t=0.0):
         """Get the rectangular forces in the transformed frame"""
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        if self._norot:
-            xyzp = numpy.array([x, y, z])
-        else:
-            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-        if self._offset is not None:
-            xyzp += self._offset
-        Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
+        Rp, phip, zp = self._transformed_coords(R, z, phi)
         Rforcep = _evaluateRforces(self._pot, Rp, zp, phi=phip, t=t)
         phitorquep = _evaluatephitorques(self._pot, Rp, zp, phi=phip, t=t)
         R2derivp = evaluateR2derivs(
@@ -455,21 +446,22 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         )
         xzderivp = Rzderivp * cp - phizderivp * sp / Rp
         yzderivp = Rzderivp * sp + phizderivp * cp / Rp
-        return numpy.dot(
+        derivs = numpy.broadcast_arrays(
+            x2derivp, xyderivp, xzderivp, y2derivp, yzderivp, z2derivp
+        )
+        return numpy.einsum(
+            "ij,jk...,lk->il...",
             self._inv_rot,
-            numpy.dot(
-                numpy.array(
-                    [
-                        [x2derivp, xyderivp, xzderivp],
-                        [xyderivp, y2derivp, yzderivp],
-                        [xzderivp, yzderivp, z2derivp],
-                    ]
-                ),
-                self._inv_rot.T,
+            numpy.array(
+                [
+                    [derivs[0], derivs[1], derivs[2]],
+                    [derivs[1], derivs[3], derivs[4]],
+                    [derivs[2], derivs[4], derivs[5]],
+                ]
             ),
+            self._inv_rot,
         )
 
-    @check_potential_inputs_not_arrays
     def _dens(self, R, z, phi=0.0, t=0.0):
         """
         NAME:
@@ -486,12 +478,5 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         HISTORY:
            2021-04-18 - Written - Bovy (UofT)
         """
-        x, y, z = coords.cyl_to_rect(R, phi, z) if not numpy.isinf(R) else (R, 0.0, z)
-        if self._norot:
-            xyzp = numpy.array([x, y, z])
-        else:
-            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-        if self._offset is not None:
-            xyzp += self._offset
-        Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
+        Rp, phip, zp = self._transformed_coords(R, z, phi)
         return evaluateDensities(self._pot, Rp, zp, phi=phip, t=t, use_physical=False)
@@ -1,12 +1,15 @@
 import hashlib
+import os
 
 import numpy
 from numpy.polynomial.legendre import leggauss
 from scipy import integrate
 from scipy.special import gamma, gammaln, lpmn
 
-from ..util import conversion, coords
+from .. import __version__
+from ..util import conversion, coords, multi
 from ..util._optional_deps import _APY_LOADED
+from ..util._table_cache import cache_table, content_hash, load_table
 from .Potential import Potential
 
 if _APY_LOADED:
@@ -49,6 +52,14 @@ class SCFPotential(Potential, NumericalPotentialDerivativesMixin):
     and :math:`P_{lm}` is the Associated Legendre Polynomials whereas :math:`C_n^{\\alpha}` is the Gegenbauer polynomial.
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = (
+        "_force_hash",
+        "_cached_dPhi_dr",
+        "_cached_dPhi_dtheta",
+        "_cached_dPhi_dphi",
+    )
+
     def __init__(
         self,
         amp=1.0,
@@ -778,7 +789,9 @@ def _dC(xi, N, L):
     return CC
 
 
-def scf_compute_coeffs_spherical_nbody(pos, N, mass=1.0, a=1.0):
+def scf_compute_coeffs_spherical_nbody(
+    pos, N, mass=1.0, a=1.0, chunksize=None, numcores=1, return_variance=False
+):
     """
     NAME:
 
@@ -790,7 +803,7 @@ def scf_compute_coeffs_spherical_nbody(pos, N, mass=1.0, a=1.0):
 
     INPUT:
 
-       pos - positions of particles in rectangular coordinates with shape [3,n]
+       pos - positions of particles in rectangular coordinates with shape [3,n] (can be a numpy.memmap), or an iterator that yields blocks of positions with shape [3,n_i] or tuples (pos_i,mass_i) of blocks of positions and masses
 
        N - size of the Nth dimension of the expansion coefficients
 
@@ -798,25 +811,30 @@ def scf_compute_coeffs_spherical_nbody(pos, N, mass=1.0, a=1.0):
 
        a= (1.) parameter used to scale the radius
 
+       chunksize= (None) number of particles to process at once (default: as many as keeps the work arrays at about 10^7 elements, i.e., 10^7/(N L) particles; blocks yielded by an iterator are not split further)
+
+       numcores= (1) number of processes to use to process chunks of particles in parallel
+
+       return_variance= (False) if True, also return an estimate of the variance of the coefficients due to particle noise
+
     OUTPUT:
 
        (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
 
+       or (Acos,Asin,Acos_var,Asin_var) if return_variance
+
     HISTORY:
 
        2020-11-18 - Written - Morgan Bennett (UofT)
 
        2021-02-22 - Sped-up - Bovy (UofT)
 
+       2026-10-19 - Chunked, parallel accumulation and variances
+
     """
-    Acos = numpy.zeros((N, 1, 1), float)
-    Asin = None
-    r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
-    RhoSum = numpy.einsum("j,ij", mass / (1.0 + r / a), _C(_RToxi(r, a=a), N, 1)[:, 0])
-    n = numpy.arange(0, N)
-    K = 4 * (n + 3.0 / 2) / ((n + 2) * (n + 1) * (1 + n * (n + 3.0) / 2.0))
-    Acos[n, 0, 0] = 2 * K * RhoSum
-    return Acos, Asin
+    return _scf_compute_coeffs_nbody_chunked(
+        pos, N, 1, 1, mass, a, chunksize, numcores, return_variance
+    )
 
 
 def _scf_compute_determine_dens_kwargs(dens, param):
@@ -830,7 +848,25 @@ def _scf_compute_determine_dens_kwargs(dens, param):
     return dens_kw
 
 
-def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
+def _scf_compute_coeffs_cached(cache, compute, name, dens, *args):
+    # Load the coefficients from a file in the cache directory whose name
+    # contains a hash of the density and all other inputs or compute them
+    # using compute() and store them there
+    cachefile = os.path.join(
+        cache, f"{name}-{content_hash(__version__, dens, *args)}.npz"
+    )
+    if os.path.exists(cachefile):
+        table = load_table(cachefile, mmap=False)
+        return table["Acos"], table.get("Asin", None)
+    Acos, Asin = compute()
+    if Asin is None:
+        cache_table(cachefile, Acos=Acos)
+    else:
+        cache_table(cachefile, Acos=Acos, Asin=Asin)
+    return Acos, Asin
+
+
+def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None, cache=None):
     """
     NAME:
 
@@ -850,6 +886,8 @@ def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
 
        radial_order - Number of sample points of the radial integral. If None, radial_order=max(20, N + 1)
 
+       cache= (None) if set to a directory, the coefficients are stored in a file in this directory whose name contains a hash of the density and all other inputs (and the galpy version); when such a file already exists, the coefficients are read from it rather than computed
+
     OUTPUT:
 
        (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
@@ -858,7 +896,21 @@ def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
 
        2016-05-18 - Written - Aladdin Seaifan (UofT)
 
+       2026-10-19 - Added cache=
+
     """
+    if cache is not None:
+        return _scf_compute_coeffs_cached(
+            cache,
+            lambda: scf_compute_coeffs_spherical(
+                dens, N, a=a, radial_order=radial_order
+            ),
+            "scf_compute_coeffs_spherical",
+            dens,
+            N,
+            a,
+            radial_order,
+        )
     numOfParam = 0
     try:
         dens(0)
@@ -899,7 +951,9 @@ def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
     return Acos, Asin
 
 
-def scf_compute_coeffs_axi_nbody(pos, N, L, mass=1.0, a=1.0):
+def scf_compute_coeffs_axi_nbody(
+    pos, N, L, mass=1.0, a=1.0, chunksize=None, numcores=1, return_variance=False
+):
     """
     NAME:
 
@@ -911,7 +965,7 @@ def scf_compute_coeffs_axi_nbody(pos, N, L, mass=1.0, a=1.0):
 
     INPUT:
 
-       pos - positions of particles in rectangular coordinates with shape [3,n]
+       pos - positions of particles in rectangular coordinates with shape [3,n] (can be a numpy.memmap), or an iterator that yields blocks of positions with shape [3,n_i] or tuples (pos_i,mass_i) of blocks of positions and masses
 
        N - size of the Nth dimension of the expansion coefficients
 
@@ -921,54 +975,33 @@ def scf_compute_coeffs_axi_nbody(pos, N, L, mass=1.0, a=1.0):
 
        a= (1.) parameter used to scale the radius
 
+       chunksize= (None) number of particles to process at once (default: as many as keeps the work arrays at about 10^7 elements, i.e., 10^7/(N L) particles; blocks yielded by an iterator are not split further)
+
+       numcores= (1) number of processes to use to process chunks of particles in parallel
+
+       return_variance= (False) if True, also return an estimate of the variance of the coefficients due to particle noise
+
     OUTPUT:
 
        (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
 
+       or (Acos,Asin,Acos_var,Asin_var) if return_variance
+
     HISTORY:
 
        2021-02-22 - Written based on general code - Bovy (UofT)
 
+       2026-10-19 - Chunked, parallel accumulation and variances
+
     """
-    r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
-    costheta = pos[2] / r
-    mass = numpy.atleast_1d(mass)
-    Acos, Asin = numpy.zeros([N, L, 1]), None
-    Pll = numpy.ones(len(r))  # Set up Assoc. Legendre recursion
-    # (n,l) dependent constant
-    n = numpy.arange(0, N)[:, numpy.newaxis]
-    l = numpy.arange(0, L)[numpy.newaxis, :]
-    Knl = 0.5 * n * (n + 4.0 * l + 3.0) + (l + 1) * (2.0 * l + 1.0)
-    Inl = (
-        -Knl
-        * 2.0
-        * numpy.pi
-        / 2.0 ** (8.0 * l + 6.0)
-        * gamma(n + 4.0 * l + 3.0)
-        / gamma(n + 1)
-        / (n + 2.0 * l + 1.5)
-        / gamma(2.0 * l + 1.5) ** 2
-        / numpy.sqrt(2.0 * l + 1)
+    return _scf_compute_coeffs_nbody_chunked(
+        pos, N, L, 1, mass, a, chunksize, numcores, return_variance
     )
-    # Set up Assoc. Legendre recursion
-    Plm = Pll
-    Plmm1 = 0.0
-    for ll in range(L):
-        # Compute Gegenbauer polys for this l
-        Cn = _C(_RToxi(r, a=a), N, ll, singleL=True)
-        phinlm = -((r / a) ** ll) / (1.0 + r / a) ** (2.0 * ll + 1) * Cn[:, 0] * Plm
-        # Acos
-        Sum = numpy.sum(mass[numpy.newaxis, :] * phinlm, axis=-1)
-        Acos[:, ll, 0] = Sum / Inl[:, ll]
-        # Recurse Assoc. Legendre
-        if ll < L:
-            tmp = Plm
-            Plm = ((2 * ll + 1.0) * costheta * Plm - ll * Plmm1) / (ll + 1)
-            Plmm1 = tmp
-    return Acos, Asin
 
 
-def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=None):
+def scf_compute_coeffs_axi(
+    dens, N, L, a=1.0, radial_order=None, costheta_order=None, cache=None
+):
     """
     NAME:
 
@@ -992,6 +1025,8 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=
 
        costheta_order - Number of sample points of the costheta integral. If None, If costheta_order=max(20, L + 1)
 
+       cache= (None) if set to a directory, the coefficients are stored in a file in this directory whose name contains a hash of the density and all other inputs (and the galpy version); when such a file already exists, the coefficients are read from it rather than computed
+
     OUTPUT:
 
        (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
@@ -1000,7 +1035,28 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=
 
        2016-05-20 - Written - Aladdin Seaifan (UofT)
 
+       2026-10-19 - Added cache=
+
     """
+    if cache is not None:
+        return _scf_compute_coeffs_cached(
+            cache,
+            lambda: scf_compute_coeffs_axi(
+                dens,
+                N,
+                L,
+                a=a,
+                radial_order=radial_order,
+                costheta_order=costheta_order,
+            ),
+            "scf_compute_coeffs_axi",
+            dens,
+            N,
+            L,
+            a,
+            radial_order,
+            costheta_order,
+        )
     numOfParam = 0
     try:
         dens(0, 0)
@@ -1059,7 +1115,9 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=
     return Acos, Asin
 
 
-def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
+def scf_compute_coeffs_nbody(
+    pos, N, L, mass=1.0, a=1.0, chunksize=None, numcores=1, return_variance=False
+):
     """
     NAME:
 
@@ -1071,7 +1129,7 @@ def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
 
     INPUT:
 
-       pos - positions of particles in rectangular coordinates with shape [3,n]
+       pos - positions of particles in rectangular coordinates with shape [3,n] (can be a numpy.memmap), or an iterator that yields blocks of positions with shape [3,n_i] or tuples (pos_i,mass_i) of blocks of positions and masses
 
        N - size of the Nth dimension of the expansion coefficients
 
@@ -1081,25 +1139,134 @@ def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
 
        a= (1.) parameter used to scale the radius
 
+       chunksize= (None) number of particles to process at once (default: as many as keeps the work arrays at about 10^7 elements, i.e., 10^7/(N L) particles; blocks yielded by an iterator are not split further)
+
+       numcores= (1) number of processes to use to process chunks of particles in parallel
+
+       return_variance= (False) if True, also return an estimate of the variance of the coefficients due to particle noise
+
     OUTPUT:
 
        (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
 
+       or (Acos,Asin,Acos_var,Asin_var) if return_variance
+
     HISTORY:
 
        2020-11-18 - Written - Morgan Bennett (UofT)
 
+       2026-10-19 - Chunked, parallel accumulation and variances
+
     """
+    return _scf_compute_coeffs_nbody_chunked(
+        pos, N, L, L, mass, a, chunksize, numcores, return_variance
+    )
+
+
+def _scf_compute_coeffs_nbody_sums(pos, mass, N, L, M, a):
+    """Compute the particle sums that make up the (unnormalized) expansion coefficients and their squares for a block of particles; M=1 for axisymmetric expansions, L=M=1 for spherical ones; returns the flattened sums, squared sums, and the number of particles"""
+    pos = numpy.asarray(pos, dtype="float")
+    mass = numpy.broadcast_to(numpy.asarray(mass, dtype="float"), pos[0].shape)
     r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
     phi = numpy.arctan2(pos[1], pos[0])
     costheta = pos[2] / r
     sintheta = numpy.sqrt(1.0 - costheta**2.0)
-    mass = numpy.atleast_1d(mass)
-    Acos, Asin = numpy.zeros([N, L, L]), numpy.zeros([N, L, L])
+    # Radial part for all (n,l) at once
+    l = numpy.arange(0, L)[:, numpy.newaxis]
+    phinl = (
+        -((r / a) ** l)
+        / (1.0 + r / a) ** (2.0 * l + 1)
+        * _C(_RToxi(r, a=a), N, L).reshape(N, L, len(r))
+    )
+    sums = numpy.zeros((2, N, L, M))
+    sqsums = numpy.zeros((2, N, L, M))
     Pll = numpy.ones(len(r))  # Set up Assoc. Legendre recursion
-    # (n,l) dependent constant
-    n = numpy.arange(0, N)[:, numpy.newaxis]
-    l = numpy.arange(0, L)[numpy.newaxis, :]
+    for mm in range(M):  # Loop over m
+        mcs = mass * numpy.array([numpy.cos(phi * mm), numpy.sin(phi * mm)])
+        # Set up Assoc. Legendre recursion
+        Plm = Pll
+        Plmm1 = 0.0
+        for ll in range(mm, L):
+            terms = mcs[:, numpy.newaxis] * (phinl[:, ll] * Plm)
+            sums[:, :, ll, mm] = numpy.sum(terms, axis=-1)
+            sqsums[:, :, ll, mm] = numpy.sum(terms**2.0, axis=-1)
+            # Recurse Assoc. Legendre
+            tmp = Plm
+            Plm = ((2 * ll + 1.0) * costheta * Plm - (ll + mm) * Plmm1) / (ll - mm + 1)
+            Plmm1 = tmp
+        # Recurse Assoc. Legendre
+        Pll = -Pll * (2 * mm + 1.0) * sintheta
+    # Return a single array, such that the results can be gathered by parallel_map
+    return numpy.concatenate((sums.flatten(), sqsums.flatten(), [len(r)]))
+
+
+# Maximum number of elements of the (particles,N,L) work arrays in the default
+# chunking of the particles when computing the coefficients from an N-body
+_SCF_NBODY_MAXCHUNKELEM = 10**7
+
+
+def _scf_compute_coeffs_nbody_chunked(
+    pos, N, L, M, mass, a, chunksize, numcores, return_variance
+):
+    """Accumulate the particle sums of the expansion coefficients over chunks of particles, possibly in parallel, and normalize them"""
+    if isinstance(pos, (numpy.ndarray, list, tuple)):
+        # Array (or memory-mapped array) input: split into chunks
+        npart = len(pos[0])
+        if chunksize is None:
+            # Bound the memory of the (particles,N,L) work arrays
+            chunksize = max(1, _SCF_NBODY_MAXCHUNKELEM // (N * L))
+        starts = range(0, npart, chunksize)
+        mass_is_array = numpy.ndim(mass) > 0
+
+        def process_chunk(start):
+            sl = slice(start, start + chunksize)
+            return _scf_compute_coeffs_nbody_sums(
+                [pos[0][sl], pos[1][sl], pos[2][sl]],
+                mass[sl] if mass_is_array else mass,
+                N,
+                L,
+                M,
+                a,
+            )
+
+        batches = [(process_chunk, starts)]
+    else:
+        # Iterator input: process numcores blocks at a time
+        def batch_blocks():
+            blocks = []
+            for block in pos:
+                blocks.append(block if isinstance(block, tuple) else (block, mass))
+                if len(blocks) == numcores:
+                    yield blocks
+                    blocks = []
+            if len(blocks) > 0:
+                yield blocks
+
+        batches = (
+            (
+                lambda ii, blocks=blocks: _scf_compute_coeffs_nbody_sums(
+                    blocks[ii][0], blocks[ii][1], N, L, M, a
+                ),
+                range(len(blocks)),
+            )
+            for blocks in batch_blocks()
+        )
+    sums = numpy.zeros((2, N, L, M))
+    sqsums = numpy.zeros((2, N, L, M))
+    npart = 0
+    for func, seq in batches:
+        if numcores == 1:
+            results = map(func, seq)
+        else:
+            results = multi.parallel_map(func, seq, numcores=numcores)
+        for result in results:
+            sums += result[: sums.size].reshape(sums.shape)
+            sqsums += result[sums.size : 2 * sums.size].reshape(sums.shape)
+            npart += result[-1]
+    # (n,l,m) dependent normalization
+    n = numpy.arange(0, N)[:, numpy.newaxis, numpy.newaxis]
+    l = numpy.arange(0, L)[numpy.newaxis, :, numpy.newaxis]
+    m = numpy.arange(0, M)[numpy.newaxis, numpy.newaxis, :]
     Knl = 0.5 * n * (n + 4.0 * l + 3.0) + (l + 1) * (2.0 * l + 1.0)
     Inl = (
         -Knl
@@ -1111,40 +1278,31 @@ def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
         / (n + 2.0 * l + 1.5)
         / gamma(2.0 * l + 1.5) ** 2
     )
-    for mm in range(L):  # Loop over m
-        cosmphi = numpy.cos(phi * mm)
-        sinmphi = numpy.sin(phi * mm)
-        # Set up Assoc. Legendre recursion
-        Plm = Pll
-        Plmm1 = 0.0
-        for ll in range(mm, L):
-            # Compute Gegenbauer polys for this l
-            Cn = _C(_RToxi(r, a=a), N, ll, singleL=True)
-            phinlm = -((r / a) ** ll) / (1.0 + r / a) ** (2.0 * ll + 1) * Cn[:, 0] * Plm
-            # Acos
-            Sum = numpy.sqrt(
-                (2.0 * ll + 1) * gamma(ll - mm + 1) / gamma(ll + mm + 1)
-            ) * numpy.sum((mass * cosmphi)[numpy.newaxis, :] * phinlm, axis=-1)
-            Acos[:, ll, mm] = Sum / Inl[:, ll]
-            # Asin
-            Sum = numpy.sqrt(
-                (2.0 * ll + 1) * gamma(ll - mm + 1) / gamma(ll + mm + 1)
-            ) * numpy.sum((mass * sinmphi)[numpy.newaxis, :] * phinlm, axis=-1)
-            Asin[:, ll, mm] = Sum / Inl[:, ll]
-            # Recurse Assoc. Legendre
-            if ll < L:
-                tmp = Plm
-                Plm = ((2 * ll + 1.0) * costheta * Plm - (ll + mm) * Plmm1) / (
-                    ll - mm + 1
-                )
-                Plmm1 = tmp
-        # Recurse Assoc. Legendre
-        Pll *= -(2 * mm + 1.0) * sintheta
-    return Acos, Asin
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        norm = numpy.where(
+            m <= l,
+            numpy.sqrt((2.0 * l + 1) * gamma(numpy.fabs(l - m) + 1) / gamma(l + m + 1))
+            / Inl,
+            0.0,
+        )
+    Acos = sums[0] * norm
+    Asin = sums[1] * norm if M > 1 else None
+    if not return_variance:
+        return Acos, Asin
+    # Variance of a sum over randomly-sampled particles
+    variance = (sqsums - sums**2.0 / npart) * norm**2.0
+    return Acos, Asin, variance[0], variance[1] if M > 1 else None
 
 
 def scf_compute_coeffs(
-    dens, N, L, a=1.0, radial_order=None, costheta_order=None, phi_order=None
+    dens,
+    N,
+    L,
+    a=1.0,
+    radial_order=None,
+    costheta_order=None,
+    phi_order=None,
+    cache=None,
 ):
     """
     NAME:
@@ -1171,6 +1329,8 @@ def scf_compute_coeffs(
 
        phi_order - Number of sample points of the phi integral. If None, If costheta_order=max(20, L + 1)
 
+       cache= (None) if set to a directory, the coefficients are stored in a file in this directory whose name contains a hash of the density and all other inputs (and the galpy version); when such a file already exists, the coefficients are read from it rather than computed
+
     OUTPUT:
 
        (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
@@ -1179,7 +1339,30 @@ def scf_compute_coeffs(
 
        2016-05-27 - Written - Aladdin Seaifan (UofT)
 
+       2026-10-19 - Added cache=
+
     """
+    if cache is not None:
+        return _scf_compute_coeffs_cached(
+            cache,
+            lambda: scf_compute_coeffs(
+                dens,
+                N,
+                L,
+                a=a,
+                radial_order=radial_order,
+                costheta_order=costheta_order,
+                phi_order=phi_order,
+            ),
+            "scf_compute_coeffs",
+            dens,
+            N,
+            L,
+            a,
+            radial_order,
+            costheta_order,
+            phi_order,
+        )
     dens_kw = _scf_compute_determine_dens_kwargs(dens, [0.1, 0.1, 0.1])
 
     def integrand(xi, costheta, phi):
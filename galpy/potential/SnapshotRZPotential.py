@@ -30,6 +30,9 @@ class SnapshotRZPotential(Potential):
     are returned and not recalculated.
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_point_hash",)
+
     def __init__(self, s, num_threads=None, nazimuths=4, ro=None, vo=None):
         """
         NAME:
@@ -27,6 +27,9 @@ class SoftenedNeedleBarPotential(Potential):
 
     """
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_force_hash", "_cached_Fx", "_cached_Fy", "_cached_Fz")
+
     def __init__(
         self,
         amp=1.0,
@@ -8,6 +8,7 @@ from numbers import Number
 
 from numpy import empty
 
+from ..util import conversion
 from .WrapperPotential import parentWrapperPotential
 
 
@@ -24,7 +25,16 @@ class TimeDependentAmplitudeWrapperPotential(parentWrapperPotential):
     Note that `amp` itself can already be a function of time.
     """
 
-    def __init__(self, amp=1.0, A=None, pot=None, ro=None, vo=None):
+    def __init__(
+        self,
+        amp=1.0,
+        A=None,
+        pot=None,
+        tabulate=None,
+        tabulate_tol=1e-10,
+        ro=None,
+        vo=None,
+    ):
         """
         NAME:
 
@@ -42,6 +52,10 @@ class TimeDependentAmplitudeWrapperPotential(parentWrapperPotential):
 
            pot - Potential instance or list thereof; the amplitude of this will modified by this wrapper
 
+           tabulate= (None) if set to [tmin,tmax] (can be Quantities), tabulate the function of time on a cubic-spline table covering this time range for orbit integration in C, such that the integration does not need to call back into Python within this range (outside of it, the function is called directly)
+
+           tabulate_tol= (1e-10) relative accuracy of the spline table
+
         OUTPUT:
 
            (none)
@@ -50,6 +64,8 @@ class TimeDependentAmplitudeWrapperPotential(parentWrapperPotential):
 
            2022-03-29 - Started - Bovy (UofT)
 
+           2026-10-19 - Added tabulate=
+
         """
         if not callable(A):
             raise TypeError(
@@ -72,6 +88,14 @@ class TimeDependentAmplitudeWrapperPotential(parentWrapperPotential):
                 "A= function needs to return a number (specifically, a numbers.Number)"
             )
         self._A = A
+        if tabulate is None:
+            self._tfuncs_tabulate = None
+        else:
+            self._tfuncs_tabulate = (
+                conversion.parse_time(tabulate[0], ro=self._ro, vo=self._vo),
+                conversion.parse_time(tabulate[1], ro=self._ro, vo=self._vo),
+                tabulate_tol,
+            )
         self.hasC = True
         self.hasC_dxdv = True
 
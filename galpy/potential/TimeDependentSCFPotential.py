@@ -0,0 +1,359 @@
+###############################################################################
+#   TimeDependentSCFPotential.py: SCF potential with expansion coefficients
+#                                 that are interpolated in time
+###############################################################################
+import numpy
+
+from ..util import conversion
+from ..util._table_cache import memmap_npz_member, save_table
+from .NumericalPotentialDerivativesMixin import NumericalPotentialDerivativesMixin
+from .Potential import Potential, PotentialError
+from .SCFPotential import (
+    SCFPotential,
+    scf_compute_coeffs_axi_nbody,
+    scf_compute_coeffs_nbody,
+    scf_compute_coeffs_spherical_nbody,
+)
+
+
+class TimeDependentSCFPotential(SCFPotential):
+    """Class that implements a `Hernquist & Ostriker (1992) <http://adsabs.harvard.edu/abs/1992ApJ...386..375H>`_ Self-Consistent-Field-type potential (see :ref:`SCFPotential <scf_potential>`) with expansion coefficients that are given on a grid of times, for example, computed from the snapshots of a simulation
+
+    .. math::
+
+        \\Phi(r,\\theta,\\phi,t) = \\sum_{n,l,m} N_{lm} P_{lm}(\\cos(\\theta))  \\tilde{\\Phi}_{nl}(r) \\left(A_{cos, nlm}(t) \\cos(m\\phi) + A_{sin, nlm}(t) \\sin(m\\phi)\\right)
+
+    where the coefficients :math:`A_{cos, nlm}(t)` and :math:`A_{sin, nlm}(t)` are interpolated linearly or using cubic Hermite interpolation between the times of the grid. Before the first and after the last time of the grid, the coefficients are held fixed at their first and last values, respectively.
+    """
+
+    # Attributes that hold cached values or the coefficients at the current
+    # time, which content_hash ignores
+    _content_hash_exclude = ("_current_t", "_Acos", "_Asin")
+
+    def __init__(
+        self,
+        amp=1.0,
+        Acos=None,
+        Asin=None,
+        tgrid=None,
+        a=1.0,
+        interp="linear",
+        normalize=False,
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+            __init__
+
+        PURPOSE:
+
+            initialize a time-dependent SCF Potential from a time series of expansion coefficients
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1); can be a Quantity with units of mass or Gxmass
+
+           Acos - The real part of the expansion coefficients at each time (ntxNxLxL array, or optionally ntxNxLx1 if Asin=None); can be a numpy.memmap, in which case only the coefficients at the required times are read from disk when evaluating the potential in python
+
+           Asin - The imaginary part of the expansion coefficients at each time (ntxNxLxL array or None)
+
+           tgrid - times of the coefficients (array with length nt, in increasing order; can be Quantity)
+
+           a - scale length (can be Quantity)
+
+           interp= ('linear') interpolation in time: 'linear' or 'cubic' (cubic Hermite interpolation)
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           TimeDependentSCFPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        NumericalPotentialDerivativesMixin.__init__(self, {})
+        Potential.__init__(self, amp=amp / 2.0, ro=ro, vo=vo, amp_units="mass")
+        a = conversion.parse_length(a, ro=self._ro)
+        if Acos is None or tgrid is None:
+            raise PotentialError(
+                "TimeDependentSCFPotential requires the coefficients Acos and their times tgrid"
+            )
+        tgrid = numpy.array(
+            conversion.parse_time(numpy.asanyarray(tgrid), ro=self._ro, vo=self._vo)
+        )
+        shape = Acos.shape
+        if len(shape) != 4:
+            raise PotentialError(
+                "Acos must be a 4 dimensional array with shape (nt,N,L,M)"
+            )
+        if tgrid.ndim != 1 or len(tgrid) != shape[0] or len(tgrid) < 2:
+            raise PotentialError(
+                "tgrid must be a 1D array with at least two times and with the same length as the first dimension of Acos"
+            )
+        if numpy.any(numpy.diff(tgrid) <= 0.0):
+            raise PotentialError("tgrid must be strictly increasing")
+        if Asin is not None and Asin.shape != shape:
+            raise PotentialError("The shape of Asin does not match the shape of Acos.")
+        if Asin is None and shape[3] != 1 and shape[2] != shape[3]:
+            raise PotentialError(
+                "The fourth dimension must have length=1 or equal to the length of the third dimension"
+            )
+        if interp.lower() not in ["linear", "cubic"]:
+            raise PotentialError("interp= must be 'linear' or 'cubic'")
+        self._cubic = interp.lower() == "cubic"
+        self._a = a
+        self._tgrid = tgrid
+        # Keep the (possibly memory-mapped) input arrays and apply the
+        # normalization after interpolating in time
+        self._Acos_t = Acos
+        self._Asin_t = Asin
+        self._NN = self._Nroot(shape[2], shape[3])
+        self.isNonAxi = Asin is not None and shape[3] > 1
+        self._current_t = None
+        self._force_hash = None
+        self.hasC = True
+        self.hasC_dxdv = True
+        self.hasC_dens = True
+        self._set_time(0.0)
+        if normalize or (
+            isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
+        ):
+            self.normalize(normalize)
+        return None
+
+    @classmethod
+    def from_nbody(
+        cls,
+        pos,
+        tgrid,
+        N,
+        L=None,
+        mass=1.0,
+        a=1.0,
+        symmetry=None,
+        interp="linear",
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+            from_nbody
+
+        PURPOSE:
+
+            initialize a time-dependent SCF Potential from a series of N-body snapshots
+
+        INPUT:
+
+           pos - positions of the particles in each snapshot in rectangular coordinates: an array with shape [nt,3,n] or a list of nt arrays with shape [3,n_i]
+
+           tgrid - times of the snapshots (can be Quantity)
+
+           N - size of the Nth dimension of the expansion coefficients
+
+           L - size of the Lth and Mth dimension of the expansion coefficients (not used for spherical symmetry)
+
+           mass= (1.) mass of the particles (scalar, array with size n, or a list of these for each snapshot)
+
+           a= (1.) expansion scale length
+
+           symmetry= (None) symmetry of the potential to assume: 'spherical', 'axisymmetry', or None (for the general, non-axisymmetric case)
+
+           interp= ('linear') interpolation in time: 'linear' or 'cubic'
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           TimeDependentSCFPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        if not isinstance(mass, (list, tuple)):
+            mass = [mass] * len(pos)
+        Acos, Asin = [], []
+        for tpos, tmass in zip(pos, mass):
+            if symmetry is not None and symmetry.startswith("spher"):
+                tAcos, tAsin = scf_compute_coeffs_spherical_nbody(
+                    tpos, N, mass=tmass, a=a
+                )
+            elif symmetry is not None and symmetry.startswith("axi"):
+                tAcos, tAsin = scf_compute_coeffs_axi_nbody(tpos, N, L, mass=tmass, a=a)
+            else:
+                tAcos, tAsin = scf_compute_coeffs_nbody(tpos, N, L, mass=tmass, a=a)
+            Acos.append(tAcos)
+            Asin.append(tAsin)
+        return cls(
+            Acos=numpy.array(Acos),
+            Asin=None if Asin[0] is None else numpy.array(Asin),
+            tgrid=tgrid,
+            a=a,
+            interp=interp,
+            ro=ro,
+            vo=vo,
+        )
+
+    def save(self, filename):
+        """
+        NAME:
+
+           save
+
+        PURPOSE:
+
+           save the coefficient time series to a file, such that it can be loaded (and memory-mapped) with TimeDependentSCFPotential.from_file
+
+        INPUT:
+
+           filename - name of the file (a .npz file, written without compression)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        coeffs = {"Acos": self._Acos_t}
+        if self._Asin_t is not None:
+            coeffs["Asin"] = self._Asin_t
+        save_table(
+            filename,
+            amp=2.0 * self._amp,
+            a=self._a,
+            tgrid=self._tgrid,
+            cubic=self._cubic,
+            ro=self._ro if self._roSet else numpy.nan,
+            vo=self._vo if self._voSet else numpy.nan,
+            **coeffs,
+        )
+        return None
+
+    @classmethod
+    def from_file(cls, filename, mmap=True):
+        """
+        NAME:
+
+           from_file
+
+        PURPOSE:
+
+           load a coefficient time series saved with TimeDependentSCFPotential.save
+
+        INPUT:
+
+           filename - name of the file
+
+           mmap= (True) if True, memory-map the coefficients rather than reading them into memory
+
+        OUTPUT:
+
+           TimeDependentSCFPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        with numpy.load(filename) as data:
+            coeffs = {}
+            for name in ["Acos", "Asin"]:
+                if not name in data.files:
+                    coeffs[name] = None
+                elif mmap:
+                    coeffs[name] = memmap_npz_member(filename, name)
+                else:
+                    coeffs[name] = data[name]
+            return cls(
+                amp=float(data["amp"]),
+                a=float(data["a"]),
+                tgrid=data["tgrid"],
+                interp="cubic" if data["cubic"] else "linear",
+                ro=None if numpy.isnan(data["ro"]) else float(data["ro"]),
+                vo=None if numpy.isnan(data["vo"]) else float(data["vo"]),
+                **coeffs,
+            )
+
+    def _set_time(self, t):
+        """Set the coefficients used by the SCFPotential methods to those at (scalar) time t"""
+        if t == self._current_t:
+            return None
+        indx, weights = _time_weights(self._tgrid, t, self._cubic)
+        self._Acos = numpy.tensordot(weights, self._Acos_t[indx], axes=1) * self._NN
+        if self._Asin_t is None:
+            self._Asin = numpy.zeros_like(self._Acos)
+        else:
+            self._Asin = numpy.tensordot(weights, self._Asin_t[indx], axes=1) * self._NN
+        self._current_t = t
+        self._force_hash = None
+        return None
+
+    def _evaluate_in_time(self, method, t, **kwargs):
+        """Evaluate an SCFPotential method at time t, which can be an array, in which case the coefficients are set once for each unique time"""
+        if numpy.ndim(t) == 0:
+            self._set_time(t)
+            return method(self, t=t, **kwargs)
+        names = [name for name in kwargs if kwargs[name] is not None]
+        bcast = numpy.broadcast_arrays(t, *[kwargs[name] for name in names])
+        t, out = bcast[0], None
+        for tt in numpy.unique(t):
+            indx = t == tt
+            kwargs.update({name: arr[indx] for name, arr in zip(names, bcast[1:])})
+            self._set_time(tt)
+            tout = method(self, t=tt, **kwargs)
+            if out is None:
+                out = numpy.empty(t.shape, dtype=numpy.result_type(tout))
+            out[indx] = tout
+        return out
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._evaluate_in_time(SCFPotential._evaluate, t, R=R, z=z, phi=phi)
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._evaluate_in_time(SCFPotential._Rforce, t, R=R, z=z, phi=phi)
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._evaluate_in_time(SCFPotential._zforce, t, R=R, z=z, phi=phi)
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._evaluate_in_time(SCFPotential._phitorque, t, R=R, z=z, phi=phi)
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        return self._evaluate_in_time(SCFPotential._dens, t, R=R, z=z, phi=phi)
+
+    def _mass(self, R, z=None, t=0.0):
+        return self._evaluate_in_time(SCFPotential._mass, t, R=R, z=z)
+
+
+def _time_weights(tgrid, t, cubic):
+    """Indices and weights of the coefficients that contribute at time t for linear or cubic Hermite interpolation; the coefficients are held fixed outside of the time grid"""
+    nt = len(tgrid)
+    ii = min(max(numpy.searchsorted(tgrid, t, side="right") - 1, 0), nt - 2)
+    h = tgrid[ii + 1] - tgrid[ii]
+    u = min(max((t - tgrid[ii]) / h, 0.0), 1.0)
+    if not cubic:
+        return numpy.array([ii, ii + 1]), numpy.array([1.0 - u, u])
+    # Hermite basis, with finite-difference slopes at the nodes
+    u2, u3 = u * u, u * u * u
+    weights = numpy.zeros(nt)
+    weights[ii] += 2.0 * u3 - 3.0 * u2 + 1.0
+    weights[ii + 1] += -2.0 * u3 + 3.0 * u2
+    for jj, hw in zip([ii, ii + 1], [u3 - 2.0 * u2 + u, u3 - u2]):
+        jp, jm = min(jj + 1, nt - 1), max(jj - 1, 0)
+        weights[jp] += hw * h / (tgrid[jp] - tgrid[jm])
+        weights[jm] -= hw * h / (tgrid[jp] - tgrid[jm])
+    indx = numpy.arange(max(ii - 1, 0), min(ii + 3, nt))
+    return indx, weights[indx]
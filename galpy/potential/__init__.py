@@ -4,8 +4,10 @@ from . import (
     AnySphericalPotential,
     BurkertPotential,
     ChandrasekharDynamicalFrictionForce,
+    CompiledPotential,
     CorotatingRotationWrapperPotential,
     CosmphiDiskPotential,
+    CylindricalFourierExpansionPotential,
     DehnenBarPotential,
     DehnenSmoothWrapperPotential,
     DiskSCFPotential,
@@ -26,7 +28,9 @@ from . import (
     LogarithmicHaloPotential,
     MiyamotoNagaiPotential,
     MN3ExponentialDiskPotential,
+    MovingObjectPopulationPotential,
     MovingObjectPotential,
+    MultipoleExpansionPotential,
     NonInertialFrameForce,
     NullPotential,
     NumericalPotentialDerivativesMixin,
@@ -48,10 +52,12 @@ from . import (
     SpiralArmsPotential,
     SteadyLogSpiralPotential,
     TimeDependentAmplitudeWrapperPotential,
+    TimeDependentSCFPotential,
     TransientLogSpiralPotential,
     TriaxialGaussianPotential,
     TwoPowerSphericalPotential,
     TwoPowerTriaxialPotential,
+    interp3DPotential,
     interpRZPotential,
     interpSphericalPotential,
     linearPotential,
@@ -80,6 +86,7 @@ evaluatephi2derivs = Potential.evaluatephi2derivs
 evaluateRphiderivs = Potential.evaluateRphiderivs
 evaluatephizderivs = Potential.evaluatephizderivs
 evaluater2derivs = Potential.evaluater2derivs
+evaluate_on_grid = Potential.evaluate_on_grid
 RZToplanarPotential = planarPotential.RZToplanarPotential
 toPlanarPotential = planarPotential.toPlanarPotential
 RZToverticalPotential = verticalPotential.RZToverticalPotential
@@ -124,6 +131,12 @@ scf_compute_coeffs_nbody = SCFPotential.scf_compute_coeffs_nbody
 scf_compute_coeffs_spherical = SCFPotential.scf_compute_coeffs_spherical
 scf_compute_coeffs_axi = SCFPotential.scf_compute_coeffs_axi
 scf_compute_coeffs = SCFPotential.scf_compute_coeffs
+multipole_compute_coeffs_nbody = (
+    MultipoleExpansionPotential.multipole_compute_coeffs_nbody
+)
+cylindrical_fourier_compute_coeffs_nbody = (
+    CylindricalFourierExpansionPotential.cylindrical_fourier_compute_coeffs_nbody
+)
 rtide = Potential.rtide
 ttensor = Potential.ttensor
 flatten = Potential.flatten
@@ -165,6 +178,9 @@ DehnenBarPotential = DehnenBarPotential.DehnenBarPotential
 SteadyLogSpiralPotential = SteadyLogSpiralPotential.SteadyLogSpiralPotential
 TransientLogSpiralPotential = TransientLogSpiralPotential.TransientLogSpiralPotential
 MovingObjectPotential = MovingObjectPotential.MovingObjectPotential
+MovingObjectPopulationPotential = (
+    MovingObjectPopulationPotential.MovingObjectPopulationPotential
+)
 EllipticalDiskPotential = EllipticalDiskPotential.EllipticalDiskPotential
 LopsidedDiskPotential = CosmphiDiskPotential.LopsidedDiskPotential
 CosmphiDiskPotential = CosmphiDiskPotential.CosmphiDiskPotential
@@ -204,12 +220,19 @@ NumericalPotentialDerivativesMixin = (
 )
 HomogeneousSpherePotential = HomogeneousSpherePotential.HomogeneousSpherePotential
 interpSphericalPotential = interpSphericalPotential.interpSphericalPotential
+interp3DPotential = interp3DPotential.interp3DPotential
+MultipoleExpansionPotential = MultipoleExpansionPotential.MultipoleExpansionPotential
+CylindricalFourierExpansionPotential = (
+    CylindricalFourierExpansionPotential.CylindricalFourierExpansionPotential
+)
+TimeDependentSCFPotential = TimeDependentSCFPotential.TimeDependentSCFPotential
 TriaxialGaussianPotential = TriaxialGaussianPotential.TriaxialGaussianPotential
 KingPotential = KingPotential.KingPotential
 AnyAxisymmetricRazorThinDiskPotential = (
     AnyAxisymmetricRazorThinDiskPotential.AnyAxisymmetricRazorThinDiskPotential
 )
 AnySphericalPotential = AnySphericalPotential.AnySphericalPotential
+CompiledPotential = CompiledPotential.CompiledPotential
 # Wrappers
 DehnenSmoothWrapperPotential = DehnenSmoothWrapperPotential.DehnenSmoothWrapperPotential
 SolidBodyRotationWrapperPotential = (
@@ -0,0 +1,447 @@
+###############################################################################
+#   interp3DPotential.py: interpolate a general, non-axisymmetric potential on
+#                         a (R,z,phi) grid for fast orbit integration
+###############################################################################
+import ctypes
+
+import numpy
+from numpy.ctypeslib import ndpointer
+
+from ..util import _load_extension_libs, conversion
+from .Potential import (
+    Potential,
+    PotentialError,
+    _check_c,
+    _evaluatephitorques,
+    _evaluatePotentials,
+    _evaluateRforces,
+    _evaluatezforces,
+    evaluatephi2derivs,
+    evaluatephizderivs,
+    evaluateR2derivs,
+    evaluateRphiderivs,
+    evaluateRzderivs,
+    evaluatez2derivs,
+)
+
+_lib, ext_loaded = _load_extension_libs.load_libgalpy()
+
+# Maximum number of points to interpolate at once, to limit memory use
+_INTERP_CHUNKSIZE = 2**16
+
+
+class interp3DPotential(Potential):
+    """Class that interpolates a general, non-axisymmetric potential on a grid in :math:`(R,z,\\phi)` for fast orbit integration. The potential and its forces are tabulated and evaluated using tricubic (Catmull-Rom) interpolation, which is done in the same way in Python and C. The interpolated potential can be made to rotate with a fixed pattern speed as
+
+    .. math::
+
+        \\Phi(R,z,\\phi,t) = \\Phi_{\\mathrm{tab}}(R,z,\\phi - \\Omega_b\\,t - \\mathrm{pa})
+
+    where :math:`\\Phi_{\\mathrm{tab}}` is the tabulated potential evaluated at :math:`t=0`.
+    """
+
+    def __init__(
+        self,
+        pot=None,
+        rgrid=(numpy.log(0.01), numpy.log(20.0), 101),
+        zgrid=(0.0, 1.0, 51),
+        nphi=64,
+        logR=True,
+        zsym=True,
+        phisym=1,
+        omegab=0.0,
+        pa=0.0,
+        use_c=True,
+        enable_c=True,
+        ro=None,
+        vo=None,
+    ):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           Initialize an interp3DPotential instance
+
+        INPUT:
+
+           pot - Potential instance or list of such instances to be interpolated (evaluated at t=0)
+
+           rgrid= R grid to be given to linspace as in rs= linspace(*rgrid)
+
+           zgrid= z grid to be given to linspace as in zs= linspace(*zgrid)
+
+           nphi= (64) number of points in the periodic phi grid
+
+           logR= (True) if True, rgrid is in the log of R so logrs= linspace(*rgrid)
+
+           zsym= (True) if True, the potential is assumed to be symmetric around z=0 (so you can use, e.g.,  zgrid=(0.,1.,51))
+
+           phisym= (1) the potential is assumed to be symmetric under rotations by 2pi/phisym (e.g., phisym=2 for a bar), such that only phi in [0,2pi/phisym) needs to be tabulated
+
+           omegab= (0.) pattern speed with which the interpolated potential rotates (can be Quantity)
+
+           pa= (0.) position angle of the interpolated potential at t=0 (can be Quantity)
+
+           use_c= (True) use C to speed up the calculation of the grid (if the potential has a C implementation)
+
+           enable_c= (True) enable the use of the C implementation of the interpolation for orbit integration
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from the potential to be interpolated)
+
+        OUTPUT:
+
+           instance
+
+        NOTES:
+
+           Outside of the grid, the Python methods evaluate the original potential, while the C implementation evaluates the interpolation at the nearest point on the grid; make sure that the grid covers the orbits that you integrate in C
+
+        HISTORY:
+
+           2026-10-19 - Written
+
+        """
+        if isinstance(pot, interp3DPotential):
+            raise PotentialError(
+                "Cannot setup interp3DPotential with another interp3DPotential"
+            )
+        # Propagate ro and vo
+        firstPot = pot[0] if isinstance(pot, list) else pot
+        roSet = ro is not None or firstPot._roSet
+        voSet = vo is not None or firstPot._voSet
+        if ro is None:
+            ro = firstPot._ro
+        if vo is None:
+            vo = firstPot._vo
+        Potential.__init__(self, amp=1.0, ro=ro, vo=vo)
+        # Turn off physical if it hadn't been on
+        if not roSet:
+            self._roSet = False
+        if not voSet:
+            self._voSet = False
+        self._origPot = pot
+        self._logR = logR
+        self._xgrid = numpy.linspace(*rgrid)
+        self._rgrid = numpy.exp(self._xgrid) if self._logR else self._xgrid
+        self._zgrid = numpy.linspace(*zgrid)
+        if len(self._xgrid) < 4 or len(self._zgrid) < 4 or nphi < 4:
+            raise PotentialError(
+                "interp3DPotential requires at least 4 grid points in each dimension"
+            )
+        self._zsym = zsym
+        self._nphi = nphi
+        self._period = 2.0 * numpy.pi / phisym
+        self._dx = self._xgrid[1] - self._xgrid[0]
+        self._dz = self._zgrid[1] - self._zgrid[0]
+        self._dphi = self._period / nphi
+        self._omegab = conversion.parse_frequency(omegab, ro=self._ro, vo=self._vo)
+        self._pa = conversion.parse_angle(pa)
+        # Evaluate the potential and forces on the grid
+        R, z, phi = numpy.meshgrid(
+            self._rgrid,
+            self._zgrid,
+            numpy.arange(nphi) * self._dphi,
+            indexing="ij",
+        )
+        grids = _eval_grids(pot, R.flatten(), z.flatten(), phi.flatten(), use_c)
+        # Pad the tables such that the interpolation stencil never needs to
+        # deal with the boundaries, done in the same way in Python and C
+        zmirror = self._zsym and self._zgrid[0] == 0.0
+        # Interleave the potential and the forces, such that all of them can be
+        # read at once at each grid point
+        self._tables = numpy.stack(
+            [
+                _pad_table(
+                    grid.reshape(R.shape),
+                    (-1 if ii == 2 else 1) if zmirror else None,
+                )
+                for ii, grid in enumerate(grids)
+            ],
+            axis=-1,
+        )
+        self.isNonAxi = True
+        self.hasC = bool(enable_c and ext_loaded)
+        self.hasC_dxdv = False
+        return None
+
+    def OmegaP(self):
+        """
+        NAME:
+           OmegaP
+        PURPOSE:
+           return the pattern speed
+        INPUT:
+           (none)
+        OUTPUT:
+           pattern speed
+        HISTORY:
+           2026-10-19 - Written
+        """
+        return self._omegab
+
+    def _interp(self, indx, R, z, phi, t, dR=0, dz=0, dphi=0, fallback=None):
+        """Interpolate table indx (0: potential, 1: Rforce, 2: zforce, 3: phitorque) or its first derivative, using fallback(pot,R,z,phi) outside of the grid"""
+        R, z, phi, t = numpy.broadcast_arrays(R, z, phi, t)
+        shape = R.shape
+        R, z, phi, t = R.flatten(), z.flatten(), phi.flatten(), t.flatten()
+        phi = phi - self._omegab * t - self._pa
+        with numpy.errstate(divide="ignore"):
+            x = numpy.log(R) if self._logR else R
+        zsign = numpy.where(z < 0.0, -1.0, 1.0) if self._zsym else numpy.ones_like(z)
+        az = zsign * z
+        ingrid = (
+            (x >= self._xgrid[0])
+            * (x <= self._xgrid[-1])
+            * (az >= self._zgrid[0])
+            * (az <= self._zgrid[-1])
+        )
+        out = numpy.empty(len(R))
+        stencil = numpy.arange(4)
+        for start in range(0, len(R), _INTERP_CHUNKSIZE):
+            chunk = numpy.arange(start, min(start + _INTERP_CHUNKSIZE, len(R)))
+            chunk = chunk[ingrid[chunk]]
+            if len(chunk) == 0:
+                continue
+            ii, wx = _cell_weights(
+                x[chunk], self._xgrid[0], self._dx, len(self._xgrid), dR
+            )
+            jj, wz = _cell_weights(
+                az[chunk], self._zgrid[0], self._dz, len(self._zgrid), dz
+            )
+            kk, wphi = _cell_weights(
+                numpy.mod(phi[chunk], self._period), 0.0, self._dphi, None, dphi
+            )
+            kk[kk >= self._nphi] -= self._nphi
+            vals = self._tables[
+                ii[:, None, None, None] + stencil[None, :, None, None],
+                jj[:, None, None, None] + stencil[None, None, :, None],
+                kk[:, None, None, None] + stencil[None, None, None, :],
+                indx,
+            ]
+            out[chunk] = numpy.einsum("nabc,na,nb,nc->n", vals, wx, wz, wphi)
+            # Derivatives with respect to the grid coordinates
+            if dR:
+                out[chunk] /= self._dx * (R[chunk] if self._logR else 1.0)
+            if dz:
+                out[chunk] /= self._dz
+            if dphi:
+                out[chunk] /= self._dphi
+            # z parity of the tabulated quantity and of its derivative
+            if (indx == 2) ^ bool(dz):
+                out[chunk] *= zsign[chunk]
+        if numpy.any(~ingrid):
+            out[~ingrid] = _eval_orig(
+                fallback, self._origPot, R[~ingrid], z[~ingrid], phi[~ingrid]
+            )
+        return out[0] if shape == () else out.reshape(shape)
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._interp(0, R, z, phi, t, fallback=_evaluatePotentials)
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._interp(1, R, z, phi, t, fallback=_evaluateRforces)
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._interp(2, R, z, phi, t, fallback=_evaluatezforces)
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._interp(3, R, z, phi, t, fallback=_evaluatephitorques)
+
+    # Second derivatives are the first derivatives of the interpolated forces
+    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+        return -self._interp(
+            1, R, z, phi, t, dR=1, fallback=_negative(evaluateR2derivs)
+        )
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+        return -self._interp(
+            2, R, z, phi, t, dz=1, fallback=_negative(evaluatez2derivs)
+        )
+
+    def _phi2deriv(self, R, z, phi=0.0, t=0.0):
+        return -self._interp(
+            3, R, z, phi, t, dphi=1, fallback=_negative(evaluatephi2derivs)
+        )
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+        return -self._interp(
+            1, R, z, phi, t, dz=1, fallback=_negative(evaluateRzderivs)
+        )
+
+    def _Rphideriv(self, R, z, phi=0.0, t=0.0):
+        return -self._interp(
+            1, R, z, phi, t, dphi=1, fallback=_negative(evaluateRphiderivs)
+        )
+
+    def _phizderiv(self, R, z, phi=0.0, t=0.0):
+        return -self._interp(
+            3, R, z, phi, t, dz=1, fallback=_negative(evaluatephizderivs)
+        )
+
+
+def _negative(func):
+    """Wrap a public function for a second derivative such that it returns minus the derivative in internal units, like the derivatives of the interpolated forces"""
+    return lambda pot, R, z, phi=None, t=0.0: -func(
+        pot, R, z, phi=phi, t=t, use_physical=False
+    )
+
+
+def _cell_weights(x, x0, dx, n, deriv):
+    """Determine the grid cell containing x (clamped to the grid if n is not None) and the Catmull-Rom weights (or those of its derivative) of the four points around it"""
+    u = (x - x0) / dx
+    if n is not None:
+        u = numpy.clip(u, 0.0, n - 1)
+    ii = numpy.floor(u).astype(int)
+    if n is not None:
+        ii = numpy.minimum(ii, n - 2)
+    s = u - ii
+    if deriv:
+        w = [
+            -1.5 * s**2 + 2.0 * s - 0.5,
+            4.5 * s**2 - 5.0 * s,
+            -4.5 * s**2 + 4.0 * s + 0.5,
+            1.5 * s**2 - s,
+        ]
+    else:
+        w = [
+            0.5 * (-(s**3) + 2.0 * s**2 - s),
+            0.5 * (3.0 * s**3 - 5.0 * s**2 + 2.0),
+            0.5 * (-3.0 * s**3 + 4.0 * s**2 + s),
+            0.5 * (s**3 - s**2),
+        ]
+    return (ii, numpy.array(w).T)
+
+
+def _pad_table(grid, zparity, periodic=True):
+    """Pad a (nR,nz,nphi) table with one point on either side in R and z and periodically in phi, such that the four-point stencil is always available; zparity= +1/-1 mirrors an even/odd table at z=0, None extrapolates; periodic=False does not pad the last axis"""
+    # phi: periodic
+    if periodic:
+        grid = numpy.concatenate((grid[:, :, -1:], grid, grid[:, :, :2]), axis=2)
+    # R: cubic extrapolation
+    grid = numpy.concatenate(
+        (
+            3.0 * grid[:1] - 3.0 * grid[1:2] + grid[2:3],
+            grid,
+            3.0 * grid[-1:] - 3.0 * grid[-2:-1] + grid[-3:-2],
+        ),
+        axis=0,
+    )
+    # z: mirror at z=0 or cubic extrapolation
+    if zparity is None:
+        zlow = 3.0 * grid[:, :1] - 3.0 * grid[:, 1:2] + grid[:, 2:3]
+    else:
+        zlow = zparity * grid[:, 1:2]
+    return numpy.concatenate(
+        (
+            zlow,
+            grid,
+            3.0 * grid[:, -1:] - 3.0 * grid[:, -2:-1] + grid[:, -3:-2],
+        ),
+        axis=1,
+    )
+
+
+def _eval_orig(func, pot, R, z, phi):
+    """Evaluate func(pot,R,z,phi=phi) on arrays, looping over the points for potentials that do not support array input"""
+    try:
+        out = func(pot, R, z, phi=phi, t=0.0)
+    except (TypeError, ValueError):
+        out = numpy.array(
+            [func(pot, r, zz, phi=p, t=0.0) for r, zz, p in zip(R, z, phi)]
+        )
+    return out * numpy.ones(len(R))
+
+
+def _eval_grids(pot, R, z, phi, use_c):
+    """Evaluate the potential, Rforce, zforce, and phitorque at a set of points at t=0, in C if possible"""
+    if use_c and ext_loaded and _check_c(pot):
+        out, err = calc_potential_forces_3d_c(pot, R, z, phi)
+        if err:  # potential could not be evaluated in C
+            out[0] = _eval_orig(_evaluatePotentials, pot, R, z, phi)
+        return out
+    return [
+        _eval_orig(func, pot, R, z, phi)
+        for func in (
+            _evaluatePotentials,
+            _evaluateRforces,
+            _evaluatezforces,
+            _evaluatephitorques,
+        )
+    ]
+
+
+def calc_potential_forces_3d_c(pot, R, z, phi, t=0.0):
+    """
+    NAME:
+       calc_potential_forces_3d_c
+    PURPOSE:
+       Use C to calculate the potential and forces at a set of points
+    INPUT:
+       pot - Potential or list of such instances
+       R, z, phi - positions (1D arrays)
+       t= (0.) time
+    OUTPUT:
+       (array (4,npts) of the potential, Rforce, zforce, and phitorque; error code, non-zero if the potential could not be evaluated in C)
+    HISTORY:
+       2026-10-19 - Written
+    """
+    from ..orbit.integrateFullOrbit import (  # here bc otherwise there is an infinite loop
+        _parse_pot,
+    )
+    from ..orbit.integratePlanarOrbit import _prep_tfuncs
+
+    # Parse the potential
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+
+    # Set up result arrays
+    out = numpy.zeros((4, len(R)))
+    err = ctypes.c_int(0)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    calc_potential_forces_3d_func = _lib.calc_potential_forces_3d
+    calc_potential_forces_3d_func.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_double,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.POINTER(ctypes.c_int),
+    ]
+
+    # Array requirements
+    R = numpy.require(R, dtype=numpy.float64, requirements=["C", "W"])
+    z = numpy.require(z, dtype=numpy.float64, requirements=["C", "W"])
+    phi = numpy.require(phi, dtype=numpy.float64, requirements=["C", "W"])
+    out = numpy.require(out, dtype=numpy.float64, requirements=["C", "W"])
+
+    # Run the C code
+    calc_potential_forces_3d_func(
+        len(R),
+        R,
+        z,
+        phi,
+        ctypes.c_double(t),
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        out[0],
+        out[1],
+        out[2],
+        out[3],
+        ctypes.byref(err),
+    )
+    return (out, err.value)
@@ -1,13 +1,16 @@
 import copy
 import ctypes
 import ctypes.util
+import os
 from functools import wraps
 
 import numpy
 from numpy.ctypeslib import ndpointer
 from scipy import interpolate
 
+from .. import __version__
 from ..util import _load_extension_libs, multi
+from ..util._table_cache import cache_table, content_hash, load_table
 from ..util.conversion import physical_conversion
 from .Potential import Potential
 
@@ -109,6 +112,7 @@ class interpRZPotential(Potential):
         enable_c=False,
         zsym=True,
         numcores=None,
+        cache=None,
     ):
         """
         NAME:
@@ -139,6 +143,8 @@ class interpRZPotential(Potential):
 
            numcores= if set to an integer, use this many cores (only used for vcirc, dvcircdR, epifreq, and verticalfreq; NOT NECESSARILY FASTER, TIME TO MAKE SURE)
 
+           cache= (None) if set to a directory, the interpolation grids are stored in a file in this directory whose name contains a hash of the potential, the grids, and the interpolated quantities; when such a file already exists, the grids are memory-mapped from it rather than computed, such that many processes can share a single table
+
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
         OUTPUT:
@@ -151,6 +157,8 @@ class interpRZPotential(Potential):
 
            2013-01-24 - Started with new implementation - Bovy (IAS)
 
+           2026-10-19 - Added cache=
+
         """
         if isinstance(RZPot, interpRZPotential):
             from ..potential import PotentialError
@@ -199,8 +207,36 @@ class interpRZPotential(Potential):
         self._enable_c = enable_c * ext_loaded
         self.hasC = self._enable_c
         self._zsym = zsym
+        # Load previously computed grids from the cache, if available
+        table = {}
+        if cache is not None:
+            cachefile = os.path.join(
+                cache,
+                "interpRZPotential-{}.npz".format(
+                    content_hash(
+                        __version__,
+                        RZPot,
+                        self._rgrid,
+                        self._zgrid,
+                        [
+                            interpPot,
+                            interpRforce,
+                            interpzforce,
+                            interpDens,
+                            interpvcirc,
+                            interpdvcircdr,
+                            interpepifreq,
+                            interpverticalfreq,
+                        ],
+                    )
+                ),
+            )
+            if os.path.exists(cachefile):
+                table = load_table(cachefile, mmap=True)
         if interpPot:
-            if use_c * ext_loaded:
+            if "potGrid" in table:
+                self._potGrid = table["potGrid"]
+            elif use_c * ext_loaded:
                 self._potGrid, err = calc_potential_c(
                     self._origPot, self._rgrid, self._zgrid
                 )
@@ -225,7 +261,9 @@ class interpRZPotential(Potential):
             if enable_c * ext_loaded:
                 self._potGrid_splinecoeffs = calc_2dsplinecoeffs_c(self._potGrid)
         if interpRforce:
-            if use_c * ext_loaded:
+            if "rforceGrid" in table:
+                self._rforceGrid = table["rforceGrid"]
+            elif use_c * ext_loaded:
                 self._rforceGrid, err = calc_potential_c(
                     self._origPot, self._rgrid, self._zgrid, rforce=True
                 )
@@ -250,7 +288,9 @@ class interpRZPotential(Potential):
             if enable_c * ext_loaded:
                 self._rforceGrid_splinecoeffs = calc_2dsplinecoeffs_c(self._rforceGrid)
         if interpzforce:
-            if use_c * ext_loaded:
+            if "zforceGrid" in table:
+                self._zforceGrid = table["zforceGrid"]
+            elif use_c * ext_loaded:
                 self._zforceGrid, err = calc_potential_c(
                     self._origPot, self._rgrid, self._zgrid, zforce=True
                 )
@@ -277,13 +317,16 @@ class interpRZPotential(Potential):
         if interpDens:
             from ..potential import evaluateDensities
 
-            densGrid = numpy.zeros((len(self._rgrid), len(self._zgrid)))
-            for ii in range(len(self._rgrid)):
-                for jj in range(len(self._zgrid)):
-                    densGrid[ii, jj] = evaluateDensities(
-                        self._origPot, self._rgrid[ii], self._zgrid[jj]
-                    )
-            self._densGrid = densGrid
+            if "densGrid" in table:
+                self._densGrid = table["densGrid"]
+            else:
+                densGrid = numpy.zeros((len(self._rgrid), len(self._zgrid)))
+                for ii in range(len(self._rgrid)):
+                    for jj in range(len(self._zgrid)):
+                        densGrid[ii, jj] = evaluateDensities(
+                            self._origPot, self._rgrid[ii], self._zgrid[jj]
+                        )
+                self._densGrid = densGrid
             if self._logR:
                 self._densInterp = interpolate.RectBivariateSpline(
                     self._logrgrid,
@@ -305,7 +348,9 @@ class interpRZPotential(Potential):
         if interpvcirc:
             from ..potential import vcirc
 
-            if not numcores is None:
+            if "vcircGrid" in table:
+                self._vcircGrid = table["vcircGrid"]
+            elif not numcores is None:
                 self._vcircGrid = multi.parallel_map(
                     (lambda x: vcirc(self._origPot, self._rgrid[x])),
                     list(range(len(self._rgrid))),
@@ -326,7 +371,9 @@ class interpRZPotential(Potential):
         if interpdvcircdr:
             from ..potential import dvcircdR
 
-            if not numcores is None:
+            if "dvcircdrGrid" in table:
+                self._dvcircdrGrid = table["dvcircdrGrid"]
+            elif not numcores is None:
                 self._dvcircdrGrid = multi.parallel_map(
                     (lambda x: dvcircdR(self._origPot, self._rgrid[x])),
                     list(range(len(self._rgrid))),
@@ -347,7 +394,9 @@ class interpRZPotential(Potential):
         if interpepifreq:
             from ..potential import epifreq
 
-            if not numcores is None:
+            if "epifreqGrid" in table:
+                self._epifreqGrid = table["epifreqGrid"]
+            elif not numcores is None:
                 self._epifreqGrid = numpy.array(
                     multi.parallel_map(
                         (lambda x: epifreq(self._origPot, self._rgrid[x])),
@@ -381,7 +430,9 @@ class interpRZPotential(Potential):
         if interpverticalfreq:
             from ..potential import verticalfreq
 
-            if not numcores is None:
+            if "verticalfreqGrid" in table:
+                self._verticalfreqGrid = table["verticalfreqGrid"]
+            elif not numcores is None:
                 self._verticalfreqGrid = multi.parallel_map(
                     (lambda x: verticalfreq(self._origPot, self._rgrid[x])),
                     list(range(len(self._rgrid))),
@@ -399,6 +450,36 @@ class interpRZPotential(Potential):
                 self._verticalfreqInterp = interpolate.InterpolatedUnivariateSpline(
                     self._rgrid, self._verticalfreqGrid, k=3
                 )
+        if cache is not None and not table:
+            cache_table(
+                cachefile,
+                **{
+                    f"{name}Grid": numpy.asarray(getattr(self, f"_{name}Grid"))
+                    for name, interp in zip(
+                        [
+                            "pot",
+                            "rforce",
+                            "zforce",
+                            "dens",
+                            "vcirc",
+                            "dvcircdr",
+                            "epifreq",
+                            "verticalfreq",
+                        ],
+                        [
+                            interpPot,
+                            interpRforce,
+                            interpzforce,
+                            interpDens,
+                            interpvcirc,
+                            interpdvcircdr,
+                            interpepifreq,
+                            interpverticalfreq,
+                        ],
+                    )
+                    if interp
+                },
+            )
         return None
 
     @scalarVectorDecorator
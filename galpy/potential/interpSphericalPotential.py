@@ -1,10 +1,14 @@
 ###################3###################3###################3##################
 # interpSphericalPotential.py: build spherical potential through interpolation
 ###################3###################3###################3##################
+import os
+
 import numpy
 from scipy import interpolate
 
+from .. import __version__
 from ..util._optional_deps import _JAX_LOADED
+from ..util._table_cache import cache_table, content_hash, load_table
 from ..util.conversion import get_physical, physical_compatible
 from .Potential import _evaluatePotentials, _evaluateRforces
 from .SphericalPotential import SphericalPotential
@@ -14,7 +18,7 @@ if _JAX_LOADED:
 
 
 class interpSphericalPotential(SphericalPotential):
-    """__init__(self,rforce=None,rgrid=numpy.geomspace(0.01,20,101),Phi0=None,ro=None,vo=None)
+    """__init__(self,rforce=None,rgrid=numpy.geomspace(0.01,20,101),Phi0=None,ro=None,vo=None,cache=None)
 
     Class that interpolates a spherical potential on a grid"""
 
@@ -25,8 +29,9 @@ class interpSphericalPotential(SphericalPotential):
         Phi0=None,
         ro=None,
         vo=None,
+        cache=None,
     ):
-        """__init__(self,rforce=None,rgrid=numpy.geomspace(0.01,20,101),Phi0=None,ro=None,vo=None)
+        """__init__(self,rforce=None,rgrid=numpy.geomspace(0.01,20,101),Phi0=None,ro=None,vo=None,cache=None)
 
         NAME:
 
@@ -46,6 +51,8 @@ class interpSphericalPotential(SphericalPotential):
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
+           cache= (None) if set to a directory, the tabulated forces are stored in a file in this directory whose name contains a hash of rforce, rgrid, and Phi0; when such a file already exists, the table is memory-mapped from it rather than computed, such that many processes can share a single table
+
         OUTPUT:
 
            (none)
@@ -54,6 +61,8 @@ class interpSphericalPotential(SphericalPotential):
 
            2020-07-13 - Written - Bovy (UofT)
 
+           2026-10-19 - Added cache=
+
         """
         SphericalPotential.__init__(self, amp=1.0, ro=ro, vo=vo)
         self._rgrid = rgrid
@@ -64,6 +73,16 @@ class interpSphericalPotential(SphericalPotential):
                 1e-3 if rgrid[0] == 0.0 else rgrid[0], rgrid[-1], 10001
             )
         )
+        table = {}
+        if cache is not None:
+            cachefile = os.path.join(
+                cache,
+                "interpSphericalPotential-{}.npz".format(
+                    content_hash(__version__, rforce, rgrid, Phi0)
+                ),
+            )
+            if os.path.exists(cachefile):
+                table = load_table(cachefile, mmap=True)
         # Determine whether rforce is a galpy Potential or list thereof
         try:
             _evaluateRforces(rforce, 1.0, 0.0)
@@ -73,7 +92,11 @@ class interpSphericalPotential(SphericalPotential):
         else:
             _rforce = lambda r: _evaluateRforces(rforce, r, 0.0)
             # Determine Phi0
-            Phi0 = _evaluatePotentials(rforce, rgrid[0], 0.0)
+            Phi0 = (
+                float(table["Phi0"])
+                if table
+                else _evaluatePotentials(rforce, rgrid[0], 0.0)
+            )
             # Also check that unit systems are compatible
             if not physical_compatible(self, rforce):
                 raise RuntimeError(
@@ -85,13 +108,26 @@ class interpSphericalPotential(SphericalPotential):
                 self.turn_physical_on(ro=phys["ro"])
             if phys["voSet"]:
                 self.turn_physical_on(vo=phys["vo"])
-        self._rforce_grid = numpy.array([_rforce(r) for r in rgrid])
+        if table:
+            self._rforce_grid = table["rforce_grid"]
+        else:
+            self._rforce_grid = numpy.array([_rforce(r) for r in rgrid])
         self._force_spline = interpolate.InterpolatedUnivariateSpline(
             self._rgrid, self._rforce_grid, k=3, ext=0
         )
-        self._rforce_jax_grid = numpy.array(
-            [self._force_spline(r) for r in self._rforce_jax_rgrid]
-        )
+        if table:
+            self._rforce_jax_grid = table["rforce_jax_grid"]
+        else:
+            self._rforce_jax_grid = numpy.array(
+                [self._force_spline(r) for r in self._rforce_jax_rgrid]
+            )
+        if cache is not None and not table:
+            cache_table(
+                cachefile,
+                rforce_grid=self._rforce_grid,
+                rforce_jax_grid=self._rforce_jax_grid,
+                Phi0=Phi0,
+            )
         # Get potential and r2deriv as splines for the integral and derivative
         self._pot_spline = self._force_spline.antiderivative()
         self._Phi0 = Phi0 + self._pot_spline(self._rgrid[0])
@@ -207,3 +207,77 @@ EXPORT void eval_zforce(int nR,
   free_potentialArgs(npot,potentialArgs);
   free(potentialArgs);
 }
+/*
+  Evaluate the potential and the forces at a set of (R,z,phi) points at time t;
+  the potential is only evaluated when all potentials have a C implementation
+  of it (wrappers do not evaluate the potential of non-axisymmetric wrapped
+  potentials correctly and are therefore excluded); otherwise err is set to 1
+  and the potential is not computed
+*/
+EXPORT void calc_potential_forces_3d(int npts,
+				     double *R,
+				     double *z,
+				     double *phi,
+				     double t,
+				     int npot,
+				     int * pot_type,
+				     double * pot_args,
+				     tfuncs_type_arr pot_tfuncs,
+				     double *outpot,
+				     double *outrforce,
+				     double *outzforce,
+				     double *outphitorque,
+				     int * err){
+  int ii, jj, tid, nthreads, do_pot;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+#ifdef _OPENMP
+  nthreads = omp_get_max_threads();
+#else
+  nthreads = 1;
+#endif
+  //Set up the potentials, one set / thread, because potentials may cache
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( nthreads * npot * sizeof (struct potentialArg) );
+  for (ii=0; ii < nthreads; ii++) {
+    thread_pot_type= pot_type;
+    thread_pot_args= pot_args;
+    thread_pot_tfuncs= pot_tfuncs;
+    parse_leapFuncArgs_Full(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+  do_pot= 1;
+  for (jj=0; jj < npot; jj++)
+    if ( (potentialArgs+jj)->potentialEval == NULL
+	 || (potentialArgs+jj)->wrappedPotentialArg != NULL )
+      do_pot= 0;
+  *err= 1 - do_pot;
+  //Run through the points and calculate
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(static,chunk) private(ii,tid,jj)	\
+  shared(npot,potentialArgs,R,z,phi,t,npts,do_pot)
+  for (ii=0; ii < npts; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( do_pot ) {
+      *(outpot+ii)= 0.;
+      for (jj=0; jj < npot; jj++)
+	*(outpot+ii)+= (potentialArgs+tid*npot+jj)->potentialEval(*(R+ii),
+								  *(z+ii),
+								  *(phi+ii),t,
+					  potentialArgs+tid*npot+jj);
+    }
+    *(outrforce+ii)= calcRforce(*(R+ii),*(z+ii),*(phi+ii),t,
+				npot,potentialArgs+tid*npot);
+    *(outzforce+ii)= calczforce(*(R+ii),*(z+ii),*(phi+ii),t,
+				npot,potentialArgs+tid*npot);
+    *(outphitorque+ii)= calcphitorque(*(R+ii),*(z+ii),*(phi+ii),t,
+				      npot,potentialArgs+tid*npot);
+  }
+  for (ii=0; ii < nthreads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
+  free(potentialArgs);
+}
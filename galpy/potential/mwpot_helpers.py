@@ -2,8 +2,15 @@
 # Milky-Way-like potentials
 # (for now, functions required to setup the Dehnen & Binney (1998),
 #  Binney & Tremaine (2008), and McMillan (2017) potentials)
+import os
+import warnings
+
 import numpy
 
+from .. import __version__
+from ..util import galpyWarning
+from ..util.config import __config__
+
 
 def expexp_dens(R, z, Rd, zd, Sigma0):
     """rho(R,z) = Sigma_0/(2zd) exp(-|z|/zd-R/Rd)"""
@@ -38,3 +45,22 @@ def pow_dens_with_cut(R, z, alpha, r0, rcut, rho0, q):
     r' = sqrt(R^2+z^2/q^2"""
     rdash = numpy.sqrt(R**2 + (z / q) ** 2)
     return rho0 / (rdash / r0) ** alpha * numpy.exp(-((rdash / rcut) ** 2))
+
+
+def _cache_dir():
+    """Directory in which to cache the tables of the Milky-Way models (None if caching is turned off or the directory cannot be created)"""
+    if not __config__.getboolean("cache", "mwpotentials"):
+        return None
+    cachedir = os.path.join(
+        os.path.expanduser(__config__.get("cache", "dir")),
+        f"mwpotentials-{__version__}",
+    )
+    try:
+        os.makedirs(cachedir, exist_ok=True)
+    except OSError as e:  # pragma: no cover
+        warnings.warn(
+            f'Could not create the cache directory {cachedir} for the Milky-Way models, because of "{type(e).__name__}: {e.__str__()}"; the models will not be cached',
+            galpyWarning,
+        )
+        return None
+    return cachedir
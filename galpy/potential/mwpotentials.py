@@ -1,6 +1,7 @@
 # galpy.potential.mwpotentials: Milky-Way-like potentials and tools for
 # working with MW-like potentials (bars, spirals, ...)
 import copy
+import importlib
 import os
 import sys
 
@@ -165,6 +166,65 @@ class _ExpensivePotentials:
             raise AttributeError(f"'module' object has no attribute '{name}'")
 
 
+# Models that are cached on disk: module, function in the module that sets
+# up the cached components of the model (reading the cache setting when it
+# is called), and the arguments of this function
+_CACHED_MODELS = {
+    "McMillan17": ("McMillan17", "_define_scf_components", ()),
+    "Cautun20": ("Cautun20", "_define_cached_components", ()),
+    "Irrgang13I": ("Irrgang13", "_halo_scf_coeffs", (1,)),
+    "Irrgang13II": ("Irrgang13", "_halo_scf_coeffs", (2,)),
+    "DehnenBinney98I": ("DehnenBinney98", "define_dehnenbinney98_models", (1,)),
+    "DehnenBinney98II": ("DehnenBinney98", "define_dehnenbinney98_models", (2,)),
+    "DehnenBinney98III": ("DehnenBinney98", "define_dehnenbinney98_models", (3,)),
+    "DehnenBinney98IV": ("DehnenBinney98", "define_dehnenbinney98_models", (4,)),
+}
+
+
+def warm_cache(models=None):
+    """
+    NAME:
+
+       warm_cache
+
+    PURPOSE:
+
+       set up the Milky-Way models that are expensive to compute (e.g., because they require SCF coefficients or an adiabatic contraction) and store their tables in the on-disk cache, such that any later process that loads these models reads the tables from the cache (e.g., run at install or deploy time)
+
+    INPUT:
+
+       models= (None) list of names of the models to set up (e.g., ['McMillan17','Cautun20']); default: all models that are cached
+
+    OUTPUT:
+
+       directory that holds the cache
+
+    HISTORY:
+
+       2026-10-19 - Written
+
+    """
+    from galpy.potential import mwpot_helpers
+
+    cachedir = mwpot_helpers._cache_dir()
+    if cachedir is None:
+        raise RuntimeError(
+            "Caching of the Milky-Way models is turned off in the configuration file"
+        )
+    if models is None:
+        models = list(_CACHED_MODELS.keys())
+    for model in models:
+        if model not in _CACHED_MODELS:
+            raise ValueError(f"Milky-Way model {model} is not cached")
+        modulename, funcname, args = _CACHED_MODELS[model]
+        # Set up the cached components again rather than relying on the
+        # module's, which may have been set up with a different cache setting;
+        # this only reads the tables if they are already in the cache
+        module = importlib.import_module(f"galpy.potential.{modulename}")
+        getattr(module, funcname)(*args)
+    return cachedir
+
+
 __all__ = ["MWPotential2014"]
 
 # The magic to make lazy-loading of expensive potentials possible
@@ -27,6 +27,9 @@ from .Potential import (
 class planarPotential:
     r"""Class representing 2D (R,\phi) potentials"""
 
+    # Attributes that hold cached values, which content_hash ignores
+    _content_hash_exclude = ("_tfuncs_tables_cache",)
+
     def __init__(self, amp=1.0, ro=None, vo=None):
         self._amp = amp
         self.dim = 2
@@ -1488,22 +1491,15 @@ def plotplanarPotentials(Pot, *args, **kwargs):
         if nonAxi:
             xs = numpy.linspace(xrange[0], xrange[1], gridx)
             ys = numpy.linspace(yrange[0], yrange[1], gridy)
-            potR = numpy.zeros((gridx, gridy))
-            for ii in range(gridx):
-                for jj in range(gridy):
-                    thisR = numpy.sqrt(xs[ii] ** 2.0 + ys[jj] ** 2.0)
-                    if xs[ii] >= 0.0:
-                        thisphi = numpy.arcsin(ys[jj] / thisR)
-                    else:
-                        thisphi = -numpy.arcsin(ys[jj] / thisR) + numpy.pi
-                    potR[ii, jj] = evaluateplanarPotentials(
-                        Pot, thisR, phi=thisphi, use_physical=False
-                    )
+            xgrid, ygrid = numpy.meshgrid(xs, ys, indexing="ij")
+            potR = _evaluateplanarPotentials_grid(
+                Pot,
+                numpy.sqrt(xgrid**2.0 + ygrid**2.0),
+                phi=numpy.arctan2(ygrid, xgrid),
+            )
         else:
             Rs = numpy.linspace(Rrange[0], Rrange[1], grid)
-            potR = numpy.zeros(grid)
-            for ii in range(grid):
-                potR[ii] = evaluateplanarPotentials(Pot, Rs[ii], use_physical=False)
+            potR = _evaluateplanarPotentials_grid(Pot, Rs)
         if not savefilename is None:
             print("Writing planar savefile " + savefilename + " ...")
             savefile = open(savefilename, "wb")
@@ -1540,3 +1536,26 @@ def plotplanarPotentials(Pot, *args, **kwargs):
         kwargs["ylabel"] = r"$\Phi(R)$"
         kwargs["xrange"] = Rrange
         return plot.plot(Rs, potR, *args, **kwargs)
+
+
+def _evaluateplanarPotentials_grid(Pot, R, phi=None):
+    """Evaluate a (list of) planarPotential(s) on an array of points in a single call, looping over the points for potentials that do not accept array input"""
+    shape = R.shape
+    R = R.flatten()
+    if phi is not None:
+        phi = phi.flatten()
+    try:
+        out = evaluateplanarPotentials(Pot, R, phi=phi, use_physical=False)
+    except (TypeError, ValueError):
+        out = numpy.array(
+            [
+                evaluateplanarPotentials(
+                    Pot,
+                    R[ii],
+                    phi=None if phi is None else phi[ii],
+                    use_physical=False,
+                )
+                for ii in range(len(R))
+            ]
+        )
+    return (out * numpy.ones(len(R))).reshape(shape)
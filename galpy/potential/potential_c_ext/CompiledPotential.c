@@ -0,0 +1,60 @@
+#include <galpy_potentials.h>
+// CompiledPotential: potential whose potential, forces, density, and second
+// derivatives are user-supplied compiled functions f(R,Z,phi,t); these are
+// passed as the functions of time and cast to their actual signature
+// 10 arguments: amp, the index of each function (Phi, Rforce, zforce,
+// phitorque, dens, R2deriv, phi2deriv, Rphideriv; -1 if not supplied) in the
+// tfuncs array, and the number of functions
+typedef double (*compiled_func_type)(double R,double Z,double phi,double t);
+static inline double CompiledPotentialCall(int ii,double R,double Z,
+					   double phi,double t,
+					   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  return *args * ((compiled_func_type) \
+		  *(potentialArgs->tfuncs + (int) *(args+1+ii)))(R,Z,phi,t);
+}
+double CompiledPotentialEval(double R,double Z, double phi,
+			     double t,
+			     struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(0,R,Z,phi,t,potentialArgs);
+}
+double CompiledPotentialRforce(double R,double Z, double phi,
+			       double t,
+			       struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(1,R,Z,phi,t,potentialArgs);
+}
+double CompiledPotentialzforce(double R,double Z, double phi,
+			       double t,
+			       struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(2,R,Z,phi,t,potentialArgs);
+}
+double CompiledPotentialphitorque(double R,double Z, double phi,
+				  double t,
+				  struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(3,R,Z,phi,t,potentialArgs);
+}
+double CompiledPotentialDens(double R,double Z, double phi,
+			     double t,
+			     struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(4,R,Z,phi,t,potentialArgs);
+}
+double CompiledPotentialPlanarRforce(double R,double phi,double t,
+				     struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(1,R,0.,phi,t,potentialArgs);
+}
+double CompiledPotentialPlanarphitorque(double R,double phi,double t,
+					struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(3,R,0.,phi,t,potentialArgs);
+}
+double CompiledPotentialPlanarR2deriv(double R,double phi,double t,
+				      struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(5,R,0.,phi,t,potentialArgs);
+}
+double CompiledPotentialPlanarphi2deriv(double R,double phi,double t,
+					struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(6,R,0.,phi,t,potentialArgs);
+}
+double CompiledPotentialPlanarRphideriv(double R,double phi,double t,
+					struct potentialArg * potentialArgs){
+  return CompiledPotentialCall(7,R,0.,phi,t,potentialArgs);
+}
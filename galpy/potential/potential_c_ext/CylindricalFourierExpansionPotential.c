@@ -0,0 +1,114 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//CylindricalFourierExpansionPotential: azimuthal Fourier harmonics tabulated
+//on a (R,z) grid and interpolated using bicubic (Catmull-Rom) interpolation
+//17 arguments: amp, M, nR, nz, R0, dR, z0, dz, zsym, totmass,
+//              cached (R,z,phi,t,Rforce,zforce,phitorque)
+//followed by the padded table of (pot,Rforce,zforce) for cos and sin for each
+//m at each of the (nR+2) x (nz+2) grid points and by scratch space for the
+//interpolated harmonics
+static void CylindricalFourierExpansionPotential_compute(double R,double z,
+							 double phi,
+							 double * args,
+							 double * out){
+  int ii, jj, ll, mm, m, pp;
+  int M= (int) *(args+1);
+  int nR= (int) *(args+2);
+  int nz= (int) *(args+3);
+  int nchannel= 6 * ( M + 1 );
+  double tR, tz, w, zsign, r, cosmphi, sinmphi;
+  double wR[4], wz[4];
+  double * node;
+  double * table= args + 17;
+  double * vals= table + nchannel * ( nR + 2 ) * ( nz + 2 );
+  zsign= ( (int) *(args+8) && z < 0. ) ? -1.: 1.;
+  if ( R > *(args+4) + ( nR - 1 ) * *(args+5)
+       || zsign * z < *(args+6) || zsign * z > *(args+6) + ( nz - 1 ) * *(args+7) ) {
+    // Outside of the grid: point mass
+    r= sqrt( R * R + z * z );
+    *out= - *(args+9) / r;
+    *(out+1)= - *(args+9) * R / r / r / r;
+    *(out+2)= - *(args+9) * z / r / r / r;
+    *(out+3)= 0.;
+    return;
+  }
+  ii= interp3D_cell(R,*(args+4),*(args+5),nR,&tR);
+  jj= interp3D_cell(zsign * z,*(args+6),*(args+7),nz,&tz);
+  interp3D_catmull_rom_weights(tR,wR);
+  interp3D_catmull_rom_weights(tz,wz);
+  for (pp=0; pp < nchannel; pp++)
+    *(vals+pp)= 0.;
+  for (ll=0; ll < 4; ll++)
+    for (mm=0; mm < 4; mm++) {
+      w= wR[ll] * wz[mm];
+      node= table + nchannel * ( ( ii + ll ) * ( nz + 2 ) + jj + mm );
+      for (pp=0; pp < nchannel; pp++)
+	*(vals+pp)+= w * *(node+pp);
+    }
+  for (pp=0; pp < 4; pp++)
+    *(out+pp)= 0.;
+  for (m=0; m <= M; m++) {
+    cosmphi= cos ( m * phi );
+    sinmphi= sin ( m * phi );
+    for (pp=0; pp < 3; pp++)
+      *(out+pp)+= *(vals+6*m+pp) * cosmphi + *(vals+6*m+3+pp) * sinmphi;
+    *(out+3)+= m * ( *(vals+6*m) * sinmphi - *(vals+6*m+3) * cosmphi );
+  }
+  *(out+2)*= zsign;
+}
+// Compute all forces at once and cache them
+static void CylindricalFourierExpansionPotential_forces(double R,double z,
+							double phi,double t,
+							double * args){
+  double out[4];
+  if ( R == *(args+10) && z == *(args+11) && phi == *(args+12)
+       && t == *(args+13) )
+    return;
+  CylindricalFourierExpansionPotential_compute(R,z,phi,args,out);
+  *(args+10)= R;
+  *(args+11)= z;
+  *(args+12)= phi;
+  *(args+13)= t;
+  *(args+14)= out[1];
+  *(args+15)= out[2];
+  *(args+16)= out[3];
+}
+double CylindricalFourierExpansionPotentialEval(double R,double z, double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double out[4];
+  CylindricalFourierExpansionPotential_compute(R,z,phi,args,out);
+  return *args * out[0];
+}
+double CylindricalFourierExpansionPotentialRforce(double R,double z, double phi,
+						  double t,
+						  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  CylindricalFourierExpansionPotential_forces(R,z,phi,t,args);
+  return *args * *(args+14);
+}
+double CylindricalFourierExpansionPotentialzforce(double R,double z, double phi,
+						  double t,
+						  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  CylindricalFourierExpansionPotential_forces(R,z,phi,t,args);
+  return *args * *(args+15);
+}
+double CylindricalFourierExpansionPotentialphitorque(double R,double z,
+						     double phi,double t,
+						     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  CylindricalFourierExpansionPotential_forces(R,z,phi,t,args);
+  return *args * *(args+16);
+}
+double CylindricalFourierExpansionPotentialPlanarRforce(double R,double phi,
+							double t,
+							struct potentialArg * potentialArgs){
+  return CylindricalFourierExpansionPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double CylindricalFourierExpansionPotentialPlanarphitorque(double R,double phi,
+							   double t,
+							   struct potentialArg * potentialArgs){
+  return CylindricalFourierExpansionPotentialphitorque(R,0.,phi,t,potentialArgs);
+}
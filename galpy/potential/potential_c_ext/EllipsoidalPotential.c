@@ -1,7 +1,17 @@
+#include <stdlib.h>
 #include <stdbool.h>
 #include <math.h>
 #include <bovy_coords.h>
 #include <galpy_potentials.h>
+#include <integrateFullOrbit.h>
+//Macros to export functions in DLL on different OS
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#elif defined(__GNUC__)
+#define EXPORT __attribute__((visibility("default")))
+#else
+#define EXPORT
+#endif
 //General routines for EllipsoidalPotentials
 double EllipsoidalPotentialEval(double R,double z, double phi,
 				double t,
@@ -281,3 +291,65 @@ double TriaxialJaffePotentialEval(double R,double z, double phi,
 }
 
 */
+/*
+  Array entry point: rectangular forces and, if do_2nd, second derivatives
+  (both without the amplitude) of a single EllipsoidalPotential at npts points
+  (x,y,z) in the aligned frame of the potential, parallelized over the points;
+  F has shape (npts,3) and d2 has shape (npts,6) with (xx,xy,xz,yy,yz,zz)
+*/
+EXPORT void EllipsoidalPotential_xyz_array(int npts,
+					   double * x,
+					   double * y,
+					   double * z,
+					   int * pot_type,
+					   double * pot_args,
+					   tfuncs_type_arr pot_tfuncs,
+					   int do_2nd,
+					   double * F,
+					   double * d2){
+  int ii, jj;
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(1,potentialArgs,&pot_type,&pot_args,&pot_tfuncs);
+  //Get args
+  double * args= potentialArgs->args;
+  double * ellipargs= args + 8 + (int) *(args+7); // *(args+7) = num. arguments dens
+  double b2= *ellipargs++;
+  double c2= *ellipargs++;
+  ellipargs+= 10; // aligned and rotation matrix, not used
+  int glorder= (int) *ellipargs++;
+  double * glx= ellipargs;
+  double * glw= ellipargs + glorder;
+#pragma omp parallel for schedule(static) private(ii,jj)
+  for (ii=0; ii < npts; ii++){
+    double t, m, td, tdd, xt, yt, zt;
+    double * Fi= F + 3 * ii;
+    double * d2i= d2 + 6 * ii;
+    *Fi= 0.;
+    *(Fi+1)= 0.;
+    *(Fi+2)= 0.;
+    if ( do_2nd )
+      for (jj=0; jj < 6; jj++) *(d2i+jj)= 0.;
+    for (jj=0; jj < glorder; jj++) {
+      t= 1. / *(glx+jj) / *(glx+jj) - 1.;
+      xt= *(x+ii) / ( 1. + t );
+      yt= *(y+ii) / ( b2 + t );
+      zt= *(z+ii) / ( c2 + t );
+      m= sqrt ( *(x+ii) * xt + *(y+ii) * yt + *(z+ii) * zt );
+      td= *(glw+jj) * potentialArgs->mdens(m,args+8);
+      *Fi+= td * xt;
+      *(Fi+1)+= td * yt;
+      *(Fi+2)+= td * zt;
+      if ( do_2nd ) {
+	tdd= *(glw+jj) * potentialArgs->mdensDeriv(m,args+8) / m;
+	*d2i-= tdd * xt * xt + td / ( 1. + t );
+	*(d2i+1)-= tdd * xt * yt;
+	*(d2i+2)-= tdd * xt * zt;
+	*(d2i+3)-= tdd * yt * yt + td / ( b2 + t );
+	*(d2i+4)-= tdd * yt * zt;
+	*(d2i+5)-= tdd * zt * zt + td / ( c2 + t );
+      }
+    }
+  }
+  free_potentialArgs(1,potentialArgs);
+  free(potentialArgs);
+}
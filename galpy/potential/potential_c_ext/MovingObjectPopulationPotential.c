@@ -0,0 +1,207 @@
+#include <math.h>
+#include <galpy_potentials.h>
+// MovingObjectPopulationPotential
+// 11 + nt + 2 x nobj + 6 x nt x nobj arguments: amp, rmax^2 (<0 for none),
+// nt, nobj, 7 caching (x,y,z,t,Fx,Fy,Fz), time grid (nt), amplitude factors
+// (nobj), scale factors (nobj), phase-space positions (nt x nobj x 6)
+void MovingObjectPopulationPotentialxyzforces(double x,double y,double z,
+					      double t,
+					      struct potentialArg * potentialArgs,
+					      double * F){
+  int ii,jj,lo,hi,mid,nt,nobj;
+  double rmax2,dt,s,h00,h10,h01,h11,dx,dy,dz,Rd,RF,b,ab;
+  double * args= potentialArgs->args;
+  double * tgrid, * amps, * scales, * xv0, * xv1;
+  // Use cached value if possible
+  if ( x == *(args+4) && y == *(args+5) && z == *(args+6) && t == *(args+7) ) {
+    *F= *(args+8);
+    *(F+1)= *(args+9);
+    *(F+2)= *(args+10);
+    return;
+  }
+  rmax2= *(args+1);
+  nt= (int) *(args+2);
+  nobj= (int) *(args+3);
+  tgrid= args+11;
+  amps= tgrid+nt;
+  scales= amps+nobj;
+  // Find the time interval, shared by all objects
+  if ( t <= *tgrid ) {
+    jj= 0;
+    t= *tgrid;
+  }
+  else if ( t >= *(tgrid+nt-1) ) {
+    jj= nt-2;
+    t= *(tgrid+nt-1);
+  }
+  else {
+    lo= 0;
+    hi= nt-1;
+    while ( hi - lo > 1 ) {
+      mid= ( lo + hi ) / 2;
+      if ( *(tgrid+mid) > t ) hi= mid;
+      else lo= mid;
+    }
+    jj= lo;
+  }
+  dt= *(tgrid+jj+1) - *(tgrid+jj);
+  s= ( t - *(tgrid+jj) ) / dt;
+  // Cubic Hermite basis functions
+  h00= ( 2. * s - 3. ) * s * s + 1.;
+  h10= ( ( s - 2. ) * s + 1. ) * s * dt;
+  h01= ( 3. - 2. * s ) * s * s;
+  h11= ( s - 1. ) * s * s * dt;
+  xv0= scales+nobj+6*jj*nobj;
+  xv1= xv0+6*nobj;
+  *F= 0.;
+  *(F+1)= 0.;
+  *(F+2)= 0.;
+  for (ii=0; ii < nobj; ii++) {
+    dx= x - h00 * *xv0 - h10 * *(xv0+3) - h01 * *xv1 - h11 * *(xv1+3);
+    dy= y - h00 * *(xv0+1) - h10 * *(xv0+4) - h01 * *(xv1+1) - h11 * *(xv1+4);
+    dz= z - h00 * *(xv0+2) - h10 * *(xv0+5) - h01 * *(xv1+2) - h11 * *(xv1+5);
+    xv0+= 6;
+    xv1+= 6;
+    if ( rmax2 >= 0. && dx * dx + dy * dy + dz * dz > rmax2 )
+      continue;
+    Rd= sqrt ( dx * dx + dy * dy );
+    b= *(scales+ii);
+    ab= *(amps+ii) / b;
+    if ( Rd > 0. ) {
+      RF= ab * calcRforce(Rd/b,dz/b,0.,t,potentialArgs->nwrapped,
+			  potentialArgs->wrappedPotentialArg) / Rd;
+      *F+= RF * dx;
+      *(F+1)+= RF * dy;
+    }
+    *(F+2)+= ab * calczforce(Rd/b,dz/b,0.,t,potentialArgs->nwrapped,
+			     potentialArgs->wrappedPotentialArg);
+  }
+  *(args+4)= x;
+  *(args+5)= y;
+  *(args+6)= z;
+  *(args+7)= t;
+  *(args+8)= *F;
+  *(args+9)= *(F+1);
+  *(args+10)= *(F+2);
+}
+double MovingObjectPopulationPotentialRforce(double R,double z,double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double cosphi= cos(phi);
+  double sinphi= sin(phi);
+  double F[3];
+  MovingObjectPopulationPotentialxyzforces(R*cosphi,R*sinphi,z,t,
+					   potentialArgs,F);
+  return *potentialArgs->args * ( cosphi * F[0] + sinphi * F[1] );
+}
+double MovingObjectPopulationPotentialzforce(double R,double z,double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double F[3];
+  MovingObjectPopulationPotentialxyzforces(R*cos(phi),R*sin(phi),z,t,
+					   potentialArgs,F);
+  return *potentialArgs->args * F[2];
+}
+double MovingObjectPopulationPotentialphitorque(double R,double z,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  double cosphi= cos(phi);
+  double sinphi= sin(phi);
+  double F[3];
+  MovingObjectPopulationPotentialxyzforces(R*cosphi,R*sinphi,z,t,
+					   potentialArgs,F);
+  return *potentialArgs->args * R * ( cosphi * F[1] - sinphi * F[0] );
+}
+void MovingObjectPopulationPotentialxyforces(double x,double y,double t,
+					     struct potentialArg * potentialArgs,
+					     double * F){
+  // Planar version: ignores the objects' vertical positions
+  int ii,jj,lo,hi,mid,nt,nobj;
+  double rmax2,dt,s,h00,h10,h01,h11,dx,dy,Rd,RF,b;
+  double * args= potentialArgs->args;
+  double * tgrid, * amps, * scales, * xv0, * xv1;
+  // Use cached value if possible
+  if ( x == *(args+4) && y == *(args+5) && t == *(args+7) ) {
+    *F= *(args+8);
+    *(F+1)= *(args+9);
+    return;
+  }
+  rmax2= *(args+1);
+  nt= (int) *(args+2);
+  nobj= (int) *(args+3);
+  tgrid= args+11;
+  amps= tgrid+nt;
+  scales= amps+nobj;
+  // Find the time interval, shared by all objects
+  if ( t <= *tgrid ) {
+    jj= 0;
+    t= *tgrid;
+  }
+  else if ( t >= *(tgrid+nt-1) ) {
+    jj= nt-2;
+    t= *(tgrid+nt-1);
+  }
+  else {
+    lo= 0;
+    hi= nt-1;
+    while ( hi - lo > 1 ) {
+      mid= ( lo + hi ) / 2;
+      if ( *(tgrid+mid) > t ) hi= mid;
+      else lo= mid;
+    }
+    jj= lo;
+  }
+  dt= *(tgrid+jj+1) - *(tgrid+jj);
+  s= ( t - *(tgrid+jj) ) / dt;
+  // Cubic Hermite basis functions
+  h00= ( 2. * s - 3. ) * s * s + 1.;
+  h10= ( ( s - 2. ) * s + 1. ) * s * dt;
+  h01= ( 3. - 2. * s ) * s * s;
+  h11= ( s - 1. ) * s * s * dt;
+  xv0= scales+nobj+6*jj*nobj;
+  xv1= xv0+6*nobj;
+  *F= 0.;
+  *(F+1)= 0.;
+  for (ii=0; ii < nobj; ii++) {
+    dx= x - h00 * *xv0 - h10 * *(xv0+3) - h01 * *xv1 - h11 * *(xv1+3);
+    dy= y - h00 * *(xv0+1) - h10 * *(xv0+4) - h01 * *(xv1+1) - h11 * *(xv1+4);
+    xv0+= 6;
+    xv1+= 6;
+    Rd= dx * dx + dy * dy;
+    if ( ( rmax2 >= 0. && Rd > rmax2 ) || Rd == 0. )
+      continue;
+    Rd= sqrt ( Rd );
+    b= *(scales+ii);
+    RF= *(amps+ii) / b * calcPlanarRforce(Rd/b,0.,t,potentialArgs->nwrapped,
+					   potentialArgs->wrappedPotentialArg) / Rd;
+    *F+= RF * dx;
+    *(F+1)+= RF * dy;
+  }
+  *(args+4)= x;
+  *(args+5)= y;
+  *(args+6)= 0.;
+  *(args+7)= t;
+  *(args+8)= *F;
+  *(args+9)= *(F+1);
+  *(args+10)= 0.;
+}
+double MovingObjectPopulationPotentialPlanarRforce(double R,double phi,
+						   double t,
+						   struct potentialArg * potentialArgs){
+  double cosphi= cos(phi);
+  double sinphi= sin(phi);
+  double F[2];
+  MovingObjectPopulationPotentialxyforces(R*cosphi,R*sinphi,t,
+					  potentialArgs,F);
+  return *potentialArgs->args * ( cosphi * F[0] + sinphi * F[1] );
+}
+double MovingObjectPopulationPotentialPlanarphitorque(double R,double phi,
+						      double t,
+						      struct potentialArg * potentialArgs){
+  double cosphi= cos(phi);
+  double sinphi= sin(phi);
+  double F[2];
+  MovingObjectPopulationPotentialxyforces(R*cosphi,R*sinphi,t,
+					  potentialArgs,F);
+  return *potentialArgs->args * R * ( cosphi * F[1] - sinphi * F[0] );
+}
@@ -0,0 +1,194 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//MultipoleExpansionPotential: multipole expansion with tabulated radial
+//functions, interpolated using cubic Hermite interpolation in ln(r)
+//arguments: amp, L, nr, cached (R,z,phi,t,Rforce,zforce,phitorque), ln(r) grid,
+//table of (Acos,dAcos/dlnr,Asin,dAsin/dlnr) for each lm at each grid point,
+//scratch space for the Legendre functions, their derivatives, cos(m phi), and
+//sin(m phi)
+static void multipole_legendre(int L,double x,double sintheta,int deriv,
+			       double * P,double * dP){
+  // Normalized associated Legendre functions w/o Condon-Shortley phase,
+  // ordered as lm=l(l+1)/2+m, and their derivatives wrt theta
+  int l, m, indx;
+  double a, b, Pmm= 0.28209479177387814; // 1/sqrt(4pi)
+  for (m=0; m <= L; m++) {
+    if ( m > 0 )
+      Pmm*= sqrt( ( 2. * m + 1. ) / 2. / m ) * sintheta;
+    *(P + m * ( m + 1 ) / 2 + m)= Pmm;
+    if ( m == L ) break;
+    *(P + ( m + 1 ) * ( m + 2 ) / 2 + m)= sqrt( 2. * m + 3. ) * x * Pmm;
+    for (l=m+2; l <= L; l++) {
+      a= sqrt( ( 4. * l * l - 1. ) / ( l * l - m * m ) );
+      b= sqrt( ( ( l - 1. ) * ( l - 1. ) - m * m )
+	       / ( 4. * ( l - 1. ) * ( l - 1. ) - 1. ) );
+      *(P + l * ( l + 1 ) / 2 + m)= a * ( x * *(P + ( l - 1 ) * l / 2 + m)
+					  - b * *(P + ( l - 2 ) * ( l - 1 ) / 2 + m) );
+    }
+  }
+  if ( ! deriv ) return;
+  *dP= 0.;
+  for (l=1; l <= L; l++) {
+    indx= l * ( l + 1 ) / 2;
+    *(dP + indx)= - sqrt( l * ( l + 1. ) ) * *(P + indx + 1);
+    for (m=1; m <= l; m++) {
+      *(dP + indx + m)= 0.5 * sqrt( ( l + m ) * ( l - m + 1. ) )
+	* *(P + indx + m - 1);
+      if ( m < l )
+	*(dP + indx + m)-= 0.5 * sqrt( ( l + m + 1. ) * ( l - m ) )
+	  * *(P + indx + m + 1);
+    }
+  }
+}
+static void multipole_compute(double R,double z,double phi,double * args,
+			      int forces,double * out){
+  int l, m, lm, ii, lo, hi, mid;
+  int L= (int) *(args+1);
+  int nr= (int) *(args+2);
+  int nlm= ( L + 1 ) * ( L + 2 ) / 2;
+  double * logr= args + 10;
+  double * table= args + 10 + nr;
+  double * P= table + 4 * nlm * nr;
+  double * dP= P + nlm;
+  double * cosmphi= dP + nlm;
+  double * sinmphi= cosmphi + L + 1;
+  double * node0, * node1;
+  double r, x, h, s, costheta, sintheta, fac= 1.;
+  double h00= 0., h10= 0., h01= 0., h11= 0., d00= 0., d10= 0., d01= 0., d11= 0.;
+  double Ac, dAc, As, dAs, trig, dtrig;
+  double pot= 0., dPhidlnr= 0., dPhidtheta= 0., dPhidphi= 0.;
+  int region;
+  r= sqrt( R * R + z * z );
+  if ( r == 0. ) r= 1e-30;
+  costheta= z / r;
+  sintheta= R / r;
+  multipole_legendre(L,costheta,sintheta,forces,P,dP);
+  for (m=0; m <= L; m++) {
+    *(cosmphi+m)= cos ( m * phi );
+    *(sinmphi+m)= sin ( m * phi );
+  }
+  // Find the grid cell
+  x= log(r);
+  if ( x < *logr ) {
+    region= -1;
+    ii= 0;
+  }
+  else if ( x > *(logr+nr-1) ) {
+    region= 1;
+    ii= nr - 1;
+  }
+  else {
+    region= 0;
+    lo= 0;
+    hi= nr - 1;
+    while ( hi - lo > 1 ) {
+      mid= ( lo + hi ) / 2;
+      if ( *(logr+mid) < x ) lo= mid;
+      else hi= mid;
+    }
+    ii= lo;
+    h= *(logr+ii+1) - *(logr+ii);
+    s= ( x - *(logr+ii) ) / h;
+    h00= ( 1. + 2. * s ) * ( 1. - s ) * ( 1. - s );
+    h10= s * ( 1. - s ) * ( 1. - s ) * h;
+    h01= s * s * ( 3. - 2. * s );
+    h11= s * s * ( s - 1. ) * h;
+    d00= 6. * s * ( s - 1. ) / h;
+    d10= ( 1. - s ) * ( 1. - 3. * s );
+    d01= -d00;
+    d11= s * ( 3. * s - 2. );
+  }
+  node0= table + 4 * nlm * ii;
+  node1= node0 + 4 * nlm;
+  lm= 0;
+  for (l=0; l <= L; l++) {
+    if ( region == -1 )
+      fac= pow(r / exp(*logr),l);
+    else if ( region == 1 )
+      fac= pow(exp(*(logr+nr-1)) / r,l+1);
+    for (m=0; m <= l; m++) {
+      if ( region == 0 ) {
+	Ac= h00 * *(node0+4*lm) + h10 * *(node0+4*lm+1)
+	  + h01 * *(node1+4*lm) + h11 * *(node1+4*lm+1);
+	As= h00 * *(node0+4*lm+2) + h10 * *(node0+4*lm+3)
+	  + h01 * *(node1+4*lm+2) + h11 * *(node1+4*lm+3);
+	dAc= d00 * *(node0+4*lm) + d10 * *(node0+4*lm+1)
+	  + d01 * *(node1+4*lm) + d11 * *(node1+4*lm+1);
+	dAs= d00 * *(node0+4*lm+2) + d10 * *(node0+4*lm+3)
+	  + d01 * *(node1+4*lm+2) + d11 * *(node1+4*lm+3);
+      }
+      else {
+	Ac= fac * *(node0+4*lm);
+	As= fac * *(node0+4*lm+2);
+	dAc= ( region == -1 ? l : -( l + 1 ) ) * Ac;
+	dAs= ( region == -1 ? l : -( l + 1 ) ) * As;
+      }
+      trig= Ac * *(cosmphi+m) + As * *(sinmphi+m);
+      if ( forces ) {
+	dtrig= dAc * *(cosmphi+m) + dAs * *(sinmphi+m);
+	dPhidlnr+= *(P+lm) * dtrig;
+	dPhidtheta+= *(dP+lm) * trig;
+	dPhidphi+= *(P+lm) * m * ( As * *(cosmphi+m) - Ac * *(sinmphi+m) );
+      }
+      else
+	pot+= *(P+lm) * trig;
+      lm++;
+    }
+  }
+  if ( forces ) {
+    *out= - ( dPhidlnr * sintheta + dPhidtheta * costheta ) / r;
+    *(out+1)= - ( dPhidlnr * costheta - dPhidtheta * sintheta ) / r;
+    *(out+2)= - dPhidphi;
+  }
+  else
+    *out= pot;
+}
+// Compute all forces at once and cache them
+static void MultipoleExpansionPotential_forces(double R,double z,double phi,
+					       double t,double * args){
+  if ( R == *(args+3) && z == *(args+4) && phi == *(args+5)
+       && t == *(args+6) )
+    return;
+  multipole_compute(R,z,phi,args,1,args+7);
+  *(args+3)= R;
+  *(args+4)= z;
+  *(args+5)= phi;
+  *(args+6)= t;
+}
+double MultipoleExpansionPotentialEval(double R,double z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double out;
+  multipole_compute(R,z,phi,args,0,&out);
+  return *args * out;
+}
+double MultipoleExpansionPotentialRforce(double R,double z, double phi,
+					 double t,
+					 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  MultipoleExpansionPotential_forces(R,z,phi,t,args);
+  return *args * *(args+7);
+}
+double MultipoleExpansionPotentialzforce(double R,double z, double phi,
+					 double t,
+					 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  MultipoleExpansionPotential_forces(R,z,phi,t,args);
+  return *args * *(args+8);
+}
+double MultipoleExpansionPotentialphitorque(double R,double z, double phi,
+					    double t,
+					    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  MultipoleExpansionPotential_forces(R,z,phi,t,args);
+  return *args * *(args+9);
+}
+double MultipoleExpansionPotentialPlanarRforce(double R,double phi,double t,
+					       struct potentialArg * potentialArgs){
+  return MultipoleExpansionPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double MultipoleExpansionPotentialPlanarphitorque(double R,double phi,double t,
+						  struct potentialArg * potentialArgs){
+  return MultipoleExpansionPotentialphitorque(R,0.,phi,t,potentialArgs);
+}
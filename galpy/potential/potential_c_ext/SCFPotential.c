@@ -907,3 +907,137 @@ double SCFPotentialDens(double R,double Z, double phi,
     return density / 2. / M_PI;
 
 }
+//TimeDependentSCFPotential: SCFPotential with coefficients interpolated in time
+//arguments: nt, cubic, isNonAxi, N, L, M, cached t, the nt times, the
+//coefficients (Acos and, if non-axisymmetric, Asin) at each time, and finally
+//the arguments of an SCFPotential that holds the coefficients at the current t
+static inline int TimeDependentSCF_blocksize(double * args){
+  return (1 + (int) *(args+2)) * (int) *(args+3) * (int) *(args+4)
+    * (int) *(args+5);
+}
+static void TimeDependentSCF_set_time(double t,double * args){
+  int ii, jj, kk, jp, jm;
+  int nt= (int) *args;
+  int bs= TimeDependentSCF_blocksize(args);
+  double h, u, u2, u3, hw;
+  double * tgrid= args + 7;
+  double * series= tgrid + nt;
+  double * scfargs= series + nt * bs;
+  double * coeffs= scfargs + 5;
+  int indx[6];
+  double weights[6];
+  int nw= 0;
+  if ( t == *(args+6) )
+    return;
+  // Find the interval, coefficients are fixed outside of the grid
+  ii= 0;
+  while ( ii < nt - 2 && t >= *(tgrid+ii+1) )
+    ii++;
+  h= *(tgrid+ii+1) - *(tgrid+ii);
+  u= ( t - *(tgrid+ii) ) / h;
+  if ( u < 0. ) u= 0.;
+  else if ( u > 1. ) u= 1.;
+  if ( (int) *(args+1) == 0 ) {
+    indx[0]= ii;
+    weights[0]= 1. - u;
+    indx[1]= ii + 1;
+    weights[1]= u;
+    nw= 2;
+  }
+  else {
+    // Cubic Hermite with finite-difference slopes at the nodes
+    u2= u * u;
+    u3= u2 * u;
+    indx[0]= ii;
+    weights[0]= 2. * u3 - 3. * u2 + 1.;
+    indx[1]= ii + 1;
+    weights[1]= -2. * u3 + 3. * u2;
+    nw= 2;
+    for (jj=ii; jj < ii + 2; jj++) {
+      hw= ( jj == ii ) ? u3 - 2. * u2 + u : u3 - u2;
+      jp= ( jj + 1 < nt ) ? jj + 1 : nt - 1;
+      jm= ( jj > 0 ) ? jj - 1 : 0;
+      hw*= h / ( *(tgrid+jp) - *(tgrid+jm) );
+      indx[nw]= jp;
+      weights[nw++]= hw;
+      indx[nw]= jm;
+      weights[nw++]= -hw;
+    }
+  }
+  for (kk=0; kk < bs; kk++) {
+    *(coeffs+kk)= 0.;
+    for (jj=0; jj < nw; jj++)
+      *(coeffs+kk)+= weights[jj] * *(series + indx[jj] * bs + kk);
+  }
+  // Invalidate the SCF force/derivative cache
+  *(coeffs+bs)= -1.;
+  *(args+6)= t;
+}
+static inline struct potentialArg TimeDependentSCF_scfargs(double t,
+							    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  struct potentialArg scfArgs= *potentialArgs;
+  TimeDependentSCF_set_time(t,args);
+  scfArgs.args= args + 7 + (int) *args * ( 1 + TimeDependentSCF_blocksize(args) );
+  return scfArgs;
+}
+double TimeDependentSCFPotentialEval(double R,double Z, double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialEval(R,Z,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialRforce(double R,double Z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialRforce(R,Z,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialzforce(double R,double Z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialzforce(R,Z,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialphitorque(double R,double Z, double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialphitorque(R,Z,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialPlanarRforce(double R,double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialPlanarRforce(R,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialPlanarphitorque(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialPlanarphitorque(R,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialPlanarR2deriv(double R,double phi,
+					      double t,
+					      struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialPlanarR2deriv(R,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialPlanarphi2deriv(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialPlanarphi2deriv(R,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialPlanarRphideriv(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialPlanarRphideriv(R,phi,t,&scfArgs);
+}
+double TimeDependentSCFPotentialDens(double R,double Z, double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  struct potentialArg scfArgs= TimeDependentSCF_scfargs(t,potentialArgs);
+  return SCFPotentialDens(R,Z,phi,t,&scfArgs);
+}
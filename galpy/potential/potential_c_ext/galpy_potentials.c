@@ -2,6 +2,7 @@
 void init_potentialArgs(int npot, struct potentialArg * potentialArgs){
   int ii;
   for (ii=0; ii < npot; ii++) {
+    (potentialArgs+ii)->potentialEval= NULL;
     (potentialArgs+ii)->i2d= NULL;
     (potentialArgs+ii)->accx= NULL;
     (potentialArgs+ii)->accy= NULL;
@@ -15,6 +16,7 @@ void init_potentialArgs(int npot, struct potentialArg * potentialArgs){
     (potentialArgs+ii)->spline1d= NULL;
     (potentialArgs+ii)->acc1d= NULL;
     (potentialArgs+ii)->tfuncs= NULL;
+    (potentialArgs+ii)->tfuncs_tables= NULL;
   }
 }
 void free_potentialArgs(int npot, struct potentialArg * potentialArgs){
@@ -53,9 +55,50 @@ void free_potentialArgs(int npot, struct potentialArg * potentialArgs){
 	gsl_interp_accel_free (*((potentialArgs+ii)->acc1d+jj));
       free((potentialArgs+ii)->acc1d);
     }
+    if ( (potentialArgs+ii)->tfuncs_tables ) {
+      for (jj=0; jj < (potentialArgs+ii)->ntfuncs; jj++)
+	free(*((potentialArgs+ii)->tfuncs_tables+jj));
+      free((potentialArgs+ii)->tfuncs_tables);
+    }
     free((potentialArgs+ii)->args);
   }
 }
+void init_tfuncs_tables(struct potentialArg * potentialArgs,
+			double ** pot_args){
+  // Parse the optional cubic-spline tables of the functions of time: a flag
+  // that is zero when the functions are not tabulated, otherwise for each
+  // function the start time t0, the spacing dt, the number of intervals n,
+  // and the 4 x n polynomial coefficients (highest order first)
+  int ii, ntable;
+  if ( (int) *(*pot_args)++ == 0 )
+    return;
+  potentialArgs->tfuncs_tables= (double **) malloc ( potentialArgs->ntfuncs * sizeof ( double * ) );
+  for (ii=0; ii < potentialArgs->ntfuncs; ii++) {
+    ntable= 3 + 4 * (int) *(*pot_args+2);
+    *(potentialArgs->tfuncs_tables+ii)= (double *) malloc ( ntable * sizeof ( double ) );
+    memcpy(*(potentialArgs->tfuncs_tables+ii),*pot_args,ntable*sizeof(double));
+    *pot_args+= ntable;
+  }
+}
+double evaluate_tfunc(struct potentialArg * potentialArgs,int ii,double t){
+  // Evaluate function of time ii using its spline table when it covers t,
+  // such that C code does not need to call back into Python
+  int jj;
+  double dt;
+  double * table;
+  if ( potentialArgs->tfuncs_tables ) {
+    table= *(potentialArgs->tfuncs_tables+ii);
+    dt= ( t - *table ) / *(table+1);
+    if ( dt >= 0. && dt <= *(table+2) ) {
+      jj= (int) dt;
+      if ( jj == (int) *(table+2) ) jj-= 1;
+      dt= ( dt - jj ) * *(table+1);
+      table+= 3 + 4 * jj;
+      return ((*table * dt + *(table+1)) * dt + *(table+2)) * dt + *(table+3);
+    }
+  }
+  return (*(*(potentialArgs->tfuncs+ii)))(t);
+}
 double evaluatePotentials(double R, double Z,
 			  int nargs, struct potentialArg * potentialArgs){
   int ii;
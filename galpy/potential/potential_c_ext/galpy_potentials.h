@@ -69,6 +69,9 @@ struct potentialArg{
   // To allow an arbitrary number of functions of time
   int ntfuncs;
   tfuncs_type_arr tfuncs; // see typedef above
+  // Optional cubic-spline tables of the functions of time (NULL if not
+  // tabulated); each is t0, dt, number of intervals, 4 x intervals coeffs
+  double ** tfuncs_tables;
   // Wrappers
   int nwrapped;
   struct potentialArg * wrappedPotentialArg;
@@ -88,6 +91,9 @@ struct potentialArg{
 //Dealing with potentialArg
 void init_potentialArgs(int,struct potentialArg *);
 void free_potentialArgs(int,struct potentialArg *);
+//Functions of time
+void init_tfuncs_tables(struct potentialArg *,double **);
+double evaluate_tfunc(struct potentialArg *,int,double);
 //Potential and force evaluation
 double evaluatePotentials(double,double,int, struct potentialArg *);
 // Hack to allow optional velocity for dissipative forces
@@ -316,6 +322,53 @@ double interpRZPotentialRforce(double ,double , double, double,
 			       struct potentialArg *);
 double interpRZPotentialzforce(double ,double , double, double,
 			       struct potentialArg *);
+//interp3DPotential
+double interp3DPotentialEval(double ,double , double, double,
+			     struct potentialArg *);
+double interp3DPotentialRforce(double ,double , double, double,
+			       struct potentialArg *);
+double interp3DPotentialzforce(double ,double , double, double,
+			       struct potentialArg *);
+double interp3DPotentialphitorque(double ,double , double, double,
+				  struct potentialArg *);
+double interp3DPotentialPlanarRforce(double ,double, double,
+				     struct potentialArg *);
+double interp3DPotentialPlanarphitorque(double ,double, double,
+					struct potentialArg *);
+void interp3D_catmull_rom_weights(double, double *);
+int interp3D_cell(double, double, double, int, double *);
+//MultipoleExpansionPotential
+double MultipoleExpansionPotentialEval(double ,double , double, double,
+				       struct potentialArg *);
+double MultipoleExpansionPotentialRforce(double ,double , double, double,
+					 struct potentialArg *);
+double MultipoleExpansionPotentialzforce(double ,double , double, double,
+					 struct potentialArg *);
+double MultipoleExpansionPotentialphitorque(double ,double , double, double,
+					    struct potentialArg *);
+double MultipoleExpansionPotentialPlanarRforce(double ,double, double,
+					       struct potentialArg *);
+double MultipoleExpansionPotentialPlanarphitorque(double ,double, double,
+						  struct potentialArg *);
+//CylindricalFourierExpansionPotential
+double CylindricalFourierExpansionPotentialEval(double ,double , double,
+						double,
+						struct potentialArg *);
+double CylindricalFourierExpansionPotentialRforce(double ,double , double,
+						  double,
+						  struct potentialArg *);
+double CylindricalFourierExpansionPotentialzforce(double ,double , double,
+						  double,
+						  struct potentialArg *);
+double CylindricalFourierExpansionPotentialphitorque(double ,double , double,
+						     double,
+						     struct potentialArg *);
+double CylindricalFourierExpansionPotentialPlanarRforce(double ,double,
+							double,
+							struct potentialArg *);
+double CylindricalFourierExpansionPotentialPlanarphitorque(double ,double,
+							   double,
+							   struct potentialArg *);
 //IsochronePotential
 double IsochronePotentialEval(double ,double , double, double,
 			      struct potentialArg *);
@@ -453,6 +506,48 @@ double SCFPotentialPlanarRphideriv(double,double,double,
 				        struct potentialArg *);
 double SCFPotentialDens(double,double,double,double,
 			struct potentialArg *);
+//TimeDependentSCFPotential
+double TimeDependentSCFPotentialEval(double,double,double,double,
+				     struct potentialArg *);
+double TimeDependentSCFPotentialRforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeDependentSCFPotentialzforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeDependentSCFPotentialphitorque(double,double,double,double,
+					  struct potentialArg *);
+double TimeDependentSCFPotentialPlanarRforce(double,double,double,
+					     struct potentialArg *);
+double TimeDependentSCFPotentialPlanarphitorque(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialPlanarR2deriv(double,double,double,
+					      struct potentialArg *);
+double TimeDependentSCFPotentialPlanarphi2deriv(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialPlanarRphideriv(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialDens(double,double,double,double,
+				     struct potentialArg *);
+//CompiledPotential
+double CompiledPotentialEval(double,double,double,double,
+			     struct potentialArg *);
+double CompiledPotentialRforce(double,double,double,double,
+			       struct potentialArg *);
+double CompiledPotentialzforce(double,double,double,double,
+			       struct potentialArg *);
+double CompiledPotentialphitorque(double,double,double,double,
+				  struct potentialArg *);
+double CompiledPotentialDens(double,double,double,double,
+			     struct potentialArg *);
+double CompiledPotentialPlanarRforce(double,double,double,
+				     struct potentialArg *);
+double CompiledPotentialPlanarphitorque(double,double,double,
+					struct potentialArg *);
+double CompiledPotentialPlanarR2deriv(double,double,double,
+				      struct potentialArg *);
+double CompiledPotentialPlanarphi2deriv(double,double,double,
+					struct potentialArg *);
+double CompiledPotentialPlanarRphideriv(double,double,double,
+					struct potentialArg *);
 //SoftenedNeedleBarPotential
 double SoftenedNeedleBarPotentialEval(double,double,double,double,
 				      struct potentialArg *);
@@ -702,6 +797,17 @@ double MovingObjectPotentialPlanarRforce(double,double,double,
 					struct potentialArg *);
 double MovingObjectPotentialPlanarphitorque(double,double,double,
 					    struct potentialArg *);
+//MovingObjectPopulationPotential
+double MovingObjectPopulationPotentialRforce(double,double,double,double,
+					     struct potentialArg *);
+double MovingObjectPopulationPotentialphitorque(double,double,double,double,
+						struct potentialArg *);
+double MovingObjectPopulationPotentialzforce(double,double,double,double,
+					     struct potentialArg *);
+double MovingObjectPopulationPotentialPlanarRforce(double,double,double,
+						   struct potentialArg *);
+double MovingObjectPopulationPotentialPlanarphitorque(double,double,double,
+						      struct potentialArg *);
 //RotateAndTiltWrapperPotential
 double RotateAndTiltWrapperPotentialRforce(double,double,double,double,
 					struct potentialArg *);
@@ -0,0 +1,121 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//interp3DPotential: tricubic (Catmull-Rom) interpolation on a (R,z,phi) grid
+//20 arguments: amp, nR, nz, nphi, R0, dR, z0, dz, dphi, logR, zsym, omegab, pa,
+//              cached (R,z,phi,t,Rforce,zforce,phitorque)
+//followed by the padded table of (potential,Rforce,zforce,phitorque) at each
+//of the (nR+2) x (nz+2) x (nphi+3) grid points
+void interp3D_catmull_rom_weights(double t, double * w){
+  double t2= t * t;
+  double t3= t2 * t;
+  *w= 0.5 * ( -t3 + 2. * t2 - t );
+  *(w+1)= 0.5 * ( 3. * t3 - 5. * t2 + 2. );
+  *(w+2)= 0.5 * ( -3. * t3 + 4. * t2 + t );
+  *(w+3)= 0.5 * ( t3 - t2 );
+}
+int interp3D_cell(double x, double x0, double dx, int n, double * frac){
+  // Returns the lower grid index of the cell and the fractional position
+  // within it; positions outside of the grid are clamped to the edge
+  int ii;
+  double u= ( x - x0 ) / dx;
+  if ( u < 0. ) u= 0.;
+  else if ( u > n - 1 ) u= n - 1;
+  ii= (int) u;
+  if ( ii > n - 2 ) ii= n - 2;
+  *frac= u - ii;
+  return ii;
+}
+// Interpolate the quantities first through first+nout-1 of the table
+static void interp3DPotential_interp(double R,double z,double phi,double t,
+				     double * args,int first,int nout,
+				     double * out){
+  int ii, jj, kk, ll, mm, nn, pp;
+  int nR= (int) *(args+1);
+  int nz= (int) *(args+2);
+  int nphi= (int) *(args+3);
+  int nzp= nz + 2;
+  int nphip= nphi + 3;
+  double x, tx, tz, tphi, w, zsign;
+  double wx[4], wz[4], wphi[4];
+  double * node;
+  double * table= args + 20;
+  double period= nphi * *(args+8);
+  if ( (int) *(args+9) == 1 )
+    x= ( R > 0. ) ? log(R): -20.72326583694641;
+  else
+    x= R;
+  zsign= ( (int) *(args+10) && z < 0. ) ? -1.: 1.;
+  ii= interp3D_cell(x,*(args+4),*(args+5),nR,&tx);
+  jj= interp3D_cell(zsign * z,*(args+6),*(args+7),nz,&tz);
+  phi= fmod(phi - *(args+11) * t - *(args+12),period);
+  if ( phi < 0. ) phi+= period;
+  tphi= phi / *(args+8);
+  kk= (int) tphi;
+  tphi-= kk;
+  if ( kk >= nphi ) kk-= nphi;
+  interp3D_catmull_rom_weights(tx,wx);
+  interp3D_catmull_rom_weights(tz,wz);
+  interp3D_catmull_rom_weights(tphi,wphi);
+  for (pp=0; pp < nout; pp++)
+    *(out+pp)= 0.;
+  for (ll=0; ll < 4; ll++)
+    for (mm=0; mm < 4; mm++)
+      for (nn=0; nn < 4; nn++) {
+	w= wx[ll] * wz[mm] * wphi[nn];
+	node= table + 4 * ( ( ( ii + ll ) * nzp + jj + mm ) * nphip + kk + nn );
+	for (pp=0; pp < nout; pp++)
+	  *(out+pp)+= w * *(node+first+pp);
+      }
+  // zforce is odd in z for z-symmetric potentials
+  if ( first + nout > 2 && first <= 2 )
+    *(out+2-first)*= zsign;
+}
+// Compute all forces at once and cache them
+static void interp3DPotential_forces(double R,double z,double phi,double t,
+				     double * args){
+  if ( R == *(args+13) && z == *(args+14) && phi == *(args+15)
+       && t == *(args+16) )
+    return;
+  interp3DPotential_interp(R,z,phi,t,args,1,3,args+17);
+  *(args+13)= R;
+  *(args+14)= z;
+  *(args+15)= phi;
+  *(args+16)= t;
+}
+double interp3DPotentialEval(double R,double z, double phi,
+			     double t,
+			     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double out;
+  interp3DPotential_interp(R,z,phi,t,args,0,1,&out);
+  return *args * out;
+}
+double interp3DPotentialRforce(double R,double z, double phi,
+			       double t,
+			       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  interp3DPotential_forces(R,z,phi,t,args);
+  return *args * *(args+17);
+}
+double interp3DPotentialzforce(double R,double z, double phi,
+			       double t,
+			       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  interp3DPotential_forces(R,z,phi,t,args);
+  return *args * *(args+18);
+}
+double interp3DPotentialphitorque(double R,double z, double phi,
+				  double t,
+				  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  interp3DPotential_forces(R,z,phi,t,args);
+  return *args * *(args+19);
+}
+double interp3DPotentialPlanarRforce(double R,double phi,double t,
+				     struct potentialArg * potentialArgs){
+  return interp3DPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double interp3DPotentialPlanarphitorque(double R,double phi,double t,
+					struct potentialArg * potentialArgs){
+  return interp3DPotentialphitorque(R,0.,phi,t,potentialArgs);
+}
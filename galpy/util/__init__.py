@@ -168,3 +168,56 @@ def _rotate_to_arbitrary_vector(v, a, inv=False, _dontcutsmall=False):
         out[numpy.fabs(costheta - 1.0) < 10.0**-10.0] = numpy.eye(3)
         out[numpy.fabs(costheta + 1.0) < 10.0**-10.0] = -numpy.eye(3)
     return out
+
+
+def _vectorized_rootfind(
+    func, a, b, xtol=1e-12, rtol=4.0 * numpy.finfo(float).eps, maxiter=200
+):
+    """
+    NAME:
+       _vectorized_rootfind
+    PURPOSE:
+       find the roots of many bracketed 1D functions at once using the Illinois variant of regula falsi
+    INPUT:
+       func - function that evaluates all functions at once: func(x) with x an array with the same shape as a and b
+       a, b - arrays of brackets such that func(a) and func(b) have opposite signs (or one of them is zero)
+       xtol, rtol= absolute and relative tolerance on the root (like scipy.optimize.brentq)
+       maxiter= maximum number of iterations
+    OUTPUT:
+       array of roots
+    HISTORY:
+       2026-10-19 - Written
+    """
+    a = numpy.array(a, dtype="float", copy=True)
+    b = numpy.array(b, dtype="float", copy=True)
+    fa = func(a)
+    fb = func(b)
+    if numpy.any(fa * fb > 0.0):
+        raise ValueError("f(a) and f(b) must have different signs")
+    out = numpy.where(fa == 0.0, a, b)
+    todo = (fa != 0.0) * (fb != 0.0)
+    side = numpy.zeros(a.shape, dtype="int")
+    for ii in range(maxiter):
+        if not numpy.any(todo):
+            break
+        c = numpy.where(todo, (a * fb - b * fa) / (fb - fa + (fb == fa)), b)
+        # Fall back onto bisection if the secant step does not give a finite value
+        bad = True ^ numpy.isfinite(c)
+        c[bad] = 0.5 * (a[bad] + b[bad])
+        fc = numpy.zeros_like(c)
+        fc[todo] = func(c)[todo]
+        out[todo] = c[todo]
+        # Illinois update: keep the bracket and halve the retained endpoint
+        # when the same endpoint is retained twice in a row
+        samesign = fc * fb > 0.0
+        swap = todo * (True ^ samesign)
+        keep = todo * samesign
+        a[swap] = b[swap]
+        fa[swap] = fb[swap]
+        fa[keep * (side == 1)] *= 0.5
+        side[keep] = 1
+        side[swap] = 0
+        b[todo] = c[todo]
+        fb[todo] = fc[todo]
+        todo *= (fc != 0.0) * (numpy.fabs(b - a) > xtol + rtol * numpy.fabs(out))
+    return out
@@ -0,0 +1,173 @@
+###############################################################################
+#   _table_cache.py: utilities to store tabulated potentials on disk, keyed
+#                    by a hash of their inputs, and to memory-map them
+###############################################################################
+import hashlib
+import os
+import pickle
+import struct
+import tempfile
+import types
+import warnings
+import zipfile
+
+import numpy
+
+from . import galpyWarning
+
+
+def content_hash(*args):
+    """Hash of the content of a set of objects (galpy potentials, arrays, numbers, strings, functions, and lists/tuples/dicts thereof); the attributes of an object that are listed in the _content_hash_exclude tuple of its class or of any of its base classes (e.g., cached values) are ignored"""
+    h = hashlib.sha256()
+    memo = set()
+    for arg in args:
+        _update_hash(h, arg, memo)
+    return h.hexdigest()
+
+
+def _update_hash(h, obj, memo):
+    if isinstance(obj, numpy.ndarray):
+        h.update(f"ndarray{obj.dtype.str}{obj.shape}".encode())
+        h.update(numpy.ascontiguousarray(obj).tobytes())
+    elif isinstance(
+        obj, (bool, int, float, complex, str, bytes, type(None), numpy.generic)
+    ):
+        h.update(f"{type(obj).__name__}{obj!r}".encode())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _update_hash(h, item, memo)
+    elif isinstance(obj, dict):
+        h.update(f"dict{len(obj)}".encode())
+        for key in sorted(obj, key=str):
+            h.update(str(key).encode())
+            _update_hash(h, obj[key], memo)
+    elif isinstance(obj, (types.ModuleType, type)):
+        h.update(f"{type(obj).__name__}{obj.__name__}".encode())
+    elif id(obj) in memo:
+        h.update(b"seen")
+    elif isinstance(obj, types.CodeType):
+        h.update(obj.co_code)
+        _update_hash(h, obj.co_consts, memo)
+    elif hasattr(obj, "__code__"):
+        # Functions: hash their code, constants, closure, and the values of
+        # the globals that they use (e.g., module-level parameters)
+        memo.add(id(obj))
+        _update_hash(h, obj.__code__, memo)
+        if obj.__closure__ is not None:
+            _update_hash(h, [c.cell_contents for c in obj.__closure__], memo)
+        _update_hash(
+            h,
+            {
+                name: obj.__globals__[name]
+                for name in _code_names(obj.__code__)
+                if name in obj.__globals__
+            },
+            memo,
+        )
+    elif hasattr(obj, "__dict__"):
+        memo.add(id(obj))
+        h.update(f"{type(obj).__module__}.{type(obj).__qualname__}".encode())
+        exclude = _content_hash_exclude(type(obj))
+        _update_hash(
+            h, {key: val for key, val in vars(obj).items() if key not in exclude}, memo
+        )
+    else:
+        try:
+            h.update(pickle.dumps(obj))
+        except Exception:
+            h.update(f"{type(obj).__module__}.{type(obj).__qualname__}".encode())
+    return None
+
+
+def _content_hash_exclude(cls):
+    # Names of the attributes to ignore, collected over the base classes
+    out = set()
+    for base in cls.__mro__:
+        out.update(base.__dict__.get("_content_hash_exclude", ()))
+    return out
+
+
+def _code_names(code):
+    # Names of the globals used by a code object and the code nested in it
+    out = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            out |= _code_names(const)
+    return out
+
+
+def save_table(filename, **arrays):
+    """Save arrays to an uncompressed .npz file, writing to a temporary file first such that processes that share the file never see a partially-written table"""
+    dirname = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(dir=dirname, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            numpy.savez(f, **arrays)
+        os.replace(tmpname, filename)
+    except:  # pragma: no cover
+        os.remove(tmpname)
+        raise
+    return None
+
+
+def cache_table(filename, **arrays):
+    """Save arrays to a cache file with save_table, but only warn if this fails (e.g., because the cache directory is not writable), such that caching never prevents the tables from being used"""
+    try:
+        save_table(filename, **arrays)
+    except OSError as e:
+        warnings.warn(
+            f'Could not store the table in the cache file {filename}, because of "{type(e).__name__}: {e.__str__()}"; the table will not be cached',
+            galpyWarning,
+        )
+    return None
+
+
+def load_table(filename, mmap=True):
+    """Load the arrays in an .npz file written by save_table as a dictionary, memory-mapping the arrays with more than one element if mmap"""
+    out = {}
+    with numpy.load(filename) as data:
+        for name in data.files:
+            if mmap and numpy.prod(_npz_member_shape(data, name)) > 1:
+                out[name] = memmap_npz_member(filename, name)
+            else:
+                out[name] = data[name]
+    return out
+
+
+def _npz_member_shape(data, name):
+    # Read only the header of the member to determine its shape
+    with data.zip.open(f"{name}.npy") as f:
+        version = numpy.lib.format.read_magic(f)
+        if version == (1, 0):
+            return numpy.lib.format.read_array_header_1_0(f)[0]
+        return numpy.lib.format.read_array_header_2_0(f)[0]  # pragma: no cover
+
+
+def memmap_npz_member(filename, name):
+    """Memory-map an array stored without compression in a .npz file"""
+    with zipfile.ZipFile(filename) as zf:
+        info = zf.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:  # pragma: no cover
+        with numpy.load(filename) as data:
+            return data[name]
+    with open(filename, "rb") as f:
+        # Skip the local file header to get to the .npy data
+        f.seek(info.header_offset)
+        namelen, extralen = struct.unpack("<HH", f.read(30)[26:30])
+        f.seek(info.header_offset + 30 + namelen + extralen)
+        version = numpy.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(f)
+        else:  # pragma: no cover
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return numpy.memmap(
+        filename,
+        dtype=dtype,
+        mode="r",
+        shape=shape,
+        offset=offset,
+        order="F" if fortran_order else "C",
+    )
@@ -489,7 +489,7 @@ Usage:
        int dim: dimension
        double *yo: initial value, dimension: dim
        int nt: number of times at which the output is wanted
-       double dt_one: (optional) stepsize to use, must be an integer divisor of time difference between output steps (NOT CHECKED EXPLICITLY)
+       double dt_one: (optional) initial stepsize to use; the stepsize is adapted and the steps end at each output time
        double *t: times at which the output is wanted (EQUALLY SPACED)
        int nargs: see above
        double *args: see above
@@ -506,6 +506,32 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
 		 int nargs, struct potentialArg * potentialArgs,
 		 double rtol, double atol,
 		 double *result, int * err){
+  bovy_dopr54_dense(func,dim,yo,nt,dt_one,t,nargs,potentialArgs,rtol,atol,
+		    result,err,NULL);
+}
+/*
+Same as bovy_dopr54, but storing the dense output and detecting events if
+dense is not NULL. In that case, the integrator takes its natural adaptive
+steps and the output at the requested times is obtained from the
+fourth-order continuous extension of the Dormand-Prince method (Hairer,
+Norsett, & Wanner 1993); after a terminal event, the output is NaN
+*/
+void bovy_dopr54_dense(void (*func)(double t, double *q, double *a,
+				    int nargs, struct potentialArg * potentialArgs),
+		       int dim,
+		       double * yo,
+		       int nt, double dt_one, double *t,
+		       int nargs, struct potentialArg * potentialArgs,
+		       double rtol, double atol,
+		       double *result, int * err,
+		       struct denseOutput * dense){
+  //coefficients of the continuous extension
+  static const double d1= -12715105075./11282082432.;
+  static const double d3= 87487479700./32700410799.;
+  static const double d4= -10690763975./1880347072.;
+  static const double d5= 701980252875./199316789632.;
+  static const double d6= -1453857185./822651844.;
+  static const double d7= 69997945./29380423.;
   //Declare and initialize
   double *a= (double *) malloc ( dim * sizeof(double) );
   double *a1= (double *) malloc ( dim * sizeof(double) );
@@ -519,7 +545,12 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
   double *yn1= (double *) malloc ( dim * sizeof(double) );
   double *yerr= (double *) malloc ( dim * sizeof(double) );
   double *ynk= (double *) malloc ( dim * sizeof(double) );
-  int ii;
+  double *rcont[5];
+  int ii, idx;
+  unsigned char accept;
+  double s, s1, h, ydiff, bspl, told, tnext, tlim;
+  for (ii=0; ii < 5; ii++)
+    rcont[ii]= (double *) malloc ( dim * sizeof(double) );
   save_rk(dim,yo,result);
   result+= dim;
   *err= 0;
@@ -529,8 +560,10 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
     dt_one= rk4_estimate_step(*func,dim,yo,dt,t,nargs,potentialArgs,
 			      rtol,atol);
   }
+  double init_dt_one= dt_one;
   //Integrate the system
   double to= *t;
+  double tend= *(t+nt-1);
   //set up a1
   func(to,yn,a1,nargs,potentialArgs);
   // Handle KeyboardInterrupt gracefully
@@ -542,7 +575,8 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
 #else
     if (SetConsoleCtrlHandler(CtrlHandler, TRUE)) {}
 #endif
-  for (ii=0; ii < (nt-1); ii++){
+  idx= 1;
+  while ( idx < nt ) {
     if ( interrupted ) {
       *err= -10;
       interrupted= 0; // need to reset, bc library and vars stay in memory
@@ -554,12 +588,72 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
       break;
 // LCOV_EXCL_STOP
     }
-    bovy_dopr54_onestep(func,dim,yn,dt,&to,&dt_one,
-			nargs,potentialArgs,rtol,atol,
-			a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,err);
-    //save
-    save_rk(dim,yn,result);
-    result+= dim;
+    if ( *(t+idx) == to ) { // e.g., repeated output times
+      save_rk(dim,yn,result);
+      result+= dim;
+      idx++;
+      continue;
+    }
+    accept= 0;
+    if ( init_dt_one/dt_one > _MAX_STEPREDUCE
+	 || dt_one != dt_one) { // check for NaN
+      dt_one= init_dt_one/_MAX_STEPREDUCE;
+      accept= 1;
+      if ( *err % 2 ==  0) *err+= 1;
+    }
+    // Don't step beyond the next output time (or the final time when
+    // storing the dense output, in which case we interpolate)
+    tnext= dense ? tend : *(t+idx);
+    h= dt_one;
+    if ( ( dt >= 0. && h > (tnext - to) ) || ( dt < 0. && h < (tnext - to) ) )
+      h= tnext - to;
+    for (ii=0; ii < dim; ii++) *(rcont[0]+ii)= *(yn+ii);
+    told= to;
+    dt_one= bovy_dopr54_actualstep(func,dim,yn,h,&to,nargs,potentialArgs,
+				   rtol,atol,
+				   a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,
+				   accept,dense != NULL);
+    if ( to == told ) continue; // step rejected
+    // Step accepted: set up the continuous extension (k are h x derivative)
+    for (ii=0; ii < dim; ii++) {
+      ydiff= *(yn+ii) - *(rcont[0]+ii);
+      bspl= *(k1+ii) - ydiff;
+      *(rcont[1]+ii)= ydiff;
+      *(rcont[2]+ii)= bspl;
+      *(rcont[3]+ii)= ydiff - h * *(a1+ii) - bspl;
+      *(rcont[4]+ii)= d1 * *(k1+ii) + d3 * *(k3+ii) + d4 * *(k4+ii)
+	+ d5 * *(k5+ii) + d6 * *(k6+ii) + d7 * h * *(a1+ii);
+    }
+    tlim= to;
+    if ( dense ) {
+      denseOutput_step(dense,told,h,rcont);
+      if ( dense->terminated ) // Only output up to a terminal event
+	tlim= dense->tterm;
+    }
+    //save the output that falls within this step; the maximum step reduction
+    //is counted from the step at the last output
+    while ( idx < nt && ( ( dt >= 0. && *(t+idx) <= tlim )
+			  || ( dt < 0. && *(t+idx) >= tlim ) ) ) {
+      init_dt_one= dt_one;
+      if ( *(t+idx) == to )
+	save_rk(dim,yn,result);
+      else {
+	s= ( *(t+idx) - told ) / h;
+	s1= 1. - s;
+	for (ii=0; ii < dim; ii++)
+	  *(yn1+ii)= *(rcont[0]+ii) + s * ( *(rcont[1]+ii) + s1 * ( *(rcont[2]+ii) + s * ( *(rcont[3]+ii) + s1 * *(rcont[4]+ii))));
+	save_rk(dim,yn1,result);
+      }
+      result+= dim;
+      idx++;
+    }
+    if ( dense && dense->terminated ) {
+      for (; idx < nt; idx++) {
+	for (ii=0; ii < dim; ii++) *(result+ii)= NAN;
+	result+= dim;
+      }
+      break;
+    }
   }
   // Back to default handler
 #ifndef _WIN32
@@ -579,40 +673,8 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
   free(yn1);
   free(yerr);
   free(ynk);
-}
-//one output step, consists of multiple steps potentially
-void bovy_dopr54_onestep(void (*func)(double t, double *y, double *a,int nargs, struct potentialArg *),
-			 int dim, double *yo,
-			 double dt, double *to,double * dt_one,
-			 int nargs,struct potentialArg * potentialArgs,
-			 double rtol,double atol,
-			 double * a1, double * a,
-			 double * k1, double * k2,
-			 double * k3, double * k4,
-			 double * k5, double * k6,
-			 double * yn1, double * yerr,double * ynk, int * err){
-  double init_dt_one= *dt_one;
-  double init_to= *to;
-  unsigned char accept;
-  //printf("%f,%f\n",*to,init_to+dt);
-  while ( ( dt >= 0. && *to < (init_to+dt))
-	  || ( dt < 0. && *to > (init_to+dt)) ) {
-    accept= 0;
-    if ( init_dt_one/ *dt_one > _MAX_STEPREDUCE
-	 || *dt_one != *dt_one) { // check for NaN
-      *dt_one= init_dt_one/_MAX_STEPREDUCE;
-      accept= 1;
-      if ( *err % 2 ==  0) *err+= 1;
-    }
-    if ( dt >= 0. && *dt_one > (init_to+dt - *to) )
-      *dt_one= (init_to + dt - *to);
-    if ( dt < 0. && *dt_one < (init_to+dt - *to) )
-      *dt_one = (init_to + dt - *to);
-    *dt_one= bovy_dopr54_actualstep(func,dim,yo,*dt_one,to,nargs,potentialArgs,
-				    rtol,atol,
-				    a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,
-				    accept);
-  }
+  for (ii=0; ii < 5; ii++)
+    free(rcont[ii]);
 }
 double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int nargs, struct potentialArg *),
 			      int dim, double *yo,
@@ -624,7 +686,8 @@ double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int na
 			      double * k3, double * k4,
 			      double * k5, double * k6,
 			      double * yn1, double * yerr,double * ynk,
-			      unsigned char accept){
+			      unsigned char accept,
+			      unsigned char dense){
   //constant
   static const double c2= 0.2;
   static const double c3= 0.3;
@@ -729,7 +792,10 @@ double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int na
   for (ii=1; ii < dim; ii++)
     if ( fabs(*(yo+ii)) > max_val )
       max_val= fabs(*(yo+ii));
-  //set up scale
+  //set up scale; rtol is log(rtol), so max_val < 1 loosens the tolerance,
+  //which is hidden when the steps end at each output time, but not for the
+  //natural steps taken for the dense output
+  if ( dense && max_val < 1. ) max_val= 1.;
   double c= fmax(atol, rtol * max_val);
   double s= log(exp(atol-c)+exp(rtol*max_val-c))+c;
   //Norm
@@ -38,6 +38,7 @@ extern "C" {
   include
 */
 #include <bovy_symplecticode.h>
+#include <dense_output.h>
 /*
   Function declarations
 */
@@ -95,17 +96,15 @@ void bovy_dopr54(void (*func)(double, double *, double *,
 		 int, struct potentialArg *,
 		 double, double,
 		 double *,int *);
-void bovy_dopr54_onestep(void (*func)(double, double *, double *,int, struct potentialArg *),
-			 int, double *,
-			 double, double *,double *,
-			 int,struct potentialArg *,
-			 double,double,
-			 double *, double *,
-			 double *, double *,
-			 double *, double *,
-			 double *, double *,
-			 double *, double *,
-			 double *,int *);
+void bovy_dopr54_dense(void (*func)(double, double *, double *,
+				    int, struct potentialArg *),
+		       int,
+		       double *,
+		       int, double, double *,
+		       int, struct potentialArg *,
+		       double, double,
+		       double *,int *,
+		       struct denseOutput *);
 double bovy_dopr54_actualstep(void (*func)(double, double *, double *,int, struct potentialArg *),
 			      int, double *,
 			      double, double *,
@@ -116,7 +115,7 @@ double bovy_dopr54_actualstep(void (*func)(double, double *, double *,int, struc
 			      double *, double *,
 			      double *, double *,
 			      double *, double *,
-			      double *,unsigned char);
+			      double *,unsigned char,unsigned char);
 #ifdef __cplusplus
 }
 #endif
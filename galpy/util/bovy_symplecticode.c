@@ -1002,3 +1002,233 @@ double symplec6_estimate_step(void (*func)(double t, double *q, double *a,int na
   //fflush(stdout);
   return dt;
 }
+/*
+Time-symmetric adaptive-step symplectic integrators, using the
+time-symmetrization of Hut, Makino, & McMillan (1995): the step h_n is
+chosen such that h_n = eta / omega(x_n,x_{n+1}), with omega a symmetric
+function of the beginning and end of the step, by iterating the step; the
+base step is a symmetric composition of kick-drift-kick leapfrog steps
+(Yoshida 1990). The frequency omega is the maximum of
+  - the average of (|a|/|q|)^(1/2) at the beginning and end of the step
+  - (|Delta a| / |Delta t| / <|p|>)^(1/2), the frequency associated with the
+    jerk along the step, which picks up close encounters with moving objects
+*/
+#define _ADAPTIVE_MAX_ITER 3
+#define _ADAPTIVE_ITER_TOL 1e-3
+#define _ADAPTIVE_MIN_DT_FRAC 1e-10
+static inline double norm2(int dim, double *x){
+  int ii;
+  double out= 0.;
+  for (ii=0; ii < dim; ii++) out+= *(x+ii) * *(x+ii);
+  return out;
+}
+static inline double adaptive_omega_q(int dim, double *q, double *a){
+  double a2= norm2(dim,a);
+  if ( a2 == 0. ) return 0.;
+  return pow(a2/norm2(dim,q),0.25);
+}
+static double adaptive_timestep(int dim, double *qo, double *po, double *ao,
+				double *qn, double *pn, double *an,
+				double h, double eta){
+  int ii;
+  double da2= 0., pmean, omega_j= 0.;
+  double omega= 0.5 * ( adaptive_omega_q(dim,qo,ao)
+			+ adaptive_omega_q(dim,qn,an) );
+  for (ii=0; ii < dim; ii++)
+    da2+= ( *(an+ii) - *(ao+ii) ) * ( *(an+ii) - *(ao+ii) );
+  pmean= 0.5 * ( sqrt(norm2(dim,po)) + sqrt(norm2(dim,pn)) );
+  if ( pmean > 0. && h > 0. ) omega_j= sqrt(sqrt(da2) / h / pmean);
+  omega= fmax(omega,omega_j);
+  if ( omega == 0. ) return INFINITY;
+  return eta / omega;
+}
+static inline double adaptive_clip(double h, double mindt, double maxdt,
+				   double remaining){
+  return fmin(fmin(fmax(h,mindt),maxdt),remaining);
+}
+static void symmetric_composition_step(void (*func)(double t, double *q,
+						    double *a, int nargs,
+						    struct potentialArg *),
+				       int dim, double *q, double *p,
+				       double *a, double *qn, double *pn,
+				       double *an, double to, double h,
+				       int nw, double *w,
+				       int nargs,
+				       struct potentialArg * potentialArgs){
+  int ii, kk;
+  double hk;
+  for (ii=0; ii < dim; ii++) {
+    *(qn+ii)= *(q+ii);
+    *(pn+ii)= *(p+ii);
+    *(an+ii)= *(a+ii);
+  }
+  for (kk=0; kk < nw; kk++) {
+    hk= *(w+kk) * h;
+    leapfrog_leapp(dim,pn,hk/2.,an,pn);
+    leapfrog_leapq(dim,qn,pn,hk,qn);
+    to+= hk;
+    func(to,qn,an,nargs,potentialArgs);
+    leapfrog_leapp(dim,pn,hk/2.,an,pn);
+  }
+}
+static void symplectic_adaptive(void (*func)(double t, double *q, double *a,
+					     int nargs,
+					     struct potentialArg * potentialArgs),
+				int dim,
+				double * yo,
+				int nt, double dt, double *t,
+				int nargs, struct potentialArg * potentialArgs,
+				double rtol, double atol,
+				double *result,int * err,
+				int nw, double * w, int order){
+  //Initialize
+  double *qo= (double *) malloc ( dim * sizeof(double) );
+  double *po= (double *) malloc ( dim * sizeof(double) );
+  double *a= (double *) malloc ( dim * sizeof(double) );
+  double *qn= (double *) malloc ( dim * sizeof(double) );
+  double *pn= (double *) malloc ( dim * sizeof(double) );
+  double *an= (double *) malloc ( dim * sizeof(double) );
+  double *tmp;
+  int ii, kk;
+  double to, tnext, sgn, remaining, mindt, maxdt;
+  double h, hstep, hnew, omega;
+  for (ii=0; ii < dim; ii++) {
+    *(qo+ii)= *(yo+ii);
+    *(po+ii)= *(yo+dim+ii);
+  }
+  save_qp(dim,qo,po,result);
+  result+= 2 * dim;
+  *err= 0;
+  // Accuracy parameter: local error of order eta^(order+1) ~ rtol, reduced
+  // for the higher-order methods, because of their larger error coefficients
+  double eta= exp(rtol/(order+1.)) / ( order / 2. );
+  // dt, if set, is the maximum stepsize
+  maxdt= ( dt == -9999.99 ) ? INFINITY : fabs(dt);
+  //Integrate the system
+  to= *t;
+  func(to,qo,a,nargs,potentialArgs);
+  // Initial guess for the first step
+  omega= adaptive_omega_q(dim,qo,a);
+  h= ( omega > 0. ) ? eta / omega : INFINITY;
+  // Handle KeyboardInterrupt gracefully
+#ifndef _WIN32
+  struct sigaction action;
+  memset(&action, 0, sizeof(struct sigaction));
+  action.sa_handler= handle_sigint;
+  sigaction(SIGINT,&action,NULL);
+#else
+    if (SetConsoleCtrlHandler(CtrlHandler, TRUE)) {}
+#endif
+  for (ii=0; ii < (nt-1); ii++){
+    if ( interrupted ) {
+      *err= -10;
+      interrupted= 0; // need to reset, bc library and vars stay in memory
+#ifdef USING_COVERAGE
+      __gcov_dump();
+// LCOV_EXCL_START
+      __gcov_reset();
+#endif
+      break;
+// LCOV_EXCL_STOP
+    }
+    tnext= *(t+ii+1);
+    sgn= ( tnext > to ) ? 1. : -1.;
+    mindt= fabs(tnext - *(t+ii)) * _ADAPTIVE_MIN_DT_FRAC;
+    remaining= sgn * ( tnext - to );
+    while ( remaining > 0. ) {
+      // Iterate to the time-symmetric step, starting from the previous step
+      for (kk=0; kk < _ADAPTIVE_MAX_ITER; kk++) {
+	hstep= adaptive_clip(h,mindt,maxdt,remaining);
+	symmetric_composition_step(func,dim,qo,po,a,qn,pn,an,to,sgn*hstep,
+				   nw,w,nargs,potentialArgs);
+	hnew= adaptive_timestep(dim,qo,po,a,qn,pn,an,hstep,eta);
+	if ( fabs(adaptive_clip(hnew,mindt,maxdt,remaining)-hstep)
+	     <= _ADAPTIVE_ITER_TOL * hstep ) {
+	  h= hnew;
+	  break;
+	}
+	h= hnew;
+      }
+      if ( hstep == mindt ) *err= 1;
+      if ( hstep == remaining ) {
+	to= tnext;
+	remaining= 0.;
+      }
+      else {
+	to+= sgn * hstep;
+	remaining= sgn * ( tnext - to );
+      }
+      // swap
+      tmp= qo; qo= qn; qn= tmp;
+      tmp= po; po= pn; pn= tmp;
+      tmp= a; a= an; an= tmp;
+    }
+    //save
+    save_qp(dim,qo,po,result);
+    result+= 2 * dim;
+  }
+  // Back to default handler
+#ifndef _WIN32
+  action.sa_handler= SIG_DFL;
+  sigaction(SIGINT,&action,NULL);
+#endif
+  //Free allocated memory
+  free(qo);
+  free(po);
+  free(a);
+  free(qn);
+  free(pn);
+  free(an);
+  //We're done
+}
+/*
+Adaptive-step versions of leapfrog, symplec4, and symplec6
+Usage: same as leapfrog, except that
+       double dt: (optional) maximum stepsize to use
+       double *t: times at which the output is wanted (do not need to be equally spaced)
+       double rtol: relative tolerance, sets the timestep parameter eta= rtol^(1/(order+1))/(order/2)
+  Output:
+       int *err: error: 1 if the minimum stepsize was reached, -10 if interrupted by CTRL-C (SIGINT)
+*/
+void leapfrog_adaptive(void (*func)(double t, double *q, double *a,
+				    int nargs,
+				    struct potentialArg * potentialArgs),
+		       int dim,
+		       double * yo,
+		       int nt, double dt, double *t,
+		       int nargs, struct potentialArg * potentialArgs,
+		       double rtol, double atol,
+		       double *result,int * err){
+  double w[1]= {1.};
+  symplectic_adaptive(func,dim,yo,nt,dt,t,nargs,potentialArgs,rtol,atol,
+		      result,err,1,w,2);
+}
+void symplec4_adaptive(void (*func)(double t, double *q, double *a,
+				    int nargs,
+				    struct potentialArg * potentialArgs),
+		       int dim,
+		       double * yo,
+		       int nt, double dt, double *t,
+		       int nargs, struct potentialArg * potentialArgs,
+		       double rtol, double atol,
+		       double *result,int * err){
+  double w[3]= {1.3512071919596578,-1.7024143839193153,1.3512071919596578};
+  symplectic_adaptive(func,dim,yo,nt,dt,t,nargs,potentialArgs,rtol,atol,
+		      result,err,3,w,4);
+}
+void symplec6_adaptive(void (*func)(double t, double *q, double *a,
+				    int nargs,
+				    struct potentialArg * potentialArgs),
+		       int dim,
+		       double * yo,
+		       int nt, double dt, double *t,
+		       int nargs, struct potentialArg * potentialArgs,
+		       double rtol, double atol,
+		       double *result,int * err){
+  // Yoshida (1990) solution A
+  double w[7]= {0.784513610477560,0.235573213359357,-1.17767998417887,
+		1.31518632068391,
+		-1.17767998417887,0.235573213359357,0.784513610477560};
+  symplectic_adaptive(func,dim,yo,nt,dt,t,nargs,potentialArgs,rtol,atol,
+		      result,err,7,w,6);
+}
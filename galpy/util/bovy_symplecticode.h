@@ -88,6 +88,30 @@ double symplec6_estimate_step(void (*func)(double , double *, double *,int, stru
 			      double, double *,
 			      int,struct potentialArg *,
 			      double,double);
+void leapfrog_adaptive(void (*func)(double, double *, double *,
+			   int, struct potentialArg *),
+	      int,
+	      double *,
+	      int, double, double *,
+	      int, struct potentialArg *,
+	      double, double,
+	      double *,int *);
+void symplec4_adaptive(void (*func)(double, double *, double *,
+			   int, struct potentialArg *),
+	      int,
+	      double *,
+	      int, double, double *,
+	      int, struct potentialArg *,
+	      double, double,
+	      double *,int *);
+void symplec6_adaptive(void (*func)(double, double *, double *,
+			   int, struct potentialArg *),
+	      int,
+	      double *,
+	      int, double, double *,
+	      int, struct potentialArg *,
+	      double, double,
+	      double *,int *);
 #ifdef __cplusplus
 }
 #endif
@@ -16,6 +16,7 @@ default_configuration = {
         "check-non-interactive-every": "1",
         "last-non-interactive-check": "2000-01-01",
     },
+    "cache": {"dir": os.path.join("~", ".galpy", "cache"), "mwpotentials": "False"},
 }
 default_filename = os.path.join(os.path.expanduser("~"), ".galpyrc")
 
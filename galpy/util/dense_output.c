@@ -0,0 +1,293 @@
+/*
+  Storage of the dense output of the Dormand-Prince integrators and event
+  detection on it, see the header file for the format
+*/
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+#include <dense_output.h>
+#ifdef _WIN32
+#define EXPORT __declspec(dllexport)
+#elif defined(__GNUC__)
+#define EXPORT __attribute__((visibility("default")))
+#else
+#define EXPORT
+#endif
+#define DENSE_OUTPUT_INIT_CAPACITY 128
+#define EVENT_INIT_CAPACITY 16
+#define EVENT_MAX_ITER 100
+#define EVENT_STOL 1e-14
+/*
+NAME: alloc_denseOutput
+PURPOSE: allocate the dense-output storage for nobj objects
+INPUT:
+   int nobj - number of objects
+   int dim - dimension of the phase space
+   int ncoeff - number of coefficients of the interpolating polynomial
+   int store - if true, store the steps
+   int nevent_type - number of events to detect
+   int * event_type - type of each event (EVENT_ defines in the header)
+   double * event_par - parameter of each event
+   int * event_terminal - whether each event terminates the integration
+OUTPUT:
+   array of nobj struct denseOutput
+ */
+struct denseOutput * alloc_denseOutput(int nobj, int dim, int ncoeff,
+				       int store, int nevent_type,
+				       int * event_type, double * event_par,
+				       int * event_terminal){
+  int ii;
+  struct denseOutput * dense= (struct denseOutput *) malloc ( nobj * sizeof (struct denseOutput) );
+  for (ii=0; ii < nobj; ii++) {
+    (dense+ii)->dim= dim;
+    (dense+ii)->ncoeff= ncoeff;
+    (dense+ii)->store= store;
+    (dense+ii)->nstep= 0;
+    (dense+ii)->capacity= store ? DENSE_OUTPUT_INIT_CAPACITY : 0;
+    (dense+ii)->tstep= (double *) malloc ( 2 * (dense+ii)->capacity * sizeof(double) );
+    (dense+ii)->coeff= (double *) malloc ( ncoeff * dim * (dense+ii)->capacity * sizeof(double) );
+    (dense+ii)->nevent_type= nevent_type;
+    (dense+ii)->event_type= event_type;
+    (dense+ii)->event_par= event_par;
+    (dense+ii)->event_terminal= event_terminal;
+    (dense+ii)->event_max= 0;
+    (dense+ii)->nevent= 0;
+    (dense+ii)->event_capacity= EVENT_INIT_CAPACITY;
+    (dense+ii)->event_t= (double *) malloc ( EVENT_INIT_CAPACITY * sizeof(double) );
+    (dense+ii)->event_indx= (int *) malloc ( EVENT_INIT_CAPACITY * sizeof(int) );
+    (dense+ii)->event_state= (double *) malloc ( dim * EVENT_INIT_CAPACITY * sizeof(double) );
+    (dense+ii)->terminated= 0;
+    (dense+ii)->tterm= 0.;
+  }
+  return dense;
+}
+/*
+NAME: eval_denseOutput_step
+PURPOSE: evaluate the interpolating polynomial of a single step
+INPUT:
+   int ncoeff - number of coefficients
+   int dim - dimension of the phase space
+   double ** coeffs - ncoeff arrays of dim coefficients
+   double s - fraction of the step (0 <= s <= 1)
+OUTPUT (as arguments):
+   double * y - phase-space position at s
+ */
+void eval_denseOutput_step(int ncoeff, int dim, double ** coeffs, double s,
+			   double * y){
+  int ii, jj;
+  double s1= 1. - s;
+  for (jj=0; jj < dim; jj++) {
+    *(y+jj)= *(*(coeffs+ncoeff-1)+jj);
+    for (ii=ncoeff-2; ii >= 0; ii--)
+      *(y+jj)= *(*(coeffs+ii)+jj) + ( ii % 2 == 0 ? s : s1 ) * *(y+jj);
+  }
+}
+static double event_function(int type, double par, int dim, double * y){
+  int ii;
+  double out= 0.;
+  switch ( type ) {
+  case EVENT_PERICENTER:
+  case EVENT_APOCENTER:
+    for (ii=0; ii < dim/2; ii++)
+      out+= *(y+ii) * *(y+ii+dim/2);
+    return out;
+  case EVENT_ZCROSS:
+    return *(y+2);
+  case EVENT_ZMAX:
+    return *(y+2) * *(y+5);
+  case EVENT_ESCAPE:
+    for (ii=0; ii < dim/2; ii++)
+      out+= *(y+ii) * *(y+ii);
+    return out - par * par;
+  case EVENT_SECTION:
+    return *(y+(int) par);
+  }
+  return out; // LCOV_EXCL_LINE
+}
+// Direction of the zero crossing in time: 1: upwards, -1: downwards, 0: both
+static int event_direction(int type){
+  switch ( type ) {
+  case EVENT_PERICENTER:
+  case EVENT_ESCAPE:
+  case EVENT_SECTION:
+    return 1;
+  case EVENT_APOCENTER:
+  case EVENT_ZMAX:
+    return -1;
+  }
+  return 0;
+}
+// Find the root of an event function within a step using the Illinois method
+static double event_root(struct denseOutput * dense, double ** coeffs,
+			 int type, double par, double ga, double gb,
+			 double * y){
+  int ii;
+  int side= 0;
+  double sa= 0., sb= 1., sc= 1., gc;
+  for (ii=0; ii < EVENT_MAX_ITER; ii++) {
+    sc= ( sa * gb - sb * ga ) / ( gb - ga );
+    eval_denseOutput_step(dense->ncoeff,dense->dim,coeffs,sc,y);
+    gc= event_function(type,par,dense->dim,y);
+    if ( gc == 0. || fabs(sb-sa) < EVENT_STOL ) break;
+    if ( gc * gb < 0. ) {
+      sa= sb;
+      ga= gb;
+      side= 0;
+    }
+    else {
+      ga*= ( side == 1 ) ? 0.5 : 1.;
+      side= 1;
+    }
+    sb= sc;
+    gb= gc;
+  }
+  return sc;
+}
+static void append_event(struct denseOutput * dense, double t, int indx,
+			 double * y){
+  if ( dense->nevent == dense->event_capacity ) {
+    dense->event_capacity*= 2;
+    dense->event_t= (double *) realloc ( dense->event_t, dense->event_capacity * sizeof(double) );
+    dense->event_indx= (int *) realloc ( dense->event_indx, dense->event_capacity * sizeof(int) );
+    dense->event_state= (double *) realloc ( dense->event_state, dense->dim * dense->event_capacity * sizeof(double) );
+  }
+  *(dense->event_t + dense->nevent)= t;
+  *(dense->event_indx + dense->nevent)= indx;
+  memcpy(dense->event_state + dense->dim * dense->nevent,y,
+	 dense->dim * sizeof(double));
+  dense->nevent+= 1;
+}
+/*
+NAME: denseOutput_step
+PURPOSE: process an accepted step: store its interpolating polynomial (if
+         requested) and detect events within the step; if a terminal event
+         occurs or the maximum number of events is reached,
+         dense->terminated is set and dense->tterm is its time
+INPUT:
+   struct denseOutput * dense - storage for this object
+   double to - start time of the step
+   double h - step size
+   double ** coeffs - ncoeff arrays of dim coefficients
+ */
+void denseOutput_step(struct denseOutput * dense, double to, double h,
+		      double ** coeffs){
+  int ii, jj, dir;
+  int stride= dense->ncoeff * dense->dim;
+  double ga, gb, sroot, sterm;
+  double * y;
+  double * sroots;
+  if ( dense->store ) {
+    if ( dense->nstep == dense->capacity ) {
+      dense->capacity*= 2;
+      dense->tstep= (double *) realloc ( dense->tstep, 2 * dense->capacity * sizeof(double) );
+      dense->coeff= (double *) realloc ( dense->coeff, stride * dense->capacity * sizeof(double) );
+    }
+    *(dense->tstep + 2 * dense->nstep)= to;
+    *(dense->tstep + 2 * dense->nstep + 1)= h;
+    for (ii=0; ii < dense->ncoeff; ii++)
+      memcpy(dense->coeff + stride * dense->nstep + ii * dense->dim,
+	     *(coeffs+ii),dense->dim * sizeof(double));
+    dense->nstep+= 1;
+  }
+  if ( dense->nevent_type == 0 ) return;
+  // Events: find the roots of all event functions within this step first,
+  // such that we can drop those that occur after a terminal event
+  y= (double *) malloc ( dense->dim * sizeof(double) );
+  sroots= (double *) malloc ( dense->nevent_type * sizeof(double) );
+  sterm= 2.;
+  for (ii=0; ii < dense->nevent_type; ii++) {
+    *(sroots+ii)= -1.;
+    // Start of the step is the first coefficient, end is the sum of the first
+    // two coefficients
+    ga= event_function(*(dense->event_type+ii),*(dense->event_par+ii),
+		       dense->dim,*coeffs);
+    eval_denseOutput_step(dense->ncoeff,dense->dim,coeffs,1.,y);
+    gb= event_function(*(dense->event_type+ii),*(dense->event_par+ii),
+		       dense->dim,y);
+    // Direction is with respect to time, which may run backwards
+    dir= event_direction(*(dense->event_type+ii)) * ( h >= 0. ? 1 : -1 );
+    if ( !( ( dir >= 0 && ga < 0. && gb >= 0. )
+	    || ( dir <= 0 && ga > 0. && gb <= 0. ) ) )
+      continue;
+    sroot= ( gb == 0. ) ? 1. : event_root(dense,coeffs,
+					   *(dense->event_type+ii),
+					   *(dense->event_par+ii),ga,gb,y);
+    *(sroots+ii)= sroot;
+    if ( *(dense->event_terminal+ii) && sroot < sterm )
+      sterm= sroot;
+  }
+  // Append the events in the order in which they occur, such that we can
+  // stop once the maximum number of events is reached
+  while ( 1 ) {
+    jj= -1;
+    for (ii=0; ii < dense->nevent_type; ii++)
+      if ( *(sroots+ii) >= 0. && *(sroots+ii) <= sterm
+	   && ( jj < 0 || *(sroots+ii) < *(sroots+jj) ) )
+	jj= ii;
+    if ( jj < 0 ) break;
+    eval_denseOutput_step(dense->ncoeff,dense->dim,coeffs,*(sroots+jj),y);
+    append_event(dense,to + *(sroots+jj) * h,jj,y);
+    if ( dense->event_max > 0 && dense->nevent >= dense->event_max ) {
+      sterm= *(sroots+jj);
+      break;
+    }
+    *(sroots+jj)= -1.;
+  }
+  if ( sterm <= 1. ) {
+    dense->terminated= 1;
+    dense->tterm= to + sterm * h;
+  }
+  free(y);
+  free(sroots);
+}
+EXPORT int denseOutput_nstep(struct denseOutput * dense, int ii){
+  return (dense+ii)->nstep;
+}
+/*
+NAME: denseOutput_copy
+PURPOSE: copy the dense output of object ii into arrays allocated by the caller
+INPUT:
+   struct denseOutput * dense - storage for all objects
+   int ii - object to copy
+OUTPUT (as arguments):
+   double * tstep - (nstep,2) array of (t_old,h)
+   double * coeff - (nstep,ncoeff,dim) array of coefficients
+ */
+EXPORT void denseOutput_copy(struct denseOutput * dense, int ii,
+			     double * tstep, double * coeff){
+  memcpy(tstep,(dense+ii)->tstep,2 * (dense+ii)->nstep * sizeof(double));
+  memcpy(coeff,(dense+ii)->coeff,
+	 (dense+ii)->ncoeff * (dense+ii)->dim * (dense+ii)->nstep * sizeof(double));
+}
+EXPORT int denseOutput_nevent(struct denseOutput * dense, int ii){
+  return (dense+ii)->nevent;
+}
+/*
+NAME: denseOutput_copy_events
+PURPOSE: copy the events detected for object ii into arrays allocated by the caller
+INPUT:
+   struct denseOutput * dense - storage for all objects
+   int ii - object to copy
+OUTPUT (as arguments):
+   double * t - (nevent) array of event times
+   int * indx - (nevent) array of the index of the event function
+   double * state - (nevent,dim) array of phase-space positions
+ */
+EXPORT void denseOutput_copy_events(struct denseOutput * dense, int ii,
+				    double * t, int * indx, double * state){
+  memcpy(t,(dense+ii)->event_t,(dense+ii)->nevent * sizeof(double));
+  memcpy(indx,(dense+ii)->event_indx,(dense+ii)->nevent * sizeof(int));
+  memcpy(state,(dense+ii)->event_state,
+	 (dense+ii)->dim * (dense+ii)->nevent * sizeof(double));
+}
+EXPORT void free_denseOutput(struct denseOutput * dense, int nobj){
+  int ii;
+  for (ii=0; ii < nobj; ii++) {
+    free((dense+ii)->tstep);
+    free((dense+ii)->coeff);
+    free((dense+ii)->event_t);
+    free((dense+ii)->event_indx);
+    free((dense+ii)->event_state);
+  }
+  free(dense);
+}
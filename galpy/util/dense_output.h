@@ -0,0 +1,56 @@
+/*
+  Storage of the dense output (continuous extension) of the Dormand-Prince
+  integrators: for every accepted step, the start time, the step size, and
+  the coefficients of the interpolating polynomial are stored, such that
+  the solution can be evaluated at any time within the integration range as
+    y(t_old+s*h) = c1 + s*(c2 + s1*(c3 + s*(c4 + s1*(c5 + s*(c6 + ...)))))
+  with s1 = 1 - s. The interpolant is also used to detect events, such as
+  pericenter passages, and optionally to terminate the integration when
+  they occur
+*/
+#ifndef __DENSE_OUTPUT_H__
+#define __DENSE_OUTPUT_H__
+#ifdef __cplusplus
+extern "C" {
+#endif
+struct denseOutput {
+  int dim;
+  int ncoeff;
+  int store; // whether to store the steps (otherwise only detect events)
+  int nstep;
+  int capacity;
+  double *tstep; // (t_old,h) for each step
+  double *coeff; // ncoeff x dim coefficients for each step
+  // Events, detected as roots of event functions of the interpolant
+  int nevent_type;
+  int *event_type; // see EVENT_ defines below
+  double *event_par; // parameter of each event function (e.g., escape radius)
+  int *event_terminal; // whether each event terminates the integration
+  int event_max; // terminate once this many events occurred (0: no limit)
+  int nevent;
+  int event_capacity;
+  double *event_t; // time of each detected event
+  int *event_indx; // index into event_type of each detected event
+  double *event_state; // dim phase-space coordinates of each detected event
+  int terminated;
+  double tterm;
+};
+// Built-in event functions of the rectangular phase-space coordinates
+#define EVENT_PERICENTER 0 // x.v crosses zero upwards
+#define EVENT_APOCENTER 1 // x.v crosses zero downwards
+#define EVENT_ZCROSS 2 // z crosses zero
+#define EVENT_ZMAX 3 // z vz crosses zero downwards
+#define EVENT_ESCAPE 4 // r crosses the parameter upwards
+#define EVENT_SECTION 5 // coordinate par (0: x, 1: y, 2: z) crosses zero upwards
+struct denseOutput * alloc_denseOutput(int,int,int,int,int,int *,double *,int *);
+void denseOutput_step(struct denseOutput *,double,double,double **);
+void eval_denseOutput_step(int,int,double **,double,double *);
+int denseOutput_nstep(struct denseOutput *,int);
+void denseOutput_copy(struct denseOutput *,int,double *,double *);
+int denseOutput_nevent(struct denseOutput *,int);
+void denseOutput_copy_events(struct denseOutput *,int,double *,int *,double *);
+void free_denseOutput(struct denseOutput *,int);
+#ifdef __cplusplus
+}
+#endif
+#endif /* dense_output.h */
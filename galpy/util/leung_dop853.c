@@ -240,6 +240,26 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 	double atol,
 	double *result,
 	int *err_)
+{
+	dop853_dense(func, dim, y0, nt, dt, t, nargs, potentialArgs, rtol, atol, result, err_, NULL);
+}
+/*
+Same as dop853, but storing the dense output of every step and detecting
+events if dense is not NULL; after a terminal event, the output is NaN
+*/
+void dop853_dense(void(*func)(double t, double *q, double *a, int nargs, struct potentialArg * potentialArgs),
+	int dim,
+	double * y0,
+	int nt,
+	double dt,
+	double *t,
+	int nargs,
+	struct potentialArg * potentialArgs,
+	double rtol,
+	double atol,
+	double *result,
+	int *err_,
+	struct denseOutput * dense)
 {
 	rtol = exp(rtol);
 	atol = exp(atol);
@@ -276,6 +296,7 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 	double *rcont6 = (double*)malloc(dim * sizeof(double));
 	double *rcont7 = (double*)malloc(dim * sizeof(double));
 	double *rcont8 = (double*)malloc(dim * sizeof(double));
+	double *rcont[8];
 	int i;
 	double hnew, ydiff, bspl;
 	double dnf, dny, sk, h, h1, der2, der12;
@@ -462,8 +483,16 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 				y0[i] = k5[i];
 			}
 
-			// loop for dense output in this time slot
-			while ((finished_user_t_ii < nt - 1) && (pos_neg * t[finished_user_t_ii + 1] < pos_neg * t_current))
+			if (dense)
+			{
+				rcont[0] = rcont1; rcont[1] = rcont2; rcont[2] = rcont3; rcont[3] = rcont4;
+				rcont[4] = rcont5; rcont[5] = rcont6; rcont[6] = rcont7; rcont[7] = rcont8;
+				denseOutput_step(dense, t_old, h, rcont);
+			}
+
+			// loop for dense output in this time slot (only up to a terminal event)
+			while ((finished_user_t_ii < nt - 1) && (pos_neg * t[finished_user_t_ii + 1] < pos_neg * t_current)
+			       && !(dense && dense->terminated && pos_neg * t[finished_user_t_ii + 1] > pos_neg * dense->tterm))
 			{
 				s = (t[finished_user_t_ii + 1] - t_old) / h;
 				s1 = 1.0 - s;
@@ -472,6 +501,16 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 				result += dim;
 				finished_user_t_ii++;
 			}
+			if (dense && dense->terminated)
+			{
+				// terminal event: output is NaN afterwards
+				for (; finished_user_t_ii < nt - 1; finished_user_t_ii++)
+				{
+					for (i = 0; i < dim; i++) result[i] = NAN;
+					result += dim;
+				}
+				break;
+			}
 
 			hnew = (fabs(hnew) > fabs(hmax)) ? pos_neg * hmax : hnew;
 			if (reject)
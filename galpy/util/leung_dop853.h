@@ -37,6 +37,7 @@ extern "C" {
 #endif
 #include "signal.h"
 #include <galpy_potentials.h>
+#include <dense_output.h>
 /* Global variables */
 extern volatile sig_atomic_t interrupted;
 #ifndef _WIN32
@@ -86,6 +87,21 @@ void dop853 (
 	double *,
 	int *
 );
+void dop853_dense (
+	void(*func)(double, double *, double *, int, struct potentialArg *),
+	int,
+	double *,
+	int,
+	double,
+	double *,
+	int,
+	struct potentialArg *,
+	double,
+	double,
+	double *,
+	int *,
+	struct denseOutput *
+);
 #ifdef __cplusplus
 }
 #endif
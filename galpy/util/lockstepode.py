@@ -0,0 +1,133 @@
+#############################################################################
+# Fixed-step ODE integrators that advance many orbits in lockstep, such that
+# each force evaluation is a single vectorized call for all orbits
+#############################################################################
+import numpy
+
+from .symplecticode import _MAX_DT_REDUCE
+
+# Forest & Ruth (1990) / Yoshida (1990) 4th-order symplectic coefficients
+# (drifts c and kicks d), the same as those used in C
+_SYMPLEC4_C = [
+    0.6756035959798289,
+    -0.1756035959798288,
+    -0.1756035959798288,
+    0.6756035959798289,
+]
+_SYMPLEC4_D = [1.3512071919596578, -1.7024143839193153, 1.3512071919596578]
+
+
+def integrate_lockstep(
+    func, qo, po, t, method="leapfrog", dt=None, rtol=1.49012e-12, atol=None
+):
+    """
+    NAME:
+       integrate_lockstep
+    PURPOSE:
+       integrate many orbits in lockstep with a fixed-step integrator
+    INPUT:
+       func - acceleration function func(q,p,t) of positions and velocities with shape [N,dim] that returns an array with shape [N,dim] (should not depend on p for the symplectic integrators)
+       qo - initial positions [N,dim]
+       po - initial velocities [N,dim]
+       t - set of times at which one wants the result
+       method= ('leapfrog') 'leapfrog', 'symplec4', or 'rk4'
+       dt= (None) (maximum) step to use, each output interval is divided into an integer number of steps; default: determine a common step for all orbits from rtol and atol and the first output interval
+       rtol= (1.49012e-12) relative tolerance used to determine the step
+       atol= (None) absolute tolerance used to determine the step (default: 1.49012e-12)
+    OUTPUT:
+       y : array, shape (N,len(t),2*dim)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+    HISTORY:
+       2026-10-19 - Written
+       2026-10-19 - Added support for times that are not equally spaced
+       2026-10-19 - Added atol=None for the default absolute tolerance
+    """
+    if method.lower() == "leapfrog":
+        step = _leapfrog_step
+    elif method.lower() == "symplec4":
+        step = _symplec4_step
+    elif method.lower() == "rk4":
+        step = _rk4_step
+    else:
+        raise ValueError(f"{method} is not a valid lockstep integration method")
+    qo = numpy.array(qo, dtype="float")
+    po = numpy.array(po, dtype="float")
+    out = numpy.empty((qo.shape[0], len(t), 2 * qo.shape[1]))
+    out[:, 0, : qo.shape[1]] = qo
+    out[:, 0, qo.shape[1] :] = po
+    if len(t) < 2:
+        return out
+    if atol is None:
+        atol = 1.49012e-12
+    if dt is None:
+        dt = _estimate_step(step, func, qo, po, t[1] - t[0], t[0], rtol, atol)
+    to = t[0]
+    for ii in range(1, len(t)):
+        # Step each output interval by its own length, such that the times
+        # do not need to be equally spaced
+        out_dt = t[ii] - t[ii - 1]
+        ndt = max(1, int(numpy.ceil(out_dt / dt - 1e-8)))
+        this_dt = out_dt / ndt
+        for jj in range(ndt):
+            qo, po = step(func, qo, po, to, this_dt)
+            to += this_dt
+        out[:, ii, : qo.shape[1]] = qo
+        out[:, ii, qo.shape[1] :] = po
+        to = t[ii]  # avoid accumulating round-off in the time
+    return out
+
+
+def _leapfrog_step(func, q, p, t, dt):
+    """One drift-kick-drift leapfrog step"""
+    q = q + 0.5 * dt * p
+    p = p + dt * func(q, p, t + 0.5 * dt)
+    return (q + 0.5 * dt * p, p)
+
+
+def _symplec4_step(func, q, p, t, dt):
+    """One 4th-order symplectic step"""
+    for c, d in zip(_SYMPLEC4_C[:-1], _SYMPLEC4_D):
+        q = q + c * dt * p
+        t = t + c * dt
+        p = p + d * dt * func(q, p, t)
+    return (q + _SYMPLEC4_C[-1] * dt * p, p)
+
+
+def _rk4_step(func, q, p, t, dt):
+    """One classical 4th-order Runge-Kutta step"""
+    k1q, k1p = p, func(q, p, t)
+    k2q = p + 0.5 * dt * k1p
+    k2p = func(q + 0.5 * dt * k1q, k2q, t + 0.5 * dt)
+    k3q = p + 0.5 * dt * k2p
+    k3p = func(q + 0.5 * dt * k2q, k3q, t + 0.5 * dt)
+    k4q = p + dt * k3p
+    k4p = func(q + dt * k3q, k4q, t + dt)
+    return (
+        q + dt / 6.0 * (k1q + 2.0 * k2q + 2.0 * k3q + k4q),
+        p + dt / 6.0 * (k1p + 2.0 * k2p + 2.0 * k3p + k4p),
+    )
+
+
+def _estimate_step(step, func, qo, po, dt, to, rtol, atol):
+    """Find the largest step dt/2^n for which one step and two half steps agree to within the tolerance for all orbits"""
+    init_dt = dt
+    qscale = atol + rtol * numpy.amax(numpy.fabs(qo), axis=1)[:, None]
+    pscale = atol + rtol * numpy.amax(numpy.fabs(po), axis=1)[:, None]
+    err = 2.0
+    dt *= 2.0
+    while err > 1.0 and init_dt / dt < _MAX_DT_REDUCE:
+        dt /= 2.0
+        q1, p1 = step(func, qo, po, to, dt)
+        q2, p2 = step(func, qo, po, to, dt / 2.0)
+        q2, p2 = step(func, q2, p2, to + dt / 2.0, dt / 2.0)
+        err = numpy.amax(
+            numpy.sqrt(
+                0.5
+                * (
+                    numpy.mean(((q1 - q2) / qscale) ** 2.0, axis=1)
+                    + numpy.mean(((p1 - p2) / pscale) ** 2.0, axis=1)
+                )
+            )
+        )
+    return dt
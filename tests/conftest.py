@@ -86,6 +86,12 @@ def pytest_generate_tests(metafunc):
             "NumericalPotentialDerivativesMixin",
             "SphericalPotential",
             "interpSphericalPotential",
+            "interp3DPotential",
+            "MultipoleExpansionPotential",
+            "CylindricalFourierExpansionPotential",
+            "TimeDependentSCFPotential",
+            "CompiledPotential",
+            "MovingObjectPopulationPotential",
         ]
         rmpots.append("SphericalShellPotential")
         rmpots.append("RingPotential")
@@ -181,6 +187,12 @@ def pytest_generate_tests(metafunc):
             "NumericalPotentialDerivativesMixin",
             "SphericalPotential",
             "interpSphericalPotential",
+            "interp3DPotential",
+            "MultipoleExpansionPotential",
+            "CylindricalFourierExpansionPotential",
+            "TimeDependentSCFPotential",
+            "CompiledPotential",
+            "MovingObjectPopulationPotential",
         ]
         rmpots.append("SphericalShellPotential")
         rmpots.append("RingPotential")
@@ -2783,6 +2783,108 @@ def test_estimateDeltaStaeckel_z_is_0():
     ), "Delta computed with array of z=0 does not agree with that computed for array of small z"
 
 
+# Test that estimating delta using the interpolation table works
+def test_estimateDeltaStaeckel_interp():
+    import os
+    import shutil
+    import tempfile
+
+    from galpy.actionAngle import actionAngleStaeckel, estimateDeltaStaeckel
+    from galpy.orbit import Orbit
+    from galpy.potential import MiyamotoNagaiPotential, MWPotential2014
+
+    numpy.random.seed(1)
+    R = numpy.random.uniform(0.1, 3.0, 1001)
+    z = numpy.random.uniform(-1.0, 1.0, 1001)
+    delta = estimateDeltaStaeckel(MWPotential2014, R, z, no_median=True)
+    idelta = estimateDeltaStaeckel(MWPotential2014, R, z, no_median=True, interp=True)
+    assert numpy.all(
+        numpy.fabs(idelta / delta - 1.0) < 1e-2
+    ), "Delta interpolated from the delta(R,z) table does not agree with the direct estimate"
+    assert (
+        numpy.fabs(
+            estimateDeltaStaeckel(MWPotential2014, 1.0, 0.1, interp=True)
+            - estimateDeltaStaeckel(MWPotential2014, 1.0, 0.1)
+        )
+        < 1e-3
+    ), "Delta interpolated from the delta(R,z) table does not agree with the direct estimate"
+    # Points outside of the table are evaluated directly
+    assert (
+        numpy.fabs(
+            estimateDeltaStaeckel(MWPotential2014, 200.0, 0.1, interp=True)
+            - estimateDeltaStaeckel(MWPotential2014, 200.0, 0.1)
+        )
+        < 1e-10
+    ), "Delta outside of the delta(R,z) table does not agree with the direct estimate"
+
+    # Potential without second derivatives, which are then computed numerically
+    class MiyamotoNagaiPotentialNoR2deriv(MiyamotoNagaiPotential):
+        _R2deriv = property()  # turns it off!
+
+    mp = MiyamotoNagaiPotential(normalize=1.0, a=0.5, b=0.1)
+    mpn = MiyamotoNagaiPotentialNoR2deriv(normalize=1.0, a=0.5, b=0.1)
+    assert numpy.all(
+        numpy.fabs(
+            estimateDeltaStaeckel(mpn, R, z, no_median=True, interp=True)
+            / estimateDeltaStaeckel(mp, R, z, no_median=True)
+            - 1.0
+        )
+        < 1e-2
+    ), "Delta interpolated for a potential without second derivatives does not agree with the direct estimate"
+    # Table stored on disk
+    cachedir = tempfile.mkdtemp()
+    estimateDeltaStaeckel(mp, R, z, no_median=True, interp=True, cache=cachedir)
+    assert len(os.listdir(cachedir)) == 1, "delta(R,z) table not stored on disk"
+    # actionAngleStaeckel and Orbit with delta='interp'
+    o = Orbit(
+        numpy.array(
+            [
+                R[:10],
+                0.1 * numpy.ones(10),
+                numpy.ones(10),
+                z[:10],
+                0.05 * numpy.ones(10),
+                numpy.zeros(10),
+            ]
+        ).T
+    )
+    aAS = actionAngleStaeckel(pot=MWPotential2014, delta="interp")
+    aASi = actionAngleStaeckel(pot=MWPotential2014, delta=idelta[:10])
+    for ii in range(3):
+        assert numpy.all(
+            numpy.fabs(aAS(o)[ii] - aASi(o)[ii]) < 1e-10
+        ), "actionAngleStaeckel with delta='interp' does not agree with using the interpolated deltas"
+    assert numpy.all(
+        numpy.fabs(
+            o.jr(pot=MWPotential2014, type="staeckel", delta="interp") - aASi(o)[0]
+        )
+        < 1e-10
+    ), "Orbit.jr with delta='interp' does not agree with using the interpolated deltas"
+    with pytest.raises(ValueError) as excinfo:
+        actionAngleStaeckel(pot=MWPotential2014, delta="automagic")
+    shutil.rmtree(cachedir)
+    return None
+
+
+# Test that the delta(R,z) table of a potential that caches values during
+# evaluation is only computed once
+def test_estimateDeltaStaeckel_interp_tablecachehit():
+    from galpy.actionAngle import estimateDeltaStaeckel
+    from galpy.actionAngle.actionAngleStaeckel import _delta2_tables
+    from galpy.potential import SCFPotential
+
+    sp = SCFPotential()
+    R = numpy.linspace(0.5, 2.0, 11)
+    z = numpy.linspace(0.05, 0.5, 11)
+    estimateDeltaStaeckel(sp, R, z, no_median=True, interp=True)
+    keys = set(_delta2_tables.keys())
+    estimateDeltaStaeckel(sp, R, z, no_median=True, interp=True)
+    assert (
+        set(_delta2_tables.keys()) <= keys
+    ), "delta(R,z) table was computed again on the second call"
+    return None
+
+
 def test_actionAngleStaeckel_indivdelta_actions_c():
     from galpy.actionAngle import actionAngleStaeckel
     from galpy.orbit import Orbit
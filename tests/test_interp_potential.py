@@ -1847,3 +1847,359 @@ def test_interpolation_potential_verticalfreq_notinterpolated():
             vfdiff < 10.0**-10.0
         ), f"RZPot interpolation w/ interpRZPotential fails when the potential was not interpolated at R = {r:g} by {vfdiff:g}"
     return None
+
+
+def test_interp3D_errors():
+    sp = potential.SpiralArmsPotential()
+    ip = potential.interp3DPotential(
+        sp, rgrid=(numpy.log(0.1), numpy.log(2.0), 11), zgrid=(0.0, 0.5, 11), nphi=8
+    )
+    # Setting up an interp3DPotential w/ another interp3DPotential should fail
+    try:
+        potential.interp3DPotential(ip)
+    except potential.PotentialError:
+        pass
+    else:
+        raise AssertionError(
+            "Setting up an interp3DPotential w/ another interp3DPotential did not raise PotentialError"
+        )
+    # Grids need at least 4 points
+    try:
+        potential.interp3DPotential(sp, zgrid=(0.0, 0.5, 3))
+    except potential.PotentialError:
+        pass
+    else:
+        raise AssertionError(
+            "Setting up an interp3DPotential with a grid with fewer than 4 points did not raise PotentialError"
+        )
+    return None
+
+
+def test_interp3D_ongrid():
+    # On the grid points, the interpolation should be exact
+    sp = potential.SpiralArmsPotential(N=2)
+    ip = potential.interp3DPotential(
+        sp,
+        rgrid=(numpy.log(0.1), numpy.log(2.0), 21),
+        zgrid=(0.0, 0.5, 11),
+        nphi=16,
+        phisym=2,
+    )
+    R, z, phi = numpy.meshgrid(
+        numpy.exp(numpy.linspace(numpy.log(0.1), numpy.log(2.0), 21)),
+        numpy.linspace(-0.5, 0.5, 21),
+        numpy.arange(32) * numpy.pi / 16.0,
+        indexing="ij",
+    )
+    R, z, phi = R.flatten(), z.flatten(), phi.flatten()
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+    ]:
+        assert numpy.all(
+            numpy.fabs(func(ip, R, z, phi=phi) - func(sp, R, z, phi=phi)) < 1e-10
+        ), f"interp3DPotential is not exact on the grid for {func.__name__}"
+    return None
+
+
+def test_interp3D_accuracy():
+    # Test the accuracy of the interpolation, including the second derivatives
+    # and the evaluation outside of the grid, for a rotating potential
+    sp = potential.SpiralArmsPotential(N=2, omega=0.65)
+    ip = potential.interp3DPotential(
+        sp,
+        rgrid=(numpy.log(0.1), numpy.log(5.0), 201),
+        zgrid=(0.0, 1.0, 101),
+        nphi=64,
+        phisym=2,
+        omegab=0.65,
+    )
+    assert numpy.fabs(ip.OmegaP() - 0.65) < 1e-10, "OmegaP of interp3DPotential wrong"
+    rng = numpy.random.default_rng(1)
+    R = numpy.exp(rng.uniform(numpy.log(0.2), numpy.log(4.0), 201))
+    z = rng.uniform(-0.8, 0.8, 201)
+    phi = rng.uniform(-7.0, 7.0, 201)
+    t = rng.uniform(0.0, 10.0, 201)
+    # Add points outside of the grid
+    R[-1], z[-1] = 7.0, 0.1
+    R[-2], z[-2] = 1.0, 1.5
+    for func, tol in [
+        (potential.evaluatePotentials, 5e-4),
+        (potential.evaluateRforces, 5e-4),
+        (potential.evaluatezforces, 5e-4),
+        (potential.evaluatephitorques, 5e-4),
+        (potential.evaluateR2derivs, 1e-2),
+        (potential.evaluatez2derivs, 1e-2),
+        (potential.evaluatephi2derivs, 1e-2),
+        (potential.evaluateRzderivs, 1e-2),
+        (potential.evaluateRphiderivs, 1e-2),
+        (potential.evaluatephizderivs, 1e-2),
+    ]:
+        interp = func(ip, R, z, phi=phi, t=t)
+        direct = numpy.array(
+            [func(sp, r, zz, phi=p, t=tt) for r, zz, p, tt in zip(R, z, phi, t)]
+        )
+        assert numpy.all(
+            numpy.fabs(interp - direct) < tol * numpy.amax(numpy.fabs(direct))
+        ), f"interp3DPotential interpolation of {func.__name__} is not accurate"
+        # Outside of the grid, the original potential is used
+        assert numpy.all(
+            numpy.fabs(interp[-2:] - direct[-2:]) < 1e-10
+        ), f"interp3DPotential does not evaluate {func.__name__} using the original potential outside of the grid"
+        # Scalar input
+        assert (
+            numpy.fabs(func(ip, R[0], z[0], phi=phi[0], t=t[0]) - interp[0]) < 1e-10
+        ), f"interp3DPotential scalar evaluation of {func.__name__} does not agree with array evaluation"
+    return None
+
+
+def test_interp3D_grid_python_vs_c():
+    # The grid computed in Python and C should be the same, also when the
+    # potential cannot be evaluated in C for a wrapper
+    for pot in [
+        potential.SpiralArmsPotential(N=2),
+        potential.SolidBodyRotationWrapperPotential(
+            pot=potential.SpiralArmsPotential(N=2), omega=0.65
+        ),
+    ]:
+        kwargs = dict(
+            rgrid=(numpy.log(0.1), numpy.log(2.0), 11),
+            zgrid=(0.0, 0.5, 11),
+            nphi=8,
+            phisym=2,
+        )
+        ipc = potential.interp3DPotential(pot, use_c=True, **kwargs)
+        ipp = potential.interp3DPotential(pot, use_c=False, **kwargs)
+        assert numpy.all(
+            numpy.fabs(ipc._tables - ipp._tables) < 1e-10
+        ), "interp3DPotential grid computed in C differs from that computed in Python"
+    return None
+
+
+def test_interp3D_nozsym():
+    # Test an interp3DPotential without z symmetry
+    sp = potential.SpiralArmsPotential(N=2)
+    ip = potential.interp3DPotential(
+        sp,
+        rgrid=(numpy.log(0.1), numpy.log(5.0), 101),
+        zgrid=(-1.0, 1.0, 101),
+        nphi=64,
+        phisym=2,
+        zsym=False,
+    )
+    rng = numpy.random.default_rng(2)
+    R = numpy.exp(rng.uniform(numpy.log(0.2), numpy.log(4.0), 101))
+    z = rng.uniform(-0.8, 0.8, 101)
+    phi = rng.uniform(-7.0, 7.0, 101)
+    for func in [potential.evaluateRforces, potential.evaluatezforces]:
+        interp = func(ip, R, z, phi=phi)
+        direct = numpy.array([func(sp, r, zz, phi=p) for r, zz, p in zip(R, z, phi)])
+        assert numpy.all(
+            numpy.fabs(interp - direct) < 2e-3 * numpy.amax(numpy.fabs(direct))
+        ), f"interp3DPotential interpolation of {func.__name__} without z symmetry is not accurate"
+    return None
+
+
+def test_interp3D_orbit_c():
+    # Orbit integration in C should agree with that in Python and be close to
+    # that in the original potential, for full and planar orbits
+    from galpy.orbit import Orbit
+
+    sp = potential.SpiralArmsPotential(N=2, omega=0.65)
+    ip = potential.interp3DPotential(
+        sp,
+        rgrid=(numpy.log(0.1), numpy.log(5.0), 201),
+        zgrid=(0.0, 1.0, 101),
+        nphi=64,
+        phisym=2,
+        omegab=0.65,
+    )
+    ts = numpy.linspace(0.0, 10.0, 101)
+    o = Orbit([[1.0, 0.1, 1.1, 0.05, 0.02, 0.0], [0.8, -0.1, 0.9, -0.1, 0.05, 2.0]])
+    op, oc, odirect = o(), o(), o()
+    op.integrate(ts, potential.MWPotential2014 + [ip], method="dop853")
+    oc.integrate(ts, potential.MWPotential2014 + [ip], method="dop853_c")
+    odirect.integrate(ts, potential.MWPotential2014 + [sp], method="dop853_c")
+    assert numpy.all(
+        numpy.fabs(oc.x(ts) - op.x(ts)) < 1e-7
+    ), "Orbit integration in interp3DPotential differs between Python and C"
+    for attr in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert numpy.all(
+            numpy.fabs(getattr(oc, attr)(ts) - getattr(odirect, attr)(ts)) < 1e-3
+        ), "Orbit integration in interp3DPotential does not agree with that in the original potential"
+    o = Orbit([1.0, 0.1, 1.1, 0.0])
+    oc, odirect = o(), o()
+    oc.integrate(
+        ts, [p.toPlanar() for p in potential.MWPotential2014 + [ip]], method="dop853_c"
+    )
+    odirect.integrate(
+        ts, [p.toPlanar() for p in potential.MWPotential2014 + [sp]], method="dop853_c"
+    )
+    assert numpy.all(
+        numpy.fabs(oc.x(ts) - odirect.x(ts)) < 1e-3
+    ), "Planar orbit integration in interp3DPotential does not agree with that in the original potential"
+    return None
+
+
+def test_interpolation_potential_cache():
+    # Test that grids stored in the cache are memory-mapped and give the same
+    # potential, and that the cache is keyed by the potential and the grid
+    import os
+    import tempfile
+
+    kw = dict(
+        rgrid=(numpy.log(0.01), numpy.log(20.0), 51),
+        zgrid=(0.0, 1.0, 51),
+        logR=True,
+        interpPot=True,
+        interpRforce=True,
+        interpzforce=True,
+        interpDens=True,
+        interpvcirc=True,
+        zsym=True,
+        enable_c=True,
+    )
+    with tempfile.TemporaryDirectory() as cachedir:
+        rzpot = potential.interpRZPotential(
+            RZPot=potential.MWPotential2014, cache=cachedir, **kw
+        )
+        assert (
+            len(os.listdir(cachedir)) == 1
+        ), "interpRZPotential cache= should write a single table"
+        rzpot2 = potential.interpRZPotential(
+            RZPot=potential.MWPotential2014, cache=cachedir, **kw
+        )
+        assert (
+            len(os.listdir(cachedir)) == 1
+        ), "interpRZPotential cache= should re-use the stored table"
+        assert isinstance(
+            rzpot2._potGrid, numpy.memmap
+        ), "interpRZPotential cache= should memory-map the stored table"
+        for R, z in zip([0.5, 1.0, 2.0], [0.0, -0.1, 0.3]):
+            for func in ["__call__", "Rforce", "zforce", "dens"]:
+                assert (
+                    numpy.fabs(getattr(rzpot, func)(R, z) - getattr(rzpot2, func)(R, z))
+                    < 10.0**-12.0
+                ), f"interpRZPotential {func} loaded from the cache does not agree with the original"
+            assert (
+                numpy.fabs(rzpot.vcirc(R) - rzpot2.vcirc(R)) < 10.0**-12.0
+            ), "interpRZPotential vcirc loaded from the cache does not agree with the original"
+        # Orbit integration in C
+        from galpy.orbit import Orbit
+
+        ts = numpy.linspace(0.0, 10.0, 101)
+        o = Orbit([1.0, 0.1, 1.1, 0.1, 0.0, 0.0])
+        o2 = o()
+        o.integrate(ts, rzpot)
+        o2.integrate(ts, rzpot2)
+        assert (
+            numpy.amax(numpy.fabs(o.x(ts) - o2.x(ts))) < 10.0**-10.0
+        ), "Orbit integrated in interpRZPotential loaded from the cache does not agree with the original"
+        # Different potential or grid --> different table
+        potential.interpRZPotential(RZPot=potential.MWPotential, cache=cachedir, **kw)
+        assert (
+            len(os.listdir(cachedir)) == 2
+        ), "interpRZPotential cache= should be keyed by the potential"
+        kw["zgrid"] = (0.0, 1.0, 41)
+        potential.interpRZPotential(
+            RZPot=potential.MWPotential2014, cache=cachedir, **kw
+        )
+        assert (
+            len(os.listdir(cachedir)) == 3
+        ), "interpRZPotential cache= should be keyed by the grid"
+    return None
+
+
+def test_content_hash_stable_after_evaluation():
+    # Test that the content hash of a potential does not change when the
+    # potential caches values during evaluation
+    from galpy.util._table_cache import content_hash
+
+    for pot in [potential.SCFPotential(), potential.MWPotential2014]:
+        hash_before = content_hash(pot)
+        potential.evaluatePotentials(pot, 1.0, 0.1)
+        potential.evaluateRforces(pot, 1.0, 0.1)
+        potential.evaluatezforces(pot, 1.0, 0.1)
+        assert hash_before == content_hash(
+            pot
+        ), "The content hash of a potential changes after evaluating it"
+    return None
+
+
+def test_content_hash_exclude():
+    # Test that the content hash only ignores the attributes that a class
+    # explicitly excludes, whatever their names
+    from galpy.util._table_cache import content_hash
+
+    for pot in [potential.SCFPotential(), potential.HernquistPotential()]:
+        hash_before = content_hash(pot)
+        pot._cache_rmax = 2.0
+        assert hash_before != content_hash(
+            pot
+        ), "The content hash of a potential ignores an attribute that is not excluded"
+    pot = potential.SCFPotential()
+    hash_before = content_hash(pot)
+    pot._force_hash = "abc"
+    assert hash_before == content_hash(
+        pot
+    ), "The content hash of a potential does not ignore an excluded attribute"
+    return None
+
+
+def test_interpSphericalPotential_cache():
+    # Test that interpSphericalPotential and AdiabaticContractionWrapperPotential
+    # tables stored in the cache give the same potential
+    import os
+    import tempfile
+
+    hp = potential.HernquistPotential(amp=2.0, a=1.3)
+    rgrid = numpy.geomspace(0.01, 20.0, 101)
+    with tempfile.TemporaryDirectory() as cachedir:
+        ip = potential.interpSphericalPotential(rforce=hp, rgrid=rgrid, cache=cachedir)
+        ip2 = potential.interpSphericalPotential(rforce=hp, rgrid=rgrid, cache=cachedir)
+        assert (
+            len(os.listdir(cachedir)) == 1
+        ), "interpSphericalPotential cache= should re-use the stored table"
+        assert isinstance(
+            ip2._rforce_grid, numpy.memmap
+        ), "interpSphericalPotential cache= should memory-map the stored table"
+        for r in [0.05, 1.0, 10.0, 30.0]:
+            assert (
+                numpy.fabs(ip(r, 0.0) - ip2(r, 0.0)) < 10.0**-12.0
+            ), "interpSphericalPotential loaded from the cache does not agree with the original"
+            assert (
+                numpy.fabs(ip.rforce(r, 0.0) - ip2.rforce(r, 0.0)) < 10.0**-12.0
+            ), "interpSphericalPotential loaded from the cache does not agree with the original"
+        potential.interpSphericalPotential(
+            rforce=potential.HernquistPotential(amp=2.0, a=1.4),
+            rgrid=rgrid,
+            cache=cachedir,
+        )
+        assert (
+            len(os.listdir(cachedir)) == 2
+        ), "interpSphericalPotential cache= should be keyed by the potential"
+    with tempfile.TemporaryDirectory() as cachedir:
+        kw = dict(
+            pot=potential.MWPotential2014[2],
+            baryonpot=potential.MWPotential2014[:2],
+            method="blumenthal",
+            cache=cachedir,
+        )
+        dm = potential.AdiabaticContractionWrapperPotential(**kw)
+        nfiles = len(os.listdir(cachedir))
+        dm2 = potential.AdiabaticContractionWrapperPotential(**kw)
+        assert (
+            len(os.listdir(cachedir)) == nfiles
+        ), "AdiabaticContractionWrapperPotential cache= should re-use the stored tables"
+        for r in [0.05, 1.0, 10.0, 60.0]:
+            assert (
+                numpy.fabs(dm(r, 0.0) - dm2(r, 0.0)) < 10.0**-12.0
+            ), "AdiabaticContractionWrapperPotential loaded from the cache does not agree with the original"
+        kw["method"] = "cautun"
+        potential.AdiabaticContractionWrapperPotential(**kw)
+        assert (
+            len(os.listdir(cachedir)) > nfiles
+        ), "AdiabaticContractionWrapperPotential cache= should be keyed by the method"
+    return None
@@ -162,6 +162,68 @@ def test_sigmar_wlog_linbeta():
     return None
 
 
+# Test sigmar_profile: spline of sigmar on a grid, should agree with sigmar
+def test_sigmar_profile():
+    from galpy.potential import (
+        HernquistPotential,
+        LogarithmicHaloPotential,
+        NFWPotential,
+        PowerSphericalPotential,
+    )
+
+    lp = LogarithmicHaloPotential(normalize=1.0, q=1.0)
+    rs = numpy.linspace(0.01, 5.0, 21)
+    for beta in [0.0, 0.5, -0.5]:
+        assert numpy.all(
+            numpy.fabs(
+                jeans.sigmar_profile(lp, 0.01, 5.0, beta=beta)(rs)
+                - 1.0 / numpy.sqrt(2.0 - 2.0 * beta)
+            )
+            < 1e-8
+        ), f"sigmar_profile incorrect for LogarithmicHaloPotential and beta={beta}"
+    # Compare to direct sigmar for other potentials, constant and varying beta
+    for pot in [HernquistPotential(amp=2.0, a=1.3), NFWPotential(amp=2.0, a=3.0)]:
+        for beta in [0.0, 0.3, lambda r: 0.5 * r / (1.0 + r)]:
+            sr = jeans.sigmar_profile(pot, 0.01, 20.0, beta=beta)
+            assert numpy.all(
+                numpy.fabs(
+                    sr(rs) / numpy.array([jeans.sigmar(pot, r, beta=beta) for r in rs])
+                    - 1.0
+                )
+                < 1e-5
+            ), f"sigmar_profile does not agree with sigmar for {type(pot).__name__}"
+    # Steep power law over a large range, where the integrand spans many
+    # orders of magnitude
+    pp = PowerSphericalPotential(alpha=2.3, normalize=2.0)
+    rs = numpy.geomspace(0.001, 60.0, 11)
+    sr = jeans.sigmar_profile(pp, 1e-4, 62.5)
+    assert numpy.all(
+        numpy.fabs(sr(rs) / numpy.array([jeans.sigmar(pp, r) for r in rs]) - 1.0) < 1e-6
+    ), "sigmar_profile does not agree with sigmar for a steep PowerSphericalPotential"
+    return None
+
+
+# Test that sigmar_profile only returns NaN where the density is zero
+def test_sigmar_profile_zerodens():
+    from galpy.potential import ChandrasekharDynamicalFrictionForce, KingPotential
+
+    kp = KingPotential(W0=3.0, M=1.0, rt=2.0)
+    sr = jeans.sigmar_profile(kp, 0.01, 3.0)
+    rs = numpy.linspace(0.1, 1.5, 11)
+    assert numpy.all(
+        numpy.fabs(sr(rs) / numpy.array([jeans.sigmar(kp, r) for r in rs]) - 1.0) < 1e-3
+    ), "sigmar_profile does not agree with sigmar inside the tidal radius"
+    assert numpy.all(
+        numpy.isnan(sr(numpy.array([2.5, 3.0])))
+    ), "sigmar_profile does not return NaN where the density is zero"
+    # Dynamical friction force in this profile should be finite
+    cdf = ChandrasekharDynamicalFrictionForce(GMs=0.01, rhm=0.1, dens=kp)
+    assert numpy.isfinite(
+        cdf.Rforce(0.5, 0.1, v=[0.1, 0.3, 0.1])
+    ), "ChandrasekharDynamicalFrictionForce is not finite for a density that is zero beyond a radius"
+    return None
+
+
 # Test sigmalos: radial velocity dispersion from the spherical Jeans equation
 # For log halo, beta = 0: sigmalos(r) = vc/sqrt(2.)
 def test_sigmalos_wlog_zerobeta():
@@ -237,6 +237,55 @@ def test_accellsrframe_vecfuncomegaz():
     return None
 
 
+def test_accellsrframe_vecfuncomegaz_tabulate():
+    # Test that tabulating the functions of time of an accelerating LSR frame
+    # gives the same orbit as calling the functions directly, also when the
+    # table only covers part of the integration
+    lp = potential.LogarithmicHaloPotential(normalize=1.0)
+    omega = lp.omegac(1.0)
+    omega_func = [lambda t: 0.0, lambda t: 0.0, lambda t: lp.omegac(1.0) + 0.02 * t]
+    omegadot_func = [lambda t: 0.0, lambda t: 0.0, lambda t: 0.02]
+    framepot = potential.NonInertialFrameForce(Omega=omega_func, Omegadot=omegadot_func)
+    o = Orbit([1.0, 0.1, 1.1 - omega, 0.1, 0.0, 0.0])
+    ts = numpy.linspace(0.0, 20.0, 1001)
+    o.integrate(ts, lp + framepot, method="dop853_c")
+    for tabulate in [[0.0, 20.0], [0.0, 10.0]]:
+        framepot_tab = potential.NonInertialFrameForce(
+            Omega=omega_func, Omegadot=omegadot_func, tabulate=tabulate
+        )
+        ot = o()
+        ot.integrate(ts, lp + framepot_tab, method="dop853_c")
+        assert (
+            numpy.amax(numpy.fabs(o.x(ts) - ot.x(ts))) < 1e-8
+        ), "Integrating an orbit in the acceleratingly-rotating LSR frame with tabulated functions of time does not agree with direct calls"
+        assert (
+            numpy.amax(numpy.fabs(o.y(ts) - ot.y(ts))) < 1e-8
+        ), "Integrating an orbit in the acceleratingly-rotating LSR frame with tabulated functions of time does not agree with direct calls"
+    return None
+
+
+def test_constomegaz_frame_before_other_potentials():
+    # Test that a frame with a constant rotation, which has no functions of
+    # time, does not shift the C arguments of the potentials that follow it
+    framepot = potential.NonInertialFrameForce(Omega=0.3)
+    for pot in [
+        [framepot] + potential.MWPotential2014,
+        [framepot, potential.MiyamotoNagaiPotential(normalize=1.0, a=0.5, b=0.05)],
+    ]:
+        o = Orbit([1.0, 0.1, 1.1, 0.1, 0.0, 0.0])
+        oc = o()
+        ts = numpy.linspace(0.0, 10.0, 1001)
+        o.integrate(ts, pot, method="dop853")
+        oc.integrate(ts, pot, method="dop853_c")
+        assert (
+            numpy.amax(numpy.fabs(o.x(ts) - oc.x(ts))) < 1e-6
+        ), "Integrating an orbit in a rotating frame followed by other potentials does not agree between C and Python"
+        assert (
+            numpy.amax(numpy.fabs(o.z(ts) - oc.z(ts))) < 1e-6
+        ), "Integrating an orbit in a rotating frame followed by other potentials does not agree between C and Python"
+    return None
+
+
 def test_arbitraryaxisrotation_nullpotential():
     # Test that integrating an orbit in a frame rotating around an
     # arbitrary axis works
@@ -750,6 +750,12 @@ def test_liouville_planar():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     # rmpots.append('BurkertPotential')
     # Don't have C implementations of the relevant 2nd derivatives
@@ -1084,6 +1090,160 @@ def test_SOS_onsurfaceerror_2D():
     return None
 
 
+# Test that the crossings found by integrating in time are on the 3D SOS
+# and agree with those found using the SOS integration
+def test_crossings_3D():
+    pot = potential.MWPotential2014
+    o = setup_orbit_energy(pot)
+    for method in ["dopr54_c", "dop853_c"]:
+        ts, vxvvs = o.crossings(pot, 5000.0, ncross=100, method=method)
+        assert ts.shape == (100,), "crossings returns times with the wrong shape"
+        assert vxvvs.shape == (
+            100,
+            6,
+        ), "crossings returns phase-space positions with the wrong shape"
+        assert numpy.all(
+            numpy.diff(ts) > 0.0
+        ), f"Times of crossings do not increase for method={method}"
+        assert numpy.all(
+            numpy.fabs(vxvvs[:, 3]) < 10.0**-10.0
+        ), f"z at crossings is not zero for method={method}"
+        assert numpy.all(
+            vxvvs[:, 4] > 0.0
+        ), f"vz at crossings is not positive for method={method}"
+        Es = potential.evaluatePotentials(pot, vxvvs[:, 0], vxvvs[:, 3]) + 0.5 * (
+            vxvvs[:, 1] ** 2.0 + vxvvs[:, 2] ** 2.0 + vxvvs[:, 4] ** 2.0
+        )
+        assert (
+            numpy.std(Es) / numpy.fabs(numpy.mean(Es))
+        ) ** 2.0 < 10.0**-10, (
+            f"Energy is not conserved at crossings for method={method}"
+        )
+        Rs, vRs = o.SOS(pot, ncross=100, method=method)
+        Rcs, vRcs = o.SOS(pot, ncross=100, method=method, tmax=5000.0)
+        assert numpy.all(
+            numpy.fabs(Rs - Rcs) < 10.0**-6.0
+        ), f"SOS with tmax does not agree with SOS integration for method={method}"
+        assert numpy.all(
+            numpy.fabs(vRs - vRcs) < 10.0**-6.0
+        ), f"SOS with tmax does not agree with SOS integration for method={method}"
+    return None
+
+
+# Test that the crossings found by integrating in time are on the 2D SOS
+# and agree with those found using the SOS integration
+def test_crossings_2D():
+    pot = potential.LogarithmicHaloPotential(normalize=1.0, q=0.9).toPlanar()
+    o = setup_orbit_energy(pot)
+    for surface in ["x", "y"]:
+        ts, vxvvs = o.crossings(pot, 5000.0, ncross=100, surface=surface)
+        assert vxvvs.shape == (
+            100,
+            4,
+        ), "crossings returns phase-space positions with the wrong shape"
+        R, vR, vT, phi = vxvvs.T
+        if surface == "x":
+            xs = R * numpy.cos(phi)
+            vxs = vR * numpy.cos(phi) - vT * numpy.sin(phi)
+        else:
+            xs = R * numpy.sin(phi)
+            vxs = vR * numpy.sin(phi) + vT * numpy.cos(phi)
+        assert numpy.all(
+            numpy.fabs(xs) < 10.0**-10.0
+        ), f"{surface} at crossings is not zero"
+        assert numpy.all(vxs > 0.0), f"v{surface} at crossings is not positive"
+        ys, vys = o.SOS(pot, ncross=100, surface=surface)
+        ycs, vycs = o.SOS(pot, ncross=100, surface=surface, tmax=5000.0)
+        assert numpy.all(
+            numpy.fabs(ys - ycs) < 10.0**-6.0
+        ), f"SOS with tmax does not agree with SOS integration for surface={surface}"
+        assert numpy.all(
+            numpy.fabs(vys - vycs) < 10.0**-6.0
+        ), f"SOS with tmax does not agree with SOS integration for surface={surface}"
+    return None
+
+
+# Test that SOS with tmax works for multi-dimensional Orbit instances, some of
+# which start in the surface
+def test_crossings_SOS_multid():
+    from galpy.orbit import Orbit
+
+    pot = potential.MWPotential2014
+    vxvv = numpy.array(
+        [
+            [[1.0, 0.1, 1.1, 0.0, 0.1, 0.0], [1.0, 0.1, 1.1, 0.05, 0.1, 0.3]],
+            [[1.1, -0.1, 1.0, 0.02, 0.15, 0.0], [0.9, 0.05, 1.05, 0.0, 0.12, 1.0]],
+        ]
+    )
+    o = Orbit(vxvv)
+    Rcs, vRcs = o.SOS(pot, ncross=20, tmax=2000.0)
+    assert Rcs.shape == (2, 2, 20), "SOS with tmax returns the wrong shape"
+    for ii in range(2):
+        for jj in range(2):
+            Rs, vRs = Orbit(vxvv[ii, jj]).SOS(pot, ncross=20)
+            assert numpy.all(
+                numpy.fabs(Rs - Rcs[ii, jj]) < 10.0**-6.0
+            ), "SOS with tmax does not agree with SOS integration for a multi-dimensional Orbit"
+            assert numpy.all(
+                numpy.fabs(vRs - vRcs[ii, jj]) < 10.0**-6.0
+            ), "SOS with tmax does not agree with SOS integration for a multi-dimensional Orbit"
+    return None
+
+
+# Test that crossings stops at t0+tmax and that t0 only shifts the crossings
+# in a static potential
+def test_crossings_tmax_t0():
+    pot = potential.MWPotential2014
+    o = setup_orbit_energy(pot)
+    ts, vxvvs = o.crossings(pot, 5000.0, ncross=100)
+    tsm, vxvvsm = o.crossings(pot, 20.0, ncross=100)
+    nfound = numpy.sum(ts <= 20.0)
+    assert nfound > 0 and nfound < 100, "Test of tmax does not test the end time"
+    assert numpy.all(numpy.isnan(tsm[nfound:])), "Crossings after t0+tmax are not NaN"
+    assert numpy.all(
+        numpy.isnan(vxvvsm[nfound:])
+    ), "Crossings after t0+tmax are not NaN"
+    assert numpy.all(
+        numpy.fabs(tsm[:nfound] - ts[:nfound]) < 10.0**-8.0
+    ), "Crossings found with a smaller tmax do not agree"
+    assert numpy.all(
+        numpy.fabs(vxvvsm[:nfound] - vxvvs[:nfound]) < 10.0**-8.0
+    ), "Crossings found with a smaller tmax do not agree"
+    tst0, vxvvst0 = o.crossings(pot, 5000.0, ncross=100, t0=5.0)
+    assert numpy.all(
+        numpy.fabs(tst0 - 5.0 - ts) < 10.0**-8.0
+    ), "Times of crossings are not shifted by t0"
+    assert numpy.all(
+        numpy.fabs(vxvvst0 - vxvvs) < 10.0**-8.0
+    ), "Crossings in a static potential depend on t0"
+    # Backwards integration
+    tsb, vxvvsb = o.crossings(pot, -5000.0, ncross=100)
+    assert numpy.all(numpy.diff(tsb) < 0.0), "Times of crossings do not decrease"
+    assert numpy.all(
+        vxvvsb[:, 4] > 0.0
+    ), "vz at crossings is not positive for backwards integration"
+    return None
+
+
+def test_crossings_errors():
+    from galpy.orbit import Orbit
+
+    o = Orbit([1.0, 0.1, 1.1, 0.1, 0.1, 0.0])
+    with pytest.raises(
+        ValueError,
+        match="crossings are only supported for method='dopr54_c' or 'dop853_c'",
+    ):
+        o.crossings(potential.MWPotential2014, 100.0, method="rk4_c")
+    with pytest.raises(
+        ValueError,
+        match="crossings can only be computed with the C integrators",
+    ):
+        o.crossings(potential.SphericalShellPotential(), 100.0)
+    with pytest.raises(NotImplementedError):
+        Orbit([1.0, 0.1]).crossings(potential.MWPotential2014, 100.0)
+    return None
+
+
 # Test that the eccentricity of circular orbits is zero
 def test_eccentricity():
     # return None
@@ -1136,6 +1296,12 @@ def test_eccentricity():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     rmpots.append("SphericalShellPotential")
     rmpots.append("RingPotential")
@@ -1310,6 +1476,12 @@ def test_pericenter():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     rmpots.append("SphericalShellPotential")
     rmpots.append("RingPotential")
@@ -1483,6 +1655,12 @@ def test_apocenter():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     rmpots.append("SphericalShellPotential")
     rmpots.append("RingPotential")
@@ -1656,6 +1834,12 @@ def test_zmax():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     rmpots.append("SphericalShellPotential")
     rmpots.append("RingPotential")
@@ -1814,6 +1998,12 @@ def test_analytic_ecc_rperi_rap():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     rmpots.append("SphericalShellPotential")
     rmpots.append("RingPotential")
@@ -2450,6 +2640,12 @@ def test_analytic_zmax():
         "NumericalPotentialDerivativesMixin",
         "SphericalPotential",
         "interpSphericalPotential",
+        "interp3DPotential",
+        "MultipoleExpansionPotential",
+        "CylindricalFourierExpansionPotential",
+        "TimeDependentSCFPotential",
+        "CompiledPotential",
+        "MovingObjectPopulationPotential",
     ]
     rmpots.append("SphericalShellPotential")
     rmpots.append("RingPotential")
@@ -2573,7 +2769,431 @@ def test_check_integrate_dt():
     return None
 
 
+# Test that the adaptive-step symplectic integrators accurately integrate a
+# highly eccentric orbit for which the fixed-step integrators fail
+def test_adaptive_symplectic_eccentric():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    times = numpy.linspace(0.0, 200.0, 201)
+    o = Orbit([5.0, 0.5, 0.05, 0.3, 0.1, 0.0])
+    oc = o()
+    oc.integrate(times, MWPotential2014, method="dop853_c")
+    for integrator in [
+        "leapfrog_adaptive_c",
+        "symplec4_adaptive_c",
+        "symplec6_adaptive_c",
+    ]:
+        o.integrate(times, MWPotential2014, method=integrator)
+        tEs = o.E(times)
+        assert (
+            numpy.amax(numpy.fabs(tEs / tEs[0] - 1.0)) < 10.0**-6.0
+        ), f"Energy is not conserved for the adaptive symplectic integrator {integrator}"
+        assert (
+            numpy.amax(numpy.fabs(o.r(times) - oc.r(times))) < 10.0**-4.0
+        ), f"Orbit integrated with the adaptive symplectic integrator {integrator} does not agree with dop853_c"
+    # The fixed-step integrator with the default step fails for this orbit
+    o.integrate(times, MWPotential2014, method="symplec4_c")
+    tEs = o.E(times)
+    assert (
+        numpy.amax(numpy.fabs(tEs / tEs[0] - 1.0)) > 10.0**-3.0
+    ), "Fixed-step symplectic integrator unexpectedly works for a highly eccentric orbit"
+    # Backwards integration
+    o.integrate(-times, MWPotential2014, method="symplec4_adaptive_c")
+    oc.integrate(-times, MWPotential2014, method="dop853_c")
+    assert (
+        numpy.amax(numpy.fabs(o.r(-times) - oc.r(-times))) < 10.0**-4.0
+    ), "Backwards orbit integration with an adaptive symplectic integrator does not agree with dop853_c"
+    # Output times do not need to be equally spaced, dt sets the maximum step
+    times = numpy.concatenate((numpy.linspace(0.0, 1.0, 11), [2.5, 10.0, 50.0]))
+    o.integrate(times, MWPotential2014, method="symplec6_adaptive_c", dt=0.01)
+    oc.integrate(times, MWPotential2014, method="dop853_c")
+    assert (
+        numpy.amax(numpy.fabs(o.r(times) - oc.r(times))) < 10.0**-4.0
+    ), "Orbit integration with an adaptive symplectic integrator with unequally-spaced output times does not agree with dop853_c"
+    # 1D and 2D orbits
+    for orb, pot in zip(
+        [Orbit([1.0, 0.1]), Orbit([1.0, 0.1, 1.1, 0.0])],
+        [potential.toVerticalPotential(MWPotential2014, 1.0), MWPotential2014],
+    ):
+        times = numpy.linspace(0.0, 100.0, 101)
+        orbc = orb()
+        orb.integrate(times, pot, method="symplec4_adaptive_c")
+        orbc.integrate(times, pot, method="dop853_c")
+        assert (
+            numpy.amax(numpy.fabs(orb.x(times) - orbc.x(times))) < 10.0**-6.0
+        ), "1D/2D orbit integration with an adaptive symplectic integrator does not agree with dop853_c"
+    return None
+
+
 # Test that fixing the stepsize works, issue #207
+# Test that the dense output of the Dormand-Prince integrators allows the orbit
+# to be evaluated at arbitrary times
+def test_dense_output():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014, toVerticalPotential
+
+    times = numpy.linspace(0.0, 100.0, 101)
+    tt = numpy.sort(numpy.random.uniform(0.0, 100.0, 13))
+    for vxvv in [
+        [1.0, 0.1, 1.1, 0.1, 0.05, 0.3],
+        [1.0, 0.1, 1.1, 0.1, 0.05],
+        [1.0, 0.1, 1.1, 0.3],
+        [1.0, 0.1, 1.1],
+        [0.1, 0.05],
+    ]:
+        if len(vxvv) > 2:
+            pot = MWPotential2014
+        else:
+            pot = toVerticalPotential(MWPotential2014, 1.0)
+        vxvvs = [vxvv, [1.05 * x for x in vxvv]]
+        for method, tol in zip(["dopr54_c", "dop853_c"], [10.0**-8.0, 10.0**-10.0]):
+            o = Orbit(vxvvs)
+            o.integrate(times, pot, method=method, dense_output=True)
+            # Direct integration to the requested times (with dop853_c, because
+            # dopr54_c is less accurate when its steps end at sparse times)
+            oc = Orbit(vxvvs)
+            oc.integrate(numpy.concatenate(([0.0], tt)), pot, method="dop853_c")
+            diff = o._call_internal(tt) - oc._call_internal(tt)
+            if len(vxvv) % 2 == 0 and len(vxvv) > 2:  # phi
+                diff[-1] = (diff[-1] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
+            assert numpy.amax(numpy.fabs(diff)) < tol, (
+                f"Dense output of {method} does not agree with direct integration "
+                f"for a phase-space dimension {len(vxvv)} orbit"
+            )
+            # Single time
+            assert (
+                numpy.amax(
+                    numpy.fabs(o._call_internal(tt[3]) - oc._call_internal(tt[3]))
+                )
+                < 10.0 * tol
+            ), f"Dense output of {method} at a single time is wrong"
+    # Re-integrating removes the dense output
+    o.integrate(times, pot, method="dopr54_c")
+    assert not hasattr(o, "_dense"), "Re-integration does not remove dense output"
+    # Backwards integration
+    o = Orbit([1.0, 0.1, 1.1, 0.1, 0.05, 0.3])
+    o.integrate(-times, MWPotential2014, method="dop853_c", dense_output=True)
+    oc = Orbit([1.0, 0.1, 1.1, 0.1, 0.05, 0.3])
+    oc.integrate(numpy.concatenate(([0.0], -tt)), MWPotential2014, method="dop853_c")
+    assert (
+        numpy.amax(numpy.fabs(o.R(-tt) - oc.R(-tt))) < 10.0**-10.0
+    ), "Dense output for backwards integration does not agree with direct integration"
+    # Only supported for the Dormand-Prince integrators
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="symplec4_c", dense_output=True)
+    return None
+
+
+def test_orbit_events():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    times = numpy.linspace(0.0, 50.0, 20001)
+    vxvvs = [[1.0, 0.1, 1.1, 0.1, 0.05, 0.0], [1.2, -0.2, 0.9, 0.0, 0.1, 1.0]]
+    for method in ["dopr54_c", "dop853_c"]:
+        o = Orbit(vxvvs)
+        o.integrate(times, MWPotential2014, method=method)
+        rs, zs = o.r(times), o.z(times)
+        o.integrate(
+            times,
+            MWPotential2014,
+            method=method,
+            events=["pericenter", "apocenter", "zcross", "zmax"],
+        )
+        for ii in range(2):
+            indx, t, vxvv = o.getEvents("pericenter")
+            rperi = numpy.sqrt(vxvv[indx == ii, 0] ** 2 + vxvv[indx == ii, 3] ** 2)
+            assert (
+                numpy.fabs(numpy.amin(rperi) - numpy.amin(rs[ii])) < 10.0**-6.0
+            ), f"Pericenter from {method} events does not agree with the orbit"
+            assert numpy.all(
+                numpy.diff(t[indx == ii]) > 0.0
+            ), "Events are not sorted in time"
+            indx, t, vxvv = o.getEvents("apocenter")
+            rap = numpy.sqrt(vxvv[indx == ii, 0] ** 2 + vxvv[indx == ii, 3] ** 2)
+            assert (
+                numpy.fabs(numpy.amax(rap) - numpy.amax(rs[ii])) < 10.0**-6.0
+            ), f"Apocenter from {method} events does not agree with the orbit"
+            # Event states agree with the orbit at the event times
+            assert (
+                numpy.amax(numpy.fabs(o.r(t[indx == ii])[ii] - rap)) < 10.0**-6.0
+            ), f"Apocenter states from {method} do not agree with the orbit"
+            indx, t, vxvv = o.getEvents("zmax")
+            assert (
+                numpy.fabs(
+                    numpy.amax(numpy.fabs(vxvv[indx == ii, 3]))
+                    - numpy.amax(numpy.fabs(zs[ii]))
+                )
+                < 10.0**-6.0
+            ), f"zmax from {method} events does not agree with the orbit"
+            assert (
+                numpy.amax(numpy.fabs(vxvv[indx == ii, 4])) < 10.0**-8.0
+            ), "vz is not zero at zmax"
+        indx, t, vxvv = o.getEvents("zcross")
+        assert (
+            numpy.amax(numpy.fabs(vxvv[:, 3])) < 10.0**-10.0
+        ), "z is not zero at z crossings"
+        # Count of crossings agrees with the sampled orbit
+        assert numpy.sum(indx == 0) == numpy.sum(
+            numpy.diff(numpy.sign(zs[0])) != 0
+        ), "Number of z crossings is wrong"
+        # Escape with termination
+        o.integrate(
+            times,
+            MWPotential2014,
+            method=method,
+            events=[("escape", 1.15), "pericenter"],
+            terminate=["escape"],
+        )
+        indx, t, vxvv = o.getEvents("escape")
+        assert numpy.all(indx == [0, 1]), "Escape events are wrong"
+        assert (
+            numpy.amax(numpy.fabs(numpy.sqrt(vxvv[:, 0] ** 2 + vxvv[:, 3] ** 2) - 1.15))
+            < 10.0**-10.0
+        ), "Escape does not happen at the escape radius"
+        for ii in range(2):
+            R = o.R(times)[ii]
+            assert numpy.all(numpy.isfinite(R[times < t[ii]])) and numpy.all(
+                numpy.isnan(R[times > t[ii]])
+            ), "Orbit is not NaN after a terminal event"
+        # No events after the terminal event
+        pindx, pt, _ = o.getEvents("pericenter")
+        assert numpy.all(pt <= t[pindx]), "Events after the terminal event"
+    # Terminal event with dense output: NaN after termination
+    o = Orbit(vxvvs[0])
+    o.integrate(
+        times,
+        MWPotential2014,
+        method="dop853_c",
+        events=[("escape", 1.15)],
+        terminate=["escape"],
+        dense_output=True,
+    )
+    tterm = o.getEvents("escape")[1][0]
+    assert numpy.isfinite(o.R(tterm - 0.0013)), "Dense output wrong before termination"
+    assert numpy.isnan(o.R(tterm + 0.0013)), "Dense output not NaN after termination"
+    # Backwards integration, planar orbit
+    o = Orbit([1.0, 0.1, 1.1, 0.3])
+    o.integrate(-times, MWPotential2014, method="dop853_c")
+    rs = o.r(-times)
+    o.integrate(
+        -times, MWPotential2014, method="dop853_c", events=["pericenter", "apocenter"]
+    )
+    _, t, vxvv = o.getEvents("pericenter")
+    assert numpy.all(numpy.diff(t) < 0.0), "Backward events are not sorted in time"
+    assert (
+        numpy.fabs(numpy.amin(vxvv[:, 0]) - numpy.amin(rs)) < 10.0**-6.0
+    ), "Pericenter for backward integration of a planar orbit is wrong"
+    assert (
+        numpy.fabs(numpy.amax(o.getEvents("apocenter")[2][:, 0]) - numpy.amax(rs))
+        < 10.0**-6.0
+    ), "Apocenter for backward integration of a planar orbit is wrong"
+    # Re-integrating removes the events
+    o.integrate(times, MWPotential2014, method="dop853_c")
+    with pytest.raises(ValueError) as excinfo:
+        o.getEvents("pericenter")
+    # Errors
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="symplec4_c", events=["pericenter"])
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="dop853_c", events=["zcross"])
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="dop853_c", events=["escape"])
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="dop853_c", events=["bovy"])
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(
+            times,
+            MWPotential2014,
+            method="dop853_c",
+            events=["pericenter"],
+            terminate=["apocenter"],
+        )
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="dop853_c", terminate=["apocenter"])
+    o = Orbit([1.0, 0.1])
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate(times, MWPotential2014, method="dop853_c", events=["pericenter"])
+    return None
+
+
+# Test that orbits can be stored in single precision
+def test_integrate_dtype():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014, toVerticalPotential
+
+    times = numpy.linspace(0.0, 10.0, 101)
+    for vxvv in [
+        [[1.0, 0.1, 1.1, 0.1, 0.05, 0.3], [1.2, 0.0, 0.9, -0.1, 0.1, 1.0]],
+        [[1.0, 0.1, 1.1, 0.1, 0.05], [1.2, 0.0, 0.9, -0.1, 0.1]],
+        [[1.0, 0.1, 1.1, 0.3], [1.2, 0.0, 0.9, 1.0]],
+        [[1.0, 0.1, 1.1], [1.2, 0.0, 0.9]],
+        [[0.1, 0.05], [0.2, -0.1]],
+    ]:
+        if len(vxvv[0]) > 2:
+            pot = MWPotential2014
+        else:
+            pot = toVerticalPotential(MWPotential2014, 1.0)
+        for method in ["dop853_c", "symplec4_c", "odeint"]:
+            o = Orbit(vxvv)
+            o.integrate(times, pot, method=method)
+            os = Orbit(vxvv)
+            os.integrate(times, pot, method=method, dtype=numpy.float32)
+            assert (
+                os.getOrbit().dtype == numpy.float32
+            ), f"Orbit integrated with dtype=numpy.float32 and method {method} is not stored in single precision"
+            assert (
+                os.R(times).dtype == numpy.float32
+            ), f"Orbit integrated with dtype=numpy.float32 and method {method} does not return single-precision output"
+            assert numpy.all(
+                numpy.fabs(os.getOrbit() - o.getOrbit())
+                < 10.0**-6.0 * (1.0 + numpy.fabs(o.getOrbit()))
+            ), f"Orbit integrated with dtype=numpy.float32 and method {method} does not agree with the double-precision orbit"
+    with pytest.raises(ValueError) as excinfo:
+        Orbit([1.0, 0.1, 1.1, 0.1, 0.05, 0.3]).integrate(
+            times, MWPotential2014, dtype=numpy.int32
+        )
+    return None
+
+
+# Test that the orbit accessors can return views of the stored orbit
+def test_orbit_views():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    times = numpy.linspace(0.0, 10.0, 101)
+    o = Orbit([[1.0, 0.1, 1.1, 0.1, 0.05, 0.3], [1.2, 0.0, 0.9, -0.1, 0.1, 1.0]])
+    o.integrate(times, MWPotential2014)
+    for ii, func in enumerate(["R", "vR", "vT", "z", "vz", "phi"]):
+        view = getattr(o, func)(times, copy=False)
+        assert numpy.shares_memory(
+            view, o.orbit
+        ), f"Orbit.{func} with copy=False does not return a view"
+        copy = getattr(o, func)(times)
+        assert not numpy.shares_memory(
+            copy, o.orbit
+        ), f"Orbit.{func} does not return a copy by default"
+        assert numpy.array_equal(view, copy) and numpy.array_equal(
+            view, o.orbit[..., ii]
+        ), f"Orbit.{func} with copy=False does not return the same as with copy=True"
+    assert numpy.shares_memory(
+        o.getOrbit(copy=False), o.orbit
+    ), "Orbit.getOrbit with copy=False does not return a view"
+    assert not numpy.shares_memory(
+        o.getOrbit(), o.orbit
+    ), "Orbit.getOrbit does not return a copy by default"
+    # Evaluating an Orbit at the integration times should return a copy
+    orig = o.getOrbit()
+    oc = o(times)
+    oc.vxvv[:] = 0.0
+    assert numpy.array_equal(
+        o.orbit, orig
+    ), "Evaluating an Orbit at its times returns a view"
+    return None
+
+
+# Test saving and loading integrated orbits
+def test_orbit_save_load():
+    import tempfile
+
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    for times, dtype in zip(
+        [numpy.linspace(0.0, 10.0, 101), numpy.geomspace(1.0, 10.0, 101) - 1.0],
+        [numpy.float32, numpy.float64],
+    ):
+        o = Orbit(
+            [[1.0, 0.1, 1.1, 0.1, 0.05, 0.3], [1.2, 0.0, 0.9, -0.1, 0.1, 1.0]],
+            ro=8.0,
+            vo=230.0,
+            zo=0.02,
+            solarmotion=[-10.0, 20.0, 5.0],
+        )
+        o.integrate(times, MWPotential2014, dtype=dtype)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "orbits.npz")
+            o.save(filename)
+            for mmap in [False, True]:
+                ol = Orbit.from_file(filename, mmap=mmap)
+                assert (
+                    ol.shape == o.shape
+                ), "Orbit loaded from file does not have the same shape"
+                assert numpy.array_equal(
+                    ol.t, o.t
+                ), "Orbit loaded from file does not have the same times"
+                assert numpy.array_equal(
+                    ol.getOrbit(), o.getOrbit()
+                ), "Orbit loaded from file does not have the same orbits"
+                assert (
+                    ol.getOrbit().dtype == dtype
+                ), "Orbit loaded from file does not have the same precision"
+                assert (
+                    ol._ro == 8.0
+                    and ol._vo == 230.0
+                    and ol._zo == 0.02
+                    and numpy.array_equal(ol._solarmotion, [-10.0, 20.0, 5.0])
+                    and ol._roSet
+                    and ol._voSet
+                ), "Orbit loaded from file does not have the same coordinate-transformation parameters"
+                assert numpy.array_equal(
+                    ol.ra(times), o.ra(times)
+                ), "Orbit loaded from file does not give the same ra"
+                assert numpy.array_equal(
+                    ol.E(times, pot=MWPotential2014), o.E(times, pot=MWPotential2014)
+                ), "Orbit loaded from file does not give the same energy"
+                del ol
+    # Non-integrated orbit without physical units
+    o = Orbit([1.0, 0.1, 1.1, 0.3])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "orbit.npz")
+        o.save(filename)
+        ol = Orbit.from_file(filename)
+        assert ol.shape == () and numpy.array_equal(
+            ol.vxvv, o.vxvv
+        ), "Non-integrated Orbit loaded from file does not have the same initial condition"
+        assert (
+            not ol._roSet and not ol._voSet
+        ), "Orbit loaded from file has physical output turned on while the original does not"
+    return None
+
+
+# Test that memory-mapped orbits can be modified in-place without changing the file
+def test_orbit_load_mmap_inplace():
+    import tempfile
+
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    times = numpy.linspace(0.0, 10.0, 101)
+    o = Orbit([[1.0, 0.1, 1.1, 0.1, 0.05, 0.3], [1.2, 0.0, 0.9, -0.1, 0.1, 1.0]])
+    o.integrate(times, MWPotential2014)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "orbits.npz")
+        o.save(filename)
+        ol = Orbit.from_file(filename, mmap=True)
+        ol.flip(inplace=True)
+        o.flip(inplace=True)
+        assert numpy.array_equal(
+            ol.getOrbit(), o.getOrbit()
+        ), "Flipping a memory-mapped orbit in-place does not work"
+        ol.integrate(times, MWPotential2014)
+        o.integrate(times, MWPotential2014)
+        assert numpy.array_equal(
+            ol.getOrbit(), o.getOrbit()
+        ), "Re-integrating a memory-mapped orbit does not work"
+        del ol
+        ol = Orbit.from_file(filename)
+        # Flip back to the original initial conditions and compare
+        o.flip(inplace=True)
+        o.integrate(times, MWPotential2014)
+        assert numpy.array_equal(
+            ol.getOrbit(), o.getOrbit()
+        ), "Modifying a memory-mapped orbit in-place changed the file"
+    return None
+
+
 def test_fixedstepsize():
     if WIN32:
         return None  # skip on windows, because fails for reason that I can't figure out (runtimes[0] == 0.) and not that important
@@ -7827,15 +8447,113 @@ def test_integrate_dxdv_errors():
     o = Orbit([1.0, 0.1, 1.0, 0.1, 0.1])
     with pytest.raises(AttributeError) as excinfo:
         o.integrate_dxdv(None, ts, potential.MWPotential)
+    # Test that dissipative forces are not allowed
     o = Orbit([1.0, 0.1, 1.0, 0.1, 0.1, 3.0])
-    with pytest.raises(AttributeError) as excinfo:
-        o.integrate_dxdv(None, ts, potential.MWPotential)
+    cdf = potential.ChandrasekharDynamicalFrictionForce(
+        GMs=0.01, const_lnLambda=8.0, dens=potential.MWPotential
+    )
+    with pytest.raises(NotImplementedError) as excinfo:
+        o.integrate_dxdv(
+            [1.0, 0.0, 0.0, 0.0, 0.0, 0.0], ts, potential.MWPotential + [cdf]
+        )
     # Test that a random string as the integrator doesn't work
     o = Orbit([1.0, 0.1, 1.0, 3.0])
     with pytest.raises(ValueError) as excinfo:
         o.integrate_dxdv(
             None, ts, potential.MWPotential, method="some non-existent integrator"
         )
+    # Test that symplectic integrators cannot be used for 4D orbits
+    with pytest.raises(ValueError) as excinfo:
+        o.integrate_dxdv(None, ts, potential.MWPotential, method="symplec4_c")
+    return None
+
+
+# Test that integrate_dxdv for 3D orbits agrees with finite differences of
+# nearby orbits
+def test_integrate_dxdv_3d_finitediff():
+    from galpy.orbit import Orbit
+
+    lp = potential.LogarithmicHaloPotential(normalize=1.0, q=0.8)
+    ts = numpy.linspace(0.0, 10.0, 101)
+    vxvv = numpy.array([1.0, 0.1, 1.1, 0.1, 0.05, 0.3])
+    dxdv = numpy.array([1.0, 0.5, -0.3, 0.2, 0.1, 0.4])
+    eps = 1e-6
+    op = Orbit(vxvv + eps * dxdv)
+    op.integrate(ts, lp, method="dop853_c")
+    om = Orbit(vxvv - eps * dxdv)
+    om.integrate(ts, lp, method="dop853_c")
+    fd = (op.getOrbit() - om.getOrbit()) / 2.0 / eps
+    fd[:, 5] = (
+        (op.getOrbit()[:, 5] - om.getOrbit()[:, 5] + numpy.pi) % (2.0 * numpy.pi)
+        - numpy.pi
+    ) / (2.0 * eps)
+    o0 = Orbit(vxvv)
+    o0.integrate(ts, lp, method="dop853_c")
+    for method in [
+        "odeint",
+        "dop853",
+        "leapfrog_c",
+        "symplec4_c",
+        "symplec6_c",
+        "rk4_c",
+        "rk6_c",
+        "dopr54_c",
+        "dop853_c",
+    ]:
+        o = Orbit(vxvv)
+        o.integrate_dxdv(dxdv, ts, lp, method=method)
+        assert (
+            numpy.amax(numpy.fabs(o.getOrbit_dxdv() - fd)) < 10.0**-5.0
+        ), f"integrate_dxdv for a 3D orbit with method {method} does not agree with finite differences of nearby orbits"
+        assert (
+            numpy.amax(numpy.fabs(o.getOrbit()[:, :5] - o0.getOrbit()[:, :5]))
+            < 10.0**-4.0
+        ), f"Orbit integrated alongside dxdv with method {method} does not agree with regular orbit integration"
+    # rectIn and rectOut should be consistent
+    o = Orbit(vxvv)
+    o.integrate_dxdv(dxdv, ts, lp, method="dopr54_c", rectOut=True)
+    rdxdv = o.getOrbit_dxdv()
+    o.integrate_dxdv(rdxdv[0], ts, lp, method="dopr54_c", rectIn=True)
+    assert (
+        numpy.amax(numpy.fabs(o.getOrbit_dxdv() - fd)) < 10.0**-5.0
+    ), "integrate_dxdv with rectIn and rectOut for a 3D orbit is not consistent"
+    return None
+
+
+# Test that the Lyapunov exponents of a regular orbit go to zero
+def test_lyapunov_exponents_regular():
+    from galpy.orbit import Orbit
+
+    o = Orbit([[1.0, 0.1, 1.1, 0.1, 0.05, 0.3], [0.9, -0.2, 1.0, 0.2, -0.1, 1.3]])
+    ts = numpy.linspace(0.0, 1000.0, 11)
+    for method in ["dopr54_c", "symplec4_c"]:
+        lyap = o.lyapunov_exponents(
+            ts, potential.MWPotential2014, nexp=3, method=method
+        )
+        assert lyap.shape == (2, 11, 3), "lyapunov_exponents returns the wrong shape"
+        assert numpy.all(
+            numpy.isnan(lyap[:, 0])
+        ), "lyapunov_exponents should return NaN at the initial time"
+        assert numpy.all(
+            numpy.fabs(lyap[:, -1]) < 0.01
+        ), "Lyapunov exponents of a regular orbit are not close to zero"
+        # Should decrease as log(t)/t
+        assert numpy.all(
+            lyap[:, -1, 0] < lyap[:, 2, 0]
+        ), "Largest Lyapunov exponent of a regular orbit does not decrease with time"
+    # Different number of exponents should give the same leading exponents
+    lyap1 = o.lyapunov_exponents(ts, potential.MWPotential2014, nexp=1)
+    lyap3 = o.lyapunov_exponents(ts, potential.MWPotential2014, nexp=3)
+    assert (
+        numpy.amax(numpy.fabs(lyap1[:, 1:, 0] - lyap3[:, 1:, 0])) < 10.0**-8.0
+    ), "Leading Lyapunov exponent depends on the number of exponents computed"
+    # Errors
+    with pytest.raises(ValueError) as excinfo:
+        o.lyapunov_exponents(ts, potential.MWPotential2014, method="odeint")
+    with pytest.raises(ValueError) as excinfo:
+        o.lyapunov_exponents(ts, potential.MWPotential2014, nexp=7)
+    with pytest.raises(AttributeError) as excinfo:
+        Orbit([1.0, 0.1, 1.1, 0.1]).lyapunov_exponents(ts, potential.MWPotential2014)
     return None
 
 
@@ -8462,6 +9180,7 @@ def test_plotSOS():
     o = setup_orbit_energy(pot)
     o.plotSOS(pot)
     o.plotSOS(pot, use_physical=True)
+    o.plotSOS(pot, tmax=1000.0)
     # 2D
     pot = potential.LogarithmicHaloPotential(normalize=1.0, q=0.9).toPlanar()
     o = setup_orbit_energy(pot)
@@ -9397,6 +10116,358 @@ def test_MovingObjectPotential_planar_orbit():
     return None
 
 
+def test_MovingObjectPopulationPotential_orbit():
+    # Test that orbits in a MovingObjectPopulationPotential integrated by C
+    # and Python are the same
+    from galpy.orbit import Orbit
+    from galpy.potential import (
+        MovingObjectPopulationPotential,
+        MWPotential2014,
+        PlummerPotential,
+    )
+
+    tmax = 2.0
+    times = numpy.linspace(0, tmax, 101)
+    os = Orbit(
+        [
+            [1.0, 0.1, 1.1, 0.1, 0.0, 0.0],
+            [1.2, -0.1, 0.9, -0.1, 0.05, 1.0],
+            [0.8, 0.05, 1.2, 0.05, 0.0, 2.0],
+        ]
+    )
+    os.integrate(times, MWPotential2014)
+    pop = MovingObjectPopulationPotential(
+        os,
+        pot=PlummerPotential(amp=0.06, b=0.1),
+        amps=[1.0, 0.5, 2.0],
+        scales=[1.0, 2.0, 0.5],
+        rmax=1.0,
+    )
+    total_potential = [MWPotential2014, pop]
+    oc = Orbit([1.0, 0.1, 1.1, 0.1, 0.0, 0.0])
+    op = Orbit([1.0, 0.1, 1.1, 0.1, 0.0, 0.0])
+    oc.integrate(times, total_potential, method="leapfrog_c")
+    op.integrate(times, total_potential, method="leapfrog")
+    for coord in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert (
+            numpy.fabs(getattr(oc, coord)(tmax) - getattr(op, coord)(tmax))
+            < 10.0**-4.0
+        ), f"Final orbit {coord} between C and Python integration in a MovingObjectPopulationPotential is too different"
+    return None
+
+
+def test_MovingObjectPopulationPotential_planar_orbit():
+    # Test that planar orbits in a MovingObjectPopulationPotential integrated
+    # by C and Python are the same
+    from galpy.orbit import Orbit
+    from galpy.potential import (
+        MovingObjectPopulationPotential,
+        MWPotential2014,
+        PlummerPotential,
+    )
+
+    tmax = 2.0
+    times = numpy.linspace(0, tmax, 101)
+    os = Orbit([[1.0, 0.1, 1.1, 0.0], [1.2, -0.1, 0.9, 1.0], [0.8, 0.05, 1.2, 2.0]])
+    os.integrate(times, MWPotential2014)
+    pop = MovingObjectPopulationPotential(
+        os,
+        pot=PlummerPotential(amp=0.06, b=0.1),
+        amps=[1.0, 0.5, 2.0],
+        scales=[1.0, 2.0, 0.5],
+        rmax=1.0,
+    )
+    total_potential = [MWPotential2014, pop]
+    oc = Orbit([1.0, 0.1, 1.1, 0.1])
+    op = Orbit([1.0, 0.1, 1.1, 0.1])
+    oc.integrate(times, total_potential, method="leapfrog_c")
+    op.integrate(times, total_potential, method="leapfrog")
+    for coord in ["x", "y", "vx", "vy"]:
+        assert (
+            numpy.fabs(getattr(oc, coord)(tmax) - getattr(op, coord)(tmax))
+            < 10.0**-4.0
+        ), f"Final orbit {coord} between C and Python integration in a planar MovingObjectPopulationPotential is too different"
+    return None
+
+
+def test_integrate_massive_reflex_vs_inertial():
+    # Test that integrating in the frame of a host accelerated by a massive
+    # body gives the same relative orbits as integrating the host as a
+    # massive body in an inertial frame
+    from galpy.orbit import Orbit
+    from galpy.potential import HernquistPotential, NullPotential
+
+    ts = numpy.linspace(0.0, 5.0, 501)
+    host = HernquistPotential(amp=2.0, a=0.5)
+    bodypot = HernquistPotential(amp=0.2, a=0.1)
+    vxvvs = [[1.0, 0.1, 1.0, 0.1, 0.0, 0.5], [0.8, -0.1, 1.1, 0.0, 0.1, 2.0]]
+    # Reflex mode
+    body = Orbit([1.5, 0.0, 0.8, 0.3, 0.1, 0.0])
+    o = Orbit(vxvvs)
+    o.integrate(ts, host, method="dop853_c", massive=[[body, bodypot]], reflex=True)
+    # Inertial, host as a massive body
+    hosto = Orbit([1e-8, 0.0, 0.0, 0.0, 0.0, 0.0])
+    bodyi = Orbit([1.5, 0.0, 0.8, 0.3, 0.1, 0.0])
+    oi = Orbit(vxvvs)
+    oi.integrate(
+        ts,
+        NullPotential(),
+        method="dop853_c",
+        massive=[[hosto, host], [bodyi, bodypot]],
+    )
+    assert (
+        numpy.amax(numpy.fabs(hosto.x(ts))) > 0.1
+    ), "Host does not move in the inertial frame"
+    for coord in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert numpy.all(
+            numpy.fabs(
+                getattr(body, coord)(ts)
+                - getattr(bodyi, coord)(ts)
+                + getattr(hosto, coord)(ts)
+            )
+            < 10.0**-6.0
+        ), f"Massive body {coord} in reflex mode does not agree with inertial integration"
+        assert numpy.all(
+            numpy.fabs(
+                getattr(o, coord)(ts)
+                - getattr(oi, coord)(ts)
+                + getattr(hosto, coord)(ts)
+            )
+            < 10.0**-6.0
+        ), f"Orbit {coord} in reflex mode does not agree with inertial integration"
+    return None
+
+
+def test_integrate_massive_outputtimes():
+    # Test that the orbits in a restricted N-body integration do not depend
+    # on how finely the output times sample the orbits of the bodies
+    from galpy.orbit import Orbit
+    from galpy.potential import HernquistPotential
+
+    host = HernquistPotential(amp=2.0, a=0.5)
+    bodypot = HernquistPotential(amp=0.2, a=0.1)
+    vxvvs = [[1.0, 0.1, 1.0, 0.1, 0.0, 0.5], [0.8, -0.1, 1.1, 0.0, 0.1, 2.0]]
+    tcoarse = numpy.linspace(0.0, 10.0, 6)
+    tfine = numpy.linspace(0.0, 10.0, 1001)
+    os, bodies = [], []
+    for ts in [tcoarse, tfine]:
+        body = Orbit([1.5, 0.0, 0.8, 0.3, 0.1, 0.0])
+        o = Orbit(vxvvs)
+        o.integrate(ts, host, method="dop853_c", massive=[[body, bodypot]])
+        os.append(o)
+        bodies.append(body)
+    for coord in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert numpy.all(
+            numpy.fabs(
+                getattr(bodies[0], coord)(tcoarse) - getattr(bodies[1], coord)(tcoarse)
+            )
+            < 10.0**-8.0
+        ), f"Massive body {coord} depends on the output times"
+        assert numpy.all(
+            numpy.fabs(getattr(os[0], coord)(tcoarse) - getattr(os[1], coord)(tcoarse))
+            < 10.0**-6.0
+        ), f"Orbit {coord} in a restricted N-body integration depends on the output times"
+    return None
+
+
+def test_integrate_massive_momentum():
+    # Test that the total momentum of two equal-mass bodies in the absence
+    # of an external potential is conserved
+    from galpy.orbit import Orbit
+    from galpy.potential import NullPotential, PlummerPotential
+
+    ts = numpy.linspace(0.0, 5.0, 101)
+    b1 = Orbit([0.5, 0.0, 0.3, 0.0, 0.1, 0.0])
+    b2 = Orbit([0.5, 0.0, 0.3, 0.0, -0.1, numpy.pi])
+    bodypot = PlummerPotential(amp=0.2, b=0.1)
+    o = Orbit([2.0, 0.0, 0.5, 0.0, 0.0, 0.0])
+    o.integrate(
+        ts, NullPotential(), method="dop853_c", massive=[[b1, bodypot], [b2, bodypot]]
+    )
+    for coord in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert numpy.all(
+            numpy.fabs(getattr(b1, coord)(ts) + getattr(b2, coord)(ts)) < 10.0**-8.0
+        ), f"Total momentum of two massive bodies not conserved in {coord}"
+    assert numpy.amax(numpy.fabs(b1.x(ts) - b1.x())) > 0.1, "Massive bodies do not move"
+    return None
+
+
+def test_integrate_massive_dynfric():
+    # Test that a single massive body with dynamical friction agrees with
+    # a regular integration
+    from galpy.orbit import Orbit
+    from galpy.potential import ChandrasekharDynamicalFrictionForce, HernquistPotential
+
+    ts = numpy.linspace(0.0, 5.0, 101)
+    host = HernquistPotential(amp=2.0, a=0.5)
+    cdf = ChandrasekharDynamicalFrictionForce(GMs=0.05, rhm=0.05, dens=host)
+    body = Orbit([1.5, 0.0, 0.8, 0.3, 0.1, 0.0])
+    ob = body()
+    o = Orbit([1.0, 0.1, 1.0, 0.1, 0.0, 0.5])
+    o.integrate(
+        ts,
+        host,
+        method="dop853_c",
+        massive=[[body, HernquistPotential(amp=0.05, a=0.05), cdf]],
+    )
+    ob.integrate(ts, [host, cdf], method="dop853_c")
+    for coord in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert numpy.all(
+            numpy.fabs(getattr(body, coord)(ts) - getattr(ob, coord)(ts)) < 10.0**-6.0
+        ), f"Massive body {coord} with dynamical friction does not agree with regular integration"
+    return None
+
+
+def test_integrate_massive_errors():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014, PlummerPotential
+
+    ts = numpy.linspace(0.0, 1.0, 11)
+    with pytest.raises(ValueError, match="only supported for 3D orbits"):
+        Orbit([1.0, 0.1, 1.1, 0.0]).integrate(
+            ts,
+            MWPotential2014,
+            massive=[[Orbit([1.5, 0.0, 0.8, 0.3, 0.1, 0.0]), PlummerPotential()]],
+        )
+    with pytest.raises(ValueError, match="single-object, 3D Orbit"):
+        Orbit([1.0, 0.1, 1.1, 0.0, 0.1, 0.0]).integrate(
+            ts,
+            MWPotential2014,
+            massive=[[Orbit([1.5, 0.0, 0.8, 0.3]), PlummerPotential()]],
+        )
+    return None
+
+
+# Test that the lockstep integrators agree with the C integrators for 1D, 2D, and 3D orbits
+def test_integrate_lockstep():
+    from galpy.orbit import Orbit
+    from galpy.potential import DehnenBarPotential, MWPotential2014, toVerticalPotential
+
+    numpy.random.seed(1)
+    nobj = 11
+    vxvv = numpy.array(
+        [
+            numpy.random.uniform(0.8, 1.2, nobj),
+            numpy.random.normal(0.0, 0.1, nobj),
+            numpy.random.normal(1.0, 0.1, nobj),
+            numpy.random.normal(0.0, 0.05, nobj),
+            numpy.random.normal(0.0, 0.05, nobj),
+            numpy.random.uniform(0.0, 2.0 * numpy.pi, nobj),
+        ]
+    ).T
+    ts = numpy.linspace(0.0, 10.0, 101)
+    pots = [
+        MWPotential2014 + DehnenBarPotential(),
+        MWPotential2014 + DehnenBarPotential(),
+        MWPotential2014 + DehnenBarPotential(),
+        MWPotential2014,
+        toVerticalPotential(MWPotential2014, 1.0),
+    ]
+    for indx, pot in zip(
+        [[0, 1, 2, 3, 4, 5], [0, 1, 2, 5], [0, 1, 2], [0, 1, 2, 3, 4], [3, 4]], pots
+    ):
+        oc = Orbit(vxvv[:, indx])
+        oc.integrate(ts, pot, method="dop853_c")
+        for method in ["leapfrog_vec", "symplec4_vec", "rk4_vec"]:
+            o = Orbit(vxvv[:, indx])
+            o.integrate(ts, pot, method=method)
+            diff = o.getOrbit() - oc.getOrbit()
+            if len(indx) in [4, 6]:  # wrap azimuth
+                diff[..., -1] = (diff[..., -1] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
+            assert numpy.all(
+                numpy.fabs(diff) < 10.0**-3.0
+            ), f"Lockstep integration with method {method} does not agree with C integration for phase-space dimension {len(indx)}"
+    # Fixed stepsize should be used when given
+    o = Orbit(vxvv)
+    o.integrate(ts, MWPotential2014, method="symplec4_vec", dt=(ts[1] - ts[0]) / 10.0)
+    oc = Orbit(vxvv)
+    oc.integrate(ts, MWPotential2014, method="symplec4_c", dt=(ts[1] - ts[0]) / 10.0)
+    assert numpy.all(
+        numpy.fabs(o.x(ts) - oc.x(ts)) < 10.0**-10.0
+    ), "Lockstep integration with a fixed stepsize does not agree with the C integrator with the same stepsize"
+    return None
+
+
+# Test that dissipative forces switch the lockstep integrators to rk4_vec and work
+def test_integrate_lockstep_dissipative():
+    from galpy.orbit import Orbit
+    from galpy.potential import ChandrasekharDynamicalFrictionForce, MWPotential2014
+
+    cdf = ChandrasekharDynamicalFrictionForce(GMs=0.001, rhm=0.01, dens=MWPotential2014)
+    ts = numpy.linspace(0.0, 10.0, 101)
+    vxvv = [[1.0, 0.1, 1.1, 0.1, 0.1, 0.3], [1.2, -0.1, 0.9, 0.0, 0.2, 1.3]]
+    oc = Orbit(vxvv)
+    oc.integrate(ts, MWPotential2014 + cdf, method="dop853")
+    o = Orbit(vxvv)
+    with pytest.warns(galpyWarning) as record:
+        o.integrate(ts, MWPotential2014 + cdf, method="leapfrog_vec")
+    assert any(
+        "using non-symplectic integrator rk4_vec" in str(rec.message) for rec in record
+    ), "Lockstep symplectic integration with dissipative forces did not switch to rk4_vec"
+    assert numpy.all(
+        numpy.fabs(o.x(ts) - oc.x(ts)) < 10.0**-5.0
+    ), "Lockstep integration with dissipative forces does not agree with dop853"
+    with pytest.raises(ValueError):
+        Orbit(vxvv).integrate_SOS(
+            numpy.linspace(0.0, 20.0 * numpy.pi, 11), MWPotential2014, method="rk4_vec"
+        )
+    return None
+
+
+# Test that the lockstep integrators work for output times that are not equally spaced
+def test_integrate_lockstep_nonuniform_times():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    ts = numpy.array([0.0, 1.0, 3.0, 6.0, 6.5, 10.0])
+    for vxvv in [[1.0, 0.1, 1.1, 0.1, 0.05, 0.0], [1.0, 0.1, 1.1, 0.0]]:
+        oc = Orbit(vxvv)
+        oc.integrate(ts, MWPotential2014, method="dop853")
+        for method in ["leapfrog_vec", "symplec4_vec", "rk4_vec"]:
+            o = Orbit(vxvv)
+            o.integrate(ts, MWPotential2014, method=method)
+            assert numpy.all(
+                numpy.fabs(o.R(ts) - oc.R(ts)) < 10.0**-5.0
+            ), f"Lockstep integration with {method} for unequally-spaced times does not agree with dop853"
+            assert numpy.all(
+                numpy.fabs(o.vR(ts) - oc.vR(ts)) < 10.0**-5.0
+            ), f"Lockstep integration with {method} for unequally-spaced times does not agree with dop853"
+    return None
+
+
+# Test that the lockstep integrators use the absolute tolerance
+def test_integrate_lockstep_atol():
+    from galpy.orbit.integrateFullOrbit import integrateFullOrbit
+    from galpy.orbit.integrateLinearOrbit import integrateLinearOrbit
+    from galpy.orbit.integratePlanarOrbit import integratePlanarOrbit
+    from galpy.potential import MWPotential2014, toPlanarPotential, toVerticalPotential
+
+    ts = numpy.linspace(0.0, 10.0, 101)
+    for integrator, pot, yo in [
+        (integrateFullOrbit, MWPotential2014, [[1.0, 0.1, 1.1, 0.1, 0.05, 0.0]]),
+        (
+            integratePlanarOrbit,
+            toPlanarPotential(MWPotential2014),
+            [[1.0, 0.1, 1.1, 0.0]],
+        ),
+        (
+            integrateLinearOrbit,
+            toVerticalPotential(MWPotential2014, 1.0),
+            [[0.1, 0.05]],
+        ),
+    ]:
+        out = integrator(pot, yo, ts, "leapfrog_vec", rtol=1e-8)[0]
+        out_atol = integrator(pot, yo, ts, "leapfrog_vec", rtol=1e-8, atol=1e-2)[0]
+        assert (
+            numpy.amax(numpy.fabs(out - out_atol)) > 10.0**-6.0
+        ), f"Lockstep integration with {integrator.__name__} does not use atol"
+        out_atol = integrator(pot, yo, ts, "leapfrog_vec", rtol=1e-8, atol=1e-12)[0]
+        assert (
+            numpy.amax(numpy.fabs(out - out_atol)) < 10.0**-10.0
+        ), f"Lockstep integration with {integrator.__name__} and a small atol does not agree with the default"
+    return None
+
+
 # Test that all integrators can start from a negative time
 def test_integrate_negative_time():
     from galpy.orbit import Orbit
@@ -9413,6 +10484,9 @@ def test_integrate_negative_time():
         "symplec6_c",
         "dopr54_c",
         "dop853_c",
+        "leapfrog_vec",
+        "symplec4_vec",
+        "rk4_vec",
     ]
     # negative time to negative time
     times = numpy.linspace(-70.0, -30.0, 1001)
@@ -9449,6 +10523,9 @@ def test_integrate_backwards():
         "symplec6_c",
         "dopr54_c",
         "dop853_c",
+        "leapfrog_vec",
+        "symplec4_vec",
+        "rk4_vec",
     ]
     # negative time to negative time
     times = numpy.linspace(-30.0, -70.0, 1001)
@@ -9490,3 +10567,24 @@ def test_call_internal_kwargs():
         o._call_internal(10.0), o._call_internal(t=10.0)
     ), "Orbit._call_internal(t0) and Orbit._call_internal(t=t0) return different results"
     return None
+
+
+# Test that the C integration of SpiralArmsPotential is not affected by
+# evaluating the potential for arrays, which reshapes its internal coefficients
+def test_spiralarms_c_after_array_evaluation():
+    from galpy.orbit import Orbit
+    from galpy.potential import SpiralArmsPotential, evaluatePotentials
+
+    sp = SpiralArmsPotential(Cs=[8.0 / 3.0 / numpy.pi, 0.5, 8.0 / 15.0 / numpy.pi])
+    times = numpy.linspace(0.0, 10.0, 101)
+    o = Orbit([1.0, 0.1, 1.1, 0.1, 0.05, 0.3])
+    o.integrate(times, sp, method="dop853_c")
+    evaluatePotentials(
+        sp, numpy.linspace(0.5, 1.5, 11), numpy.zeros(11), phi=numpy.zeros(11)
+    )
+    oa = Orbit([1.0, 0.1, 1.1, 0.1, 0.05, 0.3])
+    oa.integrate(times, sp, method="dop853_c")
+    assert (
+        numpy.amax(numpy.fabs(o.getOrbit() - oa.getOrbit())) < 1e-10
+    ), "C integration of SpiralArmsPotential changes after evaluating the potential for arrays"
+    return None
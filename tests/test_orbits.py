@@ -977,6 +977,59 @@ def test_SOS_onsurfaceerror_3D():
     return None
 
 
+# Test that the crossings of multiple orbits agree with those of the
+# individual orbits
+def test_crossings():
+    from galpy.orbit import Orbit
+
+    orbits_list = [
+        Orbit([1.0, 0.1, 1.0, 0.0, 0.1, 0.0]),
+        Orbit([0.9, 0.3, 1.0, -0.3, 0.4, 3.0]),
+        Orbit([1.2, -0.3, 0.7, 0.5, -0.5, 6.0]),
+    ]
+    orbits = Orbit(orbits_list)
+    pot = potential.MWPotential2014
+    t0s = numpy.arange(len(orbits))
+    ts, vxvvs = orbits.crossings(pot, 1000.0, ncross=50, t0=t0s)
+    assert ts.shape == (3, 50), "crossings returns times with the wrong shape"
+    assert vxvvs.shape == (
+        3,
+        50,
+        6,
+    ), "crossings returns phase-space positions with the wrong shape"
+    for ii in range(len(orbits)):
+        tsi, vxvvsi = orbits_list[ii].crossings(pot, 1000.0, ncross=50, t0=t0s[ii])
+        assert numpy.all(
+            numpy.fabs(ts[ii] - tsi) < 10.0**-10.0
+        ), "Crossings of multiple orbits do not agree with those of individual orbits"
+        assert numpy.all(
+            numpy.fabs(vxvvs[ii] - vxvvsi) < 10.0**-10.0
+        ), "Crossings of multiple orbits do not agree with those of individual orbits"
+    # Orbits without phi
+    orbits = Orbit([list(o.vxvv[0, :5]) for o in orbits_list])
+    tsnophi, vxvvsnophi = orbits.crossings(pot, 1000.0, ncross=50, t0=t0s)
+    assert vxvvsnophi.shape == (
+        3,
+        50,
+        5,
+    ), "crossings returns phase-space positions with the wrong shape"
+    assert numpy.all(
+        numpy.fabs(vxvvsnophi - vxvvs[:, :, :5]) < 10.0**-8.0
+    ), "Crossings of orbits without phi do not agree with those with phi"
+    # SOS with tmax, which includes initial conditions in the surface
+    Rs, vRs = Orbit(orbits_list).SOS(pot, ncross=50, tmax=1000.0)
+    assert (
+        numpy.fabs(Rs[0, 0] - 1.0) < 10.0**-10.0
+    ), "SOS with tmax does not start at the initial condition in the surface"
+    assert numpy.all(
+        numpy.fabs(Rs[0, 1:] - vxvvs[0, :-1, 0]) < 10.0**-10.0
+    ), "SOS with tmax does not agree with crossings"
+    assert numpy.all(
+        numpy.fabs(Rs[1:] - vxvvs[1:, :, 0]) < 10.0**-10.0
+    ), "SOS with tmax does not agree with crossings"
+    return None
+
+
 # Test slicing of orbits
 def test_slice_singleobject():
     from galpy.orbit import Orbit
@@ -5643,6 +5696,96 @@ def test_getOrbit():
     return None
 
 
+# Test that observables computes all observables in one pass and that these
+# agree with, and are then used by, the individual methods
+def test_observables():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+
+    vxvv = [
+        [1.0, 0.1, 1.2, 0.3, 0.2, 2.0],
+        [1.0, -0.1, 1.1, -0.3, 0.2, 5.0],
+        [1.1, 0.2, 0.9, 0.1, -0.1, 1.0],
+    ]
+    names = [
+        "ra",
+        "dec",
+        "dist",
+        "ll",
+        "bb",
+        "helioX",
+        "helioY",
+        "helioZ",
+        "pmra",
+        "pmdec",
+        "pmll",
+        "pmbb",
+        "vlos",
+        "U",
+        "V",
+        "W",
+    ]
+    times = numpy.linspace(0.0, 7.0, 51)
+    os = Orbit(vxvv, ro=8.0, vo=220.0)
+    os.integrate(times, MWPotential2014)
+    for args, kwargs in [
+        ((), {}),
+        ((times,), {}),
+        ((3.0,), {}),
+        ((times,), {"ro": 9.0, "vo": 230.0}),
+        ((times,), {"obs": [8.0, 1.0, 0.1, -10.0, 240.0, 5.0]}),
+        ((), {"t": times * u.Gyr / 100.0}),
+    ]:
+        obs = os.observables(*args, which=names, **kwargs)
+        for name in names:
+            # Individual method on an Orbit without memoised observables
+            oc = Orbit(vxvv, ro=8.0, vo=220.0)
+            oc.integrate(times, MWPotential2014)
+            indiv = getattr(oc, name)(*args, **kwargs)
+            assert (
+                obs[name].shape == indiv.shape
+            ), f"observables returns the wrong shape for {name}"
+            assert numpy.all(
+                numpy.fabs(obs[name] - indiv) < 10.0**-10.0
+            ), f"observables does not agree with the individual method for {name}"
+    # Default list of observables
+    obs = os.observables(times)
+    assert sorted(obs.keys()) == sorted(
+        ["ra", "dec", "dist", "pmra", "pmdec", "vlos"]
+    ), "observables does not return the default observables"
+    # Memoised: individual methods no longer evaluate the orbit
+    call_internal = os._call_internal
+    os._call_internal = None
+    for name in ["ra", "dec", "dist", "pmra", "pmdec", "vlos"]:
+        assert numpy.all(
+            getattr(os, name)(times) == obs[name]
+        ), f"Memoised {name} does not agree with observables"
+    # Returned arrays can be modified without changing the memoised values
+    obs["ra"][:] = 0.0
+    assert not numpy.all(os.ra(times) == 0.0), "Memoised observables were modified"
+    # Different ro is not memoised
+    with pytest.raises(TypeError):
+        os.ra(times, ro=9.0)
+    os._call_internal = call_internal
+    # Re-integrating removes the memoised observables
+    os.integrate(times, MWPotential2014)
+    assert not hasattr(
+        os, "_observables_cache"
+    ), "Re-integrating does not remove memoised observables"
+    # Observer as Orbit
+    obs = Orbit([1.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+    obs.integrate(times, MWPotential2014)
+    indiv = os[0].ra(times, obs=obs)
+    assert numpy.all(
+        numpy.fabs(os[0].observables(times, obs=obs, which=["ra"])["ra"] - indiv)
+        < 10.0**-10.0
+    ), "observables with obs= an Orbit does not agree with ra"
+    # Unknown observable
+    with pytest.raises(ValueError):
+        os.observables(times, which=["rperi"])
+    return None
+
+
 # Test that the eccentricity, zmax, rperi, and rap calculated numerically by
 # Orbits agrees with that calculated numerically using Orbit
 def test_EccZmaxRperiRap_num_againstorbit_3d():
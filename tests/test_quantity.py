@@ -2275,6 +2275,43 @@ def test_integrate_SOS_psiQuantity():
     return None
 
 
+def test_crossings_Quantity():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014
+    from galpy.util import conversion
+
+    ro, vo = 8.0, 200.0
+    o = Orbit(
+        [
+            10.0 * units.kpc,
+            -20.0 * units.km / units.s,
+            210.0 * units.km / units.s,
+            500.0 * units.pc,
+            -12.0 * units.km / units.s,
+            45.0 * units.deg,
+        ],
+        ro=ro,
+        vo=vo,
+    )
+    ts, vxvvs = o.crossings(
+        MWPotential2014, 2.0 * units.Gyr, ncross=10, t0=1.0 * units.Gyr
+    )
+    tsc, vxvvsc = o.crossings(
+        MWPotential2014,
+        2.0 / conversion.time_in_Gyr(vo, ro),
+        ncross=10,
+        t0=1.0 / conversion.time_in_Gyr(vo, ro),
+    )
+    assert numpy.all(
+        (numpy.fabs(ts - tsc) < 10.0**-8.0) + numpy.isnan(ts) * numpy.isnan(tsc)
+    ), "Crossings computed with tmax specified as Quantity do not agree with those computed with tmax specified as a number"
+    assert numpy.all(
+        (numpy.fabs(vxvvs - vxvvsc) < 10.0**-8.0)
+        + numpy.isnan(vxvvs) * numpy.isnan(vxvvsc)
+    ), "Crossings computed with tmax specified as Quantity do not agree with those computed with tmax specified as a number"
+    return None
+
+
 def test_orbit_inconsistentPotentialUnits_error():
     from galpy.orbit import Orbit
     from galpy.potential import IsochronePotential
@@ -1,6 +1,7 @@
 ############################TESTS ON POTENTIALS################################
 
 import numpy
+import pytest
 
 from galpy import df, potential
 from galpy.orbit import Orbit
@@ -407,11 +408,180 @@ def test_scf_compute_nbody_twopowertriaxial():
     return None
 
 
+## Tests that chunked, streamed, and parallel nbody calculations agree with the direct one
+def test_scf_compute_nbody_chunked():
+    import os
+    import tempfile
+
+    numpy.random.seed(3)
+    n = 5000
+    pos = numpy.random.normal(size=(3, n)) * numpy.array([[1.5], [1.0], [0.6]])
+    mass = numpy.random.uniform(0.5, 1.5, n) / n
+
+    def blocks():
+        for ii in range(0, n, 1700):
+            yield (pos[:, ii : ii + 1700], mass[ii : ii + 1700])
+
+    savefile, tmp_savefilename = tempfile.mkstemp(suffix=".npy")
+    try:
+        os.close(savefile)
+        numpy.save(tmp_savefilename, pos)
+        mpos = numpy.load(tmp_savefilename, mmap_mode="r")
+        for func, args in [
+            (potential.scf_compute_coeffs_spherical_nbody, (6,)),
+            (potential.scf_compute_coeffs_axi_nbody, (6, 4)),
+            (potential.scf_compute_coeffs_nbody, (6, 4)),
+        ]:
+            Acos, Asin = func(pos, *args, mass=mass, a=1.3)
+            for tpos, kwargs in [
+                (pos, {"mass": mass, "chunksize": 999}),
+                (pos, {"mass": mass, "chunksize": 999, "numcores": 2}),
+                (mpos, {"mass": mass, "chunksize": 2000}),
+                (blocks(), {}),
+                (blocks(), {"numcores": 2}),
+            ]:
+                tAcos, tAsin = func(tpos, *args, a=1.3, **kwargs)
+                assert numpy.all(
+                    numpy.fabs(tAcos - Acos) < 1e-12
+                ), f"Chunked {func.__name__} does not agree with the direct calculation"
+                if Asin is None:
+                    assert (
+                        tAsin is None
+                    ), f"Chunked {func.__name__} does not return Asin=None"
+                else:
+                    assert numpy.all(
+                        numpy.fabs(tAsin - Asin) < 1e-12
+                    ), f"Chunked {func.__name__} does not agree with the direct calculation"
+        del mpos
+    finally:
+        os.remove(tmp_savefilename)
+    return None
+
+
+## Tests that the default chunking of the nbody calculation bounds the chunks and agrees with a single chunk
+def test_scf_compute_nbody_defaultchunksize(monkeypatch):
+    import importlib
+
+    scf_module = importlib.import_module("galpy.potential.SCFPotential")
+    numpy.random.seed(5)
+    n = 3000
+    pos = numpy.random.normal(size=(3, n))
+    Acos, Asin = potential.scf_compute_coeffs_nbody(pos, 6, 4, mass=1.0 / n)
+    nchunks = []
+    sums = scf_module._scf_compute_coeffs_nbody_sums
+
+    def count_sums(tpos, *args):
+        nchunks.append(len(tpos[0]))
+        return sums(tpos, *args)
+
+    monkeypatch.setattr(scf_module, "_SCF_NBODY_MAXCHUNKELEM", 6 * 4 * 700)
+    monkeypatch.setattr(scf_module, "_scf_compute_coeffs_nbody_sums", count_sums)
+    tAcos, tAsin = potential.scf_compute_coeffs_nbody(pos, 6, 4, mass=1.0 / n)
+    assert (
+        max(nchunks) == 700 and len(nchunks) == 5
+    ), "Default chunking of scf_compute_coeffs_nbody does not bound the chunk size"
+    assert numpy.all(
+        numpy.fabs(tAcos - Acos) < 1e-12
+    ), "Default chunking of scf_compute_coeffs_nbody does not agree with a single chunk"
+    assert numpy.all(
+        numpy.fabs(tAsin - Asin) < 1e-12
+    ), "Default chunking of scf_compute_coeffs_nbody does not agree with a single chunk"
+    return None
+
+
+## Tests that the variance of the nbody coefficients matches the scatter between samples
+def test_scf_compute_nbody_variance():
+    numpy.random.seed(4)
+    n = 2000
+    c = numpy.array(
+        [
+            potential.scf_compute_coeffs_nbody(
+                numpy.random.normal(size=(3, n)), 3, 3, mass=1.0 / n
+            )[0]
+            for ii in range(100)
+        ]
+    )
+    _, _, Acos_var, Asin_var = potential.scf_compute_coeffs_nbody(
+        numpy.random.normal(size=(3, n)),
+        3,
+        3,
+        mass=1.0 / n,
+        chunksize=700,
+        return_variance=True,
+    )
+    indx = numpy.tril(numpy.ones((3, 3), dtype=bool))[None].repeat(3, axis=0)
+    assert numpy.all(
+        numpy.fabs(numpy.std(c, axis=0)[indx] / numpy.sqrt(Acos_var[indx]) - 1.0) < 0.3
+    ), "Variance of scf_compute_coeffs_nbody coefficients does not match the scatter between samples"
+    assert numpy.all(
+        Asin_var[:, :, 0] < 1e-20
+    ), "Variance of scf_compute_coeffs_nbody Asin coefficients with m=0 is not zero"
+    return None
+
+
 def test_scf_compute_nfw():
     Acos, Asin = potential.scf_compute_coeffs_spherical(rho_NFW, 10)
     spherical_coeffsTest(Acos, Asin)
 
 
+##Tests that the coefficients are stored in and read from the on-disk cache
+def test_scf_compute_cache(tmp_path):
+    import os
+
+    for compute, dens, args in [
+        (potential.scf_compute_coeffs_spherical, rho_NFW, (10,)),
+        (potential.scf_compute_coeffs_axi, axi_density1, (10, 10)),
+        (potential.scf_compute_coeffs, density1, (5, 5)),
+    ]:
+        cachedir = str(tmp_path / compute.__name__)
+        Acos, Asin = compute(dens, *args)
+        Acos1, Asin1 = compute(dens, *args, cache=cachedir)
+        assert (
+            len(os.listdir(cachedir)) == 1
+        ), f"{compute.__name__} with cache= did not store the coefficients"
+        Acos2, Asin2 = compute(dens, *args, cache=cachedir)
+        assert (
+            len(os.listdir(cachedir)) == 1
+        ), f"{compute.__name__} with cache= did not re-use the cached coefficients"
+        for A, A1, A2 in [(Acos, Acos1, Acos2), (Asin, Asin1, Asin2)]:
+            if A is None:
+                assert (
+                    A1 is None and A2 is None
+                ), f"{compute.__name__} with cache= does not return Asin=None"
+            else:
+                assert numpy.all(A == A1) and numpy.all(
+                    A == A2
+                ), f"{compute.__name__} with cache= returns different coefficients"
+        # Different inputs should not re-use the cache
+        compute(dens, *args, a=2.0, cache=cachedir)
+        assert (
+            len(os.listdir(cachedir)) == 2
+        ), f"{compute.__name__} with cache= re-used coefficients for different inputs"
+    return None
+
+
+##Tests that failing to store the coefficients in the cache only warns
+def test_scf_compute_cache_unwritable(tmp_path):
+    from galpy.util import galpyWarning
+
+    # A cache directory below a regular file cannot be created, even by root
+    notadir = tmp_path / "notadir"
+    notadir.write_text("")
+    cachedir = str(notadir / "cache")
+    Acos, Asin = potential.scf_compute_coeffs_spherical(rho_NFW, 10)
+    with pytest.warns(galpyWarning, match="Could not store the table"):
+        Acos1, Asin1 = potential.scf_compute_coeffs_spherical(
+            rho_NFW, 10, cache=cachedir
+        )
+    assert numpy.all(
+        Acos == Acos1
+    ), "scf_compute_coeffs_spherical with an unwritable cache= returns different coefficients"
+    assert (
+        Asin1 is None
+    ), "scf_compute_coeffs_spherical with an unwritable cache= does not return Asin=None"
+    return None
+
+
 ##Tests radial order from scf_compute_coeffs_spherical
 def test_nfw_sphericalOrder():
     Acos, Asin = potential.scf_compute_coeffs_spherical(rho_NFW, 10)
@@ -737,6 +907,209 @@ def test_from_density():
     return None
 
 
+# Test that the time-dependent SCF potential agrees with SCFPotential at the
+# times of the snapshots
+def test_timedependent_snapshots():
+    pos = _timedependent_snapshots()
+    ts = numpy.linspace(0.0, 3.0, len(pos))
+    for interp in ["linear", "cubic"]:
+        tdp = potential.TimeDependentSCFPotential.from_nbody(
+            pos, ts, 4, 3, mass=1.0 / pos[0].shape[1], interp=interp
+        )
+        assert (
+            tdp.isNonAxi
+        ), "TimeDependentSCFPotential from non-axisymmetric snapshots should be non-axisymmetric"
+        for t, tpos in zip(ts, pos):
+            Acos, Asin = potential.scf_compute_coeffs_nbody(
+                tpos, 4, 3, mass=1.0 / tpos.shape[1]
+            )
+            sp = SCFPotential(Acos=Acos, Asin=Asin)
+            for func in ["__call__", "Rforce", "zforce", "phitorque", "dens"]:
+                assert (
+                    numpy.fabs(
+                        getattr(tdp, func)(0.9, 0.2, phi=0.3, t=t)
+                        - getattr(sp, func)(0.9, 0.2, phi=0.3)
+                    )
+                    < 1e-12
+                ), f"TimeDependentSCFPotential {func} does not agree with SCFPotential at the time of a snapshot"
+    return None
+
+
+# Test the interpolation in time
+def test_timedependent_interp():
+    Acos0, Asin0 = potential.scf_compute_coeffs_nbody(
+        _timedependent_snapshots()[0], 4, 3
+    )
+    Acos1, Asin1 = 0.1 * numpy.roll(Acos0, 1, axis=0), 0.1 * Asin0
+    # Coefficients that are linear in time are reproduced by both schemes
+    ts = numpy.array([0.0, 1.0, 1.5, 3.0])
+    Acos = Acos0[None] + ts[:, None, None, None] * Acos1[None]
+    Asin = Asin0[None] + ts[:, None, None, None] * Asin1[None]
+    for interp in ["linear", "cubic"]:
+        tdp = potential.TimeDependentSCFPotential(
+            Acos=Acos, Asin=Asin, tgrid=ts, interp=interp
+        )
+        for t, tt in [(0.3, 0.3), (1.2, 1.2), (2.9, 2.9), (-1.0, 0.0), (4.0, 3.0)]:
+            sp = SCFPotential(Acos=Acos0 + tt * Acos1, Asin=Asin0 + tt * Asin1)
+            for func in ["__call__", "Rforce", "phitorque"]:
+                assert (
+                    numpy.fabs(
+                        getattr(tdp, func)(1.1, -0.3, phi=2.0, t=t)
+                        - getattr(sp, func)(1.1, -0.3, phi=2.0)
+                    )
+                    < 1e-12
+                ), f"TimeDependentSCFPotential {func} does not correctly interpolate the coefficients in time for interp={interp}"
+    # On a uniform grid, cubic interpolation reproduces a quadratic evolution
+    ts = numpy.array([0.0, 1.0, 2.0, 3.0])
+    Acos = Acos0[None] + ts[:, None, None, None] ** 2 * Acos1[None]
+    sp = SCFPotential(Acos=Acos0 + 1.5**2 * Acos1, Asin=Asin0)
+    errs = [
+        numpy.fabs(
+            potential.TimeDependentSCFPotential(
+                Acos=Acos,
+                Asin=numpy.tile(Asin0, (4, 1, 1, 1)),
+                tgrid=ts,
+                interp=interp,
+            )(1.1, -0.3, phi=2.0, t=1.5)
+            - sp(1.1, -0.3, phi=2.0)
+        )
+        for interp in ["linear", "cubic"]
+    ]
+    assert (
+        errs[1] < 1e-10 and errs[0] > 1e-3
+    ), "Cubic interpolation in time does not reproduce a quadratic evolution of the coefficients"
+    return None
+
+
+# Test that the time-dependent SCF potential can be evaluated at an array of times
+def test_timedependent_arrayt():
+    pos = _timedependent_snapshots()
+    ts = numpy.linspace(0.0, 3.0, len(pos))
+    tdp = potential.TimeDependentSCFPotential.from_nbody(
+        pos, ts, 4, 3, mass=1.0 / pos[0].shape[1], interp="cubic"
+    )
+    Rs, zs, phis = numpy.array([1.0, 1.2, 0.8]), numpy.array([0.1, -0.2, 0.0]), 0.4
+    times = numpy.array([0.5, 1.5, 0.5])
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+        potential.evaluateDensities,
+    ]:
+        out = func(tdp, Rs, zs, phi=phis, t=times)
+        for ii in range(len(Rs)):
+            assert (
+                numpy.fabs(out[ii] - func(tdp, Rs[ii], zs[ii], phi=phis, t=times[ii]))
+                < 1e-12
+            ), f"TimeDependentSCFPotential {func.__name__} with an array of times does not agree with evaluating at each time"
+    return None
+
+
+# Test that orbit integration in C agrees with that in python
+def test_timedependent_orbit_c():
+    pos = _timedependent_snapshots()
+    ts = numpy.linspace(0.0, 3.0, len(pos))
+    for interp in ["linear", "cubic"]:
+        tdp = potential.TimeDependentSCFPotential.from_nbody(
+            pos, ts, 4, 3, mass=1.0 / pos[0].shape[1], interp=interp
+        )
+        times = numpy.linspace(0.0, 4.0, 41)
+        for o, pot in [
+            (Orbit([1.0, 0.1, 1.1, 0.1, 0.0, 0.0]), tdp),
+            (Orbit([1.0, 0.1, 1.1, 0.0]), tdp.toPlanar()),
+        ]:
+            op, oc = o(), o()
+            op.integrate(times, pot, method="dop853")
+            oc.integrate(times, pot, method="dop853_c")
+            assert numpy.all(
+                numpy.fabs(op.x(times) - oc.x(times)) < 1e-7
+            ), f"Orbit integration in TimeDependentSCFPotential differs between python and C for interp={interp}"
+    return None
+
+
+# Test that the coefficients can be saved and memory-mapped
+def test_timedependent_save_memmap():
+    import os
+    import tempfile
+
+    pos = _timedependent_snapshots()
+    ts = numpy.linspace(0.0, 3.0, len(pos))
+    tdp = potential.TimeDependentSCFPotential.from_nbody(
+        pos, ts, 4, 3, mass=1.0 / pos[0].shape[1], interp="cubic", ro=8.0
+    )
+    savefile, tmp_savefilename = tempfile.mkstemp(suffix=".npz")
+    try:
+        os.close(savefile)
+        tdp.save(tmp_savefilename)
+        for mmap in [True, False]:
+            tdpl = potential.TimeDependentSCFPotential.from_file(
+                tmp_savefilename, mmap=mmap
+            )
+            assert isinstance(tdpl._Acos_t, numpy.memmap) == mmap, (
+                "TimeDependentSCFPotential.from_file does not memory-map the coefficients"
+                if mmap
+                else "TimeDependentSCFPotential.from_file memory-maps the coefficients when mmap=False"
+            )
+            for t in [0.0, 1.7, 2.2]:
+                assert (
+                    numpy.fabs(
+                        tdpl(1.0, 0.1, phi=0.5, t=t, use_physical=False)
+                        - tdp(1.0, 0.1, phi=0.5, t=t, use_physical=False)
+                    )
+                    < 1e-14
+                ), "Loaded TimeDependentSCFPotential does not agree with the saved one"
+            assert (
+                tdpl._roSet and numpy.fabs(tdpl._ro - 8.0) < 1e-14
+            ), "Loaded TimeDependentSCFPotential does not have the saved ro"
+            del tdpl
+    finally:
+        os.remove(tmp_savefilename)
+    return None
+
+
+def test_timedependent_errors():
+    Acos = numpy.zeros((2, 3, 2, 2))
+    Acos[:, 0, 0, 0] = 1.0
+    with pytest.raises(potential.PotentialError):
+        potential.TimeDependentSCFPotential(Acos=Acos)
+    with pytest.raises(potential.PotentialError):
+        potential.TimeDependentSCFPotential(Acos=Acos[0], tgrid=[0.0, 1.0])
+    with pytest.raises(potential.PotentialError):
+        potential.TimeDependentSCFPotential(Acos=Acos, tgrid=[0.0, 1.0, 2.0])
+    with pytest.raises(potential.PotentialError):
+        potential.TimeDependentSCFPotential(Acos=Acos, tgrid=[1.0, 0.0])
+    with pytest.raises(potential.PotentialError):
+        potential.TimeDependentSCFPotential(
+            Acos=Acos, Asin=Acos[:, :2], tgrid=[0.0, 1.0]
+        )
+    with pytest.raises(potential.PotentialError):
+        potential.TimeDependentSCFPotential(
+            Acos=Acos, tgrid=[0.0, 1.0], interp="quintic"
+        )
+    return None
+
+
+def _timedependent_snapshots(nt=4, n=500):
+    # Snapshots of a rotating, slowly-expanding triaxial distribution
+    rng = numpy.random.default_rng(4)
+    pos = []
+    for ii in range(nt):
+        x = rng.normal(size=(3, n)) * numpy.array([[1.3], [0.8], [0.5]])
+        x *= 1.0 + 0.1 * ii
+        ang = 0.4 * ii
+        pos.append(
+            numpy.array(
+                [
+                    numpy.cos(ang) * x[0] - numpy.sin(ang) * x[1],
+                    numpy.sin(ang) * x[0] + numpy.cos(ang) * x[1],
+                    x[2],
+                ]
+            )
+        )
+    return pos
+
+
 ##############GENERIC FUNCTIONS BELOW###############
 
 